@@ -0,0 +1,38 @@
+"""Adds organizations.version, users.version, jobs.version and applications.version.
+
+A counter incremented on every UPDATE - i.e. a validator (e.g. of entity tags) telling apart writes within the
+same second, which `updated` cannot. Existing rows start at 1; the columns are added in place (i.e. instantly).
+
+Revision ID: 4d8b2f6a1c93
+Revises: f2a7c3d9e184
+Create Date: 2026-10-17 05:30:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d8b2f6a1c93"
+down_revision: Union[str, None] = "f2a7c3d9e184"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ("organizations", "users", "jobs", "applications")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, "version")
@@ -0,0 +1,38 @@
+"""Adds index for jobs.organization_id, jobs.created and jobs.id.
+
+Revision ID: 5c0e8d2f4a91
+Revises: 1a74a354922f
+Create Date: 2026-10-17 04:20:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c0e8d2f4a91"
+down_revision: Union[str, None] = "1a74a354922f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NOTE: supports listing an organization's jobs - keyset paginated by (created, id).
+    op.create_index(
+        "ix_jobs_organization_id_created_id",
+        "jobs",
+        ["organization_id", "created", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    # NOTE: the index may back the foreign key on organization_id (i.e. if MySQL/MariaDB dropped the
+    # implicit one once it was created), hence recreating a plain index for it first.
+    indexes = sa.inspect(op.get_bind()).get_indexes("jobs")
+    if not any(index["column_names"] == ["organization_id"] for index in indexes):
+        op.create_index("organization_id", "jobs", ["organization_id"], unique=False)
+    op.drop_index("ix_jobs_organization_id_created_id", table_name="jobs")
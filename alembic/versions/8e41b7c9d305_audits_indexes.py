@@ -0,0 +1,104 @@
+"""Audits indexes.
+
+Drops the redundant indexes - i.e. the unique indexes on primary keys (`ix_*_id`) and the indexes on
+low-cardinality enums - and adds composite indexes for the listings.
+
+Revision ID: 8e41b7c9d305
+Revises: 5c0e8d2f4a91
+Create Date: 2026-10-17 04:30:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8e41b7c9d305"
+down_revision: Union[str, None] = "5c0e8d2f4a91"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NOTE: the primary key is unique and indexed already.
+    op.drop_index("ix_organizations_id", table_name="organizations")
+    op.drop_index("ix_users_id", table_name="users")
+    op.drop_index("ix_jobs_id", table_name="jobs")
+    op.drop_index("ix_applications_id", table_name="applications")
+
+    # NOTE: low-cardinality - i.e. only useful as part of composite indexes.
+    op.drop_index("ix_jobs_state", table_name="jobs")
+    op.drop_index("ix_jobs_mode", table_name="jobs")
+    op.drop_index("ix_jobs_contract", table_name="jobs")
+    op.drop_index("ix_applications_state", table_name="applications")
+
+    op.create_index(
+        "ix_jobs_organization_id_state_created",
+        "jobs",
+        ["organization_id", "state", "created"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_applications_job_id_state",
+        "applications",
+        ["job_id", "state"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_applications_user_id_created",
+        "applications",
+        ["user_id", "created"],
+        unique=False,
+    )
+
+    # NOTE: the composite indexes back the foreign keys.
+    _drop_foreign_key_index("jobs", "organization_id")
+    _drop_foreign_key_index("applications", "job_id")
+    _drop_foreign_key_index("applications", "user_id")
+
+
+def _drop_foreign_key_index(table_name: str, column_name: str) -> None:
+    """
+    Drops the plain index for a foreign key - if any (e.g. recreated by `downgrade`).
+
+    MySQL/MariaDB drop the index they implicitly created for a foreign key on their own, once another index
+    can back it - but not an explicitly created one.
+    """
+    for index in sa.inspect(op.get_bind()).get_indexes(table_name):
+        if index["column_names"] == [column_name]:
+            op.drop_index(index["name"], table_name=table_name)
+
+
+def _create_foreign_key_index(table_name: str, column_name: str) -> None:
+    """
+    Creates a plain index for a foreign key - unless one exists already.
+
+    MySQL/MariaDB silently drop the index they implicitly created for a foreign key once another index
+    can back it (e.g. a composite one starting with the same column) - i.e. dropping the latter requires
+    recreating the former.
+    """
+    indexes = sa.inspect(op.get_bind()).get_indexes(table_name)
+    if not any(index["column_names"] == [column_name] for index in indexes):
+        op.create_index(column_name, table_name, [column_name], unique=False)
+
+
+def downgrade() -> None:
+    _create_foreign_key_index("applications", "job_id")
+    _create_foreign_key_index("applications", "user_id")
+
+    op.drop_index("ix_applications_user_id_created", table_name="applications")
+    op.drop_index("ix_applications_job_id_state", table_name="applications")
+    op.drop_index("ix_jobs_organization_id_state_created", table_name="jobs")
+
+    op.create_index("ix_applications_state", "applications", ["state"], unique=False)
+    op.create_index("ix_jobs_contract", "jobs", ["contract"], unique=False)
+    op.create_index("ix_jobs_mode", "jobs", ["mode"], unique=False)
+    op.create_index("ix_jobs_state", "jobs", ["state"], unique=False)
+
+    op.create_index("ix_applications_id", "applications", ["id"], unique=True)
+    op.create_index("ix_jobs_id", "jobs", ["id"], unique=True)
+    op.create_index("ix_users_id", "users", ["id"], unique=True)
+    op.create_index("ix_organizations_id", "organizations", ["id"], unique=True)
@@ -0,0 +1,77 @@
+"""Adds binary UUID columns.
+
+First step of moving the UUID columns from `CHAR(32)` to `BINARY(16)` - with the application deployed as follows:
+
+0. before this revision: deploy the application with `uuid_column_type=char` - i.e. `BinaryUUID` columns
+   writing hex, to the `CHAR(32)` columns (and reading both representations).
+1. (this revision) expand: adds a nullable `BINARY(16)` shadow column (`<column>_binary`) for every UUID
+   column, and triggers keeping them in sync for rows being inserted/updated - online.
+2. (c7d2e5f8a916) backfill: fills the shadow columns of the existing rows - in small batches, online.
+3. (e1b4a8d6c357) contract: swaps the shadow columns in (i.e. drops the `CHAR(32)` ones) - during a write
+   freeze, given that the application writes hex until:
+4. redeploy the application with `uuid_column_type=binary` (the default).
+
+Revision ID: a3f9c1e7b204
+Revises: 8e41b7c9d305
+Create Date: 2026-10-17 04:40:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f9c1e7b204"
+down_revision: Union[str, None] = "8e41b7c9d305"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# NOTE: the UUID columns of every table.
+COLUMNS = {
+    "organizations": ["id"],
+    "users": ["id"],
+    "jobs": ["id", "organization_id"],
+    "applications": ["id", "job_id", "user_id"],
+}
+
+
+def upgrade() -> None:
+    for table_name, column_names in COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE {table_name} "
+            + ", ".join(
+                f"ADD COLUMN {column_name}_binary BINARY(16) NULL"
+                for column_name in column_names
+            )
+            + ", LOCK=NONE"
+        )
+
+        assignments = ", ".join(
+            f"NEW.{column_name}_binary = UNHEX(NEW.{column_name})"
+            for column_name in column_names
+        )
+        for event in ("INSERT", "UPDATE"):
+            op.execute(
+                f"CREATE TRIGGER {table_name}_binary_uuid_{event.lower()} "
+                f"BEFORE {event} ON {table_name} FOR EACH ROW SET {assignments}"
+            )
+
+
+def downgrade() -> None:
+    for table_name, column_names in COLUMNS.items():
+        for event in ("INSERT", "UPDATE"):
+            op.execute(
+                f"DROP TRIGGER IF EXISTS {table_name}_binary_uuid_{event.lower()}"
+            )
+
+        op.execute(
+            f"ALTER TABLE {table_name} "
+            + ", ".join(
+                f"DROP COLUMN {column_name}_binary" for column_name in column_names
+            )
+            + ", LOCK=NONE"
+        )
@@ -0,0 +1,34 @@
+"""Adds FULLTEXT index for jobs.title and jobs.description.
+
+Revision ID: b5e2d9c4f718
+Revises: e1b4a8d6c357
+Create Date: 2026-10-17 05:10:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5e2d9c4f718"
+down_revision: Union[str, None] = "e1b4a8d6c357"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NOTE: supports searching jobs - i.e. `MATCH (title, description) AGAINST (...)`. InnoDB rebuilds the
+    # table when its first FULLTEXT index is added (i.e. to add the hidden FTS_DOC_ID column).
+    op.create_index(
+        "ix_jobs_title_description",
+        "jobs",
+        ["title", "description"],
+        unique=False,
+        mysql_prefix="FULLTEXT",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_title_description", table_name="jobs")
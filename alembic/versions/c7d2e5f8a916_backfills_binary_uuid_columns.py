@@ -0,0 +1,71 @@
+"""Backfills binary UUID columns.
+
+Second step of moving the UUID columns from `CHAR(32)` to `BINARY(16)` online (see a3f9c1e7b204): fills the
+shadow columns of the existing rows. Rows are updated in small batches, each committed on its own - i.e.
+neither a long-running transaction nor long-held locks.
+
+Revision ID: c7d2e5f8a916
+Revises: a3f9c1e7b204
+Create Date: 2026-10-17 04:41:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d2e5f8a916"
+down_revision: Union[str, None] = "a3f9c1e7b204"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 10_000
+
+# NOTE: the UUID columns of every table.
+COLUMNS = {
+    "organizations": ["id"],
+    "users": ["id"],
+    "jobs": ["id", "organization_id"],
+    "applications": ["id", "job_id", "user_id"],
+}
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    with op.get_context().autocommit_block():
+        for table_name, column_names in COLUMNS.items():
+            # NOTE: walking the primary key (i.e. rather than looking for unfilled rows) so that every batch
+            # is an index range - rows inserted meanwhile are filled by the triggers.
+            last = ""
+            while True:
+                batch = connection.execute(
+                    sa.text(
+                        f"SELECT MAX(id) FROM (SELECT id FROM {table_name} WHERE id > :last "
+                        f"ORDER BY id LIMIT {BATCH_SIZE}) AS batch"
+                    ),
+                    {"last": last},
+                ).scalar()
+                if batch is None:
+                    break
+
+                connection.execute(
+                    sa.text(
+                        f"UPDATE {table_name} SET "
+                        + ", ".join(
+                            f"{column_name}_binary = UNHEX({column_name})"
+                            for column_name in column_names
+                        )
+                        + " WHERE id > :last AND id <= :batch"
+                    ),
+                    {"last": last, "batch": batch},
+                )
+                last = batch
+
+
+def downgrade() -> None:
+    # NOTE: nothing to undo - the shadow columns are dropped by a3f9c1e7b204.
+    pass
@@ -0,0 +1,162 @@
+"""Swaps binary UUID columns.
+
+Last step of moving the UUID columns from `CHAR(32)` to `BINARY(16)` (see a3f9c1e7b204): replaces every
+UUID column with its (backfilled) shadow column - along with the primary key, and the indexes and foreign
+keys involving it. Each table is altered by a single `ALTER TABLE ... LOCK=NONE` - i.e. rebuilt in place
+while still accepting reads - and its sync triggers are only dropped once its `ALTER` completes, so that
+rows written meanwhile still get their shadow columns filled.
+
+Not online for writes: once a table is swapped, the application (deployed with `uuid_column_type=char`)
+can no longer write to it, until redeployed with `uuid_column_type=binary` - i.e. run it during a write
+freeze, and redeploy right after.
+
+Foreign keys are dropped first and added back with `foreign_key_checks` disabled, so that no table is copied.
+
+Revision ID: e1b4a8d6c357
+Revises: c7d2e5f8a916
+Create Date: 2026-10-17 04:42:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1b4a8d6c357"
+down_revision: Union[str, None] = "c7d2e5f8a916"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# NOTE: the UUID columns of every table - parents before children.
+COLUMNS = {
+    "organizations": ["id"],
+    "users": ["id"],
+    "jobs": ["id", "organization_id"],
+    "applications": ["id", "job_id", "user_id"],
+}
+
+
+def _swap(
+    table_name: str, column_names: list[str], suffix: str, column_type: str
+) -> None:
+    """
+    Replaces UUID columns with their shadow ones (`<column><suffix>`) - recreating the primary key and the
+    indexes involving them - then drops the triggers syncing the (now gone) shadow columns, if any.
+    """
+    indexes = [
+        index
+        for index in sa.inspect(op.get_bind()).get_indexes(table_name)
+        if set(index["column_names"]) & set(column_names)
+    ]
+
+    op.execute(
+        f"ALTER TABLE {table_name} "
+        + ", ".join(
+            [f"DROP INDEX {index['name']}" for index in indexes]
+            + ["DROP PRIMARY KEY"]
+            + [f"DROP COLUMN {column_name}" for column_name in column_names]
+            + [
+                f"CHANGE COLUMN {column_name}{suffix} {column_name} {column_type} NOT NULL"
+                for column_name in column_names
+            ]
+            + ["ADD PRIMARY KEY (id)"]
+            + [
+                f"ADD {'UNIQUE ' if index['unique'] else ''}INDEX {index['name']} "
+                f"({', '.join(index['column_names'])})"
+                for index in indexes
+            ]
+            + ["LOCK=NONE"]
+        )
+    )
+
+    for event in ("insert", "update"):
+        op.execute(f"DROP TRIGGER IF EXISTS {table_name}_binary_uuid_{event}")
+
+
+def _swap_all(suffix: str, column_type: str) -> None:
+    """
+    Replaces every UUID column with its shadow one (`<column><suffix>`) - recreating the foreign keys.
+    """
+    inspector = sa.inspect(op.get_bind())
+    foreign_keys = {
+        table_name: inspector.get_foreign_keys(table_name) for table_name in COLUMNS
+    }
+
+    op.execute("SET foreign_key_checks = 0")
+
+    for table_name, table_foreign_keys in foreign_keys.items():
+        for foreign_key in table_foreign_keys:
+            op.drop_constraint(foreign_key["name"], table_name, type_="foreignkey")
+
+    for table_name, column_names in COLUMNS.items():
+        _swap(table_name, column_names, suffix, column_type)
+
+    for table_name, table_foreign_keys in foreign_keys.items():
+        for foreign_key in table_foreign_keys:
+            op.create_foreign_key(
+                foreign_key["name"],
+                table_name,
+                foreign_key["referred_table"],
+                foreign_key["constrained_columns"],
+                foreign_key["referred_columns"],
+            )
+
+    op.execute("SET foreign_key_checks = 1")
+
+
+def _add_shadow_columns(
+    table_name: str, column_names: list[str], suffix: str, column_type: str, fill: str
+) -> None:
+    """
+    Adds (and fills) a shadow column (`<column><suffix>`) for every UUID column of a table.
+    """
+    op.execute(
+        f"ALTER TABLE {table_name} "
+        + ", ".join(
+            f"ADD COLUMN {column_name}{suffix} {column_type} NULL"
+            for column_name in column_names
+        )
+        + ", LOCK=NONE"
+    )
+    op.execute(
+        f"UPDATE {table_name} SET "
+        + ", ".join(
+            f"{column_name}{suffix} = {fill.format(column=column_name)}"
+            for column_name in column_names
+        )
+    )
+
+
+def upgrade() -> None:
+    _swap_all("_binary", "BINARY(16)")
+
+
+def downgrade() -> None:
+    # NOTE: not online - the shadow columns are filled by a single UPDATE per table.
+    for table_name, column_names in COLUMNS.items():
+        _add_shadow_columns(
+            table_name, column_names, "_char", "CHAR(32)", "LOWER(HEX({column}))"
+        )
+
+    _swap_all("_char", "CHAR(32)")
+
+    # NOTE: back to the state after the backfill (c7d2e5f8a916) - i.e. with filled binary shadow columns,
+    # kept in sync by triggers.
+    for table_name, column_names in COLUMNS.items():
+        _add_shadow_columns(
+            table_name, column_names, "_binary", "BINARY(16)", "UNHEX({column})"
+        )
+
+        assignments = ", ".join(
+            f"NEW.{column_name}_binary = UNHEX(NEW.{column_name})"
+            for column_name in column_names
+        )
+        for event in ("INSERT", "UPDATE"):
+            op.execute(
+                f"CREATE TRIGGER {table_name}_binary_uuid_{event.lower()} "
+                f"BEFORE {event} ON {table_name} FOR EACH ROW SET {assignments}"
+            )
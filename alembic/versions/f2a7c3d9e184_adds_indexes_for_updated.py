@@ -0,0 +1,33 @@
+"""Adds indexes for organizations.updated, users.updated, jobs.updated and applications.updated.
+
+Revision ID: f2a7c3d9e184
+Revises: b5e2d9c4f718
+Create Date: 2026-10-17 05:20:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a7c3d9e184"
+down_revision: Union[str, None] = "b5e2d9c4f718"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ("organizations", "users", "jobs", "applications")
+
+
+def upgrade() -> None:
+    # NOTE: supports reading the rows updated since a watermark - e.g. incremental snapshots, or the
+    # in-process read models catching up.
+    for table in TABLES:
+        op.create_index(f"ix_{table}_updated", table, ["updated"], unique=False)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_updated", table_name=table)
@@ -0,0 +1,126 @@
+"""
+Benchmark of the bulk import CLI (`python -m src.jobs.cli import`): jobs and users from a file.
+
+It writes a CSV of 1M jobs (by default) and an NDJSON file of 10k users - drawn from the synthetic corpus - imports
+both into the configured database, and reports rows/s. Users are far slower than jobs: every password is hashed,
+at the configured cost, on the hashing pool.
+
+The imported rows (and the scratch organization) are deleted afterwards.
+
+Example:
+    ENV_FILE=src/jobs/settings/.env.development python -m benchmarks.bulk_import 1000000 10000
+"""
+
+import asyncio
+import csv
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import make_job
+from src.jobs.cli import import_file
+from src.jobs.models.async_database import async_engine
+from src.jobs.models.database import Session
+from src.jobs.models.job import Job
+from src.jobs.models.organization import Organization
+from src.jobs.models.user import User
+
+
+JOBS = 1_000_000
+USERS = 10_000
+CHUNK_SIZE = 5_000
+
+PASSWORD = "jqM.[+D;]TK*&q*jHG<JC]yAu1Evtv6K"
+
+
+def write_jobs(path: Path, size: int) -> None:
+    rand = random.Random(0)
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(
+            file, fieldnames=["title", "salary", "mode", "contract", "description"]
+        )
+        writer.writeheader()
+        for _ in range(size):
+            job = make_job(rand)
+            writer.writerow(
+                {
+                    **job,
+                    "mode": job["mode"].value,
+                    "contract": job["contract"].value,
+                }
+            )
+
+
+def write_users(path: Path, size: int) -> None:
+    with open(path, "w") as file:
+        for index in range(size):
+            file.write(
+                json.dumps(
+                    {
+                        "username": f"a-benchmark-user-{index}@server.io",
+                        "name": f"a-benchmark-user-{index}",
+                        "password": PASSWORD,
+                    }
+                )
+                + "\n"
+            )
+
+
+async def report(entity: str, path: Path, **kwargs) -> None:
+    start = time.perf_counter()
+    checkpoint = await import_file(
+        entity=entity,
+        path=str(path),
+        format="csv" if path.suffix == ".csv" else "ndjson",
+        chunk_size=CHUNK_SIZE,
+        checkpoint_path=f"{path}.checkpoint",
+        rejects_path=f"{path}.rejects.ndjson",
+        **kwargs,
+    )
+    seconds = time.perf_counter() - start
+
+    print(
+        f"{entity:<8} {checkpoint.imported:>12,} imported {checkpoint.rejected:>8,} rejected "
+        f"{checkpoint.rows / seconds:>12,.0f} rows/s {seconds:>10.1f} s"
+    )
+
+
+async def run(directory: Path, organization_id, jobs: int, users: int) -> None:
+    try:
+        write_jobs(directory / "jobs.csv", jobs)
+        write_users(directory / "users.ndjson", users)
+
+        await report("jobs", directory / "jobs.csv", organization_id=organization_id)
+        await report("users", directory / "users.ndjson")
+    finally:
+        await async_engine.dispose()
+
+
+def main() -> None:
+    jobs = int(sys.argv[1]) if len(sys.argv) > 1 else JOBS
+    users = int(sys.argv[2]) if len(sys.argv) > 2 else USERS
+
+    with Session() as session:
+        organization = Organization(name="a-benchmark-organization", password=PASSWORD)
+        session.add(organization)
+        session.commit()
+        organization_id = organization.id
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            asyncio.run(run(Path(directory), organization_id, jobs, users))
+    finally:
+        with Session() as session:
+            session.query(Job).filter_by(organization_id=organization_id).delete()
+            session.query(Organization).filter_by(id=organization_id).delete()
+            session.query(User).filter(
+                User.username.like("a-benchmark-user-%@server.io")
+            ).delete(synchronize_session=False)
+            session.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+A synthetic corpus of jobs - shared by the search benchmarks.
+
+Titles combine a seniority, a skill and a role; descriptions are drawn from a vocabulary with Zipf-like
+frequencies (i.e. a few words are very common, most are rare) - roughly like real postings. The corpus is
+deterministic for a given seed.
+
+Example:
+    jobs = make_jobs(random.Random(0), 1_000)
+"""
+
+import itertools
+import random
+
+from src.jobs.utils.job import JobContract, JobMode
+
+
+SENIORITIES = ("junior", "senior", "staff", "principal", "lead", "intern")
+ROLES = (
+    "developer",
+    "engineer",
+    "designer",
+    "analyst",
+    "manager",
+    "scientist",
+    "administrator",
+    "architect",
+    "consultant",
+    "accountant",
+)
+SKILLS = (
+    "python",
+    "java",
+    "golang",
+    "rust",
+    "frontend",
+    "backend",
+    "data",
+    "cloud",
+    "security",
+    "mobile",
+    "database",
+    "network",
+    "product",
+    "marketing",
+    "finance",
+)
+WORDS = SKILLS + (
+    "team",
+    "experience",
+    "remote",
+    "office",
+    "benefits",
+    "growth",
+    "customers",
+    "platform",
+    "scale",
+    "startup",
+    "enterprise",
+    "agile",
+    "kubernetes",
+    "postgres",
+    "mariadb",
+    "react",
+    "django",
+    "fastapi",
+    "terraform",
+    "linux",
+    "payments",
+    "healthcare",
+    "logistics",
+    "retail",
+    "insurance",
+    "analytics",
+    "machine",
+    "learning",
+    "compliance",
+    "mentoring",
+)
+# NOTE: Zipf-like - i.e. the k-th word is 1/k as frequent as the first one.
+WEIGHTS = tuple(itertools.accumulate(1 / rank for rank in range(1, len(WORDS) + 1)))
+
+
+def make_job(rand: random.Random) -> dict:
+    """
+    Makes a job - i.e. the keyword arguments of `JobService.create`, bar the organization.
+
+    Parameters:
+        rand (random.Random): The source of randomness.
+
+    Returns:
+        dict: The job.
+    """
+    skill = rand.choice(SKILLS)
+    return {
+        "title": f"{rand.choice(SENIORITIES)} {skill} {rand.choice(ROLES)}",
+        "description": " ".join(
+            [skill] + rand.choices(WORDS, cum_weights=WEIGHTS, k=rand.randint(20, 120))
+        ),
+        "salary": float(rand.randrange(20_000, 200_000, 1_000)),
+        "mode": rand.choice(list(JobMode)),
+        "contract": rand.choice(list(JobContract)),
+    }
+
+
+def make_jobs(rand: random.Random, size: int) -> list[dict]:
+    """
+    Makes jobs.
+
+    Parameters:
+        rand (random.Random): The source of randomness.
+        size (int): The number of jobs.
+
+    Returns:
+        list[dict]: The jobs.
+    """
+    return [make_job(rand) for _ in range(size)]
@@ -0,0 +1,130 @@
+"""
+Benchmark of the entity cache: database queries per authentication request, with and without caching.
+
+It authenticates an organization and a user (`POST /api/v1/{organizations,users}/auth`) repeatedly against the
+configured database and reports the queries issued per request and requests/s, with:
+    - no cache: every request looks the principal up in the database.
+    - local: the in-process LRU - only the first request looks the principal up.
+    - shared: every request lands on a "cold" worker (i.e. an empty local tier), served from the shared tier
+      (`LocalSharedCacheBackend`, standing in for Redis).
+
+Password hashes are never cached, so every request still reads one from the database - i.e. one query per
+request either way: caching saves the lookup by name (and its index scan), not the round trip. Verifying the
+password dominates the latency - lower `password_pbkdf2_sha256_rounds` to see the lookups'.
+
+Example:
+    ENV_FILE=src/jobs/settings/.env.development python -m benchmarks.entity_cache 200
+"""
+
+import sys
+import time
+from collections.abc import Callable
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from src.jobs.endpoints.app import app
+from src.jobs.models.async_database import async_engine
+from src.jobs.models.database import Session
+from src.jobs.models.organization import Organization
+from src.jobs.models.user import User
+from src.jobs.utils.cache import ENTITY_CACHE, LocalSharedCacheBackend
+
+
+REQUESTS = 200
+
+PASSWORD = "jqM.[+D;]TK*&q*jHG<JC]yAu1Evtv6K"
+
+
+def run(
+    client: TestClient,
+    resource: str,
+    username: str,
+    before: Callable[[], None],
+    requests: int,
+) -> tuple[float, float]:
+    statements = []
+
+    def record(connection, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        start = time.perf_counter()
+        for _ in range(requests):
+            before()
+            response = client.post(
+                resource, data={"username": username, "password": PASSWORD}
+            )
+            assert response.status_code == 200, response.text
+        seconds = time.perf_counter() - start
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+    return len(statements) / requests, requests / seconds
+
+
+def report(
+    client: TestClient, name: str, resource: str, username: str, requests: int
+) -> None:
+    max_size = ENTITY_CACHE.max_size
+    variants = {
+        "no cache": (0, None, lambda: None),
+        "local": (max_size, None, lambda: None),
+        "shared": (max_size, LocalSharedCacheBackend(), ENTITY_CACHE.clear),
+    }
+    for variant, (size, backend, before) in variants.items():
+        ENTITY_CACHE.max_size, ENTITY_CACHE.backend = size, backend
+        ENTITY_CACHE.clear()
+        queries, rate = run(client, resource, username, before, requests)
+        print(
+            f"{name:<14} {variant:<10} {queries:>8.2f} queries/request {rate:>10,.0f} requests/s"
+        )
+
+    ENTITY_CACHE.max_size, ENTITY_CACHE.backend = max_size, None
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else REQUESTS
+
+    with Session() as session:
+        session.add(Organization(name="a-benchmark-organization", password=PASSWORD))
+        session.add(
+            User(
+                name="a-benchmark-user",
+                username="a-benchmark-user@server.io",
+                password=PASSWORD,
+            )
+        )
+        session.commit()
+
+    try:
+        with TestClient(app) as client:
+            report(
+                client,
+                "organization",
+                "/api/v1/organizations/auth",
+                "a-benchmark-organization",
+                requests,
+            )
+            report(
+                client,
+                "user",
+                "/api/v1/users/auth",
+                "a-benchmark-user@server.io",
+                requests,
+            )
+    finally:
+        with Session() as session:
+            session.query(Organization).filter_by(
+                name="a-benchmark-organization"
+            ).delete()
+            session.query(User).filter_by(
+                username="a-benchmark-user@server.io"
+            ).delete()
+            session.commit()
+        ENTITY_CACHE.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Benchmark of insert throughput before and after the index audit (revision 8e41b7c9d305).
+
+It creates scratch copies of the `jobs` and `applications` tables in the configured database - one with
+the indexes they had before the audit, one with the indexes they have after it - inserts the same rows into
+each (one by one, then in batches) and reports rows/s. The scratch tables are dropped afterwards.
+
+Example:
+    ENV_FILE=src/jobs/settings/.env.development python -m benchmarks.index_audit 10000
+"""
+
+import sys
+import time
+import uuid
+from collections.abc import Callable
+
+from sqlalchemy import Column, Index, MetaData, Table, insert
+
+from src.jobs.models.application import Application
+from src.jobs.models.base import utcnow
+from src.jobs.models.database import engine
+from src.jobs.models.job import Job
+from src.jobs.utils.application import ApplicationState
+from src.jobs.utils.job import JobContract, JobMode, JobState
+
+
+ROWS = 100_000
+BATCH_SIZE = 1_000
+
+# NOTE: (columns, unique) for each index - the foreign key indexes are the ones MySQL/MariaDB create implicitly.
+INDEXES = {
+    "jobs": {
+        "before": [
+            (["id"], True),
+            (["title"], False),
+            (["state"], False),
+            (["salary"], False),
+            (["mode"], False),
+            (["contract"], False),
+            (["organization_id", "created", "id"], False),
+        ],
+        "after": [
+            (["title"], False),
+            (["salary"], False),
+            (["organization_id", "created", "id"], False),
+            (["organization_id", "state", "created"], False),
+        ],
+    },
+    "applications": {
+        "before": [
+            (["id"], True),
+            (["state"], False),
+            (["job_id"], False),
+            (["user_id"], False),
+        ],
+        "after": [
+            (["job_id", "state"], False),
+            (["user_id", "created"], False),
+        ],
+    },
+}
+
+
+def make_table(metadata: MetaData, source: Table, name: str, indexes: list) -> Table:
+    table = Table(
+        name,
+        metadata,
+        *(
+            Column(
+                column.name,
+                column.type,
+                primary_key=column.primary_key,
+                nullable=column.nullable,
+            )
+            for column in source.columns
+        ),
+    )
+    for number, (columns, unique) in enumerate(indexes):
+        Index(
+            f"ix_{name}_{number}",
+            *(table.c[column] for column in columns),
+            unique=unique,
+        )
+
+    return table
+
+
+def make_job() -> dict:
+    now = utcnow()
+    return {
+        "id": uuid.uuid4(),
+        "title": "a-job",
+        "state": JobState.DRAFT,
+        "salary": float(100000),
+        "mode": JobMode.ON_SITE,
+        "contract": JobContract.FULL_TIME,
+        "organization_id": uuid.uuid4(),
+        "created": now,
+        "updated": now,
+    }
+
+
+def make_application() -> dict:
+    now = utcnow()
+    return {
+        "id": uuid.uuid4(),
+        "state": ApplicationState.DRAFT,
+        "job_id": uuid.uuid4(),
+        "user_id": uuid.uuid4(),
+        "created": now,
+        "updated": now,
+    }
+
+
+def insert_one_by_one(table: Table, rows: list[dict]) -> None:
+    with engine.connect() as connection:
+        for row in rows:
+            connection.execute(insert(table), row)
+            connection.commit()
+
+
+def insert_in_batches(table: Table, rows: list[dict]) -> None:
+    with engine.connect() as connection:
+        for start in range(0, len(rows), BATCH_SIZE):
+            connection.execute(insert(table), rows[start : start + BATCH_SIZE])
+            connection.commit()
+
+
+def report(name: str, size: int, run: Callable[[], None]) -> None:
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+
+    print(f"{name:<40} {size:>8,} rows {size / seconds:>12,.0f} rows/s")
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+
+    metadata = MetaData()
+    sources = {
+        "jobs": (Job.__table__, make_job),
+        "applications": (Application.__table__, make_application),
+    }
+    tables = {
+        (table_name, version): make_table(
+            metadata,
+            sources[table_name][0],
+            f"benchmark_{table_name}_{version}",
+            indexes,
+        )
+        for table_name, versions in INDEXES.items()
+        for version, indexes in versions.items()
+    }
+
+    metadata.create_all(engine)
+    try:
+        for (table_name, version), table in tables.items():
+            make_row = sources[table_name][1]
+            rows = [make_row() for _ in range(size // 10)]
+            # NOTE: a tenth of the rows - i.e. one by one is much slower.
+            report(
+                f"{table_name} ({version}) one by one",
+                len(rows),
+                lambda: insert_one_by_one(table, rows),
+            )
+            rows = [make_row() for _ in range(size)]
+            report(
+                f"{table_name} ({version}) in batches",
+                len(rows),
+                lambda: insert_in_batches(table, rows),
+            )
+    finally:
+        metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark of posting jobs: one request per job against batches (`jobs:batchCreate`).
+
+It posts the same number of jobs - 10, 1k and 100k by default - through both endpoints, against the
+configured database, and reports rows/s. Batches are at most `Settings.job_batch_max_size` jobs each.
+
+Posting 100k jobs one by one takes a while: sizes can be given as arguments instead.
+
+Example:
+    ENV_FILE=src/jobs/settings/.env.development python -m benchmarks.job_batch_create 10 1000
+"""
+
+import sys
+import time
+from collections.abc import Callable
+
+from fastapi.testclient import TestClient
+
+from src.jobs.endpoints.app import app
+from src.jobs.models.database import Session
+from src.jobs.models.job import Job
+from src.jobs.models.organization import Organization
+from src.jobs.settings.base import get_settings
+from src.jobs.utils.auth import PrincipalType, create_jwt_token
+from src.jobs.utils.job import JobContract, JobMode
+
+
+SIZES = (10, 1_000, 100_000)
+
+PASSWORD = "jqM.[+D;]TK*&q*jHG<JC]yAu1Evtv6K"
+
+
+def make_job(index: int) -> dict:
+    return {
+        "title": f"a-job-{index}",
+        "salary": float(100000),
+        "mode": JobMode.ON_SITE.value,
+        "contract": JobContract.FULL_TIME.value,
+    }
+
+
+def post_one_by_one(client: TestClient, resource: str, size: int) -> None:
+    for index in range(size):
+        response = client.post(resource, json=make_job(index))
+        assert response.status_code == 201, response.text
+
+
+def post_in_batches(client: TestClient, resource: str, size: int) -> None:
+    batch_size = get_settings().job_batch_max_size
+    for start in range(0, size, batch_size):
+        response = client.post(
+            f"{resource}:batchCreate",
+            json={
+                "jobs": [
+                    make_job(index)
+                    for index in range(start, min(start + batch_size, size))
+                ]
+            },
+        )
+        assert response.status_code == 200, response.text
+
+
+def report(name: str, size: int, post: Callable[[], None]) -> None:
+    start = time.perf_counter()
+    post()
+    seconds = time.perf_counter() - start
+
+    print(f"{name:<16} {size:>8,} jobs {size / seconds:>12,.0f} rows/s")
+
+
+def main() -> None:
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+
+    with Session() as session:
+        organization = Organization(name="a-benchmark-organization", password=PASSWORD)
+        session.add(organization)
+        session.commit()
+        organization_id = organization.id
+
+    token = create_jwt_token(
+        "a-benchmark-organization", organization_id, PrincipalType.ORGANIZATION
+    )
+    resource = f"/api/v1/organizations/{organization_id}/jobs"
+
+    try:
+        with TestClient(app, headers={"Authorization": f"Bearer {token}"}) as client:
+            for size in sizes:
+                report(
+                    "one by one",
+                    size,
+                    lambda: post_one_by_one(client, resource, size),
+                )
+                report(
+                    "batchCreate",
+                    size,
+                    lambda: post_in_batches(client, resource, size),
+                )
+    finally:
+        with Session() as session:
+            session.query(Job).filter_by(organization_id=organization_id).delete()
+            session.query(Organization).filter_by(id=organization_id).delete()
+            session.commit()
+
+
+if __name__ == "__main__":
+    main()
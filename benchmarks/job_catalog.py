@@ -0,0 +1,203 @@
+"""
+Benchmark of browsing jobs: the in-process catalog (`JobCatalog`) against the equivalent SQL query.
+
+For each size - 1M and 10M jobs by default - it creates a scratch copy of the `jobs` table (with its indexes, bar
+the FULLTEXT one) in the configured database, inserts the jobs into it and into a catalog, in batches, and reports
+the p50/p99 latency of the same filter+sort queries - as catalog queries and as SQL queries (i.e. only fetching the
+IDs, which is all the catalog returns). The scratch table is dropped afterwards.
+
+Example:
+    ENV_FILE=src/jobs/settings/.env.development python -m benchmarks.job_catalog 1000000 10000000
+"""
+
+import random
+import statistics
+import sys
+import time
+from collections import namedtuple
+from datetime import timedelta
+
+from sqlalchemy import Column, Index, MetaData, Table, insert, select
+
+from src.jobs.models.base import utcnow
+from src.jobs.models.database import engine
+from src.jobs.models.job import Job
+from src.jobs.utils.catalog import JobCatalog
+from src.jobs.utils.identifier import uuid7
+from src.jobs.utils.job import JobContract, JobMode, JobState
+
+
+SIZES = (1_000_000, 10_000_000)
+BATCH_SIZE = 10_000
+ORGANIZATIONS = 1_000
+QUERIES_PER_KIND = 100
+LIMIT = 20
+
+Row = namedtuple(
+    "Row",
+    [
+        "id",
+        "title",
+        "salary",
+        "mode",
+        "contract",
+        "state",
+        "organization_id",
+        "created",
+        "updated",
+    ],
+)
+
+
+def make_table(metadata: MetaData, name: str) -> Table:
+    table = Table(
+        name,
+        metadata,
+        *(
+            Column(
+                column.name,
+                column.type,
+                primary_key=column.primary_key,
+                nullable=column.nullable,
+            )
+            for column in Job.__table__.columns
+        ),
+    )
+    for index in Job.__table__.indexes:
+        if index.dialect_options["mysql"]["prefix"] is None:
+            Index(
+                f"{index.name}_{name}",
+                *(table.c[column.name] for column in index.columns),
+            )
+
+    return table
+
+
+def make_rows(size: int, organizations: list) -> list[Row]:
+    now = utcnow()
+    return [
+        Row(
+            id=uuid7(),
+            title="a-job",
+            salary=float(random.randrange(20_000, 200_000, 1_000)),
+            mode=random.choice(list(JobMode)),
+            contract=random.choice(list(JobContract)),
+            state=random.choice(list(JobState)),
+            organization_id=random.choice(organizations),
+            created=now - timedelta(seconds=random.randrange(365 * 24 * 3600)),
+            updated=now,
+        )
+        for _ in range(size)
+    ]
+
+
+def seed(table: Table, catalog: JobCatalog, size: int, organizations: list) -> None:
+    seconds = 0.0
+    with engine.connect() as connection:
+        for start in range(0, size, BATCH_SIZE):
+            rows = make_rows(min(BATCH_SIZE, size - start), organizations)
+            connection.execute(insert(table), [row._asdict() for row in rows])
+            connection.commit()
+
+            started = time.perf_counter()
+            catalog.add_many(rows)
+            seconds += time.perf_counter() - started
+
+    print(
+        f"catalog {size:>12,} jobs built in {seconds:>8.2f} s ({size / seconds:>12,.0f} jobs/s)"
+    )
+
+
+def make_queries(organizations: list) -> dict[str, list[dict]]:
+    return {
+        "mode and salary": [
+            {
+                "mode": random.choice(list(JobMode)),
+                "min_salary": random.randrange(100_000, 190_000, 1_000),
+            }
+            for _ in range(QUERIES_PER_KIND)
+        ],
+        "organization and state": [
+            {
+                "organization_id": random.choice(organizations),
+                "state": random.choice(list(JobState)),
+            }
+            for _ in range(QUERIES_PER_KIND)
+        ],
+        "contract and salary range (by salary)": [
+            {
+                "contract": random.choice(list(JobContract)),
+                "min_salary": float(salary),
+                "max_salary": float(salary + 20_000),
+                "order_by": "salary",
+            }
+            for salary in random.choices(
+                range(20_000, 180_000, 1_000), k=QUERIES_PER_KIND
+            )
+        ],
+        "nothing": [{} for _ in range(QUERIES_PER_KIND)],
+    }
+
+
+def query_sql(connection, table: Table, order_by: str = "created", **filters) -> list:
+    query = select(table.c.id)
+    for name in ("organization_id", "mode", "contract", "state"):
+        if name in filters:
+            query = query.where(table.c[name] == filters[name])
+    if "min_salary" in filters:
+        query = query.where(table.c.salary >= filters["min_salary"])
+    if "max_salary" in filters:
+        query = query.where(table.c.salary <= filters["max_salary"])
+
+    return (
+        connection.execute(
+            query.order_by(table.c[order_by].desc(), table.c.id.desc()).limit(LIMIT)
+        )
+        .scalars()
+        .all()
+    )
+
+
+def report(name: str, latencies: list[float]) -> None:
+    print(
+        f"{name:<70} p50 {statistics.median(latencies) * 1e3:>9.2f} ms "
+        f"p99 {statistics.quantiles(latencies, n=100)[98] * 1e3:>9.2f} ms"
+    )
+
+
+def report_queries(table: Table, catalog: JobCatalog, organizations: list) -> None:
+    with engine.connect() as connection:
+        for kind, queries in make_queries(organizations).items():
+            latencies = {"catalog": [], "sql": []}
+            for filters in queries:
+                start = time.perf_counter()
+                catalog.query(limit=LIMIT, **filters)
+                latencies["catalog"].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                query_sql(connection, table, **filters)
+                latencies["sql"].append(time.perf_counter() - start)
+
+            for source, values in latencies.items():
+                report(f"{len(catalog):>12,} jobs by {kind} ({source})", values)
+
+
+def main() -> None:
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+
+    for size in sizes:
+        organizations = [uuid7() for _ in range(ORGANIZATIONS)]
+        metadata = MetaData()
+        table = make_table(metadata, "benchmark_jobs_catalog")
+        catalog = JobCatalog()
+
+        metadata.create_all(engine)
+        try:
+            seed(table, catalog, size, organizations)
+            report_queries(table, catalog, organizations)
+        finally:
+            metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
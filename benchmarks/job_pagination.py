@@ -0,0 +1,97 @@
+"""
+Benchmark of listing an organization's jobs: latency per page, from the first page to the last.
+
+It seeds an organization with `pages * limit` jobs - 10,000 pages of 20 by default - against the configured
+database, walks through all of them (following `next_cursor`) and reports the p50/p99 latency of each tenth of
+the pages. With keyset pagination, the deepest pages should be as fast as the first ones.
+
+Example:
+    ENV_FILE=src/jobs/settings/.env.development python -m benchmarks.job_pagination 10000 20
+"""
+
+import statistics
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+from src.jobs.endpoints.app import app
+from src.jobs.models.database import Session
+from src.jobs.models.job import Job
+from src.jobs.models.organization import Organization
+from src.jobs.services.job import JobService
+from src.jobs.utils.job import JobContract, JobMode
+
+
+PAGES = 10_000
+LIMIT = 20
+BATCH_SIZE = 1_000
+
+PASSWORD = "jqM.[+D;]TK*&q*jHG<JC]yAu1Evtv6K"
+
+
+def seed(size: int) -> Organization:
+    with Session() as session:
+        organization = Organization(name="a-benchmark-organization", password=PASSWORD)
+        session.add(organization)
+        session.commit()
+
+        for start in range(0, size, BATCH_SIZE):
+            JobService(session=session).create_many(
+                organization_id=organization.id,
+                jobs=[
+                    {
+                        "title": f"a-job-{index}",
+                        "salary": float(100000),
+                        "mode": JobMode.ON_SITE,
+                        "contract": JobContract.FULL_TIME,
+                    }
+                    for index in range(start, min(start + BATCH_SIZE, size))
+                ],
+            )
+
+        return organization
+
+
+def walk(client: TestClient, resource: str, limit: int) -> list[float]:
+    latencies = []
+    params = {"limit": limit}
+    while True:
+        start = time.perf_counter()
+        response = client.get(resource, params=params)
+        latencies.append(time.perf_counter() - start)
+
+        assert response.status_code == 200, response.text
+        if response.json()["next_cursor"] is None:
+            return latencies
+        params["cursor"] = response.json()["next_cursor"]
+
+
+def report(latencies: list[float]) -> None:
+    step = max(len(latencies) // 10, 1)
+    for start in range(0, len(latencies), step):
+        bucket = latencies[start : start + step]
+        p50 = statistics.median(bucket)
+        p99 = statistics.quantiles(bucket, n=100)[98] if len(bucket) > 1 else p50
+        print(
+            f"pages {start + 1:>6,}-{start + len(bucket):<6,} p50 {p50 * 1e3:>7.2f} ms  p99 {p99 * 1e3:>7.2f} ms"
+        )
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else PAGES
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else LIMIT
+
+    organization = seed(pages * limit)
+    try:
+        with TestClient(app) as client:
+            report(walk(client, f"/api/v1/organizations/{organization.id}/jobs", limit))
+    finally:
+        with Session() as session:
+            session.query(Job).filter_by(organization_id=organization.id).delete()
+            session.query(Organization).filter_by(id=organization.id).delete()
+            session.commit()
+
+
+if __name__ == "__main__":
+    main()
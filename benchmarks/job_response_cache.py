@@ -0,0 +1,107 @@
+"""
+Benchmark of the job detail response cache: requests/s (and database queries per request) of `GET /api/v1/jobs/{id}`
+on a hot job, with and without caching.
+
+It retrieves a job repeatedly against the configured database, with:
+    - no cache: every request loads (a single query), validates and encodes the job.
+    - entities: the entity cache serves the job - only validation and encoding remain.
+    - responses: the entity cache serves the version and the response cache the encoded job - i.e. no ORM,
+      validation nor encoding.
+
+Example:
+    ENV_FILE=src/jobs/settings/.env.development python -m benchmarks.job_response_cache 2000
+"""
+
+import sys
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from src.jobs.endpoints.app import app
+from src.jobs.models.async_database import async_engine
+from src.jobs.models.database import Session
+from src.jobs.models.job import Job
+from src.jobs.models.organization import Organization
+from src.jobs.services.job import JobService
+from src.jobs.utils.cache import ENTITY_CACHE, JOB_RESPONSE_CACHE
+from src.jobs.utils.job import JobContract, JobMode
+
+
+REQUESTS = 2_000
+
+PASSWORD = "jqM.[+D;]TK*&q*jHG<JC]yAu1Evtv6K"
+
+
+def run(client: TestClient, resource: str, requests: int) -> tuple[float, float]:
+    statements = []
+
+    def record(connection, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        start = time.perf_counter()
+        for _ in range(requests):
+            response = client.get(resource)
+            assert response.status_code == 200, response.text
+        seconds = time.perf_counter() - start
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+    return len(statements) / requests, requests / seconds
+
+
+def report(client: TestClient, resource: str, requests: int) -> None:
+    max_size, max_bytes = ENTITY_CACHE.max_size, JOB_RESPONSE_CACHE.max_bytes
+    variants = {
+        "no cache": (0, 0),
+        "entities": (max_size, 0),
+        "responses": (max_size, max_bytes),
+    }
+    for variant, (size, size_bytes) in variants.items():
+        ENTITY_CACHE.max_size, JOB_RESPONSE_CACHE.max_bytes = size, size_bytes
+        ENTITY_CACHE.clear()
+        JOB_RESPONSE_CACHE.clear()
+        queries, rate = run(client, resource, requests)
+        print(
+            f"{variant:<10} {queries:>8.2f} queries/request {rate:>10,.0f} requests/s"
+        )
+
+    ENTITY_CACHE.max_size, JOB_RESPONSE_CACHE.max_bytes = max_size, max_bytes
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else REQUESTS
+
+    with Session() as session:
+        session.add(Organization(name="a-benchmark-organization", password=PASSWORD))
+        session.commit()
+        an_organization = (
+            session.query(Organization).filter_by(name="a-benchmark-organization").one()
+        )
+        a_job = JobService(session=session).create(
+            organization_id=an_organization.id,
+            title="a-benchmark-job",
+            salary=float(100000),
+            mode=JobMode.REMOTE,
+            contract=JobContract.FULL_TIME,
+            description="a viral posting " * 100,
+        )
+
+    try:
+        with TestClient(app) as client:
+            report(client, f"/api/v1/jobs/{a_job.id}", requests)
+    finally:
+        with Session() as session:
+            session.query(Job).filter_by(id=a_job.id).delete()
+            session.query(Organization).filter_by(
+                name="a-benchmark-organization"
+            ).delete()
+            session.commit()
+        ENTITY_CACHE.clear()
+        JOB_RESPONSE_CACHE.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Benchmark of searching jobs (`GET /api/v1/jobs?q=...`), and of what the FULLTEXT index costs `JobService.create`.
+
+It seeds an organization with a synthetic corpus (see `benchmarks.corpus`) of 1M jobs by default, against the
+configured database, and reports the p50/p99 latency of searches - with and without filters.
+
+It then creates two scratch copies of the `jobs` table - with and without the `(title, description)` FULLTEXT
+index - inserts the same jobs into each one by one (i.e. one INSERT and one commit per job, as
+`JobService.create` does) and reports rows/s. It fails if the index slows inserts down by more than
+`INSERT_BUDGET`. The jobs and the scratch tables are deleted afterwards.
+
+Example:
+    ENV_FILE=src/jobs/settings/.env.development python -m benchmarks.job_search 1000000 10000
+"""
+
+import random
+import statistics
+import sys
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Index, MetaData, Table, insert
+
+from benchmarks.corpus import make_jobs
+from src.jobs.endpoints.app import app
+from src.jobs.models.base import utcnow
+from src.jobs.models.database import Session, engine
+from src.jobs.models.job import Job
+from src.jobs.models.organization import Organization
+from src.jobs.services.job import JobService
+from src.jobs.utils.identifier import uuid7
+from src.jobs.utils.job import JobMode, JobState
+
+
+JOBS = 1_000_000
+INSERTS = 10_000
+BATCH_SIZE = 1_000
+SEARCHES = 200
+# NOTE: the agreed budget - i.e. how much slower `JobService.create` may get because of the FULLTEXT index.
+INSERT_BUDGET = 0.10
+
+PASSWORD = "jqM.[+D;]TK*&q*jHG<JC]yAu1Evtv6K"
+
+QUERIES = {
+    "a common word": {"q": "python"},
+    "a rare word": {"q": "compliance"},
+    "a title": {"q": "senior python developer"},
+    "a title (filtered)": {
+        "q": "senior python developer",
+        "mode": JobMode.REMOTE.value,
+        "min_salary": 100_000,
+    },
+}
+
+
+def seed(size: int) -> Organization:
+    rand = random.Random(0)
+    with Session() as session:
+        organization = Organization(name="a-benchmark-organization", password=PASSWORD)
+        session.add(organization)
+        session.commit()
+
+        for start in range(0, size, BATCH_SIZE):
+            JobService(session=session).create_many(
+                organization_id=organization.id,
+                jobs=make_jobs(rand, min(BATCH_SIZE, size - start)),
+            )
+
+        return organization
+
+
+def report_searches(client: TestClient) -> None:
+    for name, params in QUERIES.items():
+        latencies = []
+        for _ in range(SEARCHES):
+            start = time.perf_counter()
+            response = client.get("/api/v1/jobs", params=params)
+            latencies.append(time.perf_counter() - start)
+
+            assert response.status_code == 200, response.text
+
+        print(
+            f"search by {name:<24} p50 {statistics.median(latencies) * 1e3:>8.2f} ms "
+            f"p99 {statistics.quantiles(latencies, n=100)[98] * 1e3:>8.2f} ms"
+        )
+
+
+def make_table(metadata: MetaData, name: str, fulltext: bool) -> Table:
+    table = Table(
+        name,
+        metadata,
+        *(
+            Column(
+                column.name,
+                column.type,
+                primary_key=column.primary_key,
+                nullable=column.nullable,
+            )
+            for column in Job.__table__.columns
+        ),
+    )
+    if fulltext:
+        Index(
+            f"ix_{name}_title_description",
+            table.c.title,
+            table.c.description,
+            mysql_prefix="FULLTEXT",
+        )
+
+    return table
+
+
+def insert_one_by_one(table: Table, rows: list[dict]) -> float:
+    start = time.perf_counter()
+    with engine.connect() as connection:
+        for row in rows:
+            connection.execute(insert(table), row)
+            connection.commit()
+    seconds = time.perf_counter() - start
+
+    print(f"{table.name:<40} {len(rows):>8,} rows {len(rows) / seconds:>12,.0f} rows/s")
+    return seconds
+
+
+def report_inserts(size: int) -> bool:
+    organization_id = uuid7()
+    rows = []
+    for job in make_jobs(random.Random(1), size):
+        now = utcnow()
+        rows.append(
+            {
+                **job,
+                "id": uuid7(),
+                "state": JobState.DRAFT,
+                "organization_id": organization_id,
+                "created": now,
+                "updated": now,
+            }
+        )
+
+    metadata = MetaData()
+    without_index = make_table(metadata, "benchmark_jobs_without_fulltext", False)
+    with_index = make_table(metadata, "benchmark_jobs_with_fulltext", True)
+
+    metadata.create_all(engine)
+    try:
+        overhead = (
+            insert_one_by_one(with_index, rows) / insert_one_by_one(without_index, rows)
+            - 1
+        )
+    finally:
+        metadata.drop_all(engine)
+
+    print(f"FULLTEXT insert overhead {overhead:>8.1%} (budget {INSERT_BUDGET:.0%})")
+    return overhead <= INSERT_BUDGET
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else JOBS
+    inserts = int(sys.argv[2]) if len(sys.argv) > 2 else INSERTS
+
+    organization = seed(size)
+    try:
+        with TestClient(app) as client:
+            report_searches(client)
+    finally:
+        with Session() as session:
+            session.query(Job).filter_by(organization_id=organization.id).delete()
+            session.query(Organization).filter_by(id=organization.id).delete()
+            session.commit()
+
+    if not report_inserts(inserts):
+        sys.exit("The FULLTEXT index slows inserts down by more than the budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Micro-benchmark of the JWT hot path: decoding (and verifying) a bearer token.
+
+It compares the cold path - i.e. reading the settings and verifying the token's signature on every call,
+as it used to be - against the cached one (`get_settings` and `TOKEN_CACHE`).
+
+Example:
+    ENV_FILE=src/jobs/settings/.env.development python -m benchmarks.jwt_decode
+"""
+
+import timeit
+import uuid
+
+import jwt
+
+from src.jobs.settings.base import Settings
+from src.jobs.utils.auth import (
+    TOKEN_CACHE,
+    PrincipalType,
+    create_jwt_token,
+    decode_jwt_token,
+)
+
+
+CALLS = 10_000
+
+
+def decode_cold(token: str) -> dict:
+    """
+    Decode a token the way it used to be decoded - i.e. without any caching.
+    """
+    settings = Settings()
+
+    return jwt.decode(
+        token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
+    )
+
+
+def report(name: str, seconds: float) -> None:
+    print(
+        f"{name:<32} {CALLS / seconds:>12,.0f} decodes/s  {seconds / CALLS * 1e6:>8.1f} us/decode"
+    )
+
+
+def main() -> None:
+    token = create_jwt_token(
+        "an-organization", uuid.uuid4(), PrincipalType.ORGANIZATION
+    )
+
+    report(
+        "cold (settings + verify)",
+        timeit.timeit(lambda: decode_cold(token), number=CALLS),
+    )
+
+    TOKEN_CACHE.clear()
+    report("cached", timeit.timeit(lambda: decode_jwt_token(token), number=CALLS))
+
+    stats = TOKEN_CACHE.stats()
+    print(f"token cache: {stats.hits} hits, {stats.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
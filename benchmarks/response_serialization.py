@@ -0,0 +1,190 @@
+"""
+Micro-benchmark of response serialization: from ORM rows to JSON bytes, per response type.
+
+For each response type it compares:
+    - hand-copied: copying the row's fields into the response model, which FastAPI then dumps, validates again
+      (through the return annotation) and encodes with `json` - as the endpoints used to.
+    - from_attributes: returning the row itself, which the response model validates once (`from_attributes`)
+      before FastAPI encodes it with `json`.
+    - orjson (lists only): building the response model from the rows (`from_attributes`) and encoding it with
+      orjson (`ORJSONResponse`) - i.e. what the large list endpoints do, bypassing FastAPI's response validation.
+
+Rows are transient (i.e. never written to the database) - only serialization is measured.
+
+Example:
+    ENV_FILE=src/jobs/settings/.env.development python -m benchmarks.response_serialization
+"""
+
+import asyncio
+import functools
+import random
+import time
+from collections.abc import Callable
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import BaseModel
+
+from benchmarks.corpus import make_job
+from src.jobs.endpoints.application import Application
+from src.jobs.endpoints.job import (
+    Job,
+    JobBatch,
+    JobBatchResult,
+    JobPage,
+    JobSearchResults,
+)
+from src.jobs.endpoints.organization import Organization
+from src.jobs.endpoints.user import User
+from src.jobs.models import application, job, organization, user
+from src.jobs.utils.application import ApplicationState
+from src.jobs.utils.job import JobState
+from src.jobs.utils.identifier import uuid7
+
+
+CALLS = 2_000
+PAGE_SIZE = 100
+
+NOW = datetime(2024, 6, 17, 12, 0, 0)
+
+
+def make_rows(rand: random.Random) -> dict[str, Any]:
+    an_organization = organization.Organization(
+        id=uuid7(), name="an-organization", created=NOW, updated=NOW
+    )
+    a_user = user.User(
+        id=uuid7(),
+        name="a-user",
+        username="username@server.io",
+        created=NOW,
+        updated=NOW,
+    )
+    jobs = [
+        job.Job(
+            **fields,
+            id=uuid7(),
+            organization_id=an_organization.id,
+            state=JobState.OPEN,
+            created=NOW,
+            updated=NOW,
+        )
+        for fields in (
+            {**make_job(rand), "salary": Decimal(rand.randrange(20_000, 200_000))}
+            for _ in range(PAGE_SIZE)
+        )
+    ]
+    an_application = application.Application(
+        id=uuid7(),
+        job_id=jobs[0].id,
+        user_id=a_user.id,
+        state=ApplicationState.SUBMITTED,
+        created=NOW,
+        updated=NOW,
+    )
+
+    return {
+        "organization": an_organization,
+        "user": a_user,
+        "jobs": jobs,
+        "application": an_application,
+    }
+
+
+def copy(model: type[BaseModel], row: Any) -> BaseModel:
+    """
+    Copy a row's fields into a response model - the way endpoints used to.
+    """
+    return model(**{name: getattr(row, name) for name in model.model_fields})
+
+
+@functools.cache
+def get_response_field(model: type[BaseModel]):
+    return create_response_field(name="response", type_=model)
+
+
+async def render(model: type[BaseModel], content: Any) -> bytes:
+    """
+    Serialize a response the way FastAPI does for a `response_model` - i.e. validate, then encode with `json`.
+    """
+    return JSONResponse(
+        await serialize_response(
+            field=get_response_field(model), response_content=content
+        )
+    ).body
+
+
+async def measure(make: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        result = make()
+        if asyncio.iscoroutine(result):
+            await result
+
+    return time.perf_counter() - start
+
+
+def report(name: str, variant: str, seconds: float) -> None:
+    print(
+        f"{name:<18} {variant:<16} {CALLS / seconds:>12,.0f} responses/s {seconds / CALLS * 1e6:>10.1f} us/response"
+    )
+
+
+async def run() -> None:
+    rows = make_rows(random.Random(0))
+    jobs = rows["jobs"]
+
+    singles = {
+        "Organization": (Organization, rows["organization"]),
+        "User": (User, rows["user"]),
+        "Job": (Job, jobs[0]),
+        "Application": (Application, rows["application"]),
+    }
+    for name, (model, row) in singles.items():
+        report(
+            name,
+            "hand-copied",
+            await measure(lambda: render(model, copy(model, row))),
+        )
+        report(name, "from_attributes", await measure(lambda: render(model, row)))
+
+    lists = {
+        f"JobPage[{PAGE_SIZE}]": (
+            JobPage,
+            lambda copied: JobPage(jobs=copied, next_cursor="a-cursor"),
+        ),
+        f"JobSearch[{PAGE_SIZE}]": (
+            JobSearchResults,
+            lambda copied: JobSearchResults(jobs=copied),
+        ),
+        f"JobBatch[{PAGE_SIZE}]": (
+            JobBatch,
+            lambda copied: JobBatch(
+                results=[JobBatchResult(job=job) for job in copied]
+            ),
+        ),
+    }
+    for name, (model, build) in lists.items():
+        report(
+            name,
+            "hand-copied",
+            await measure(
+                lambda: render(model, build([copy(Job, job) for job in jobs]))
+            ),
+        )
+        report(
+            name,
+            "orjson",
+            await measure(lambda: ORJSONResponse(build(jobs).model_dump()).body),
+        )
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark of the in-process search index (`JobSearchIndex`): build time, memory per job and query latency.
+
+It builds an index over a synthetic corpus (see `benchmarks.corpus`) of 1M jobs by default - in memory only,
+i.e. no database is needed - and reports:
+    - build time (jobs/s);
+    - memory per job - traced on a sample of the corpus (tracing slows the build down);
+    - the p50/p99 latency of searches;
+    - snapshot size, and how long snapshotting and restoring take.
+
+Example:
+    python -m benchmarks.search_index 1000000
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+from benchmarks.corpus import make_jobs
+from src.jobs.utils.search import JobSearchIndex
+
+
+JOBS = 1_000_000
+MEMORY_SAMPLE = 100_000
+SEARCHES = 200
+LIMIT = 20
+
+QUERIES = {
+    "a common word": "python",
+    "a rare word": "compliance",
+    "a title": "senior python developer",
+}
+
+
+def build(jobs: list[dict]) -> JobSearchIndex:
+    index = JobSearchIndex()
+    for job in jobs:
+        index.add(uuid.uuid4(), job["title"], job["description"])
+
+    return index
+
+
+def report_build(jobs: list[dict]) -> JobSearchIndex:
+    start = time.perf_counter()
+    index = build(jobs)
+    seconds = time.perf_counter() - start
+
+    print(
+        f"build {len(jobs):>12,} jobs {seconds:>8.2f} s {len(jobs) / seconds:>12,.0f} jobs/s"
+    )
+    return index
+
+
+def report_memory(jobs: list[dict]) -> None:
+    tracemalloc.start()
+    try:
+        index = build(jobs)
+        memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    print(
+        f"memory {len(index):>11,} jobs {memory / 2**20:>8.1f} MiB {memory / len(index):>12,.0f} B/job"
+    )
+
+
+def report_searches(index: JobSearchIndex) -> None:
+    for name, q in QUERIES.items():
+        latencies = []
+        for _ in range(SEARCHES):
+            start = time.perf_counter()
+            index.search(q, limit=LIMIT)
+            latencies.append(time.perf_counter() - start)
+
+        print(
+            f"search by {name:<16} p50 {statistics.median(latencies) * 1e3:>8.2f} ms "
+            f"p99 {statistics.quantiles(latencies, n=100)[98] * 1e3:>8.2f} ms"
+        )
+
+
+def report_snapshot(index: JobSearchIndex) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "index"
+
+        start = time.perf_counter()
+        index.snapshot(path)
+        snapshotted = time.perf_counter() - start
+
+        start = time.perf_counter()
+        JobSearchIndex().restore(path)
+        restored = time.perf_counter() - start
+
+        print(
+            f"snapshot {path.stat().st_size / 2**20:>8.1f} MiB "
+            f"written in {snapshotted:>6.2f} s, restored in {restored:>6.2f} s"
+        )
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else JOBS
+
+    jobs = make_jobs(random.Random(0), size)
+    index = report_build(jobs)
+    report_memory(jobs[:MEMORY_SAMPLE])
+    report_searches(index)
+    report_snapshot(index)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Benchmark of primary keys: random UUIDs stored as `CHAR(32)` against time-ordered UUIDs stored as `BINARY(16)`.
+
+It creates two scratch tables in the configured database - shaped like `jobs` (i.e. a UUID primary key, a
+UUID foreign key and the `(organization_id, created, id)` listing index) - inserts 10M rows (by default) into
+each, in batches, and reports:
+    - insert throughput (rows/s) - per million rows, as the indexes outgrow the buffer pool;
+    - the size of the table and of its indexes (MySQL/MariaDB only);
+    - range scans: by primary key, and by organization and creation (i.e. the listing).
+
+The scratch tables are dropped afterwards.
+
+Example:
+    ENV_FILE=src/jobs/settings/.env.development python -m benchmarks.uuid_keys 10000000
+"""
+
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from datetime import timedelta
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    MetaData,
+    Table,
+    Uuid,
+    func,
+    insert,
+    select,
+    text,
+)
+
+from src.jobs.models.base import utcnow
+from src.jobs.models.database import engine
+from src.jobs.models.types import BinaryUUID
+from src.jobs.utils.identifier import uuid7
+
+
+ROWS = 10_000_000
+BATCH_SIZE = 10_000
+ORGANIZATIONS = 100
+SCANS = 100
+SCAN_SIZE = 1_000
+
+
+def make_table(metadata: MetaData, name: str, type_: object) -> Table:
+    table = Table(
+        name,
+        metadata,
+        Column("id", type_, primary_key=True),
+        Column("organization_id", type_, nullable=False),
+        Column("created", DateTime(timezone=True), nullable=False),
+    )
+    Index(
+        f"ix_{name}_organization_id_created_id",
+        table.c.organization_id,
+        table.c.created,
+        table.c.id,
+    )
+
+    return table
+
+
+def insert_rows(
+    table: Table, size: int, make_id: Callable[[], uuid.UUID], organizations: list
+) -> None:
+    start = checkpoint = time.perf_counter()
+    reported = 0
+    with engine.connect() as connection:
+        for offset in range(0, size, BATCH_SIZE):
+            now = utcnow()
+            rows = [
+                {
+                    "id": make_id(),
+                    "organization_id": random.choice(organizations),
+                    "created": now,
+                }
+                for _ in range(min(BATCH_SIZE, size - offset))
+            ]
+            connection.execute(insert(table), rows)
+            connection.commit()
+
+            inserted = offset + len(rows)
+            if inserted - reported >= 1_000_000 or inserted == size:
+                seconds = time.perf_counter() - checkpoint
+                print(
+                    f"{table.name:<40} {inserted:>12,} rows "
+                    f"{(inserted - reported) / seconds:>12,.0f} rows/s"
+                )
+                checkpoint, reported = time.perf_counter(), inserted
+
+    seconds = time.perf_counter() - start
+    print(f"{table.name:<40} {'total':>12} {size / seconds:>17,.0f} rows/s")
+
+
+def report_size(table: Table) -> None:
+    if engine.dialect.name != "mysql":
+        return
+
+    with engine.connect() as connection:
+        data_length, index_length = connection.execute(
+            text(
+                "SELECT data_length, index_length FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = :name"
+            ),
+            {"name": table.name},
+        ).one()
+
+    print(
+        f"{table.name:<40} data {data_length / 2**20:>10,.1f} MiB  indexes {index_length / 2**20:>10,.1f} MiB"
+    )
+
+
+def report_scans(table: Table, organizations: list) -> None:
+    with engine.connect() as connection:
+        # NOTE: random starting points - i.e. sampled from the whole table.
+        ids = (
+            connection.execute(
+                select(table.c.id).order_by(func.random()).limit(SCANS)
+                if engine.dialect.name != "mysql"
+                else select(table.c.id).order_by(func.rand()).limit(SCANS)
+            )
+            .scalars()
+            .all()
+        )
+
+        latencies = {"primary key": [], "organization and created": []}
+        for an_id in ids:
+            start = time.perf_counter()
+            connection.execute(
+                select(table)
+                .where(table.c.id >= an_id)
+                .order_by(table.c.id)
+                .limit(SCAN_SIZE)
+            ).all()
+            latencies["primary key"].append(time.perf_counter() - start)
+
+        since = utcnow() - timedelta(minutes=1)
+        for _ in range(SCANS):
+            start = time.perf_counter()
+            connection.execute(
+                select(table)
+                .where(
+                    table.c.organization_id == random.choice(organizations),
+                    table.c.created >= since,
+                )
+                .order_by(table.c.created, table.c.id)
+                .limit(SCAN_SIZE)
+            ).all()
+            latencies["organization and created"].append(time.perf_counter() - start)
+
+    for name, values in latencies.items():
+        print(
+            f"{table.name:<40} scan by {name:<26} p50 {statistics.median(values) * 1e3:>8.2f} ms "
+            f"p99 {statistics.quantiles(values, n=100)[98] * 1e3:>8.2f} ms"
+        )
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+
+    metadata = MetaData()
+    tables = [
+        (make_table(metadata, "benchmark_keys_uuid4_char", Uuid()), uuid.uuid4),
+        (make_table(metadata, "benchmark_keys_uuid7_binary", BinaryUUID()), uuid7),
+    ]
+
+    metadata.create_all(engine)
+    try:
+        for table, make_id in tables:
+            organizations = [make_id() for _ in range(ORGANIZATIONS)]
+            insert_rows(table, size, make_id, organizations)
+            report_size(table)
+            report_scans(table, organizations)
+    finally:
+        metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
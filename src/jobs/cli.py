@@ -0,0 +1,509 @@
+"""
+This module defines the command-line interface - i.e. operations that are run against the database directly, rather
+than through the API.
+
+`import` streams jobs (of an organization) or users from a CSV/NDJSON file into the database:
+    - rows are read one at a time and validated with the same schemas as the API's (`JobInput`, `UserInput`);
+    - users' passwords are hashed in parallel - on a pool of worker processes (see `PasswordHashingService`);
+    - rows are written in chunks - a transaction (and a multi-row INSERT) each - and a checkpoint is saved after
+      every chunk, so that an interrupted import resumes where it stopped;
+    - invalid rows (and users whose username is taken) are written - with why, but without passwords - to a
+      reject file (NDJSON);
+    - throughput (rows/s) is logged as chunks are committed.
+
+`snapshot` writes `organizations`, `users`, `jobs` and `applications` - every column but password hashes - to
+Parquet files, partitioned by the date rows were last updated (see `utils.snapshot`), for analytics to run off the
+database:
+    - tables are read through server-side cursors - a batch at a time - in a single transaction (i.e. as of the same
+      point in time);
+    - snapshots are incremental - only the rows updated since the previous snapshot (in the same directory), less
+      `watermark_lag_seconds`, are read through the `updated` indexes - unless `--full` is given.
+
+Example:
+    python -m src.jobs.cli import jobs jobs.csv --organization-id 0190...
+    python -m src.jobs.cli import users users.ndjson --chunk-size 2000
+    python -m src.jobs.cli snapshot snapshots/
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import shutil
+import time
+from collections.abc import Iterable
+from datetime import timedelta
+from itertools import batched
+from pathlib import Path
+from typing import Any, Literal, TextIO
+from uuid import UUID
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import select
+
+from .endpoints.config import setup_logger
+from .endpoints.job import JobInput
+from .endpoints.user import UserInput
+from .models.application import Application
+from .models.async_database import async_engine, async_session_scope
+from .models.base import Abstract, utcnow
+from .models.database import engine
+from .models.job import Job
+from .models.organization import Organization
+from .models.user import User
+from .services.exceptions import ClientError, ConflictError, NotFoundError
+from .services.hashing import PasswordHashingService
+from .services.job import JobService
+from .services.user import UserService
+from .settings.base import get_settings
+from .utils.identifier import uuid7
+from .utils.importer import (
+    ImportCheckpoint,
+    ImportFormat,
+    ImportRow,
+    read_rows,
+)
+from .utils.password import calibrate_crypt_context
+from .utils.snapshot import SnapshotManifest, get_arrow_schema, write_snapshot
+
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+SCHEMAS: dict[str, type[BaseModel]] = {"jobs": JobInput, "users": UserInput}
+
+SNAPSHOT_MODELS: dict[str, type[Abstract]] = {
+    "organizations": Organization,
+    "users": User,
+    "jobs": Job,
+    "applications": Application,
+}
+
+# NOTE: password hashes are never snapshotted.
+SNAPSHOT_EXCLUDED_COLUMNS = {"password"}
+
+
+def reject(rejects: TextIO, row: ImportRow, error: str) -> None:
+    """
+    Write a rejected row - and why - to the reject file. Passwords are left out - i.e. rows are identified by
+    their number.
+
+    Args:
+        rejects (TextIO): The reject file.
+        row (ImportRow): The row.
+        error (str): Why the row is rejected.
+
+    Returns:
+        None
+    """
+    data = (
+        {key: value for key, value in row.data.items() if key != "password"}
+        if isinstance(row.data, dict)
+        else row.data
+    )
+    rejects.write(json.dumps({"row": row.number, "error": error, "data": data}) + "\n")
+
+
+def validate(
+    rows: Iterable[ImportRow], schema: type[BaseModel], rejects: TextIO
+) -> list[tuple[ImportRow, BaseModel]]:
+    """
+    Validate rows - rejecting the invalid ones.
+
+    Args:
+        rows (Iterable[ImportRow]): The rows.
+        schema (type[BaseModel]): The schema - e.g. `JobInput`.
+        rejects (TextIO): The reject file.
+
+    Returns:
+        list[tuple[ImportRow, BaseModel]]: The valid rows and their validated input.
+    """
+    valid = []
+    for row in rows:
+        if row.error is not None:
+            reject(rejects, row, row.error)
+            continue
+
+        try:
+            valid.append((row, schema.model_validate(row.data)))
+        except ValidationError as exc:
+            reject(rejects, row, str(exc))
+
+    return valid
+
+
+async def import_jobs(
+    inputs: list[tuple[ImportRow, JobInput]], organization_id: UUID, rejects: TextIO
+) -> int:
+    """
+    Create a chunk of jobs - in a single transaction.
+
+    If the chunk is rejected by the database (e.g. a value too long for its column), it is retried a job at a
+    time - i.e. only the failing ones are rejected.
+
+    Args:
+        inputs (list[tuple[ImportRow, JobInput]]): The (valid) rows and their input.
+        organization_id (UUID): The ID of the organization the jobs belong to.
+        rejects (TextIO): The reject file.
+
+    Returns:
+        int: The number of jobs created.
+
+    Raises:
+        NotFoundError: If the organization is not found.
+    """
+    jobs = [job_input.model_dump() for _, job_input in inputs]
+
+    # NOTE: no in-process read models - i.e. the workers serving the API catch up with the imported jobs.
+    async with async_session_scope() as session:
+        job_service = JobService(async_session=session, search_index=None, catalog=None)
+        try:
+            results: list[Any] = await job_service.acreate_many(
+                organization_id=organization_id, jobs=jobs
+            )
+        except NotFoundError:
+            raise
+        except ClientError:
+            # NOTE: e.g. a value the database rejects (but validation let through) - i.e. only its row is rejected.
+            results = []
+            for job in jobs:
+                try:
+                    results.extend(
+                        await job_service.acreate_many(
+                            organization_id=organization_id, jobs=[job]
+                        )
+                    )
+                except NotFoundError:
+                    raise
+                except ClientError as exc:
+                    results.append(exc)
+
+    for (row, _), result in zip(inputs, results):
+        if isinstance(result, ClientError):
+            reject(rejects, row, result.message)
+
+    return sum(not isinstance(result, ClientError) for result in results)
+
+
+async def import_users(
+    inputs: list[tuple[ImportRow, UserInput]],
+    hashing_service: PasswordHashingService,
+    rejects: TextIO,
+) -> int:
+    """
+    Create a chunk of users - in a single transaction, with their passwords hashed in parallel.
+
+    If any of the usernames is taken - or the chunk is otherwise rejected by the database (e.g. a value too long for
+    its column) - it is retried a user at a time, i.e. only the failing ones are rejected.
+
+    Args:
+        inputs (list[tuple[ImportRow, UserInput]]): The (valid) rows and their input.
+        hashing_service (PasswordHashingService): The service passwords are hashed with.
+        rejects (TextIO): The reject file.
+
+    Returns:
+        int: The number of users created.
+    """
+    password_hashes = await asyncio.gather(
+        *(hashing_service.hash(user_input.password) for _, user_input in inputs)
+    )
+    users = [
+        {
+            "username": user_input.username,
+            "name": user_input.name,
+            "password_hash": password_hash,
+        }
+        for (_, user_input), password_hash in zip(inputs, password_hashes)
+    ]
+
+    async with async_session_scope() as session:
+        user_service = UserService(async_session=session)
+        try:
+            results: list[Any] = await user_service.acreate_many(users=users)
+        except ClientError:
+            results = []
+            for user in users:
+                try:
+                    results.extend(await user_service.acreate_many(users=[user]))
+                except ConflictError:
+                    results.append(
+                        ClientError(message=f"Username {user['username']} is taken.")
+                    )
+                except ClientError as exc:
+                    results.append(exc)
+
+    for (row, _), result in zip(inputs, results):
+        if isinstance(result, ClientError):
+            reject(rejects, row, result.message)
+
+    return sum(not isinstance(result, ClientError) for result in results)
+
+
+async def import_file(
+    entity: Literal["jobs", "users"],
+    path: str,
+    format: ImportFormat,
+    chunk_size: int,
+    checkpoint_path: str,
+    rejects_path: str,
+    organization_id: UUID | None = None,
+    hashing_workers: int | None = None,
+) -> ImportCheckpoint:
+    """
+    Import jobs or users from a file - a chunk (i.e. a transaction) at a time, resuming from the checkpoint (if any).
+
+    Args:
+        entity (str): What is imported - `jobs` or `users`.
+        path (str): The path of the file.
+        format (ImportFormat): The format of the file - `csv` or `ndjson`.
+        chunk_size (int): The number of rows per transaction.
+        checkpoint_path (str): The path of the checkpoint.
+        rejects_path (str): The path of the reject file - appended to.
+        organization_id (UUID, optional): The ID of the organization the jobs belong to. Defaults to None.
+        hashing_workers (int, optional): The number of password hashing processes. Defaults to None (i.e. the
+            number of CPUs).
+
+    Returns:
+        ImportCheckpoint: The final checkpoint - i.e. the totals.
+
+    Raises:
+        InvalidCheckpointError: If the checkpoint cannot be resumed from.
+    """
+    checkpoint = ImportCheckpoint.load(checkpoint_path, source=path)
+    if checkpoint.rows:
+        logger.info(f"Resuming import of {path} after row {checkpoint.rows}.")
+
+    # NOTE: the queue holds a whole chunk - i.e. a chunk's passwords are all submitted at once.
+    hashing_service = PasswordHashingService(
+        max_workers=hashing_workers or os.cpu_count() or 1,
+        max_queue_size=chunk_size,
+    )
+    start, consumed = time.perf_counter(), 0
+    try:
+        with (
+            open(path, newline="") as file,
+            open(rejects_path, "a") as rejects,
+        ):
+            for chunk in batched(
+                read_rows(file, format, skip=checkpoint.rows), chunk_size
+            ):
+                inputs = validate(chunk, SCHEMAS[entity], rejects)
+                created = 0
+                if inputs and entity == "jobs":
+                    created = await import_jobs(inputs, organization_id, rejects)
+                elif inputs:
+                    created = await import_users(inputs, hashing_service, rejects)
+
+                # NOTE: rejects are flushed before the checkpoint - i.e. a resumed import may repeat (but never
+                # lose) a rejected row.
+                rejects.flush()
+                checkpoint.rows = chunk[-1].number
+                checkpoint.imported += created
+                checkpoint.rejected += len(chunk) - created
+                checkpoint.save()
+
+                consumed += len(chunk)
+                seconds = time.perf_counter() - start
+                logger.info(
+                    f"Imported {checkpoint.imported} {entity} ({checkpoint.rejected} rejected) - "
+                    f"{consumed / seconds:,.0f} rows/s."
+                )
+    finally:
+        hashing_service.shutdown()
+
+    return checkpoint
+
+
+def snapshot_tables(
+    directory: str, full: bool = False, batch_size: int = 10000
+) -> dict[str, int]:
+    """
+    Snapshot the tables to Parquet files - incrementally (i.e. the rows updated since the previous snapshot), unless
+    `full`.
+
+    The manifest is only saved once every table is written: if a snapshot fails halfway, the next one reads the same
+    rows again (i.e. some are duplicated, none is missed). Likewise, watermarks are capped at when the snapshot
+    started minus `watermark_lag_seconds`: `updated` is set before committing, so rows committed after the
+    snapshot may be older than the latest it read - the next one reads them (and the lag's rows again).
+
+    Args:
+        directory (str): The directory of the snapshots - a subdirectory per table.
+        full (bool, optional): Whether every row is snapshotted - replacing the previous snapshots. Defaults to False.
+        batch_size (int, optional): The number of rows read (and written) at a time. Defaults to 10000.
+
+    Returns:
+        dict[str, int]: The number of rows snapshotted - per table.
+
+    Raises:
+        InvalidSnapshotManifestError: If the manifest cannot be read.
+    """
+    root = Path(directory)
+    root.mkdir(parents=True, exist_ok=True)
+    manifest = SnapshotManifest.load(root / "_manifest.json")
+    # NOTE: time-ordered and unique - i.e. a run never overwrites the files of another (even within a second).
+    run = uuid7().hex
+    # NOTE: i.e. rows updated since are read again by the next (incremental) snapshot.
+    ceiling = utcnow() - timedelta(seconds=settings.watermark_lag_seconds)
+
+    counts = {}
+    with engine.connect() as connection:
+        for table, model in SNAPSHOT_MODELS.items():
+            if full:
+                shutil.rmtree(root / table, ignore_errors=True)
+                manifest.watermarks.pop(table, None)
+
+            columns = [
+                column
+                for column in model.__table__.columns
+                if column.name not in SNAPSHOT_EXCLUDED_COLUMNS
+            ]
+            query = select(*columns)
+            watermark = manifest.watermarks.get(table)
+            if watermark is not None:
+                query = query.where(model.__table__.c.updated >= watermark)
+
+            start = time.perf_counter()
+            result = connection.execution_options(yield_per=batch_size).execute(query)
+            counts[table], latest = write_snapshot(
+                result.mappings().partitions(),
+                get_arrow_schema(columns),
+                root / table,
+                run=run,
+            )
+            if latest is not None:
+                manifest.watermarks[table] = min(latest, ceiling)
+
+            seconds = time.perf_counter() - start
+            logger.info(
+                f"Snapshotted {counts[table]} {table} ({'full' if watermark is None else f'since {watermark}'}) - "
+                f"{counts[table] / seconds:,.0f} rows/s."
+            )
+
+    manifest.save()
+
+    return counts
+
+
+def parse_arguments(arguments: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    Args:
+        arguments (list[str], optional): The arguments. Defaults to None (i.e. `sys.argv`).
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.jobs.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser(
+        "import", help="Import jobs or users from a CSV/NDJSON file."
+    )
+    importer.add_argument("entity", choices=SCHEMAS)
+    importer.add_argument("path")
+    importer.add_argument(
+        "--format",
+        choices=["csv", "ndjson"],
+        help="The format of the file - defaults to its extension.",
+    )
+    importer.add_argument(
+        "--organization-id",
+        type=UUID,
+        help="The ID of the organization the jobs belong to - required for jobs.",
+    )
+    importer.add_argument("--chunk-size", type=int, default=5000)
+    importer.add_argument(
+        "--checkpoint", help="Defaults to the path of the file plus `.checkpoint`."
+    )
+    importer.add_argument(
+        "--rejects", help="Defaults to the path of the file plus `.rejects.ndjson`."
+    )
+    importer.add_argument("--hashing-workers", type=int)
+
+    snapshot = commands.add_parser(
+        "snapshot", help="Snapshot the tables to (partitioned) Parquet files."
+    )
+    snapshot.add_argument("directory")
+    snapshot.add_argument(
+        "--full",
+        action="store_true",
+        help="Snapshot every row - rather than the ones updated since the previous snapshot.",
+    )
+    snapshot.add_argument("--batch-size", type=int, default=10000)
+
+    parsed = parser.parse_args(arguments)
+    if parsed.command == "import":
+        if parsed.entity == "jobs" and parsed.organization_id is None:
+            parser.error("--organization-id is required to import jobs.")
+        if parsed.format is None:
+            parsed.format = "csv" if parsed.path.endswith(".csv") else "ndjson"
+
+    return parsed
+
+
+async def run_import(parsed: argparse.Namespace) -> None:
+    """
+    Run the `import` command.
+
+    Args:
+        parsed (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        None
+    """
+    # NOTE: passwords are hashed with the same policy as the application's.
+    if settings.password_calibration_target_ms is not None:
+        calibrate_crypt_context(settings.password_calibration_target_ms / 1000)
+
+    start = time.perf_counter()
+    try:
+        checkpoint = await import_file(
+            entity=parsed.entity,
+            path=parsed.path,
+            format=parsed.format,
+            chunk_size=parsed.chunk_size,
+            checkpoint_path=parsed.checkpoint or f"{parsed.path}.checkpoint",
+            rejects_path=parsed.rejects or f"{parsed.path}.rejects.ndjson",
+            organization_id=parsed.organization_id,
+            hashing_workers=parsed.hashing_workers,
+        )
+    finally:
+        await async_engine.dispose()
+
+    logger.info(
+        f"Import of {parsed.path} done in {time.perf_counter() - start:.1f}s: "
+        f"{checkpoint.imported} {parsed.entity} imported, {checkpoint.rejected} rejected."
+    )
+
+
+def main(arguments: list[str] | None = None) -> None:
+    """
+    Run a command.
+
+    Args:
+        arguments (list[str], optional): The arguments. Defaults to None (i.e. `sys.argv`).
+
+    Returns:
+        None
+    """
+    parsed = parse_arguments(arguments)
+
+    match parsed.command:
+        case "import":
+            asyncio.run(run_import(parsed))
+        case "snapshot":
+            start = time.perf_counter()
+            counts = snapshot_tables(
+                parsed.directory, full=parsed.full, batch_size=parsed.batch_size
+            )
+            logger.info(
+                f"Snapshot to {parsed.directory} done in {time.perf_counter() - start:.1f}s: {counts}."
+            )
+
+
+if __name__ == "__main__":
+    setup_logger()
+    main()
@@ -4,26 +4,149 @@ This module defines the FastAPI application for the jobs endpoints.
 The FastAPI application is created with the specified title, description, debug settings, version, docs_url, and redoc_url attributes from the `Settings` class.
 
 The `organization` router is included in the application to handle the jobs endpoints related to organizations.
+
+The application's lifespan starts the process-wide resources (e.g. the password hashing pool) on startup and releases them on shutdown.
+If jobs are searched in memory, it also builds the in-process search index (from a snapshot, if any), keeps it up to date with other
+workers' writes and snapshots it on shutdown - and likewise (bar the snapshot) for the in-process catalog, if jobs are browsed with it.
 """
 
+import asyncio
+import contextlib
+import logging
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from .config import setup_logger
-from ..endpoints import application, job, organization, user
-from ..settings.base import Settings
+from ..endpoints import application, job, metrics, organization, user
+from ..models.async_database import async_engine, async_session_scope
+from ..services.hashing import password_hashing_service
+from ..services.job import JobService
+from ..settings.base import get_settings
+from ..utils.catalog import JOB_CATALOG
+from ..utils.password import calibrate_crypt_context
+from ..utils.search import JOB_SEARCH_INDEX, InvalidSearchSnapshotError
+
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+async def refresh_search_index() -> None:
+    """
+    Catch the in-process search index up with the database.
+
+    Returns:
+        None
+    """
+    async with async_session_scope() as session:
+        count = await JobService(async_session=session).arefresh_search_index()
+
+    logger.info(f"Indexed {count} jobs (search index: {len(JOB_SEARCH_INDEX)} jobs).")
+
+
+async def refresh_catalog() -> None:
+    """
+    Catch the in-process catalog up with the database.
+
+    Returns:
+        None
+    """
+    async with async_session_scope() as session:
+        count = await JobService(async_session=session).arefresh_catalog()
+
+    logger.info(f"Cataloged {count} jobs (catalog: {len(JOB_CATALOG)} jobs).")
+
+
+async def refresh_periodically(
+    refresh: Callable[[], Awaitable[None]], seconds: float
+) -> None:
+    """
+    Catch an in-process read model (e.g. the search index) up with the database - every so often.
+
+    Args:
+        refresh (Callable[[], Awaitable[None]]): What catches the read model up - e.g. `refresh_search_index`.
+        seconds (float): How often.
+
+    Returns:
+        None
+    """
+    while True:
+        await asyncio.sleep(seconds)
+        try:
+            await refresh()
+        except Exception as exc:
+            logger.error(f"Failed to {refresh.__name__.replace('_', ' ')}: {exc}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Start the application's process-wide resources - and release them on shutdown.
+
+    Args:
+        app (FastAPI): The application.
+
+    Yields:
+        None
+    """
+    if settings.password_calibration_target_ms is not None:
+        calibrate_crypt_context(settings.password_calibration_target_ms / 1000)
+
+    password_hashing_service.start()
+
+    refresh_tasks = []
+    if JOB_SEARCH_INDEX is not None:
+        snapshot_path = settings.job_search_snapshot_path
+        if snapshot_path is not None and os.path.exists(snapshot_path):
+            try:
+                JOB_SEARCH_INDEX.restore(snapshot_path)
+            except InvalidSearchSnapshotError as exc:
+                logger.warning(f"Rebuilding the search index: {exc}")
+        await refresh_search_index()
+        refresh_tasks.append(
+            asyncio.create_task(
+                refresh_periodically(
+                    refresh_search_index, settings.job_search_refresh_seconds
+                )
+            )
+        )
+    if JOB_CATALOG is not None:
+        await refresh_catalog()
+        refresh_tasks.append(
+            asyncio.create_task(
+                refresh_periodically(
+                    refresh_catalog, settings.job_catalog_refresh_seconds
+                )
+            )
+        )
+
+    yield
 
+    for refresh_task in refresh_tasks:
+        refresh_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await refresh_task
+    if JOB_SEARCH_INDEX is not None and settings.job_search_snapshot_path is not None:
+        JOB_SEARCH_INDEX.snapshot(settings.job_search_snapshot_path)
 
-settings = Settings()
+    password_hashing_service.shutdown()
+    await async_engine.dispose()
 
 
 app = FastAPI(
     title=settings.app_name,
     description=settings.description,
     debug=settings.debug,
+    lifespan=lifespan,
 )
 app.include_router(organization.router)
 app.include_router(job.router)
 app.include_router(user.router)
 app.include_router(application.router)
+app.include_router(metrics.router)
 
 setup_logger()
@@ -5,6 +5,7 @@ from fastapi import APIRouter, status, HTTPException
 from pydantic import BaseModel
 
 from .base import AbstractModel
+from .job import Job
 from ..utils.application import ApplicationState
 
 
@@ -40,6 +41,28 @@ class Application(AbstractModel, ApplicationInput):
     user_id: UUID
 
 
+class ApplicationWithJob(Application):
+    """
+    Represents the output data for an application - with its job.
+
+    Attributes:
+        job (Job): The job the application is for.
+    """
+
+    job: Job
+
+
+class ApplicationList(BaseModel):
+    """
+    Represents a list of applications (e.g. a user's).
+
+    Attributes:
+        applications (list[ApplicationWithJob]): The applications - ordered by creation.
+    """
+
+    applications: list[ApplicationWithJob]
+
+
 @router.patch("/{application_id}", status_code=status.HTTP_501_NOT_IMPLEMENTED)
 async def patch_application(application_id: UUID) -> None:
     """
@@ -1,21 +1,30 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from ..settings.base import get_settings
 from ..utils.password import PASSWORD_SCHEMA, InvalidPasswordError
 
 
+settings = get_settings()
+
+
 class AbstractModel(BaseModel):
     """
     Represents the output data for an organization.
 
+    Output models are built straight from ORM rows (i.e. `from_attributes`) - endpoints return the rows
+    themselves, and the response model validates them once.
+
     Attributes:
         id (UUID): The unique identifier of the organization.
         created (datetime): The datetime when the organization was created.
         updated (datetime): The datetime when the organization was last updated.
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     created: datetime
     updated: datetime
@@ -31,7 +40,8 @@ class PasswordInput(BaseModel):
 
     password: str
 
-    @validator("password")
+    @field_validator("password")
+    @classmethod
     def validate_password(cls, password: str) -> str:
         """
         Validate the password.
@@ -43,10 +53,11 @@ class PasswordInput(BaseModel):
             str: The validated password.
 
         Raises:
-            InvalidPasswordError: If the password is invalid.
+            ValueError: If the password is invalid - i.e. a validation error (422), rather than an unhandled
+                `InvalidPasswordError` (500).
         """
         if not PASSWORD_SCHEMA.validate(password):
-            raise InvalidPasswordError()
+            raise ValueError(str(InvalidPasswordError()))
 
         return password
 
@@ -62,3 +73,14 @@ class Token(BaseModel):
 
     access_token: str
     token_type: str = "bearer"
+
+
+class BatchGetInput(BaseModel):
+    """
+    Represents the input data for retrieving resources (e.g. jobs) in a batch.
+
+    Attributes:
+        ids (list[UUID]): The IDs of the resources - results are in the same order.
+    """
+
+    ids: list[UUID] = Field(min_length=1, max_length=settings.batch_get_max_size)
@@ -1,16 +1,30 @@
 import logging
 from datetime import datetime
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, status, HTTPException
-from pydantic import BaseModel
-
-from .base import AbstractModel
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base import AbstractModel, BatchGetInput
+from ..models.async_database import get_async_session
+from ..services.exceptions import NotFoundError
+from ..services.job import JobService
+from ..settings.base import get_settings
+from ..utils.conditional import (
+    get_cache_headers,
+    get_public_cache_control,
+    is_not_modified,
+)
 from ..utils.job import JobMode, JobContract, JobState
 
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
 router = APIRouter(
     prefix="/api/v1/jobs",
     tags=["jobs"],
@@ -22,14 +36,14 @@ class JobInput(BaseModel):
     Represents the input data for a job.
 
     Attributes:
-        title (str): The title of the job.
+        title (str): The title of the job - at most 255 characters (i.e. the column's length).
         salary (float): The salary for the job.
         mode (JobMode): The mode of the job.
         contract (JobContract): The contract type for the job.
         description (str, optional): The description of the job. Defaults to None.
     """
 
-    title: str
+    title: str = Field(max_length=255)
     salary: float
     mode: JobMode
     contract: JobContract
@@ -49,6 +63,158 @@ class Job(AbstractModel, JobInput):
     organization_id: UUID
 
 
+class JobPage(BaseModel):
+    """
+    Represents a page of jobs.
+
+    Attributes:
+        jobs (list[Job]): The jobs - ordered by creation.
+        next_cursor (str, optional): The cursor to the next page - None if this is the last one. Defaults to None.
+    """
+
+    jobs: list[Job]
+    next_cursor: str | None = None
+
+
+class JobBatchInput(BaseModel):
+    """
+    Represents the input data for creating jobs in a batch.
+
+    Attributes:
+        jobs (list[dict[str, Any]]): The jobs - each one is validated (as a `JobInput`) on its own, so that an
+            invalid job is reported rather than failing the whole batch.
+    """
+
+    jobs: list[dict[str, Any]] = Field(
+        min_length=1, max_length=settings.job_batch_max_size
+    )
+
+
+class JobBatchResult(BaseModel):
+    """
+    Represents the outcome for a job in a batch - i.e. of creating or retrieving it.
+
+    Attributes:
+        job (Job, optional): The created (or retrieved) job - if valid (or found). Defaults to None.
+        error (str, optional): Why the job is invalid (or not found) - if so. Defaults to None.
+    """
+
+    job: Job | None = None
+    error: str | None = None
+
+
+class JobBatch(BaseModel):
+    """
+    Represents the output data for creating (or retrieving) jobs in a batch.
+
+    Attributes:
+        results (list[JobBatchResult]): The outcome for each job - in the order of the input.
+    """
+
+    results: list[JobBatchResult]
+
+
+class JobSearchResults(BaseModel):
+    """
+    Represents the jobs matching a search (or browse).
+
+    Attributes:
+        jobs (list[Job]): The jobs - most relevant (or highest `order_by`) first.
+    """
+
+    jobs: list[Job]
+
+
+@router.get("", response_model=JobSearchResults, response_class=ORJSONResponse)
+async def get_jobs(
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    q: Annotated[str | None, Query(min_length=1)] = None,
+    organization_id: UUID | None = None,
+    mode: JobMode | None = None,
+    contract: JobContract | None = None,
+    state: JobState | None = None,
+    min_salary: Annotated[float | None, Query(gt=0)] = None,
+    max_salary: Annotated[float | None, Query(gt=0)] = None,
+    order_by: Literal["created", "salary"] = "created",
+    limit: Annotated[
+        int, Query(ge=1, le=settings.job_page_max_size)
+    ] = settings.job_page_size,
+) -> ORJSONResponse:
+    """
+    Searches jobs by their title and description - ranked by relevance - or, without search terms, browses them.
+
+    Args:
+        session (AsyncSession): The request-scoped database session.
+        q (str, optional): The search terms - None to browse jobs instead. Defaults to None.
+        organization_id (UUID, optional): The ID of the organization of the jobs. Defaults to None (i.e. any).
+        mode (JobMode, optional): The mode of the jobs. Defaults to None (i.e. any).
+        contract (JobContract, optional): The contract type of the jobs. Defaults to None (i.e. any).
+        state (JobState, optional): The state of the jobs. Defaults to None (i.e. any).
+        min_salary (float, optional): The minimum salary of the jobs. Defaults to None.
+        max_salary (float, optional): The maximum salary of the jobs. Defaults to None.
+        order_by (str, optional): What browsed jobs are sorted by (highest first) - `created` or `salary`.
+            Searched jobs are ranked by relevance. Defaults to `created`.
+        limit (int): The maximum number of jobs.
+
+    Returns:
+        ORJSONResponse: The jobs - i.e. `JobSearchResults`, built from the ORM rows and encoded with orjson.
+    """
+    service = JobService(async_session=session)
+    filters = {
+        "organization_id": organization_id,
+        "mode": mode,
+        "contract": contract,
+        "state": state,
+        "min_salary": min_salary,
+        "max_salary": max_salary,
+    }
+    if q is not None:
+        jobs = await service.asearch(q=q, limit=limit, **filters)
+    else:
+        jobs = await service.abrowse(limit=limit, order_by=order_by, **filters)
+
+    return ORJSONResponse(JobSearchResults(jobs=jobs).model_dump())
+
+
+@router.post(
+    ":batchGet",
+    response_model=JobBatch,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_jobs_by_ids(
+    batch_input: BatchGetInput,
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> ORJSONResponse:
+    """
+    Retrieve jobs by ID - in a batch (i.e. a single `IN (...)` query for those not cached).
+
+    The outcome of each ID is in the result at the same position - a missing job is reported rather than
+    failing the batch.
+
+    Args:
+        batch_input (BatchGetInput): The IDs of the jobs.
+        session (AsyncSession): The request-scoped database session.
+
+    Returns:
+        ORJSONResponse: The outcome for each ID - i.e. a `JobBatch`.
+    """
+    jobs = await JobService(async_session=session).aget_many(batch_input.ids)
+
+    return ORJSONResponse(
+        JobBatch(
+            results=[
+                (
+                    JobBatchResult(error=job.message)
+                    if isinstance(job, NotFoundError)
+                    else JobBatchResult(job=job)
+                )
+                for job in jobs
+            ]
+        ).model_dump()
+    )
+
+
 @router.patch("/{job_id}", status_code=status.HTTP_501_NOT_IMPLEMENTED)
 async def patch_job(job_id: UUID) -> None:
     """
@@ -69,24 +235,66 @@ async def patch_job(job_id: UUID) -> None:
     )
 
 
-@router.get("/{job_id}", status_code=status.HTTP_501_NOT_IMPLEMENTED)
-async def get_job(job_id: UUID) -> None:
+@router.get("/{job_id}", response_model=Job, response_class=ORJSONResponse)
+async def get_job(
+    job_id: UUID,
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    if_none_match: Annotated[str | None, Header()] = None,
+    if_modified_since: Annotated[str | None, Header()] = None,
+) -> Response:
     """
     Retrieve a job.
 
+    Conditional requests (`If-None-Match`/`If-Modified-Since`) of an unchanged job are answered with
+    `304 Not Modified` - checking its version alone (i.e. without serializing it). Otherwise, the serialized job is
+    served from `JOB_RESPONSE_CACHE` (by version) if cached - i.e. without the ORM, validation and encoding. The
+    version is only looked up for either (i.e. a plain `GET` of an uncached response loads the job once).
+
     Args:
         job_id (UUID): The ID of the job.
+        session (AsyncSession): The request-scoped database session.
+        if_none_match (str, optional): The entity tags the client has. Defaults to None.
+        if_modified_since (str, optional): When the client's copy was last modified. Defaults to None.
 
     Returns:
-        None
+        Response: The job - i.e. a `Job` encoded with orjson - or an empty `304 Not Modified` response.
 
     Raises:
-        HTTPException: Operation not implemented yet.
+        HTTPException: If the job is not found.
     """
-    logger.warning("Yet to be implemented.")
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Yet to be implemented."
+    service = JobService(async_session=session)
+    cache_control = get_public_cache_control(settings.http_cache_max_age_seconds)
+    try:
+        if (
+            if_none_match is not None
+            or if_modified_since is not None
+            or job_id in service.response_cache
+        ):
+            updated, version = await service.aget_version(job_id)
+            headers = get_cache_headers(updated, version, cache_control)
+            if is_not_modified(
+                headers["ETag"], updated, if_none_match, if_modified_since
+            ):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+                )
+
+            content = service.response_cache.get(job_id, version)
+            if content is not None:
+                return Response(content, media_type="application/json", headers=headers)
+
+        job = await service.aget(job_id)
+    except NotFoundError as exc:
+        logger.error(f"Failed to retrieve job: {exc.message}")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message)
+
+    response = ORJSONResponse(
+        Job.model_validate(job).model_dump(),
+        headers=get_cache_headers(job.updated, job.version, cache_control),
     )
+    service.response_cache.set(job.id, job.version, response.body)
+
+    return response
 
 
 @router.delete("/{job_id}", status_code=status.HTTP_501_NOT_IMPLEMENTED)
@@ -0,0 +1,142 @@
+import logging
+from dataclasses import asdict
+
+from fastapi import APIRouter, status
+from pydantic import BaseModel
+
+from ..services.hashing import password_hashing_service
+from ..utils.auth import TOKEN_CACHE
+from ..utils.cache import ENTITY_CACHE, JOB_RESPONSE_CACHE
+
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/v1/metrics",
+    tags=["metrics"],
+)
+
+
+class HashingMetrics(BaseModel):
+    """
+    Represents the metrics of the password hashing service.
+
+    Attributes:
+        workers (int): The number of worker processes.
+        max_queue_size (int): The maximum number of requests waiting for a worker.
+        in_flight (int): The number of requests being processed or waiting for a worker.
+        queue_depth (int): The number of requests waiting for a worker.
+        completed (int): The number of requests completed.
+        rejected (int): The number of requests rejected because the queue was full.
+        average_hash_latency (float): The average time spent hashing/verifying (in seconds).
+        max_hash_latency (float): The maximum time spent hashing/verifying (in seconds).
+        average_wait_latency (float): The average time spent waiting for a worker (in seconds).
+    """
+
+    workers: int
+    max_queue_size: int
+    in_flight: int
+    queue_depth: int
+    completed: int
+    rejected: int
+    average_hash_latency: float
+    max_hash_latency: float
+    average_wait_latency: float
+
+
+class TokenCacheMetrics(BaseModel):
+    """
+    Represents the metrics of the verified JWT token cache.
+
+    Attributes:
+        size (int): The number of tokens cached.
+        max_size (int): The maximum number of tokens cached.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups not served from the cache.
+    """
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+
+
+class EntityCacheMetrics(BaseModel):
+    """
+    Represents the metrics of the entity (i.e. organization, user and job) cache.
+
+    Attributes:
+        size (int): The number of keys cached (locally).
+        max_size (int): The maximum number of keys cached (locally).
+        hits (int): The number of lookups served from the local tier.
+        misses (int): The number of lookups not served from the local tier.
+        evictions (int): The number of keys evicted from the local tier - i.e. expired or least recently used.
+        invalidations (int): The number of keys invalidated by writes.
+        shared_hits (int): The number of local misses served from the shared tier.
+        shared_misses (int): The number of local misses not served from the shared tier either.
+    """
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    shared_hits: int
+    shared_misses: int
+
+
+class ResponseCacheMetrics(BaseModel):
+    """
+    Represents the metrics of the (job detail) response cache.
+
+    Attributes:
+        size (int): The number of responses cached.
+        bytes (int): The total size (in bytes) of the responses cached.
+        max_bytes (int): The maximum total size (in bytes) of the responses cached.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups not served from the cache - i.e. missing or of another version.
+        evictions (int): The number of responses evicted - i.e. least recently used.
+        invalidations (int): The number of responses invalidated by writes.
+    """
+
+    size: int
+    bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+class Metrics(BaseModel):
+    """
+    Represents the output data for the metrics endpoint.
+
+    Attributes:
+        hashing (HashingMetrics): The metrics of the password hashing service.
+        tokens (TokenCacheMetrics): The metrics of the verified JWT token cache.
+        entities (EntityCacheMetrics): The metrics of the entity cache.
+        jobs (ResponseCacheMetrics): The metrics of the job detail response cache.
+    """
+
+    hashing: HashingMetrics
+    tokens: TokenCacheMetrics
+    entities: EntityCacheMetrics
+    jobs: ResponseCacheMetrics
+
+
+@router.get("", status_code=status.HTTP_200_OK)
+async def get_metrics() -> Metrics:
+    """
+    Retrieve the (process-wide) metrics of the application.
+
+    Returns:
+        Metrics: The metrics.
+    """
+    return Metrics(
+        hashing=HashingMetrics(**asdict(password_hashing_service.stats())),
+        tokens=TokenCacheMetrics(**asdict(TOKEN_CACHE.stats())),
+        entities=EntityCacheMetrics(**asdict(ENTITY_CACHE.stats())),
+        jobs=ResponseCacheMetrics(**asdict(JOB_RESPONSE_CACHE.stats())),
+    )
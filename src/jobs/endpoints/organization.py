@@ -1,28 +1,52 @@
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from .base import AbstractModel, PasswordInput, Token
-from .job import JobInput, Job
+from .base import AbstractModel, BatchGetInput, PasswordInput, Token
+from .job import JobBatch, JobBatchInput, JobBatchResult, JobInput, Job, JobPage
+from ..models.async_database import async_session_scope, get_async_session
+from ..services.application import EXPORT_COLUMNS, ApplicationService
 from ..services.job import JobService
 from ..services.organization import OrganizationService
-from ..services.exceptions import ClientError, ConflictError, NotFoundError, ServerError
+from ..services.exceptions import (
+    ClientError,
+    ConflictError,
+    NotFoundError,
+    ServerError,
+    UnavailableError,
+)
+from ..settings.base import get_settings
 from ..utils.auth import (
     create_jwt_token,
-    get_jwt_subject,
+    get_jwt_principal,
     FailedJWTDecodeError,
+    InvalidJWTPrincipalError,
     NoJWTSubjectError,
+    Principal,
+    PrincipalType,
+)
+from ..utils.conditional import (
+    get_cache_headers,
+    get_public_cache_control,
+    is_not_modified,
 )
+from ..utils.export import ExportFormat, media_type, stream_export
+from ..utils.pagination import Cursor, InvalidCursorError
 from ..utils.password import PASSWORD_SCHEMA, InvalidPasswordError
 
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
 router = APIRouter(
     prefix="/api/v1/organizations",
     tags=["organizations"],
@@ -53,15 +77,41 @@ class Organization(AbstractModel):
     name: str
 
 
-@router.post("", status_code=status.HTTP_201_CREATED)
+class OrganizationBatchResult(BaseModel):
+    """
+    Represents the outcome for an organization in a batch - i.e. of retrieving it.
+
+    Attributes:
+        organization (Organization, optional): The retrieved organization - if found. Defaults to None.
+        error (str, optional): Why the organization is missing - if so. Defaults to None.
+    """
+
+    organization: Organization | None = None
+    error: str | None = None
+
+
+class OrganizationBatch(BaseModel):
+    """
+    Represents the output data for retrieving organizations in a batch.
+
+    Attributes:
+        results (list[OrganizationBatchResult]): The outcome for each organization - in the order of the input.
+    """
+
+    results: list[OrganizationBatchResult]
+
+
+@router.post("", response_model=Organization, status_code=status.HTTP_201_CREATED)
 async def create_organization(
     organization_input: OrganizationInput,
-) -> Organization:
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> Any:
     """
     Create a new organization.
 
     Args:
         organization (OrganizationInput): The input data for creating the organization.
+        session (AsyncSession): The request-scoped database session.
 
     Returns:
         Organization: The created organization.
@@ -71,7 +121,7 @@ async def create_organization(
     """
     try:
         logger.info(f"Creating organization with name: {organization_input.name}")
-        organization = OrganizationService().create(
+        organization = await OrganizationService(async_session=session).acreate(
             name=organization_input.name, password=organization_input.password
         )
     except ConflictError as exc:
@@ -80,6 +130,11 @@ async def create_organization(
     except ClientError as exc:
         logger.error(f"Failed to create organization: {exc.message}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=exc.message)
+    except UnavailableError as exc:
+        logger.error(f"Failed to create organization: {exc.message}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=exc.message
+        )
     except ServerError as exc:
         logger.error(f"Failed to create organization: {exc.message}")
         raise HTTPException(
@@ -88,23 +143,20 @@ async def create_organization(
 
     logger.info(f"Organization created: {organization.name}")
 
-    return Organization(
-        id=organization.id,
-        name=organization.name,
-        created=organization.created,
-        updated=organization.updated,
-    )
+    return organization
 
 
 @router.post("/auth", status_code=status.HTTP_200_OK)
 async def authenticate_organization(
-    form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> Token:
     """
     Authenticate an organization.
 
     Args:
         form_data (Annotated[OAuth2PasswordRequestForm, Depends()]): The form data containing the username and password.
+        session (AsyncSession): The request-scoped database session.
 
     Returns:
         Token: The token for the authenticated organization.
@@ -114,40 +166,52 @@ async def authenticate_organization(
     """
     try:
         logger.info(f"Authenticating organization {form_data.username}.")
-        organization = OrganizationService().authenticate(
+        organization = await OrganizationService(async_session=session).aauthenticate(
             name=form_data.username, password=form_data.password
         )
     except (NotFoundError, InvalidPasswordError) as exc:
-        logger.error(f"Failed to authenticate organization: {exc.message}")
+        logger.error(f"Failed to authenticate organization: {exc}")
         # NOTE: not a good practice to return detailed error messages in this use case.
         # Hence, avoiding returning the actual error message.
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Failure to authenticate."
         )
+    except UnavailableError as exc:
+        logger.error(f"Failed to authenticate organization: {exc.message}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=exc.message
+        )
 
     logger.info(f"Authenticated organization {form_data.username}.")
 
-    return Token(access_token=create_jwt_token(organization.name))
+    return Token(
+        access_token=create_jwt_token(
+            organization.name, organization.id, PrincipalType.ORGANIZATION
+        )
+    )
 
 
 async def get_authenticated_organization(
-    token: Annotated[str, Depends(oauth2_scheme)]
-) -> Organization:
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> Principal:
     """
     Retrieves the authenticated organization based on the provided token.
 
+    The organization is resolved from the (verified) token claims alone - i.e. without a database lookup.
+    A deleted organization is caught by the services' foreign key checks instead.
+
     Args:
         token (str): The authentication token.
 
     Returns:
-        Organization: The authenticated organization.
+        Principal: The authenticated organization.
 
     Raises:
-        HTTPException: If the token is invalid or the organization cannot be retrieved.
+        HTTPException: If the token is invalid.
     """
     try:
-        organization = OrganizationService().get(name=get_jwt_subject(token))
-    except (FailedJWTDecodeError, NoJWTSubjectError, NotFoundError) as exc:
+        return get_jwt_principal(token, PrincipalType.ORGANIZATION)
+    except (FailedJWTDecodeError, NoJWTSubjectError, InvalidJWTPrincipalError) as exc:
         logger.error(f"Failed to decode JWT token/get Organization: {exc}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -155,28 +219,26 @@ async def get_authenticated_organization(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return Organization(
-        id=organization.id,
-        name=organization.name,
-        created=organization.created,
-        updated=organization.updated,
-    )
-
 
-@router.post("/{organization_id}/jobs", status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/{organization_id}/jobs", response_model=Job, status_code=status.HTTP_201_CREATED
+)
 async def create_job(
     organization_id: UUID,
     job_input: JobInput,
     authenticated_organization: Annotated[
-        Organization, Depends(get_authenticated_organization)
+        Principal, Depends(get_authenticated_organization)
     ],
-) -> Job:
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> Any:
     """
     Create a new job.
 
     Args:
         organization_id (UUID): The ID of the organization.
         job_input (JobInput): The input data for creating the job.
+        authenticated_organization (Principal): The authenticated organization.
+        session (AsyncSession): The request-scoped database session.
 
     Returns:
         Job: The created job.
@@ -186,7 +248,7 @@ async def create_job(
     """
     if organization_id != authenticated_organization.id:
         logger.error(
-            f"Failed to create job: Organization mismatch (path: {organization_id}, authenticated: {authenticate_organization.id})."
+            f"Failed to create job: Organization mismatch (path: {organization_id}, authenticated: {authenticated_organization.id})."
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -197,7 +259,7 @@ async def create_job(
         logger.info(
             f"Creating job with title: {job_input.title} (organization: {organization_id})."
         )
-        job = JobService().create(
+        job = await JobService(async_session=session).acreate(
             organization_id=organization_id,
             title=job_input.title,
             salary=job_input.salary,
@@ -219,19 +281,106 @@ async def create_job(
 
     logger.info(f"Job created: {job.title} (organization: {organization_id}).")
 
-    return Job(
-        id=job.id,
-        title=job.title,
-        salary=job.salary,
-        mode=job.mode.value,
-        contract=job.contract.value,
-        description=job.description,
-        organization_id=job.organization_id,
-        state=job.state.value,
-        created=job.created,
-        updated=job.updated,
+    return job
+
+
+@router.post(
+    "/{organization_id}/jobs:batchCreate",
+    response_model=JobBatch,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def create_jobs(
+    organization_id: UUID,
+    batch_input: JobBatchInput,
+    authenticated_organization: Annotated[
+        Principal, Depends(get_authenticated_organization)
+    ],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> ORJSONResponse:
+    """
+    Create new jobs - in a batch (i.e. a single transaction).
+
+    Every job is validated on its own: the valid ones are created, and the invalid ones are reported - i.e.
+    the outcome of each job is in the result at the same position. The result is built from the ORM rows and
+    encoded with orjson, given that batches are large.
+
+    Args:
+        organization_id (UUID): The ID of the organization.
+        batch_input (JobBatchInput): The input data for creating the jobs.
+        authenticated_organization (Principal): The authenticated organization.
+        session (AsyncSession): The request-scoped database session.
+
+    Returns:
+        ORJSONResponse: The outcome for each job - i.e. a `JobBatch`.
+
+    Raises:
+        HTTPException: If the organization mismatches or is not found, or there is an internal server error.
+    """
+    if organization_id != authenticated_organization.id:
+        logger.error(
+            f"Failed to create jobs: Organization mismatch (path: {organization_id}, authenticated: {authenticated_organization.id})."
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Failed to create jobs: Organization mismatch.",
+        )
+
+    results: list[JobBatchResult | JobInput] = []
+    for job in batch_input.jobs:
+        try:
+            results.append(JobInput.model_validate(job))
+        except ValidationError as exc:
+            results.append(
+                JobBatchResult(
+                    error="; ".join(
+                        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                        for error in exc.errors()
+                    )
+                )
+            )
+
+    try:
+        logger.info(f"Creating {len(results)} jobs (organization: {organization_id}).")
+        jobs = iter(
+            await JobService(async_session=session).acreate_many(
+                organization_id=organization_id,
+                jobs=[
+                    result.model_dump()
+                    for result in results
+                    if isinstance(result, JobInput)
+                ],
+            )
+        )
+    except NotFoundError as exc:
+        logger.error(f"Failed to create jobs: {exc.message}")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message)
+    except ClientError as exc:
+        logger.error(f"Failed to create jobs: {exc.message}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=exc.message)
+    except ServerError as exc:
+        logger.error(f"Failed to create jobs: {exc.message}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=exc.message
+        )
+
+    for index, result in enumerate(results):
+        if isinstance(result, JobBatchResult):
+            continue
+
+        job = next(jobs)
+        results[index] = (
+            JobBatchResult(error=job.message)
+            if isinstance(job, ClientError)
+            else JobBatchResult(job=job)
+        )
+
+    logger.info(
+        f"Jobs created: {sum(result.job is not None for result in results)} of {len(results)} (organization: {organization_id})."
     )
 
+    return ORJSONResponse(JobBatch(results=results).model_dump())
+
 
 @router.get("", status_code=status.HTTP_501_NOT_IMPLEMENTED)
 async def get_organizations() -> None:
@@ -253,25 +402,99 @@ async def get_organizations() -> None:
     )
 
 
-@router.get("/{organization_id}", status_code=status.HTTP_501_NOT_IMPLEMENTED)
-async def get_organization(organization_id: UUID) -> None:
+@router.post(
+    ":batchGet",
+    response_model=OrganizationBatch,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_organizations_by_ids(
+    batch_input: BatchGetInput,
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> ORJSONResponse:
+    """
+    Retrieve organizations by ID - in a batch (i.e. a single `IN (...)` query for those not cached).
+
+    The outcome of each ID is in the result at the same position - a missing organization is reported rather than
+    failing the batch.
+
+    Args:
+        batch_input (BatchGetInput): The IDs of the organizations.
+        session (AsyncSession): The request-scoped database session.
+
+    Returns:
+        ORJSONResponse: The outcome for each ID - i.e. an `OrganizationBatch`.
+    """
+    organizations = await OrganizationService(async_session=session).aget_many(
+        batch_input.ids
+    )
+
+    return ORJSONResponse(
+        OrganizationBatch(
+            results=[
+                (
+                    OrganizationBatchResult(error=organization.message)
+                    if isinstance(organization, NotFoundError)
+                    else OrganizationBatchResult(organization=organization)
+                )
+                for organization in organizations
+            ]
+        ).model_dump()
+    )
+
+
+@router.get("/{organization_id}", response_model=Organization)
+async def get_organization(
+    organization_id: UUID,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    if_none_match: Annotated[str | None, Header()] = None,
+    if_modified_since: Annotated[str | None, Header()] = None,
+) -> Any:
     """
     Retrieve an organization.
 
+    Conditional requests (`If-None-Match`/`If-Modified-Since`) of an unchanged organization are answered with
+    `304 Not Modified` - checking its version alone (i.e. without serializing it, nor even loading it if cached).
+    A plain `GET` loads the organization once.
+
     Args:
         organization_id (UUID): The ID of the organization.
+        response (Response): The response - i.e. its caching headers.
+        session (AsyncSession): The request-scoped database session.
+        if_none_match (str, optional): The entity tags the client has. Defaults to None.
+        if_modified_since (str, optional): When the client's copy was last modified. Defaults to None.
 
     Returns:
-        None
+        Organization: The organization - or an empty `304 Not Modified` response.
 
     Raises:
-        HTTPException: Operation not implemented yet.
+        HTTPException: If the organization is not found.
     """
-    logger.warning("Yet to be implemented.")
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Yet to be implemented."
+    service = OrganizationService(async_session=session)
+    cache_control = get_public_cache_control(settings.http_cache_max_age_seconds)
+    try:
+        if if_none_match is not None or if_modified_since is not None:
+            updated, version = await service.aget_version(organization_id)
+            headers = get_cache_headers(updated, version, cache_control)
+            if is_not_modified(
+                headers["ETag"], updated, if_none_match, if_modified_since
+            ):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+                )
+
+        organization = await service.aget(id=organization_id)
+    except NotFoundError as exc:
+        logger.error(f"Failed to retrieve organization: {exc.message}")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message)
+
+    response.headers.update(
+        get_cache_headers(organization.updated, organization.version, cache_control)
     )
 
+    return organization
+
 
 @router.patch("/{organization_id}", status_code=status.HTTP_501_NOT_IMPLEMENTED)
 async def patch_organization(organization_id: UUID) -> None:
@@ -313,21 +536,110 @@ async def delete_organization(organization_id: UUID) -> None:
     )
 
 
-@router.get("/{organization_id}/jobs", status_code=status.HTTP_501_NOT_IMPLEMENTED)
-async def get_jobs_by_organization(organization_id: UUID) -> None:
+@router.get(
+    "/{organization_id}/jobs",
+    response_model=JobPage,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_jobs_by_organization(
+    organization_id: UUID,
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    limit: Annotated[
+        int, Query(ge=1, le=settings.job_page_max_size)
+    ] = settings.job_page_size,
+    cursor: str | None = None,
+) -> ORJSONResponse:
     """
-    Retrieves job for an organization.
+    Retrieves jobs for an organization - a page at a time, ordered by creation.
+
+    Pages are keyset paginated: the next page is requested with the `next_cursor` of the previous one. Pages are
+    built from the ORM rows and encoded with orjson.
 
     Args:
         organization_id (UUID): The ID of the organization.
+        session (AsyncSession): The request-scoped database session.
+        limit (int): The maximum number of jobs in the page.
+        cursor (str, optional): The cursor to the page - None for the first page. Defaults to None.
 
     Returns:
-        None
+        ORJSONResponse: The page of jobs - i.e. a `JobPage`.
 
     Raises:
-        HTTPException: Operation not implemented yet.
+        HTTPException: If the cursor is invalid.
     """
-    logger.warning("Yet to be implemented.")
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Yet to be implemented."
+    try:
+        decoded_cursor = Cursor.decode(cursor) if cursor is not None else None
+    except InvalidCursorError as exc:
+        logger.error(f"Failed to get jobs: {exc}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    jobs, next_cursor = await JobService(async_session=session).aget_by_organization(
+        organization_id=organization_id, limit=limit, cursor=decoded_cursor
+    )
+
+    return ORJSONResponse(
+        JobPage(
+            jobs=jobs,
+            next_cursor=next_cursor.encode() if next_cursor is not None else None,
+        ).model_dump()
+    )
+
+
+@router.get("/{organization_id}/applications:export")
+async def export_applications(
+    organization_id: UUID,
+    authenticated_organization: Annotated[
+        Principal, Depends(get_authenticated_organization)
+    ],
+    format: ExportFormat = "ndjson",
+    compress: bool = False,
+) -> StreamingResponse:
+    """
+    Export the applications for an organization's jobs - streamed as NDJSON or CSV, optionally gzipped.
+
+    Applications are read through a server-side cursor and serialized a batch at a time - i.e. memory use does
+    not depend on the number of applications. The export runs on its own session, given that the response
+    outlives the request-scoped one.
+
+    Args:
+        organization_id (UUID): The ID of the organization.
+        authenticated_organization (Principal): The authenticated organization.
+        format (ExportFormat, optional): The format - `ndjson` or `csv`. Defaults to `ndjson`.
+        compress (bool, optional): Whether the export is gzipped. Defaults to False.
+
+    Returns:
+        StreamingResponse: The export.
+
+    Raises:
+        HTTPException: If the organization mismatches.
+    """
+    if organization_id != authenticated_organization.id:
+        logger.error(
+            f"Failed to export applications: Organization mismatch (path: {organization_id}, authenticated: {authenticated_organization.id})."
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Failed to export applications: Organization mismatch.",
+        )
+
+    async def export() -> AsyncIterator[bytes]:
+        async with async_session_scope() as session:
+            async for chunk in stream_export(
+                ApplicationService(async_session=session).astream_by_organization(
+                    organization_id=organization_id,
+                    batch_size=settings.application_export_batch_size,
+                ),
+                columns=[column.name for column in EXPORT_COLUMNS],
+                format=format,
+                compress=compress,
+            ):
+                yield chunk
+
+    logger.info(f"Exporting applications (organization: {organization_id}).")
+    filename = f"applications.{format}{'.gz' if compress else ''}"
+    return StreamingResponse(
+        export(),
+        media_type=media_type(format, compress),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
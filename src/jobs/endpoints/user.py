@@ -1,22 +1,42 @@
 import logging
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from pydantic import validator
-
-from .application import Application, ApplicationInput
-from .base import AbstractModel, PasswordInput, Token
+from pydantic import BaseModel, Field, field_validator
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .application import Application, ApplicationInput, ApplicationList
+from .base import AbstractModel, BatchGetInput, PasswordInput, Token
+from .organization import get_authenticated_organization
+from ..models.application import Application as ApplicationEntity
+from ..models.async_database import get_async_session
 from ..services.application import ApplicationService
-from ..services.exceptions import ClientError, ConflictError, NotFoundError, ServerError
+from ..services.loader import RelationshipLoader
+from ..services.exceptions import (
+    ClientError,
+    ConflictError,
+    NotFoundError,
+    ServerError,
+    UnavailableError,
+)
 from ..services.user import UserService
 from ..utils.auth import (
     create_jwt_token,
-    get_jwt_subject,
+    get_jwt_principal,
     FailedJWTDecodeError,
+    InvalidJWTPrincipalError,
     NoJWTSubjectError,
+    Principal,
+    PrincipalType,
+)
+from ..utils.conditional import (
+    PRIVATE_CACHE_CONTROL,
+    get_cache_headers,
+    is_not_modified,
 )
 from ..utils.password import PASSWORD_SCHEMA, InvalidPasswordError
 
@@ -36,14 +56,16 @@ class UserInput(PasswordInput):
     Represents the input data for a user.
 
     Attributes:
-        name (str): The name of the user.
+        name (str): The name of the user - at most 255 characters (i.e. the column's length).
+        username (str): The username (i.e. email address) of the user - at most 255 characters.
         password (str): The password for the user.
     """
 
-    name: str
-    username: str
+    name: str = Field(max_length=255)
+    username: str = Field(max_length=255)
 
-    @validator("username")
+    @field_validator("username")
+    @classmethod
     def validate_username(cls, username: str) -> str:
         """
         Validate the username.
@@ -76,15 +98,41 @@ class User(AbstractModel):
     username: str
 
 
-@router.post("", status_code=status.HTTP_201_CREATED)
+class UserBatchResult(BaseModel):
+    """
+    Represents the outcome for a user in a batch - i.e. of retrieving it.
+
+    Attributes:
+        user (User, optional): The retrieved user - if found. Defaults to None.
+        error (str, optional): Why the user is missing - if so. Defaults to None.
+    """
+
+    user: User | None = None
+    error: str | None = None
+
+
+class UserBatch(BaseModel):
+    """
+    Represents the output data for retrieving users in a batch.
+
+    Attributes:
+        results (list[UserBatchResult]): The outcome for each user - in the order of the input.
+    """
+
+    results: list[UserBatchResult]
+
+
+@router.post("", response_model=User, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_input: UserInput,
-) -> User:
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> Any:
     """
     Create a new user.
 
     Args:
         user (UserInput): The input data for creating the user.
+        session (AsyncSession): The request-scoped database session.
 
     Returns:
         User: The created user.
@@ -94,7 +142,7 @@ async def create_user(
     """
     try:
         logger.info(f"Creating user with username: {user_input.username}")
-        user = UserService().create(
+        user = await UserService(async_session=session).acreate(
             name=user_input.name,
             username=user_input.username,
             password=user_input.password,
@@ -105,6 +153,11 @@ async def create_user(
     except ClientError as exc:
         logger.error(f"Failed to create user: {exc.message}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=exc.message)
+    except UnavailableError as exc:
+        logger.error(f"Failed to create user: {exc.message}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=exc.message
+        )
     except ServerError as exc:
         logger.error(f"Failed to create user: {exc.message}")
         raise HTTPException(
@@ -113,24 +166,20 @@ async def create_user(
 
     logger.info(f"User created: {user.username}")
 
-    return User(
-        id=user.id,
-        name=user.name,
-        username=user.username,
-        created=user.created,
-        updated=user.updated,
-    )
+    return user
 
 
 @router.post("/auth", status_code=status.HTTP_200_OK)
 async def authenticate_user(
-    form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> Token:
     """
     Authenticate a user.
 
     Args:
         form_data (Annotated[OAuth2PasswordRequestForm, Depends()]): The form data containing the username and password.
+        session (AsyncSession): The request-scoped database session.
 
     Returns:
         Token: The token for the authenticated user.
@@ -140,67 +189,77 @@ async def authenticate_user(
     """
     try:
         logger.info(f"Authenticating user {form_data.username}.")
-        user = UserService().authenticate(
+        user = await UserService(async_session=session).aauthenticate(
             username=form_data.username, password=form_data.password
         )
     except (NotFoundError, InvalidPasswordError) as exc:
-        logger.error(f"Failed to authenticate user: {exc.message}")
+        logger.error(f"Failed to authenticate user: {exc}")
         # NOTE: not a good practice to return detailed error messages in this use case.
         # Hence, avoiding returning the actual error message.
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Failure to authenticate."
         )
+    except UnavailableError as exc:
+        logger.error(f"Failed to authenticate user: {exc.message}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=exc.message
+        )
 
     logger.info(f"Authenticated user {form_data.username}.")
 
-    return Token(access_token=create_jwt_token(user.username))
+    return Token(
+        access_token=create_jwt_token(user.username, user.id, PrincipalType.USER)
+    )
 
 
-async def get_authenticated_user(token: Annotated[str, Depends(oauth2_scheme)]) -> User:
+async def get_authenticated_user(
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> Principal:
     """
     Retrieves the authenticated user based on the provided token.
 
+    The user is resolved from the (verified) token claims alone - i.e. without a database lookup.
+    A deleted user is caught by the services' foreign key checks instead.
+
     Args:
         token (str): The authentication token.
 
     Returns:
-        User: The authenticated User.
+        Principal: The authenticated user.
 
     Raises:
-        HTTPException: If the token is invalid or the user cannot be retrieved.
+        HTTPException: If the token is invalid.
     """
     try:
-        user = UserService().get(username=get_jwt_subject(token))
-    except (FailedJWTDecodeError, NoJWTSubjectError, NotFoundError) as exc:
-        logger.error(f"Failed to decode JWT token/get user: {exc}")
+        return get_jwt_principal(token, PrincipalType.USER)
+    except (FailedJWTDecodeError, NoJWTSubjectError, InvalidJWTPrincipalError) as exc:
+        logger.error(f"Failed to decode JWT token/get User: {exc}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return User(
-        id=user.id,
-        name=user.name,
-        username=user.username,
-        created=user.created,
-        updated=user.updated,
-    )
 
-
-@router.post("/{user_id}/applications", status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/{user_id}/applications",
+    response_model=Application,
+    status_code=status.HTTP_201_CREATED,
+)
 async def create_application(
     user_id: UUID,
     application_input: ApplicationInput,
-    authenticated_user: Annotated[User, Depends(get_authenticated_user)],
-) -> Application:
+    authenticated_user: Annotated[Principal, Depends(get_authenticated_user)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> Any:
     """
     Create an application for a job.
 
     Args:
         user_id (UUID): The ID of the user creating the application.
         application_input (ApplicationInput): The input data for creating the application.
-        authenticated_user (User): The authenticated user.
+        authenticated_user (Principal): The authenticated user.
+        session (AsyncSession): The request-scoped database session.
 
     Returns:
         Application: The created application.
@@ -211,7 +270,7 @@ async def create_application(
     """
     if user_id != authenticated_user.id:
         logger.error(
-            f"Failed to create application: User mismatch (path: {user_id}, authenticated: {authenticate_id.id})."
+            f"Failed to create application: User mismatch (path: {user_id}, authenticated: {authenticated_user.id})."
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -222,7 +281,7 @@ async def create_application(
         logger.info(
             f"Creating application for job: {application_input.job_id} (user: {user_id})."
         )
-        application = ApplicationService().create(
+        application = await ApplicationService(async_session=session).acreate(
             job_id=application_input.job_id,
             user_id=user_id,
         )
@@ -242,14 +301,7 @@ async def create_application(
         f"Application created for job: {application_input.job_id} (user: {user_id})."
     )
 
-    return Application(
-        id=application.id,
-        state=application.state,
-        job_id=application.job_id,
-        user_id=application.user_id,
-        created=application.created,
-        updated=application.updated,
-    )
+    return application
 
 
 @router.get("", status_code=status.HTTP_501_NOT_IMPLEMENTED)
@@ -272,25 +324,118 @@ async def get_users() -> None:
     )
 
 
-@router.get("/{user_id}", status_code=status.HTTP_501_NOT_IMPLEMENTED)
-async def get_user(user_id: UUID) -> None:
+@router.post(
+    ":batchGet",
+    response_model=UserBatch,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_users_by_ids(
+    batch_input: BatchGetInput,
+    authenticated_organization: Annotated[
+        Principal, Depends(get_authenticated_organization)
+    ],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> ORJSONResponse:
     """
-    Retrieve a user.
+    Retrieve users by ID - in a batch (i.e. a single `IN (...)` query for those not cached) - for an organization.
+
+    Users are private: an organization only sees those who applied to its jobs, and any other user is reported as
+    missing (i.e. whether they exist is not disclosed). The outcome of each ID is in the result at the same
+    position.
+
+    Args:
+        batch_input (BatchGetInput): The IDs of the users.
+        authenticated_organization (Principal): The authenticated organization.
+        session (AsyncSession): The request-scoped database session.
+
+    Returns:
+        ORJSONResponse: The outcome for each ID - i.e. a `UserBatch`.
+    """
+    applicant_ids = await ApplicationService(async_session=session).aget_applicant_ids(
+        organization_id=authenticated_organization.id, user_ids=batch_input.ids
+    )
+    visible_ids = [id for id in batch_input.ids if id in applicant_ids]
+    users = dict(
+        zip(
+            visible_ids,
+            await UserService(async_session=session).aget_many(visible_ids),
+        )
+    )
+    results = [
+        (
+            UserBatchResult(user=users[id])
+            if id in users and not isinstance(users[id], NotFoundError)
+            else UserBatchResult(error=f"User {id} not found.")
+        )
+        for id in batch_input.ids
+    ]
+
+    return ORJSONResponse(UserBatch(results=results).model_dump())
+
+
+@router.get("/{user_id}", response_model=User)
+async def get_user(
+    user_id: UUID,
+    response: Response,
+    authenticated_user: Annotated[Principal, Depends(get_authenticated_user)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    if_none_match: Annotated[str | None, Header()] = None,
+    if_modified_since: Annotated[str | None, Header()] = None,
+) -> Any:
+    """
+    Retrieve a user - only by themselves.
+
+    Conditional requests (`If-None-Match`/`If-Modified-Since`) of an unchanged user are answered with
+    `304 Not Modified` - checking its version alone (i.e. without serializing it, nor even loading it if cached).
+    A plain `GET` loads the user once. Users are private: shared caches must not store them.
 
     Args:
         user_id (UUID): The ID of the user.
+        response (Response): The response - i.e. its caching headers.
+        authenticated_user (Principal): The authenticated user.
+        session (AsyncSession): The request-scoped database session.
+        if_none_match (str, optional): The entity tags the client has. Defaults to None.
+        if_modified_since (str, optional): When the client's copy was last modified. Defaults to None.
 
     Returns:
-        None
+        User: The user - or an empty `304 Not Modified` response.
 
     Raises:
-        HTTPException: Operation not implemented yet.
+        HTTPException: If the user is not the authenticated one, or is not found.
     """
-    logger.warning("Yet to be implemented.")
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Yet to be implemented."
+    if user_id != authenticated_user.id:
+        logger.error(
+            f"Failed to retrieve user: User mismatch (path: {user_id}, authenticated: {authenticated_user.id})."
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Failed to retrieve user: User mismatch.",
+        )
+
+    service = UserService(async_session=session)
+    try:
+        if if_none_match is not None or if_modified_since is not None:
+            updated, version = await service.aget_version(user_id)
+            headers = get_cache_headers(updated, version, PRIVATE_CACHE_CONTROL)
+            if is_not_modified(
+                headers["ETag"], updated, if_none_match, if_modified_since
+            ):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+                )
+
+        user = await service.aget(id=user_id)
+    except NotFoundError as exc:
+        logger.error(f"Failed to retrieve user: {exc.message}")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message)
+
+    response.headers.update(
+        get_cache_headers(user.updated, user.version, PRIVATE_CACHE_CONTROL)
     )
 
+    return user
+
 
 @router.patch("/{user_id}", status_code=status.HTTP_501_NOT_IMPLEMENTED)
 async def patch_user(user_id: UUID) -> None:
@@ -332,21 +477,44 @@ async def delete_user(user_id: UUID) -> None:
     )
 
 
-@router.get("/{user_id}/applications", status_code=status.HTTP_501_NOT_IMPLEMENTED)
-async def get_applications_by_user(user_id: UUID) -> None:
+@router.get(
+    "/{user_id}/applications",
+    response_model=ApplicationList,
+    response_class=ORJSONResponse,
+)
+async def get_applications_by_user(
+    user_id: UUID,
+    authenticated_user: Annotated[Principal, Depends(get_authenticated_user)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> ORJSONResponse:
     """
-    Retrieve applications for a user.
+    Retrieve the applications of a user - with their jobs - only by themselves.
+
+    The applications and their jobs are resolved by a `RelationshipLoader` - i.e. two queries at most (jobs by ID
+    go through the entity cache first), however many applications there are.
 
     Args:
         user_id (UUID): The ID of the user.
+        authenticated_user (Principal): The authenticated user.
+        session (AsyncSession): The request-scoped database session.
 
     Returns:
-        None
+        ORJSONResponse: The applications - i.e. an `ApplicationList`, ordered by creation.
 
     Raises:
-        HTTPException: Operation not implemented yet.
+        HTTPException: If the user is not the authenticated one.
     """
-    logger.warning("Yet to be implemented.")
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Yet to be implemented."
-    )
+    if user_id != authenticated_user.id:
+        logger.error(
+            f"Failed to retrieve applications: User mismatch (path: {user_id}, authenticated: {authenticated_user.id})."
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Failed to retrieve applications: User mismatch.",
+        )
+
+    loader = RelationshipLoader(async_session=session)
+    applications = await loader.applications_by_user.load(user_id)
+    await loader.load(applications, ApplicationEntity.job)
+
+    return ORJSONResponse(ApplicationList(applications=applications).model_dump())
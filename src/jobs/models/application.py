@@ -1,7 +1,8 @@
-from sqlalchemy import Column, UUID, Enum, ForeignKey
+from sqlalchemy import Column, Enum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from .base import Abstract
+from .types import BinaryUUID
 from ..utils.application import ApplicationState
 
 
@@ -18,17 +19,25 @@ class Application(Abstract):
     """
 
     __tablename__ = "applications"
+    # NOTE: the state (i.e. low-cardinality) is not indexed on its own - only as part of composite indexes
+    # supporting the listings. These also back the foreign keys on job_id and user_id.
+    __table_args__ = (
+        # NOTE: supports listing a job's applications in a given state (e.g. submitted).
+        Index("ix_applications_job_id_state", "job_id", "state"),
+        # NOTE: supports listing a user's applications - by creation.
+        Index("ix_applications_user_id_created", "user_id", "created"),
+    )
 
     state = Column(
         Enum(ApplicationState),
         nullable=False,
-        index=True,
         default=ApplicationState.DRAFT,
     )
-    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"), nullable=False)
-    job = relationship("Job", back_populates="applications")
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    user = relationship("User", back_populates="applications")
+    job_id = Column(BinaryUUID, ForeignKey("jobs.id"), nullable=False)
+    # NOTE: see `Job` - resolved by `RelationshipLoader`, never lazy loaded.
+    job = relationship("Job", back_populates="applications", lazy="raise_on_sql")
+    user_id = Column(BinaryUUID, ForeignKey("users.id"), nullable=False)
+    user = relationship("User", back_populates="applications", lazy="raise_on_sql")
 
     def __repr__(self):
         return f"<Application(id={self.id})>"
@@ -0,0 +1,55 @@
+"""
+This module sets up the asynchronous database connection for the application using SQLAlchemy's asyncio extension.
+
+It mirrors `database.py`: it creates an async engine that connects to the same MariaDB database - through
+the async driver set at `Settings.async_database_driver` - and an async sessionmaker that's bound to this engine.
+
+Sessions are created with `expire_on_commit=False`, given that refreshing expired attributes would require
+(implicit) IO - which is not possible when running under asyncio.
+
+Example:
+    To use a request-scoped async session in an endpoint:
+        async def endpoint(session: Annotated[AsyncSession, Depends(get_async_session)]): ...
+
+    To use a scoped async session elsewhere:
+        async with async_session_scope() as session:
+            ...
+
+Attributes:
+    async_engine (sqlalchemy.ext.asyncio.AsyncEngine): The SQLAlchemy async engine.
+    AsyncSession (sqlalchemy.ext.asyncio.async_sessionmaker): The SQLAlchemy async sessionmaker.
+"""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext import asyncio as sqlalchemy_asyncio
+
+from ..settings.base import get_settings
+
+settings = get_settings()
+
+async_engine = sqlalchemy_asyncio.create_async_engine(
+    make_url(settings.database_url).set(drivername=settings.async_database_driver)
+)
+
+AsyncSession = sqlalchemy_asyncio.async_sessionmaker(
+    bind=async_engine, expire_on_commit=False
+)
+
+
+async def get_async_session() -> AsyncIterator[sqlalchemy_asyncio.AsyncSession]:
+    """
+    Yield a new async session and close it afterwards.
+
+    Meant to be used as a FastAPI dependency, so that every request gets its own session.
+
+    Yields:
+        sqlalchemy_asyncio.AsyncSession: The request-scoped async session.
+    """
+    async with AsyncSession() as session:
+        yield session
+
+
+async_session_scope = asynccontextmanager(get_async_session)
@@ -1,11 +1,27 @@
-import uuid
+from datetime import datetime, timezone
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, DateTime, UUID
-from sqlalchemy.sql import func
+from sqlalchemy import Column, DateTime, Integer, text
+
+from .types import BinaryUUID
+from ..utils.identifier import uuid7
 
 Base = declarative_base()
 
 
+def utcnow() -> datetime:
+    """
+    Returns the current UTC time - as stored by the database (i.e. naive and truncated to seconds, like
+    `UTC_TIMESTAMP()`).
+
+    Used as the client-side default of timestamps, so that they are known without reading them back after an
+    INSERT/UPDATE.
+
+    Returns:
+        datetime: The current UTC time.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
 class Abstract(Base):
     """
     Base class for defining abstract models.
@@ -14,25 +30,40 @@ class Abstract(Base):
 
     Attributes:
         __abstract__ (bool): Indicates whether the class is abstract or not.
+        __mapper_args__ (dict): Mapper arguments - server-generated defaults (if any) are fetched eagerly on
+            flush, so that they can be read without any (implicit) IO afterwards. Defaults are generated
+            client-side though (e.g. `id`, `created`), so that an INSERT needs no follow-up SELECT. (`version`
+            is incremented by the database - i.e. read back after an UPDATE.)
 
     """
 
     __abstract__ = True
+    __mapper_args__ = {"eager_defaults": True}
 
+    # NOTE: the primary key is unique and indexed already - i.e. no need for another (unique) index.
+    # IDs are time-ordered (i.e. new rows are appended to the clustered index) and stored as 16 bytes.
     id = Column(
-        UUID(as_uuid=True),
+        BinaryUUID,
         primary_key=True,
-        default=uuid.uuid4,
-        unique=True,
-        index=True,
+        default=uuid7,
         nullable=False,
     )
-    created = Column(
-        DateTime(timezone=True), default=func.utc_timestamp(), nullable=False
-    )
+    created = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    # NOTE: indexed - i.e. catching up with what changed since a watermark (e.g. in-process read models,
+    # incremental snapshots) reads those rows only, rather than the whole table.
     updated = Column(
         DateTime(timezone=True),
-        default=func.utc_timestamp(),
-        onupdate=func.utc_timestamp(),
+        default=utcnow,
+        onupdate=utcnow,
+        nullable=False,
+        index=True,
+    )
+    # NOTE: incremented by the database on every UPDATE (i.e. atomically) - tells apart writes within the same
+    # second, which `updated` cannot (e.g. in entity tags).
+    version = Column(
+        Integer,
+        default=1,
+        server_default="1",
+        onupdate=text("version + 1"),
         nullable=False,
     )
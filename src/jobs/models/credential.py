@@ -1,8 +1,7 @@
-from passlib.hash import pbkdf2_sha256
 from sqlalchemy import Column, Unicode
 
 from .base import Base
-from ..utils.password import PASSWORD_SCHEMA, InvalidPasswordError
+from ..utils.password import CRYPT_CONTEXT, PASSWORD_SCHEMA, InvalidPasswordError
 
 
 class Credential(Base):
@@ -15,7 +14,8 @@ class Credential(Base):
 
     __abstract__ = True
 
-    _password = Column("password", Unicode(128), nullable=False)
+    # NOTE: never cached (see `EntityCache.dump`) - password hashes are only ever read from the database.
+    _password = Column("password", Unicode(128), nullable=False, info={"cached": False})
 
     @property
     def password(self) -> None:
@@ -38,7 +38,27 @@ class Credential(Base):
         if not PASSWORD_SCHEMA.validate(password):
             raise InvalidPasswordError()
 
-        self._password = pbkdf2_sha256.hash(password)
+        self._password = CRYPT_CONTEXT.hash(password)
+
+    @property
+    def password_hash(self) -> str:
+        """
+        The hashed password.
+        """
+        return self._password
+
+    @password_hash.setter
+    def password_hash(self, password_hash: str) -> None:
+        """
+        Setter method for the (already) hashed password - e.g. as hashed by `PasswordHashingService`.
+
+        Args:
+            password_hash (str): The hashed password.
+
+        Returns:
+            None
+        """
+        self._password = password_hash
 
     def check_password(self, password: str) -> bool:
         """
@@ -50,4 +70,23 @@ class Credential(Base):
         Returns:
             bool: True if the password matches, False otherwise.
         """
-        return pbkdf2_sha256.verify(password, self._password)
+        return CRYPT_CONTEXT.verify(password, self._password)
+
+    def verify_and_update_password(self, password: str) -> bool:
+        """
+        Check if the provided password matches the stored hashed password - rehashing it if the hash is outdated
+        (i.e. a deprecated scheme or a lower cost than the configured one).
+
+        Args:
+            password (str): The password to be checked.
+
+        Returns:
+            bool: True if the password matches, False otherwise.
+        """
+        verified, password_hash = CRYPT_CONTEXT.verify_and_update(
+            password, self._password
+        )
+        if password_hash is not None:
+            self._password = password_hash
+
+        return verified
@@ -6,6 +6,10 @@ It creates an engine that connects to a MariaDB database, and a sessionmaker tha
 The engine is configured with the connection string to the MariaDB database. Replace 'username', 'password', 'hostname', 'port', and 'database_name' with your actual credentials and database name.
 
 The Session class is a sessionmaker that's bound to this engine. This class is used to create new Session objects which represent database transactions.
+Objects are not expired on commit - i.e. reading a just created (or updated) object does not issue a SELECT.
+
+Requests use the async sessions set up at `async_database.py` (`get_async_session`); sync sessions are meant
+for the services' sync methods (e.g. the CLI, tests and benchmarks) and are not meant to be shared across threads.
 
 Example:
     To create a new Session object:
@@ -14,6 +18,10 @@ Example:
     To close a Session object:
         session.close()
 
+    To close a Session object at the end of a block:
+        with Session() as session:
+            ...
+
 Attributes:
     engine (sqlalchemy.engine.Engine): The SQLAlchemy engine.
     Session (sqlalchemy.orm.session.sessionmaker): The SQLAlchemy sessionmaker.
@@ -22,11 +30,11 @@ Attributes:
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from ..settings.base import Settings
+from ..settings.base import get_settings
 
-settings = Settings()
+settings = get_settings()
 
 # TODO: Create app user for DB.
 engine = create_engine(settings.database_url)
 
-Session = sessionmaker(bind=engine)
+Session = sessionmaker(bind=engine, expire_on_commit=False)
@@ -1,7 +1,16 @@
-from sqlalchemy import Column, UUID, Unicode, UnicodeText, Enum, Numeric, ForeignKey
+from sqlalchemy import (
+    Column,
+    Unicode,
+    UnicodeText,
+    Enum,
+    Numeric,
+    ForeignKey,
+    Index,
+)
 from sqlalchemy.orm import relationship, validates
 
 from .base import Abstract
+from .types import BinaryUUID
 from ..utils.job import JobContract, JobMode, JobState, InvalidSalaryError
 
 
@@ -18,21 +27,43 @@ class Job(Abstract):
         contract (JobContract): The contract type of the job.
         organization_id (UUID): The ID of the organization associated with the job.
         organization (Organization): The organization associated with the job.
+        applications (list[Application]): The applications for the job.
     """
 
     __tablename__ = "jobs"
+    # NOTE: low-cardinality columns (i.e. the enums) are not indexed on their own - only as part of
+    # composite indexes supporting the listings. Both also back the foreign key on organization_id.
+    __table_args__ = (
+        # NOTE: supports listing an organization's jobs - keyset paginated by (created, id).
+        Index("ix_jobs_organization_id_created_id", "organization_id", "created", "id"),
+        # NOTE: supports listing an organization's jobs in a given state (e.g. open) - by creation.
+        Index(
+            "ix_jobs_organization_id_state_created",
+            "organization_id",
+            "state",
+            "created",
+        ),
+        # NOTE: supports searching jobs - i.e. `MATCH (title, description) AGAINST (...)`.
+        Index(
+            "ix_jobs_title_description", "title", "description", mysql_prefix="FULLTEXT"
+        ),
+    )
 
     title = Column(Unicode(255), nullable=False, index=True)
     description = Column(UnicodeText)
-    state = Column(Enum(JobState), nullable=False, index=True, default=JobState.DRAFT)
+    state = Column(Enum(JobState), nullable=False, default=JobState.DRAFT)
     salary = Column(Numeric(10, 2), nullable=False, index=True)
-    mode = Column(Enum(JobMode), nullable=False, index=True)
-    contract = Column(Enum(JobContract), nullable=False, index=True)
-    organization_id = Column(
-        UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
+    mode = Column(Enum(JobMode), nullable=False)
+    contract = Column(Enum(JobContract), nullable=False)
+    organization_id = Column(BinaryUUID, ForeignKey("organizations.id"), nullable=False)
+    # NOTE: relationships are never lazy loaded (i.e. one query per row) - reading one that is not loaded raises.
+    # They are resolved in batches by `RelationshipLoader` (or eagerly, with a loader option) instead.
+    organization = relationship(
+        "Organization", back_populates="jobs", lazy="raise_on_sql"
+    )
+    applications = relationship(
+        "Application", back_populates="job", lazy="raise_on_sql"
     )
-    organization = relationship("Organization", back_populates="jobs")
-    applications = relationship("Application", back_populates="job")
 
     def __repr__(self):
         return f"<Job(id={self.id}, title={self.title})>"
@@ -0,0 +1,74 @@
+"""
+This module defines custom column types.
+
+`BinaryUUID` stores UUIDs as 16 bytes (i.e. `BINARY(16)`) rather than as 32 hex characters (i.e. `CHAR(32)`,
+which is how SQLAlchemy's `UUID` is stored by MariaDB) - halving the primary key and every index referencing
+it. UUIDs are still `uuid.UUID` in Python - i.e. the API representation is unchanged.
+
+While the columns are migrated from `CHAR(32)` (see a3f9c1e7b204), `Settings.uuid_column_type` is set to `char`: UUIDs
+are then written as hex strings - i.e. to the `CHAR(32)` columns - and read in either representation.
+
+Example:
+    id = Column(BinaryUUID, primary_key=True, default=uuid7)
+"""
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import BINARY, Dialect
+from sqlalchemy.types import TypeDecorator
+
+from ..settings.base import get_settings
+
+
+settings = get_settings()
+
+
+class BinaryUUID(TypeDecorator):
+    """
+    A UUID stored as 16 bytes.
+
+    Bytes compare the same way UUIDs do - i.e. time-ordered UUIDs (e.g. `uuid7`) are stored in order.
+    """
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: UUID | str | None, dialect: Dialect
+    ) -> bytes | None:
+        """
+        Converts a UUID (or its string representation) to bytes - or to hex, if `uuid_column_type` is `char` - on
+        its way to the database.
+        """
+        if value is None:
+            return None
+
+        value = value if isinstance(value, UUID) else UUID(value)
+        return value.hex if settings.uuid_column_type == "char" else value.bytes
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> UUID | None:
+        """
+        Converts bytes (or hex, from a `CHAR(32)` column) to a UUID - on its way from the database.
+        """
+        if value is None:
+            return None
+
+        return UUID(value) if isinstance(value, str) else UUID(bytes=bytes(value))
+
+    def process_literal_param(self, value: UUID | None, dialect: Dialect) -> str:
+        """
+        Renders a UUID as a literal - e.g. when compiling statements with literal binds.
+        """
+        if value is None:
+            return "NULL"
+
+        return (
+            f"'{value.hex}'"
+            if settings.uuid_column_type == "char"
+            else f"X'{value.hex}'"
+        )
+
+    @property
+    def python_type(self) -> type:
+        return UUID
@@ -15,13 +15,17 @@ class User(Abstract, Credential):
         __tablename__ (str): The name of the table in the database.
         name (Unicode): The name of the user.
         username (Unicode): The username of the user. Has to be an email.
+        applications (relationship): The relationship to the applications of the user.
     """
 
     __tablename__ = "users"
 
     name = Column(Unicode(255), nullable=False)
     username = Column(Unicode(255), nullable=False, unique=True, index=True)
-    applications = relationship("Application", back_populates="user")
+    # NOTE: see `Job` - resolved by `RelationshipLoader`, never lazy loaded.
+    applications = relationship(
+        "Application", back_populates="user", lazy="raise_on_sql"
+    )
 
     def __repr__(self):
         return f"<User(id={self.id}, username={self.username})>"
@@ -31,6 +35,9 @@ class User(Abstract, Credential):
         """
         Validates the given username - which should be an email.
 
+        Only the syntax is validated here (i.e. no network lookups): deliverability is checked - if enabled -
+        asynchronously, by `UserService.acreate`.
+
         Parameters:
         - key (str): The key associated with the username.
         - username (str): The username to be validated.
@@ -42,7 +49,7 @@ class User(Abstract, Credential):
         - InvalidUsername: If the username is not a valid email address.
         """
         try:
-            email = validate_email(username)
+            email = validate_email(username, check_deliverability=False)
         except EmailNotValidError:
             raise InvalidUsernameError(
                 f"Invalid username (i.e. email address): {username}."
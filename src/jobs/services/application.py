@@ -1,18 +1,31 @@
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
+from typing import Literal
 from uuid import UUID
 
+from sqlalchemy import RowMapping, select
 from sqlalchemy.exc import (
     DataError,
     IntegrityError,
     InvalidRequestError,
     OperationalError,
-    NoResultFound,
 )
-from .base import BaseService
+from .base import BaseService, get_violated_foreign_key
 from .exceptions import ClientError, ServerError, NotFoundError
 from ..models.application import Application
 from ..models.job import Job
-from ..models.user import User
+
+
+# NOTE: the columns of an export - i.e. each application, and the title of its job.
+EXPORT_COLUMNS = (
+    Application.id,
+    Application.state,
+    Application.job_id,
+    Job.title.label("job_title"),
+    Application.user_id,
+    Application.created,
+    Application.updated,
+)
 
 
 @dataclass
@@ -29,6 +42,9 @@ class ApplicationService(BaseService):
         """
         Creates a new Application.
 
+        The application is inserted by `job_id` and `user_id` - i.e. without looking the job and the user up
+        first.
+
         Parameters:
             job_id (UUID): The ID of the job the application is for.
             user_id (UUID): The ID of the user who is applying for the job.
@@ -41,25 +57,23 @@ class ApplicationService(BaseService):
             ClientError: If there is a data error or an invalid password is provided.
             ServerError: If there is an invalid request or operational error.
         """
-        try:
-            job = self.session.query(Job).filter_by(id=job_id).one()
-        except NoResultFound:
-            raise NotFoundError(message=f"Job {job_id} not found.")
-
-        try:
-            user = self.session.query(User).filter_by(id=user_id).one()
-        except NoResultFound:
-            raise NotFoundError(message=f"User {user_id} not found.")
-
         try:
             application = Application(
-                job=job,
-                user=user,
+                job_id=job_id,
+                user_id=user_id,
             )
             self.session.add(application)
             self.session.flush()
             self.session.commit()
-        except (DataError, IntegrityError) as exc:
+        except IntegrityError as exc:
+            self.session.rollback()
+            match get_violated_foreign_key(exc):
+                case "job_id":
+                    raise NotFoundError(message=f"Job {job_id} not found.")
+                case "user_id":
+                    raise NotFoundError(message=f"User {user_id} not found.")
+            raise ClientError(message=str(exc))
+        except DataError as exc:
             self.session.rollback()
             raise ClientError(message=str(exc))
         except (InvalidRequestError, OperationalError) as exc:
@@ -68,6 +82,137 @@ class ApplicationService(BaseService):
 
         return application
 
+    async def acreate(self, job_id: UUID, user_id: UUID) -> Application:
+        """
+        Awaitable version of `create` - runs on `async_session`.
+
+        Parameters:
+            job_id (UUID): The ID of the job the application is for.
+            user_id (UUID): The ID of the user who is applying for the job.
+
+        Returns:
+            Application: The newly created application.
+        """
+        return await self.run_sync(
+            ApplicationService.create, job_id=job_id, user_id=user_id
+        )
+
+    def get_applicant_ids(
+        self, organization_id: UUID, user_ids: list[UUID]
+    ) -> set[UUID]:
+        """
+        Retrieves which of the given users applied to an organization's jobs - i.e. which users it may see.
+
+        Parameters:
+            organization_id (UUID): The ID of the organization.
+            user_ids (list[UUID]): The IDs of the users.
+
+        Returns:
+            set[UUID]: The IDs of the users who applied to (at least) one of the organization's jobs.
+        """
+        return set(
+            self.session.scalars(
+                select(Application.user_id)
+                .join(Job, Application.job_id == Job.id)
+                .where(
+                    Job.organization_id == organization_id,
+                    Application.user_id.in_(user_ids),
+                )
+                .distinct()
+            )
+        )
+
+    async def aget_applicant_ids(
+        self, organization_id: UUID, user_ids: list[UUID]
+    ) -> set[UUID]:
+        """
+        Awaitable version of `get_applicant_ids` - runs on `async_session`.
+
+        Parameters:
+            organization_id (UUID): The ID of the organization.
+            user_ids (list[UUID]): The IDs of the users.
+
+        Returns:
+            set[UUID]: The IDs of the users who applied to (at least) one of the organization's jobs.
+        """
+        return await self.run_sync(
+            ApplicationService.get_applicant_ids,
+            organization_id=organization_id,
+            user_ids=user_ids,
+        )
+
+    def get_by_parent_ids(
+        self, parent: Literal["job_id", "user_id"], ids: list[UUID]
+    ) -> list[list[Application]]:
+        """
+        Retrieves the applications of jobs (or users) - with a single `IN (...)` query.
+
+        Parameters:
+            parent (str): The column the applications are retrieved by - `job_id` or `user_id`.
+            ids (list[UUID]): The IDs of the jobs (or users).
+
+        Returns:
+            list[list[Application]]: The applications - ordered by creation - of each of `ids` (in order).
+        """
+        column = getattr(Application, parent)
+        applications: dict[UUID, list[Application]] = {id: [] for id in ids}
+        for application in self.session.scalars(
+            select(Application)
+            .where(column.in_(ids))
+            .order_by(Application.created, Application.id)
+        ):
+            applications[getattr(application, parent)].append(application)
+
+        return [applications[id] for id in ids]
+
+    async def aget_by_parent_ids(
+        self, parent: Literal["job_id", "user_id"], ids: list[UUID]
+    ) -> list[list[Application]]:
+        """
+        Awaitable version of `get_by_parent_ids` - runs on `async_session`.
+
+        Parameters:
+            parent (str): The column the applications are retrieved by - `job_id` or `user_id`.
+            ids (list[UUID]): The IDs of the jobs (or users).
+
+        Returns:
+            list[list[Application]]: The applications - ordered by creation - of each of `ids` (in order).
+        """
+        return await self.run_sync(
+            ApplicationService.get_by_parent_ids, parent=parent, ids=ids
+        )
+
+    async def astream_by_organization(
+        self, organization_id: UUID, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """
+        Streams the applications for an organization's jobs - in batches, through a server-side cursor.
+
+        Rows are fetched `batch_size` at a time - i.e. memory use does not depend on the number of applications.
+        They are not ordered (ordering would require sorting all of them first).
+
+        Parameters:
+            organization_id (UUID): The ID of the organization.
+            batch_size (int, optional): The number of rows fetched at a time. Defaults to 1000.
+
+        Yields:
+            Sequence[RowMapping]: The rows - i.e. `EXPORT_COLUMNS` - a batch at a time.
+
+        Raises:
+            ServerError: If the service has no async session.
+        """
+        if self.async_session is None:
+            raise ServerError(message=f"{type(self).__name__} has no async session.")
+
+        result = await self.async_session.stream(
+            select(*EXPORT_COLUMNS)
+            .join(Job, Application.job_id == Job.id)
+            .where(Job.organization_id == organization_id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for rows in result.mappings().partitions():
+            yield rows
+
     def update(self):
         """
         Updates an existing application.
@@ -1,15 +1,33 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from sqlalchemy import inspect
+from sqlalchemy.exc import InvalidRequestError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .exceptions import ClientError, ServerError
+from .hashing import PasswordHashingService, password_hashing_service
+from ..models.credential import Credential
 from ..models.database import Session
+from ..utils.password import PASSWORD_SCHEMA, InvalidPasswordError
 
 
 @dataclass
 class AuthService(ABC):
     """
     Abstract class for service classes that need to implement authentication.
+
+    Attributes:
+        session (Session): The database session used by the service.
+        async_session (AsyncSession | None): The async database session used by the service.
+        hashing_service (PasswordHashingService): The service the awaitable methods hash and verify passwords with.
     """
 
-    session: Session = Session()
+    session: Session = field(default_factory=Session)
+    async_session: AsyncSession | None = None
+    hashing_service: PasswordHashingService = field(
+        default_factory=lambda: password_hashing_service
+    )
 
     @abstractmethod
     def authenticate(self):
@@ -17,3 +35,82 @@ class AuthService(ABC):
         Abstract method for authenticating an entity.
         """
         pass
+
+    async def hash_password(self, password: str) -> str:
+        """
+        Validates and hashes a password - off the event loop.
+
+        Parameters:
+            password (str): The password to hash.
+
+        Returns:
+            str: The hashed password.
+
+        Raises:
+            ClientError: If the password does not meet the requirements.
+            UnavailableError: If the hashing service is overloaded.
+        """
+        if not PASSWORD_SCHEMA.validate(password):
+            raise ClientError(message=str(InvalidPasswordError()))
+
+        return await self.hashing_service.hash(password)
+
+    async def verify_password(self, password: str, password_hash: str) -> str | None:
+        """
+        Verifies a password against a hash - off the event loop.
+
+        Parameters:
+            password (str): The password to verify.
+            password_hash (str): The hashed password.
+
+        Returns:
+            str | None: The new hash for the password - if `password_hash` is outdated.
+
+        Raises:
+            InvalidPasswordError: If the password does not match.
+            UnavailableError: If the hashing service is overloaded.
+        """
+        verified, new_password_hash = await self.hashing_service.verify(
+            password, password_hash
+        )
+        if not verified:
+            raise InvalidPasswordError()
+
+        return new_password_hash
+
+    async def aget_password_hash(self, credential: Credential) -> str:
+        """
+        Gets a credential's password hash - from the database (on `async_session`) if it is not loaded, e.g. when
+        the credential was built from `EntityCache`, which never caches it.
+
+        Parameters:
+            credential (Credential): The credential.
+
+        Returns:
+            str: The hashed password.
+        """
+        if "_password" in inspect(credential).unloaded:
+            await self.async_session.refresh(credential, attribute_names=["_password"])
+
+        return credential.password_hash
+
+    def _rehash_password(self, credential: Credential, password_hash: str) -> None:
+        """
+        Stores a credential's new password hash - e.g. after an outdated hash was verified.
+
+        Parameters:
+            credential (Credential): The credential.
+            password_hash (str): The new hashed password.
+
+        Returns:
+            None
+
+        Raises:
+            ServerError: If there is an invalid request or operational error.
+        """
+        try:
+            credential.password_hash = password_hash
+            self.session.commit()
+        except (InvalidRequestError, OperationalError) as exc:
+            self.session.rollback()
+            raise ServerError(message=str(exc))
@@ -1,15 +1,237 @@
+import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .exceptions import NotFoundError, ServerError
 from ..models.database import Session
+from ..utils.cache import ENTITY_CACHE, EntityCache
+
+
+T = TypeVar("T")
+
+# NOTE: MySQL/MariaDB error codes for inserting (or updating) a row whose parent row does not exist.
+FOREIGN_KEY_ERROR_CODES = (1216, 1452)
+FOREIGN_KEY_PATTERN = re.compile(r"FOREIGN KEY \(`(?P<column>\w+)`\)")
+
+
+def get_violated_foreign_key(exc: IntegrityError) -> str | None:
+    """
+    Returns the column of the foreign key an integrity error violated - i.e. the column referencing a
+    missing parent row.
+
+    Inserting by foreign key (rather than looking the parent up first) relies on it to tell which parent is
+    missing.
+
+    Parameters:
+        exc (IntegrityError): The integrity error.
+
+    Returns:
+        str | None: The foreign key column - None if the error is not a foreign key violation.
+    """
+    args = getattr(exc.orig, "args", ())
+    if len(args) < 2 or args[0] not in FOREIGN_KEY_ERROR_CODES:
+        return None
+
+    match = FOREIGN_KEY_PATTERN.search(str(args[1]))
+    return match["column"] if match else None
 
 
 @dataclass
 class BaseService(ABC):
     """
     Abstract base class for service classes.
+
+    Attributes:
+        session (Session): The database session used by the service. A new session is created
+            per service instance unless one is provided.
+        async_session (AsyncSession | None): The async database session used by the awaitable
+            methods (e.g. `acreate`) - e.g. the request-scoped session yielded by `get_async_session`.
+        entity_cache (EntityCache): The cache entities are looked up in (by ID or natural key) before the database.
     """
 
-    session: Session = Session()
+    session: Session = field(default_factory=Session)
+    async_session: AsyncSession | None = None
+    entity_cache: EntityCache = field(default_factory=lambda: ENTITY_CACHE)
+
+    async def run_sync(
+        self, method: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Runs a (synchronous) service method on `async_session`.
+
+        The method is called on a copy of the service bound to the sync facade of `async_session` -
+        i.e. the database IO is performed by the async driver and does not block the event loop.
+
+        Parameters:
+            method (Callable[..., T]): The (unbound) service method to run.
+            *args (Any): Positional arguments for the method.
+            **kwargs (Any): Keyword arguments for the method.
+
+        Returns:
+            T: Whatever the method returns.
+
+        Raises:
+            ServerError: If the service has no async session.
+        """
+        if self.async_session is None:
+            raise ServerError(message=f"{type(self).__name__} has no async session.")
+
+        return await self.async_session.run_sync(
+            lambda session: method(replace(self, session=session), *args, **kwargs)
+        )
+
+    def _get_version(
+        self, model: type, id: UUID, cached_by: tuple[str, ...]
+    ) -> tuple[datetime, int]:
+        """
+        Returns the version of an entity - i.e. when it was last updated, and its write counter - from
+        `entity_cache` (its local tier) or, on a miss, by loading (and caching) the entity.
+
+        Parameters:
+            model (type): The model - e.g. `Job`.
+            id (UUID): The ID of the entity.
+            cached_by (tuple[str, ...]): The names of the (unique) columns the entity is cached by.
+
+        Returns:
+            tuple[datetime, int]: When the entity was last updated, and its version.
+
+        Raises:
+            NotFoundError: If the entity is not found.
+        """
+        values = self.entity_cache.get(model, "id", id)
+        if values is not None:
+            return values["updated"], values["version"]
+
+        [entity] = self._get_many(model, [id], cached_by)
+        if isinstance(entity, NotFoundError):
+            raise entity
+
+        return entity.updated, entity.version
+
+    async def _aget_version(
+        self, model: type, id: UUID, cached_by: tuple[str, ...]
+    ) -> tuple[datetime, int]:
+        """
+        Awaitable version of `_get_version` - runs on `async_session`, with the entity looked up in both tiers of
+        `entity_cache` first.
+
+        Parameters:
+            model (type): The model - e.g. `Job`.
+            id (UUID): The ID of the entity.
+            cached_by (tuple[str, ...]): The names of the (unique) columns the entity is cached by.
+
+        Returns:
+            tuple[datetime, int]: When the entity was last updated, and its version.
+        """
+        values = await self.entity_cache.aget(model, "id", id)
+        if values is not None:
+            return values["updated"], values["version"]
+
+        [entity] = await self._aget_many(model, [id], cached_by)
+        if isinstance(entity, NotFoundError):
+            raise entity
+
+        return entity.updated, entity.version
+
+    def _get_many(
+        self, model: type[T], ids: list[UUID], cached_by: tuple[str, ...]
+    ) -> list[T | NotFoundError]:
+        """
+        Returns entities by ID - from `entity_cache` (its local tier) or, for the misses, a single `IN (...)` query.
+
+        Parameters:
+            model (type[T]): The model - e.g. `Job`.
+            ids (list[UUID]): The IDs of the entities.
+            cached_by (tuple[str, ...]): The names of the (unique) columns the entities are cached by.
+
+        Returns:
+            list[T | NotFoundError]: The entity - or why it is missing - for each of `ids` (in order).
+        """
+        cached = {}
+        for id in dict.fromkeys(ids):
+            values = self.entity_cache.get(model, "id", id)
+            if values is not None:
+                cached[id] = values
+
+        results, queried = self._load_many(model, ids, cached)
+        for entity in queried:
+            self.entity_cache.set(entity, cached_by)
+
+        return results
+
+    async def _aget_many(
+        self, model: type[T], ids: list[UUID], cached_by: tuple[str, ...]
+    ) -> list[T | NotFoundError]:
+        """
+        Awaitable version of `_get_many` - runs on `async_session`, with the entities looked up in both tiers of
+        `entity_cache` first.
+
+        Parameters:
+            model (type[T]): The model - e.g. `Job`.
+            ids (list[UUID]): The IDs of the entities.
+            cached_by (tuple[str, ...]): The names of the (unique) columns the entities are cached by.
+
+        Returns:
+            list[T | NotFoundError]: The entity - or why it is missing - for each of `ids` (in order).
+        """
+        cached = {}
+        for id in dict.fromkeys(ids):
+            values = await self.entity_cache.aget(model, "id", id)
+            if values is not None:
+                cached[id] = values
+
+        results, queried = await self.run_sync(
+            BaseService._load_many, model, ids, cached
+        )
+        for entity in queried:
+            await self.entity_cache.aset(entity, cached_by)
+
+        return results
+
+    def _load_many(
+        self, model: type[T], ids: list[UUID], cached: dict[UUID, dict[str, Any]]
+    ) -> tuple[list[T | NotFoundError], list[T]]:
+        """
+        Attaches cached entities to the session (without a query) and queries the others with a single
+        `IN (...)` query.
+
+        Parameters:
+            model (type[T]): The model - e.g. `Job`.
+            ids (list[UUID]): The IDs of the entities.
+            cached (dict[UUID, dict[str, Any]]): The (cached) column values of the entities - by ID.
+
+        Returns:
+            tuple[list[T | NotFoundError], list[T]]: The entity - or why it is missing - for each of `ids` (in
+                order), and the entities queried (i.e. to be cached).
+        """
+        found = {
+            id: self.session.merge(self.entity_cache.build(model, values), load=False)
+            for id, values in cached.items()
+        }
+        missing = [id for id in dict.fromkeys(ids) if id not in found]
+        queried = (
+            list(self.session.scalars(select(model).where(model.id.in_(missing))))
+            if missing
+            else []
+        )
+        found.update((entity.id, entity) for entity in queried)
+
+        return [
+            (
+                found[id]
+                if id in found
+                else NotFoundError(message=f"{model.__name__} {id} not found.")
+            )
+            for id in ids
+        ], queried
 
     @abstractmethod
     def create(self):
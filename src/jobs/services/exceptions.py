@@ -9,6 +9,9 @@ class BaseError(Exception):
 
     message: str
 
+    def __str__(self) -> str:
+        return self.message
+
 
 @dataclass
 class ServerError(BaseError):
@@ -19,6 +22,15 @@ class ServerError(BaseError):
     pass
 
 
+@dataclass
+class UnavailableError(ServerError):
+    """
+    Exception raised when the server is (temporarily) unable to handle a request - e.g. when overloaded.
+    """
+
+    pass
+
+
 @dataclass
 class ClientError(BaseError):
     """
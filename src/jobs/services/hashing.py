@@ -0,0 +1,262 @@
+"""
+This module defines the password hashing service.
+
+Hashing (and verifying) passwords is CPU-bound and takes tens of milliseconds - i.e. running it inline
+within an async handler freezes the event loop. The `PasswordHashingService` offloads it to a pool of
+worker processes (so that it scales across cores) fronted by a bounded queue: once the pool and the queue
+are full, further requests are rejected (with `UnavailableError`) instead of piling up.
+
+The service keeps track of how many requests are in flight/queued and of how long hashing takes, so
+that workers can be sized for login storms.
+
+Attributes:
+    password_hashing_service (PasswordHashingService): The process-wide password hashing service.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from .exceptions import UnavailableError
+from ..settings.base import get_settings
+from ..utils.password import CRYPT_CONTEXT
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _initialize(policy: str) -> None:
+    """
+    Initializes a worker process - with the same password hashing policy as the parent's (e.g. if calibrated).
+
+    Parameters:
+        policy (str): The password hashing policy - as serialized by `CryptContext.to_string`.
+
+    Returns:
+        None
+    """
+    CRYPT_CONTEXT.load(policy)
+
+
+def _hash(password: str) -> tuple[str, float]:
+    """
+    Hashes a password - runs on a worker process.
+
+    Parameters:
+        password (str): The password to hash.
+
+    Returns:
+        tuple[str, float]: The hashed password and how long hashing took (in seconds).
+    """
+    start = time.perf_counter()
+    hashed = CRYPT_CONTEXT.hash(password)
+    return hashed, time.perf_counter() - start
+
+
+def _verify(password: str, hashed: str) -> tuple[tuple[bool, str | None], float]:
+    """
+    Verifies a password against a hash - and rehashes it if outdated - runs on a worker process.
+
+    Parameters:
+        password (str): The password to verify.
+        hashed (str): The hashed password.
+
+    Returns:
+        tuple[tuple[bool, str | None], float]: Whether the password matches, its new hash (if outdated) and how
+            long verifying took (in seconds).
+    """
+    start = time.perf_counter()
+    verified = CRYPT_CONTEXT.verify_and_update(password, hashed)
+    return verified, time.perf_counter() - start
+
+
+@dataclass
+class HashingStats:
+    """
+    Represents a snapshot of the password hashing service's metrics.
+
+    Attributes:
+        workers (int): The number of worker processes.
+        max_queue_size (int): The maximum number of requests waiting for a worker.
+        in_flight (int): The number of requests being processed or waiting for a worker.
+        queue_depth (int): The number of requests waiting for a worker.
+        completed (int): The number of requests completed.
+        rejected (int): The number of requests rejected because the queue was full.
+        average_hash_latency (float): The average time spent hashing/verifying (in seconds).
+        max_hash_latency (float): The maximum time spent hashing/verifying (in seconds).
+        average_wait_latency (float): The average time spent waiting for a worker (in seconds).
+    """
+
+    workers: int
+    max_queue_size: int
+    in_flight: int
+    queue_depth: int
+    completed: int
+    rejected: int
+    average_hash_latency: float
+    max_hash_latency: float
+    average_wait_latency: float
+
+
+@dataclass
+class PasswordHashingService:
+    """
+    A class that hashes and verifies passwords on a bounded pool of worker processes.
+
+    The pool is started on first use (or explicitly, via `start`) and should be shut down - via
+    `shutdown` - when the application stops. Workers hash with the policy `CRYPT_CONTEXT` has when the
+    pool is started - i.e. it should be calibrated beforehand.
+
+    Attributes:
+        max_workers (int): The number of worker processes.
+        max_queue_size (int): The maximum number of requests waiting for a worker.
+    """
+
+    max_workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    max_queue_size: int = 64
+    _executor: ProcessPoolExecutor | None = field(default=None, init=False, repr=False)
+    _in_flight: int = field(default=0, init=False, repr=False)
+    _completed: int = field(default=0, init=False, repr=False)
+    _rejected: int = field(default=0, init=False, repr=False)
+    _hash_latency: float = field(default=0.0, init=False, repr=False)
+    _max_hash_latency: float = field(default=0.0, init=False, repr=False)
+    _wait_latency: float = field(default=0.0, init=False, repr=False)
+
+    def start(self) -> None:
+        """
+        Starts the worker processes - if not started yet.
+
+        Returns:
+            None
+        """
+        if self._executor is None:
+            logger.info(f"Starting password hashing pool ({self.max_workers} workers).")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize,
+                initargs=(CRYPT_CONTEXT.to_string(),),
+            )
+
+    def shutdown(self) -> None:
+        """
+        Shuts the worker processes down - if started.
+
+        Returns:
+            None
+        """
+        if self._executor is not None:
+            logger.info("Shutting password hashing pool down.")
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of requests waiting for a worker.
+        """
+        return max(0, self._in_flight - self.max_workers)
+
+    def stats(self) -> HashingStats:
+        """
+        Returns a snapshot of the service's metrics.
+
+        Returns:
+            HashingStats: The service's metrics.
+        """
+        return HashingStats(
+            workers=self.max_workers,
+            max_queue_size=self.max_queue_size,
+            in_flight=self._in_flight,
+            queue_depth=self.queue_depth,
+            completed=self._completed,
+            rejected=self._rejected,
+            average_hash_latency=self._hash_latency / max(self._completed, 1),
+            max_hash_latency=self._max_hash_latency,
+            average_wait_latency=self._wait_latency / max(self._completed, 1),
+        )
+
+    async def hash(self, password: str) -> str:
+        """
+        Hashes a password.
+
+        Parameters:
+            password (str): The password to hash.
+
+        Returns:
+            str: The hashed password.
+
+        Raises:
+            UnavailableError: If the queue is full.
+        """
+        return await self._submit(_hash, password)
+
+    async def verify(self, password: str, hashed: str) -> tuple[bool, str | None]:
+        """
+        Verifies a password against a hash - and rehashes it if outdated (i.e. a deprecated scheme or a lower cost
+        than the configured one).
+
+        Parameters:
+            password (str): The password to verify.
+            hashed (str): The hashed password.
+
+        Returns:
+            tuple[bool, str | None]: True if the password matches (False otherwise) and the new hash - if outdated.
+
+        Raises:
+            UnavailableError: If the queue is full.
+        """
+        return await self._submit(_verify, password, hashed)
+
+    async def _submit(self, function: Callable[..., tuple[T, float]], *args: Any) -> T:
+        """
+        Submits a function to the worker processes and awaits its result.
+
+        Parameters:
+            function (Callable[..., tuple[T, float]]): The function to run - which returns its result
+                and how long it took.
+            *args (Any): Arguments for the function.
+
+        Returns:
+            T: The result of the function.
+
+        Raises:
+            UnavailableError: If the queue is full.
+        """
+        if self._in_flight >= self.max_workers + self.max_queue_size:
+            self._rejected += 1
+            raise UnavailableError(message="Password hashing queue is full.")
+
+        self.start()
+
+        self._in_flight += 1
+        start = time.perf_counter()
+        try:
+            result, latency = await asyncio.get_running_loop().run_in_executor(
+                self._executor, function, *args
+            )
+        finally:
+            self._in_flight -= 1
+
+        self._completed += 1
+        self._hash_latency += latency
+        self._max_hash_latency = max(self._max_hash_latency, latency)
+        self._wait_latency += time.perf_counter() - start - latency
+
+        return result
+
+
+settings = get_settings()
+
+password_hashing_service = PasswordHashingService(
+    max_workers=settings.password_hashing_workers or os.cpu_count() or 1,
+    max_queue_size=settings.password_hashing_queue_size,
+)
@@ -1,6 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Literal
 from uuid import UUID
 
+from sqlalchemy import and_, or_, select
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.exc import (
     DataError,
     IntegrityError,
@@ -8,19 +12,47 @@ from sqlalchemy.exc import (
     OperationalError,
     NoResultFound,
 )
-from .base import BaseService
+from .base import BaseService, get_violated_foreign_key
 from .exceptions import ClientError, ServerError, NotFoundError
+from ..models.base import utcnow
 from ..models.job import Job
-from ..models.organization import Organization
-from ..utils.job import JobMode, JobContract
+from ..settings.base import get_settings
+from ..utils.cache import JOB_RESPONSE_CACHE, ResponseCache
+from ..utils.catalog import JOB_CATALOG, JobCatalog
+from ..utils.identifier import uuid7
+from ..utils.job import InvalidSalaryError, JobMode, JobContract, JobState
+from ..utils.pagination import Cursor
+from ..utils.search import JOB_SEARCH_INDEX, JobSearchIndex
+
+
+settings = get_settings()
+
+# NOTE: the (unique) columns jobs are cached by - see `EntityCache`.
+CACHED_BY = ("id",)
+
+# NOTE: how far back past their watermark the in-process read models catch up from - see `refresh_search_index`.
+WATERMARK_LAG = timedelta(seconds=settings.watermark_lag_seconds)
 
 
 @dataclass
 class JobService(BaseService):
     """
     A class that provides methods for creating, updating, getting, and deleting jobs.
+
+    Attributes:
+        search_index (JobSearchIndex | None): The in-process index jobs are searched with (and kept up to date as
+            they are committed) - None if they are searched with the database's FULLTEXT index.
+        catalog (JobCatalog | None): The in-process catalog jobs are browsed with (and kept up to date as they are
+            committed) - None if they are browsed with SQL.
+        response_cache (ResponseCache): The serialized job detail responses - invalidated as jobs are committed.
     """
 
+    search_index: JobSearchIndex | None = field(
+        default_factory=lambda: JOB_SEARCH_INDEX
+    )
+    catalog: JobCatalog | None = field(default_factory=lambda: JOB_CATALOG)
+    response_cache: ResponseCache = field(default_factory=lambda: JOB_RESPONSE_CACHE)
+
     def create(
         self,
         organization_id: UUID,
@@ -33,6 +65,8 @@ class JobService(BaseService):
         """
         Creates a new job.
 
+        The job is inserted by `organization_id` - i.e. without looking the organization up first.
+
         Parameters:
             organization_id (UUID): The ID of the organization the job belongs to.
             title (str): The title of the job.
@@ -49,13 +83,6 @@ class JobService(BaseService):
             ClientError: If there is a data error or an invalid password is provided.
             ServerError: If there is an invalid request or operational error.
         """
-        try:
-            organization = (
-                self.session.query(Organization).filter_by(id=organization_id).one()
-            )
-        except NoResultFound:
-            raise NotFoundError(message=f"Organization {organization_id} not found.")
-
         try:
             job = Job(
                 title=title,
@@ -63,12 +90,20 @@ class JobService(BaseService):
                 mode=mode,
                 contract=contract,
                 description=description,
-                organization=organization,
+                organization_id=organization_id,
             )
             self.session.add(job)
             self.session.flush()
             self.session.commit()
-        except (DataError, IntegrityError) as exc:
+            self._publish([job])
+        except IntegrityError as exc:
+            self.session.rollback()
+            if get_violated_foreign_key(exc) == "organization_id":
+                raise NotFoundError(
+                    message=f"Organization {organization_id} not found."
+                )
+            raise ClientError(message=str(exc))
+        except DataError as exc:
             self.session.rollback()
             raise ClientError(message=str(exc))
         except (InvalidRequestError, OperationalError) as exc:
@@ -77,6 +112,578 @@ class JobService(BaseService):
 
         return job
 
+    async def acreate(
+        self,
+        organization_id: UUID,
+        title: str,
+        salary: float,
+        mode: JobMode,
+        contract: JobContract,
+        description: str | None = None,
+    ) -> Job:
+        """
+        Awaitable version of `create` - runs on `async_session`.
+
+        Parameters:
+            organization_id (UUID): The ID of the organization the job belongs to.
+            title (str): The title of the job.
+            salary (float): The salary of the job.
+            mode (JobMode): The mode of the job.
+            contract (JobContract): The contract type of the job.
+            description (str, optional): The description of the job. Defaults to None.
+
+        Returns:
+            Job: The newly created job.
+        """
+        return await self.run_sync(
+            JobService.create,
+            organization_id=organization_id,
+            title=title,
+            salary=salary,
+            mode=mode,
+            contract=contract,
+            description=description,
+        )
+
+    def create_many(
+        self, organization_id: UUID, jobs: list[dict[str, Any]]
+    ) -> list[Job | ClientError]:
+        """
+        Creates new jobs - in a single transaction.
+
+        Jobs are validated one by one - an invalid job is reported (rather than failing the others) - and the
+        valid ones are inserted with multi-row INSERTs (i.e. every value, including the ID and timestamps, is
+        set client-side so that the rows are batched).
+
+        Parameters:
+            organization_id (UUID): The ID of the organization the jobs belong to.
+            jobs (list[dict[str, Any]]): The jobs - i.e. the `title`, `salary`, `mode`, `contract` and
+                (optionally) `description` of each.
+
+        Returns:
+            list[Job | ClientError]: The newly created job - or why it is invalid - for each of `jobs` (in order).
+
+        Raises:
+            NotFoundError: If the organization with the given ID is not found.
+            ClientError: If there is a data error.
+            ServerError: If there is an invalid request or operational error.
+        """
+        now = utcnow()
+        results: list[Job | ClientError] = []
+        for job in jobs:
+            try:
+                results.append(
+                    Job(
+                        id=uuid7(),
+                        state=JobState.DRAFT,
+                        organization_id=organization_id,
+                        created=now,
+                        updated=now,
+                        **job,
+                    )
+                )
+            except InvalidSalaryError as exc:
+                results.append(ClientError(message=str(exc)))
+
+        created = [result for result in results if isinstance(result, Job)]
+        if not created:
+            return results
+
+        try:
+            self.session.add_all(created)
+            self.session.flush()
+            self.session.commit()
+            self._publish(created)
+        except IntegrityError as exc:
+            self.session.rollback()
+            if get_violated_foreign_key(exc) == "organization_id":
+                raise NotFoundError(
+                    message=f"Organization {organization_id} not found."
+                )
+            raise ClientError(message=str(exc))
+        except DataError as exc:
+            self.session.rollback()
+            raise ClientError(message=str(exc))
+        except (InvalidRequestError, OperationalError) as exc:
+            self.session.rollback()
+            raise ServerError(message=str(exc))
+
+        return results
+
+    async def acreate_many(
+        self, organization_id: UUID, jobs: list[dict[str, Any]]
+    ) -> list[Job | ClientError]:
+        """
+        Awaitable version of `create_many` - runs on `async_session`.
+
+        Parameters:
+            organization_id (UUID): The ID of the organization the jobs belong to.
+            jobs (list[dict[str, Any]]): The jobs - i.e. the `title`, `salary`, `mode`, `contract` and
+                (optionally) `description` of each.
+
+        Returns:
+            list[Job | ClientError]: The newly created job - or why it is invalid - for each of `jobs` (in order).
+        """
+        return await self.run_sync(
+            JobService.create_many, organization_id=organization_id, jobs=jobs
+        )
+
+    def get_by_organization(
+        self, organization_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> tuple[list[Job], Cursor | None]:
+        """
+        Retrieves a page of an organization's jobs - ordered by `(created, id)`.
+
+        Pages are keyset paginated (i.e. no `OFFSET`): a page starts right after the cursor, so that - given
+        the `(organization_id, created, id)` index - every page costs the same, however deep.
+
+        Parameters:
+            organization_id (UUID): The ID of the organization.
+            limit (int): The maximum number of jobs in the page.
+            cursor (Cursor, optional): The position of the last job of the previous page - None for the
+                first page. Defaults to None.
+
+        Returns:
+            tuple[list[Job], Cursor | None]: The jobs and the cursor to the next page - None if this is the last.
+        """
+        query = select(Job).where(Job.organization_id == organization_id)
+        if cursor is not None:
+            # NOTE: expanded (rather than a row comparison) so that MySQL/MariaDB use it as an index range.
+            query = query.where(
+                or_(
+                    Job.created > cursor.created,
+                    and_(Job.created == cursor.created, Job.id > cursor.id),
+                )
+            )
+
+        # NOTE: fetching one more job than the limit tells whether there is a next page.
+        jobs = list(
+            self.session.scalars(query.order_by(Job.created, Job.id).limit(limit + 1))
+        )
+        if len(jobs) <= limit:
+            return jobs, None
+
+        jobs = jobs[:limit]
+        return jobs, Cursor(created=jobs[-1].created, id=jobs[-1].id)
+
+    async def aget_by_organization(
+        self, organization_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> tuple[list[Job], Cursor | None]:
+        """
+        Awaitable version of `get_by_organization` - runs on `async_session`.
+
+        Parameters:
+            organization_id (UUID): The ID of the organization.
+            limit (int): The maximum number of jobs in the page.
+            cursor (Cursor, optional): The position of the last job of the previous page - None for the
+                first page. Defaults to None.
+
+        Returns:
+            tuple[list[Job], Cursor | None]: The jobs and the cursor to the next page - None if this is the last.
+        """
+        return await self.run_sync(
+            JobService.get_by_organization,
+            organization_id=organization_id,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    def search(
+        self,
+        q: str,
+        limit: int,
+        organization_id: UUID | None = None,
+        mode: JobMode | None = None,
+        contract: JobContract | None = None,
+        state: JobState | None = None,
+        min_salary: float | None = None,
+        max_salary: float | None = None,
+    ) -> list[Job]:
+        """
+        Searches jobs by their title and description - ranked by relevance.
+
+        Jobs are matched by the in-process index (scored with BM25) if there is one - or by the
+        `(title, description)` FULLTEXT index (in natural language mode) otherwise - and narrowed down by the
+        given filters.
+
+        Parameters:
+            q (str): The search terms.
+            limit (int): The maximum number of jobs.
+            organization_id (UUID, optional): The ID of the organization of the jobs. Defaults to None (i.e. any).
+            mode (JobMode, optional): The mode of the jobs. Defaults to None (i.e. any).
+            contract (JobContract, optional): The contract type of the jobs. Defaults to None (i.e. any).
+            state (JobState, optional): The state of the jobs. Defaults to None (i.e. any).
+            min_salary (float, optional): The minimum salary of the jobs. Defaults to None.
+            max_salary (float, optional): The maximum salary of the jobs. Defaults to None.
+
+        Returns:
+            list[Job]: The most relevant jobs - most relevant first.
+        """
+        filters = self._filters(
+            organization_id=organization_id,
+            mode=mode,
+            contract=contract,
+            state=state,
+            min_salary=min_salary,
+            max_salary=max_salary,
+        )
+        if self.search_index is not None:
+            return self._search_index(q, limit, filters)
+
+        relevance = match(
+            Job.title, Job.description, against=q
+        ).in_natural_language_mode()
+
+        return list(
+            self.session.scalars(
+                select(Job)
+                .where(relevance > 0, *filters)
+                .order_by(relevance.desc(), Job.id)
+                .limit(limit)
+            )
+        )
+
+    async def asearch(
+        self,
+        q: str,
+        limit: int,
+        organization_id: UUID | None = None,
+        mode: JobMode | None = None,
+        contract: JobContract | None = None,
+        state: JobState | None = None,
+        min_salary: float | None = None,
+        max_salary: float | None = None,
+    ) -> list[Job]:
+        """
+        Awaitable version of `search` - runs on `async_session`.
+
+        Parameters:
+            q (str): The search terms.
+            limit (int): The maximum number of jobs.
+            organization_id (UUID, optional): The ID of the organization of the jobs. Defaults to None (i.e. any).
+            mode (JobMode, optional): The mode of the jobs. Defaults to None (i.e. any).
+            contract (JobContract, optional): The contract type of the jobs. Defaults to None (i.e. any).
+            state (JobState, optional): The state of the jobs. Defaults to None (i.e. any).
+            min_salary (float, optional): The minimum salary of the jobs. Defaults to None.
+            max_salary (float, optional): The maximum salary of the jobs. Defaults to None.
+
+        Returns:
+            list[Job]: The most relevant jobs - most relevant first.
+        """
+        return await self.run_sync(
+            JobService.search,
+            q=q,
+            limit=limit,
+            organization_id=organization_id,
+            mode=mode,
+            contract=contract,
+            state=state,
+            min_salary=min_salary,
+            max_salary=max_salary,
+        )
+
+    def browse(
+        self,
+        limit: int,
+        organization_id: UUID | None = None,
+        mode: JobMode | None = None,
+        contract: JobContract | None = None,
+        state: JobState | None = None,
+        min_salary: float | None = None,
+        max_salary: float | None = None,
+        order_by: Literal["created", "salary"] = "created",
+    ) -> list[Job]:
+        """
+        Browses jobs - i.e. filters them and sorts them by `order_by`, highest first.
+
+        Jobs are filtered and sorted by the in-process catalog if there is one - the matching jobs are then read
+        by primary key - or by SQL otherwise.
+
+        Parameters:
+            limit (int): The maximum number of jobs.
+            organization_id (UUID, optional): The ID of the organization of the jobs. Defaults to None (i.e. any).
+            mode (JobMode, optional): The mode of the jobs. Defaults to None (i.e. any).
+            contract (JobContract, optional): The contract type of the jobs. Defaults to None (i.e. any).
+            state (JobState, optional): The state of the jobs. Defaults to None (i.e. any).
+            min_salary (float, optional): The minimum salary of the jobs. Defaults to None.
+            max_salary (float, optional): The maximum salary of the jobs. Defaults to None.
+            order_by (str, optional): What the jobs are sorted by - `created` or `salary`. Defaults to `created`.
+
+        Returns:
+            list[Job]: The jobs - in order.
+        """
+        if self.catalog is not None:
+            ids = self.catalog.query(
+                limit=limit,
+                organization_id=organization_id,
+                mode=mode,
+                contract=contract,
+                state=state,
+                min_salary=min_salary,
+                max_salary=max_salary,
+                order_by=order_by,
+            )
+            found = {
+                job.id: job
+                for job in self.session.scalars(select(Job).where(Job.id.in_(ids)))
+            }
+            return [found[id] for id in ids if id in found]
+
+        filters = self._filters(
+            organization_id=organization_id,
+            mode=mode,
+            contract=contract,
+            state=state,
+            min_salary=min_salary,
+            max_salary=max_salary,
+        )
+
+        return list(
+            self.session.scalars(
+                select(Job)
+                .where(*filters)
+                .order_by(getattr(Job, order_by).desc(), Job.id.desc())
+                .limit(limit)
+            )
+        )
+
+    async def abrowse(
+        self,
+        limit: int,
+        organization_id: UUID | None = None,
+        mode: JobMode | None = None,
+        contract: JobContract | None = None,
+        state: JobState | None = None,
+        min_salary: float | None = None,
+        max_salary: float | None = None,
+        order_by: Literal["created", "salary"] = "created",
+    ) -> list[Job]:
+        """
+        Awaitable version of `browse` - runs on `async_session`.
+
+        Parameters:
+            limit (int): The maximum number of jobs.
+            organization_id (UUID, optional): The ID of the organization of the jobs. Defaults to None (i.e. any).
+            mode (JobMode, optional): The mode of the jobs. Defaults to None (i.e. any).
+            contract (JobContract, optional): The contract type of the jobs. Defaults to None (i.e. any).
+            state (JobState, optional): The state of the jobs. Defaults to None (i.e. any).
+            min_salary (float, optional): The minimum salary of the jobs. Defaults to None.
+            max_salary (float, optional): The maximum salary of the jobs. Defaults to None.
+            order_by (str, optional): What the jobs are sorted by - `created` or `salary`. Defaults to `created`.
+
+        Returns:
+            list[Job]: The jobs - in order.
+        """
+        return await self.run_sync(
+            JobService.browse,
+            limit=limit,
+            organization_id=organization_id,
+            mode=mode,
+            contract=contract,
+            state=state,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            order_by=order_by,
+        )
+
+    def refresh_search_index(self, batch_size: int = 1000) -> int:
+        """
+        Catches the in-process index up with the database - i.e. indexes the jobs updated since its watermark.
+
+        Jobs committed by this worker are indexed as they are committed; this picks up the ones committed by other
+        workers (or before a snapshot was taken). Jobs updated within `watermark_lag_seconds` before the watermark are
+        indexed again - given that `updated` is set before committing, i.e. a job committed late may be older than
+        the watermark (and timestamps have a one second resolution).
+
+        Parameters:
+            batch_size (int, optional): The number of jobs read at a time. Defaults to 1000.
+
+        Returns:
+            int: The number of jobs indexed - 0 if there is no in-process index.
+        """
+        if self.search_index is None:
+            return 0
+
+        query = select(Job.id, Job.title, Job.description, Job.updated)
+        if self.search_index.watermark is not None:
+            query = query.where(
+                Job.updated >= self.search_index.watermark - WATERMARK_LAG
+            )
+
+        count = 0
+        for row in self.session.execute(
+            query.order_by(Job.updated).execution_options(yield_per=batch_size)
+        ):
+            self.search_index.add(
+                row.id, row.title, row.description, updated=row.updated
+            )
+            count += 1
+
+        return count
+
+    async def arefresh_search_index(self, batch_size: int = 1000) -> int:
+        """
+        Awaitable version of `refresh_search_index` - runs on `async_session`.
+
+        Parameters:
+            batch_size (int, optional): The number of jobs read at a time. Defaults to 1000.
+
+        Returns:
+            int: The number of jobs indexed - 0 if there is no in-process index.
+        """
+        return await self.run_sync(
+            JobService.refresh_search_index, batch_size=batch_size
+        )
+
+    def refresh_catalog(self, batch_size: int = 1000) -> int:
+        """
+        Catches the in-process catalog up with the database - i.e. catalogs the jobs updated since its watermark.
+
+        Jobs committed by this worker are cataloged as they are committed; this picks up the ones committed by
+        other workers. Jobs updated within `watermark_lag_seconds` before the watermark are cataloged again - given
+        that `updated` is set before committing, i.e. a job committed late may be older than the watermark (and
+        timestamps have a one second resolution).
+
+        Parameters:
+            batch_size (int, optional): The number of jobs read (and cataloged) at a time. Defaults to 1000.
+
+        Returns:
+            int: The number of jobs cataloged - 0 if there is no in-process catalog.
+        """
+        if self.catalog is None:
+            return 0
+
+        query = select(
+            Job.id,
+            Job.salary,
+            Job.mode,
+            Job.contract,
+            Job.state,
+            Job.organization_id,
+            Job.created,
+            Job.updated,
+        )
+        if self.catalog.watermark is not None:
+            query = query.where(Job.updated >= self.catalog.watermark - WATERMARK_LAG)
+
+        count = 0
+        for rows in self.session.execute(
+            query.order_by(Job.updated).execution_options(yield_per=batch_size)
+        ).partitions():
+            self.catalog.add_many(rows)
+            count += len(rows)
+
+        return count
+
+    async def arefresh_catalog(self, batch_size: int = 1000) -> int:
+        """
+        Awaitable version of `refresh_catalog` - runs on `async_session`.
+
+        Parameters:
+            batch_size (int, optional): The number of jobs read (and cataloged) at a time. Defaults to 1000.
+
+        Returns:
+            int: The number of jobs cataloged - 0 if there is no in-process catalog.
+        """
+        return await self.run_sync(JobService.refresh_catalog, batch_size=batch_size)
+
+    @staticmethod
+    def _filters(
+        organization_id: UUID | None = None,
+        mode: JobMode | None = None,
+        contract: JobContract | None = None,
+        state: JobState | None = None,
+        min_salary: float | None = None,
+        max_salary: float | None = None,
+    ) -> list:
+        """
+        Builds the SQL filters on jobs' fixed-width fields.
+
+        Parameters:
+            organization_id (UUID, optional): The ID of the organization of the jobs. Defaults to None (i.e. any).
+            mode (JobMode, optional): The mode of the jobs. Defaults to None (i.e. any).
+            contract (JobContract, optional): The contract type of the jobs. Defaults to None (i.e. any).
+            state (JobState, optional): The state of the jobs. Defaults to None (i.e. any).
+            min_salary (float, optional): The minimum salary of the jobs. Defaults to None.
+            max_salary (float, optional): The maximum salary of the jobs. Defaults to None.
+
+        Returns:
+            list: The filters - i.e. SQL expressions on `Job`.
+        """
+        filters = []
+        if organization_id is not None:
+            filters.append(Job.organization_id == organization_id)
+        if mode is not None:
+            filters.append(Job.mode == mode)
+        if contract is not None:
+            filters.append(Job.contract == contract)
+        if state is not None:
+            filters.append(Job.state == state)
+        if min_salary is not None:
+            filters.append(Job.salary >= min_salary)
+        if max_salary is not None:
+            filters.append(Job.salary <= max_salary)
+
+        return filters
+
+    def _publish(self, jobs: list[Job]) -> None:
+        """
+        Adds (committed) jobs to the in-process read models - i.e. the search index and the catalog, if any - and
+        invalidates their cached copies (i.e. entities and responses).
+
+        Parameters:
+            jobs (list[Job]): The jobs.
+
+        Returns:
+            None
+        """
+        if self.search_index is not None:
+            for job in jobs:
+                self.search_index.add(
+                    job.id, job.title, job.description, updated=job.updated
+                )
+
+        if self.catalog is not None:
+            self.catalog.add_many(jobs)
+
+        for job in jobs:
+            self.entity_cache.invalidate(job, CACHED_BY)
+            self.response_cache.invalidate(job.id)
+
+    def _search_index(self, q: str, limit: int, filters: list) -> list[Job]:
+        """
+        Searches jobs with the in-process index - narrowing the matches down by the filters in the database.
+
+        Matches are read (and filtered) in batches, most relevant first, until there are enough jobs.
+
+        Parameters:
+            q (str): The search terms.
+            limit (int): The maximum number of jobs.
+            filters (list): The filters - i.e. SQL expressions on `Job`.
+
+        Returns:
+            list[Job]: The most relevant jobs - most relevant first.
+        """
+        matches = [
+            id for id, _ in self.search_index.search(q, None if filters else limit)
+        ]
+
+        jobs: list[Job] = []
+        batch_size = max(limit * 4, 100)
+        for start in range(0, len(matches), batch_size):
+            ids = matches[start : start + batch_size]
+            found = {
+                job.id: job
+                for job in self.session.scalars(
+                    select(Job).where(Job.id.in_(ids), *filters)
+                )
+            }
+            jobs += [found[id] for id in ids if id in found]
+            if len(jobs) >= limit:
+                break
+
+        return jobs[:limit]
+
     def update(self):
         """
         Updates an existing job.
@@ -92,20 +699,132 @@ class JobService(BaseService):
         """
         raise NotImplementedError("JobService.update not implemented.")
 
-    def get(self):
+    def get(self, id: UUID) -> Job:
         """
-        Retrieves information about an job.
+        Retrieves a job.
+
+        The job is looked up in `entity_cache` (its local tier) first - i.e. the database is only queried on a miss.
 
         Parameters:
-            self: The instance of the JobService class.
+            id (UUID): The ID of the job.
+
+        Returns:
+            Job: The job.
 
         Raises:
-            NotImplementedError: Method is yet to be implemented.
+            NotFoundError: If the job is not found.
+        """
+        values = self.entity_cache.get(Job, "id", id)
+        if values is not None:
+            return self._attach(values)
+
+        job = self._get(id)
+        self.entity_cache.set(job, CACHED_BY)
+
+        return job
+
+    async def aget(self, id: UUID) -> Job:
+        """
+        Awaitable version of `get` - runs on `async_session`, with the job looked up in both tiers of
+        `entity_cache` first.
+
+        Parameters:
+            id (UUID): The ID of the job.
 
         Returns:
-            None
+            Job: The job.
+        """
+        values = await self.entity_cache.aget(Job, "id", id)
+        if values is not None:
+            return await self.run_sync(JobService._attach, values)
+
+        job = await self.run_sync(JobService._get, id)
+        await self.entity_cache.aset(job, CACHED_BY)
+
+        return job
+
+    def get_many(self, ids: list[UUID]) -> list[Job | NotFoundError]:
+        """
+        Retrieves jobs by ID - with a single `IN (...)` query for those not in `entity_cache` (its local tier).
+
+        Parameters:
+            ids (list[UUID]): The IDs of the jobs.
+
+        Returns:
+            list[Job | NotFoundError]: The job - or why it is missing - for each of `ids` (in order).
+        """
+        return self._get_many(Job, ids, CACHED_BY)
+
+    async def aget_many(self, ids: list[UUID]) -> list[Job | NotFoundError]:
+        """
+        Awaitable version of `get_many` - runs on `async_session`, with the jobs looked up in both tiers of
+        `entity_cache` first.
+
+        Parameters:
+            ids (list[UUID]): The IDs of the jobs.
+
+        Returns:
+            list[Job | NotFoundError]: The job - or why it is missing - for each of `ids` (in order).
+        """
+        return await self._aget_many(Job, ids, CACHED_BY)
+
+    def get_version(self, id: UUID) -> tuple[datetime, int]:
+        """
+        Retrieves the version of a job - i.e. when it was last updated, and its write counter - from
+        `entity_cache` or, on a miss, by loading (and caching) it.
+
+        Parameters:
+            id (UUID): The ID of the job.
+
+        Returns:
+            tuple[datetime, int]: When the job was last updated, and its version.
+
+        Raises:
+            NotFoundError: If the job is not found.
+        """
+        return self._get_version(Job, id, CACHED_BY)
+
+    async def aget_version(self, id: UUID) -> tuple[datetime, int]:
+        """
+        Awaitable version of `get_version` - runs on `async_session`.
+
+        Parameters:
+            id (UUID): The ID of the job.
+
+        Returns:
+            tuple[datetime, int]: When the job was last updated, and its version.
+        """
+        return await self._aget_version(Job, id, CACHED_BY)
+
+    def _get(self, id: UUID) -> Job:
+        """
+        Queries a job by ID.
+
+        Parameters:
+            id (UUID): The ID of the job.
+
+        Returns:
+            Job: The job.
+
+        Raises:
+            NotFoundError: If the job is not found.
+        """
+        try:
+            return self.session.query(Job).filter_by(id=id).one()
+        except NoResultFound:
+            raise NotFoundError(message=f"Job {id} not found.")
+
+    def _attach(self, values: dict[str, Any]) -> Job:
+        """
+        Attaches a cached job to the session - without a query.
+
+        Parameters:
+            values (dict[str, Any]): The job's (cached) column values.
+
+        Returns:
+            Job: The job.
         """
-        raise NotImplementedError("JobService.get not implemented.")
+        return self.session.merge(self.entity_cache.build(Job, values), load=False)
 
     def delete(self):
         """
@@ -0,0 +1,108 @@
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from .application import ApplicationService
+from .exceptions import NotFoundError
+from .job import JobService
+from .organization import OrganizationService
+from .user import UserService
+from ..models.application import Application
+from ..models.job import Job
+from ..models.user import User
+from ..utils.cache import ENTITY_CACHE, EntityCache
+from ..utils.loader import DataLoader
+
+
+@dataclass
+class RelationshipLoader:
+    """
+    A request-scoped loader of the relationships which are never lazy loaded - i.e. `Job.organization`,
+    `Job.applications`, `Application.job`, `Application.user` and `User.applications`.
+
+    A relationship is resolved for many entities at once: their keys are collected and loaded with a single
+    `IN (...)` query - entities by ID are looked up in `entity_cache` first - and the values are set on the
+    entities, so that reading the relationship issues no query. Values are memoized for the loader's lifetime:
+    hence a loader per request.
+
+    Attributes:
+        async_session (AsyncSession): The request-scoped database session - loaded entities are attached to it.
+        entity_cache (EntityCache): The cache entities are looked up in (by ID) before the database.
+        organizations (DataLoader[UUID, Organization | None]): Organizations by ID.
+        jobs (DataLoader[UUID, Job | None]): Jobs by ID.
+        users (DataLoader[UUID, User | None]): Users by ID.
+        applications_by_job (DataLoader[UUID, list[Application]]): Applications by job ID.
+        applications_by_user (DataLoader[UUID, list[Application]]): Applications by user ID.
+    """
+
+    async_session: AsyncSession
+    entity_cache: EntityCache = field(default_factory=lambda: ENTITY_CACHE)
+    organizations: DataLoader = field(init=False)
+    jobs: DataLoader = field(init=False)
+    users: DataLoader = field(init=False)
+    applications_by_job: DataLoader = field(init=False)
+    applications_by_user: DataLoader = field(init=False)
+    # NOTE: batches of different loaders may be dispatched concurrently - but a session may not be used so.
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.organizations = DataLoader(
+            lambda ids: self._get_many(OrganizationService, ids)
+        )
+        self.jobs = DataLoader(lambda ids: self._get_many(JobService, ids))
+        self.users = DataLoader(lambda ids: self._get_many(UserService, ids))
+        self.applications_by_job = DataLoader(
+            lambda ids: self._get_applications("job_id", ids)
+        )
+        self.applications_by_user = DataLoader(
+            lambda ids: self._get_applications("user_id", ids)
+        )
+
+    async def load(self, entities: Sequence[Any], relationship: Any) -> None:
+        """
+        Resolves a relationship of entities - in a single batch - and sets it on them.
+
+        Parameters:
+            entities (Sequence[Any]): The entities - e.g. applications.
+            relationship (Any): The relationship - e.g. `Application.job`.
+
+        Returns:
+            None
+
+        Raises:
+            KeyError: If the relationship is not one the loader resolves.
+        """
+        loader, key = {
+            (Job, "organization"): (self.organizations, "organization_id"),
+            (Job, "applications"): (self.applications_by_job, "id"),
+            (Application, "job"): (self.jobs, "job_id"),
+            (Application, "user"): (self.users, "user_id"),
+            (User, "applications"): (self.applications_by_user, "id"),
+        }[(relationship.class_, relationship.key)]
+
+        values = await loader.load_many(getattr(entity, key) for entity in entities)
+        for entity, value in zip(entities, values):
+            set_committed_value(entity, relationship.key, value)
+
+    async def _get_many(self, service: type, ids: list[UUID]) -> list[Any | None]:
+        async with self._lock:
+            results = await service(
+                async_session=self.async_session, entity_cache=self.entity_cache
+            ).aget_many(ids)
+
+        return [
+            None if isinstance(result, NotFoundError) else result for result in results
+        ]
+
+    async def _get_applications(
+        self, parent: str, ids: list[UUID]
+    ) -> list[list[Application]]:
+        async with self._lock:
+            return await ApplicationService(
+                async_session=self.async_session
+            ).aget_by_parent_ids(parent=parent, ids=ids)
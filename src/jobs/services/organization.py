@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
 
 from sqlalchemy.exc import (
     DataError,
@@ -15,6 +18,10 @@ from ..models.organization import Organization
 from ..utils.password import InvalidPasswordError
 
 
+# NOTE: the (unique) columns organizations are cached by - see `EntityCache`.
+CACHED_BY = ("id", "name")
+
+
 @dataclass
 class OrganizationService(BaseService, AuthService):
     """
@@ -39,10 +46,51 @@ class OrganizationService(BaseService, AuthService):
         """
         try:
             organization = Organization(name=name, password=password)
+        except InvalidPasswordError as exc:
+            raise ClientError(message=str(exc))
+
+        return self._add(organization)
+
+    async def acreate(self, name: str, password: str) -> Organization:
+        """
+        Awaitable version of `create` - runs on `async_session`, with the password hashed by `hashing_service`.
+
+        Parameters:
+            name (str): The name of the organization.
+            password (str): The password for the organization.
+
+        Returns:
+            Organization: The newly created organization.
+
+        Raises:
+            UnavailableError: If the hashing service is overloaded.
+        """
+        organization = Organization(
+            name=name, password_hash=await self.hash_password(password)
+        )
+
+        return await self.run_sync(OrganizationService._add, organization)
+
+    def _add(self, organization: Organization) -> Organization:
+        """
+        Adds (i.e. inserts) an organization.
+
+        Parameters:
+            organization (Organization): The organization to add.
+
+        Returns:
+            Organization: The added organization.
+
+        Raises:
+            ClientError: If there is a data error.
+            ConflictError: If there is a conflict error.
+            ServerError: If there is an invalid request or operational error.
+        """
+        try:
             self.session.add(organization)
             self.session.flush()
             self.session.commit()
-        except (DataError, InvalidPasswordError) as exc:
+        except DataError as exc:
             self.session.rollback()
             raise ClientError(message=str(exc))
         except IntegrityError as exc:
@@ -73,6 +121,9 @@ class OrganizationService(BaseService, AuthService):
         """
         Retrieves information about an organization.
 
+        The organization is looked up in `entity_cache` (its local tier) first - i.e. the database is only queried
+        on a miss.
+
         Parameters:
             id (str | None): The ID of the organization to retrieve information for.
             name (str | None): The name of the organization to retrieve information for.
@@ -84,6 +135,110 @@ class OrganizationService(BaseService, AuthService):
             ClientError: If neither id nor name is provided, or if both id and name are provided.
             NotFoundError: If the organization with the specified id or name is not found.
         """
+        column, value = self._get_lookup(id=id, name=name)
+
+        values = self.entity_cache.get(Organization, column, value)
+        if values is not None:
+            return self._attach(values)
+
+        organization = self._get(column, value)
+        self.entity_cache.set(organization, CACHED_BY)
+
+        return organization
+
+    async def aget(
+        self, id: str | None = None, name: str | None = None
+    ) -> Organization:
+        """
+        Awaitable version of `get` - runs on `async_session`, with the organization looked up in both tiers of
+        `entity_cache` first.
+
+        Parameters:
+            id (str | None): The ID of the organization to retrieve information for.
+            name (str | None): The name of the organization to retrieve information for.
+
+        Returns:
+            Organization: An instance of the Organization class representing the retrieved organization.
+        """
+        column, value = self._get_lookup(id=id, name=name)
+
+        values = await self.entity_cache.aget(Organization, column, value)
+        if values is not None:
+            return await self.run_sync(OrganizationService._attach, values)
+
+        organization = await self.run_sync(OrganizationService._get, column, value)
+        await self.entity_cache.aset(organization, CACHED_BY)
+
+        return organization
+
+    def get_many(self, ids: list[UUID]) -> list[Organization | NotFoundError]:
+        """
+        Retrieves organizations by ID - with a single `IN (...)` query for those not in `entity_cache` (its local tier).
+
+        Parameters:
+            ids (list[UUID]): The IDs of the organizations.
+
+        Returns:
+            list[Organization | NotFoundError]: The organization - or why it is missing - for each of `ids` (in order).
+        """
+        return self._get_many(Organization, ids, CACHED_BY)
+
+    async def aget_many(self, ids: list[UUID]) -> list[Organization | NotFoundError]:
+        """
+        Awaitable version of `get_many` - runs on `async_session`, with the organizations looked up in both tiers of
+        `entity_cache` first.
+
+        Parameters:
+            ids (list[UUID]): The IDs of the organizations.
+
+        Returns:
+            list[Organization | NotFoundError]: The organization - or why it is missing - for each of `ids` (in order).
+        """
+        return await self._aget_many(Organization, ids, CACHED_BY)
+
+    def get_version(self, id: UUID) -> tuple[datetime, int]:
+        """
+        Retrieves the version of an organization - i.e. when it was last updated, and its write counter - from
+        `entity_cache` or, on a miss, by loading (and caching) it.
+
+        Parameters:
+            id (UUID): The ID of the organization.
+
+        Returns:
+            tuple[datetime, int]: When the organization was last updated, and its version.
+
+        Raises:
+            NotFoundError: If the organization is not found.
+        """
+        return self._get_version(Organization, id, CACHED_BY)
+
+    async def aget_version(self, id: UUID) -> tuple[datetime, int]:
+        """
+        Awaitable version of `get_version` - runs on `async_session`.
+
+        Parameters:
+            id (UUID): The ID of the organization.
+
+        Returns:
+            tuple[datetime, int]: When the organization was last updated, and its version.
+        """
+        return await self._aget_version(Organization, id, CACHED_BY)
+
+    @staticmethod
+    def _get_lookup(id: str | None, name: str | None) -> tuple[str, Any]:
+        """
+        Returns the (unique) column an organization is looked up by - and its value.
+
+        Parameters:
+            id (str | None): The ID of the organization.
+            name (str | None): The name of the organization.
+
+        Returns:
+            tuple[str, Any]: The column - `id` or `name` - and its value.
+
+        Raises:
+            ClientError: If neither id nor name is provided, or if both id and name are provided.
+        """
         if id is None and name is None:
             raise ClientError(message="Either id or name must be provided.")
         elif id is not None and name is not None:
@@ -91,14 +246,40 @@ class OrganizationService(BaseService, AuthService):
                 message="Both id and name cannot be provided simultaneously."
             )
 
+        return ("id", id) if id is not None else ("name", name)
+
+    def _get(self, column: str, value: Any) -> Organization:
+        """
+        Queries an organization by a (unique) column.
+
+        Parameters:
+            column (str): The column - `id` or `name`.
+            value (Any): The value of the column.
+
+        Returns:
+            Organization: The organization.
+
+        Raises:
+            NotFoundError: If the organization is not found.
+        """
         try:
-            return (
-                self.session.query(Organization).filter_by(id=id).one()
-                if id is not None
-                else self.session.query(Organization).filter_by(name=name).one()
-            )
+            return self.session.query(Organization).filter_by(**{column: value}).one()
         except NoResultFound:
-            raise NotFoundError(message=f"Organization {id or name} not found.")
+            raise NotFoundError(message=f"Organization {value} not found.")
+
+    def _attach(self, values: dict[str, Any]) -> Organization:
+        """
+        Attaches a cached organization to the session - without a query.
+
+        Parameters:
+            values (dict[str, Any]): The organization's (cached) column values.
+
+        Returns:
+            Organization: The organization.
+        """
+        return self.session.merge(
+            self.entity_cache.build(Organization, values), load=False
+        )
 
     def delete(self):
         """
@@ -129,13 +310,54 @@ class OrganizationService(BaseService, AuthService):
         Raises:
             NotFoundError: If the organization with the given name is not found.
             InvalidPasswordError: If the password is invalid.
+
+        Note:
+            Outdated password hashes (i.e. a deprecated scheme or a lower cost than the configured one) are rehashed.
         """
         try:
             organization = self.session.query(Organization).filter_by(name=name).one()
         except NoResultFound:
             raise NotFoundError(message=f"Organization {name} not found.")
 
-        if not organization.check_password(password):
-            raise InvalidPasswordError(message="Invalid password.")
+        if not organization.verify_and_update_password(password):
+            raise InvalidPasswordError()
+
+        if self.session.is_modified(organization):
+            self.session.commit()
+            self.entity_cache.invalidate(organization, CACHED_BY)
+
+        return organization
+
+    async def aauthenticate(self, name: str, password: str) -> Organization:
+        """
+        Awaitable version of `authenticate` - runs on `async_session`, with the password verified by `hashing_service`.
+
+        Parameters:
+            name (str): The name of the organization to authenticate.
+            password (str): The password for the organization.
+
+        Returns:
+            Organization: The authenticated organization.
+
+        Raises:
+            NotFoundError: If the organization with the given name is not found.
+            InvalidPasswordError: If the password is invalid.
+            UnavailableError: If the hashing service is overloaded.
+
+        Note:
+            Outdated password hashes (i.e. a deprecated scheme or a lower cost than the configured one) are rehashed
+            - and the organization invalidated in `entity_cache`. The organization may come from `entity_cache`, but its password
+            hash is always read from the database.
+        """
+        organization = await self.aget(name=name)
+
+        password_hash = await self.verify_password(
+            password, await self.aget_password_hash(organization)
+        )
+        if password_hash is not None:
+            await self.run_sync(
+                OrganizationService._rehash_password, organization, password_hash
+            )
+            await self.entity_cache.ainvalidate(organization, CACHED_BY)
 
         return organization
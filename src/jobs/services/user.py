@@ -1,4 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+from uuid import UUID
 
 from sqlalchemy.exc import (
     DataError,
@@ -10,17 +13,35 @@ from sqlalchemy.exc import (
 from .auth import AuthService
 from .base import BaseService
 from .exceptions import ClientError, ConflictError, ServerError, NotFoundError
+from ..models.base import utcnow
 from ..models.user import User
+from ..utils.identifier import uuid7
 from ..utils.password import InvalidPasswordError
-from ..utils.user import InvalidUsernameError
+from ..utils.user import (
+    EMAIL_DELIVERABILITY_CHECKER,
+    EmailDeliverabilityChecker,
+    InvalidUsernameError,
+)
+
+
+# NOTE: the (unique) columns users are cached by - see `EntityCache`.
+CACHED_BY = ("id", "username")
 
 
 @dataclass
 class UserService(BaseService, AuthService):
     """
     A class that provides methods for creating, updating, getting, deleting and authenticating users.
+
+    Attributes:
+        email_deliverability_checker (EmailDeliverabilityChecker | None): The checker `acreate` checks usernames'
+            deliverability with - None if only their syntax is validated.
     """
 
+    email_deliverability_checker: EmailDeliverabilityChecker | None = field(
+        default_factory=lambda: EMAIL_DELIVERABILITY_CHECKER
+    )
+
     def create(self, username: str, name: str, password: str) -> User:
         """
         Creates a new user.
@@ -39,10 +60,129 @@ class UserService(BaseService, AuthService):
         """
         try:
             user = User(username=username, name=name, password=password)
+        except (InvalidPasswordError, InvalidUsernameError) as exc:
+            raise ClientError(message=str(exc))
+
+        return self._add(user)
+
+    async def acreate(self, username: str, name: str, password: str) -> User:
+        """
+        Awaitable version of `create` - runs on `async_session`, with the password hashed by `hashing_service`
+        and - if enabled - the username's deliverability checked by `email_deliverability_checker`.
+
+        Parameters:
+            username (str): The username of the user.
+            name (str): The name of the user.
+            password (str): The password for the user.
+
+        Returns:
+            User: The newly created user.
+
+        Raises:
+            ClientError: If the username is invalid (or not deliverable).
+            UnavailableError: If the hashing service is overloaded.
+        """
+        try:
+            user = User(username=username, name=name)
+            if self.email_deliverability_checker is not None:
+                await self.email_deliverability_checker.check(user.username)
+        except InvalidUsernameError as exc:
+            raise ClientError(message=str(exc))
+
+        user.password_hash = await self.hash_password(password)
+
+        return await self.run_sync(UserService._add, user)
+
+    def create_many(self, users: list[dict[str, Any]]) -> list[User | ClientError]:
+        """
+        Creates new users - with already hashed passwords (e.g. by `PasswordHashingService`), in a single transaction.
+
+        Users are validated one by one - an invalid user is reported (rather than failing the others) - and the
+        valid ones are inserted with multi-row INSERTs (i.e. every value, including the ID and timestamps, is
+        set client-side so that the rows are batched).
+
+        Parameters:
+            users (list[dict[str, Any]]): The users - i.e. the `username`, `name` and `password_hash` of each.
+
+        Returns:
+            list[User | ClientError]: The newly created user - or why it is invalid - for each of `users` (in order).
+
+        Raises:
+            ClientError: If there is a data error.
+            ConflictError: If any of the usernames is taken - i.e. none of the users is created.
+            ServerError: If there is an invalid request or operational error.
+        """
+        now = utcnow()
+        results: list[User | ClientError] = []
+        for user in users:
+            try:
+                results.append(
+                    User(
+                        id=uuid7(),
+                        username=user["username"],
+                        name=user["name"],
+                        password_hash=user["password_hash"],
+                        created=now,
+                        updated=now,
+                    )
+                )
+            except InvalidUsernameError as exc:
+                results.append(ClientError(message=str(exc)))
+
+        created = [result for result in results if isinstance(result, User)]
+        if not created:
+            return results
+
+        try:
+            self.session.add_all(created)
+            self.session.flush()
+            self.session.commit()
+        except DataError as exc:
+            self.session.rollback()
+            raise ClientError(message=str(exc))
+        except IntegrityError as exc:
+            self.session.rollback()
+            raise ConflictError(message=str(exc))
+        except (InvalidRequestError, OperationalError) as exc:
+            self.session.rollback()
+            raise ServerError(message=str(exc))
+
+        return results
+
+    async def acreate_many(
+        self, users: list[dict[str, Any]]
+    ) -> list[User | ClientError]:
+        """
+        Awaitable version of `create_many` - runs on `async_session`.
+
+        Parameters:
+            users (list[dict[str, Any]]): The users - i.e. the `username`, `name` and `password_hash` of each.
+
+        Returns:
+            list[User | ClientError]: The newly created user - or why it is invalid - for each of `users` (in order).
+        """
+        return await self.run_sync(UserService.create_many, users=users)
+
+    def _add(self, user: User) -> User:
+        """
+        Adds (i.e. inserts) a user.
+
+        Parameters:
+            user (User): The user to add.
+
+        Returns:
+            User: The added user.
+
+        Raises:
+            ClientError: If there is a data error.
+            ConflictError: If there is a conflict error.
+            ServerError: If there is an invalid request or operational error.
+        """
+        try:
             self.session.add(user)
             self.session.flush()
             self.session.commit()
-        except (DataError, InvalidPasswordError, InvalidUsernameError) as exc:
+        except DataError as exc:
             self.session.rollback()
             raise ClientError(message=str(exc))
         except IntegrityError as exc:
@@ -73,6 +213,8 @@ class UserService(BaseService, AuthService):
         """
         Retrieve a user by their ID or username.
 
+        The user is looked up in `entity_cache` (its local tier) first - i.e. the database is only queried on a miss.
+
         Args:
             id (str, optional): The ID of the user. Defaults to None.
             username (str, optional): The username of the user. Defaults to None.
@@ -84,7 +226,108 @@ class UserService(BaseService, AuthService):
             ClientError: If neither id nor username is provided, or if both id and username are provided.
             NotFoundError: If the user is not found.
         """
+        column, value = self._get_lookup(id=id, username=username)
+
+        values = self.entity_cache.get(User, column, value)
+        if values is not None:
+            return self._attach(values)
+
+        user = self._get(column, value)
+        self.entity_cache.set(user, CACHED_BY)
+
+        return user
+
+    async def aget(self, id: str | None = None, username: str | None = None) -> User:
+        """
+        Awaitable version of `get` - runs on `async_session`, with the user looked up in both tiers of
+        `entity_cache` first.
+
+        Args:
+            id (str, optional): The ID of the user. Defaults to None.
+            username (str, optional): The username of the user. Defaults to None.
+
+        Returns:
+            User: The user object.
+        """
+        column, value = self._get_lookup(id=id, username=username)
+
+        values = await self.entity_cache.aget(User, column, value)
+        if values is not None:
+            return await self.run_sync(UserService._attach, values)
 
+        user = await self.run_sync(UserService._get, column, value)
+        await self.entity_cache.aset(user, CACHED_BY)
+
+        return user
+
+    def get_many(self, ids: list[UUID]) -> list[User | NotFoundError]:
+        """
+        Retrieves users by ID - with a single `IN (...)` query for those not in `entity_cache` (its local tier).
+
+        Parameters:
+            ids (list[UUID]): The IDs of the users.
+
+        Returns:
+            list[User | NotFoundError]: The user - or why it is missing - for each of `ids` (in order).
+        """
+        return self._get_many(User, ids, CACHED_BY)
+
+    async def aget_many(self, ids: list[UUID]) -> list[User | NotFoundError]:
+        """
+        Awaitable version of `get_many` - runs on `async_session`, with the users looked up in both tiers of
+        `entity_cache` first.
+
+        Parameters:
+            ids (list[UUID]): The IDs of the users.
+
+        Returns:
+            list[User | NotFoundError]: The user - or why it is missing - for each of `ids` (in order).
+        """
+        return await self._aget_many(User, ids, CACHED_BY)
+
+    def get_version(self, id: UUID) -> tuple[datetime, int]:
+        """
+        Retrieves the version of a user - i.e. when it was last updated, and its write counter - from
+        `entity_cache` or, on a miss, by loading (and caching) it.
+
+        Parameters:
+            id (UUID): The ID of the user.
+
+        Returns:
+            tuple[datetime, int]: When the user was last updated, and its version.
+
+        Raises:
+            NotFoundError: If the user is not found.
+        """
+        return self._get_version(User, id, CACHED_BY)
+
+    async def aget_version(self, id: UUID) -> tuple[datetime, int]:
+        """
+        Awaitable version of `get_version` - runs on `async_session`.
+
+        Parameters:
+            id (UUID): The ID of the user.
+
+        Returns:
+            tuple[datetime, int]: When the user was last updated, and its version.
+        """
+        return await self._aget_version(User, id, CACHED_BY)
+
+    @staticmethod
+    def _get_lookup(id: str | None, username: str | None) -> tuple[str, Any]:
+        """
+        Returns the (unique) column a user is looked up by - and its value.
+
+        Args:
+            id (str, optional): The ID of the user.
+            username (str, optional): The username of the user.
+
+        Returns:
+            tuple[str, Any]: The column - `id` or `username` - and its value.
+
+        Raises:
+            ClientError: If neither id nor username is provided, or if both id and username are provided.
+        """
         if id is None and username is None:
             raise ClientError(message="Either id or name must be provided.")
         elif id is not None and username is not None:
@@ -92,14 +335,38 @@ class UserService(BaseService, AuthService):
                 message="Both id and name cannot be provided simultaneously."
             )
 
+        return ("id", id) if id is not None else ("username", username)
+
+    def _get(self, column: str, value: Any) -> User:
+        """
+        Queries a user by a (unique) column.
+
+        Args:
+            column (str): The column - `id` or `username`.
+            value (Any): The value of the column.
+
+        Returns:
+            User: The user.
+
+        Raises:
+            NotFoundError: If the user is not found.
+        """
         try:
-            return (
-                self.session.query(User).filter_by(id=id).one()
-                if id is not None
-                else self.session.query(User).filter_by(username=username).one()
-            )
+            return self.session.query(User).filter_by(**{column: value}).one()
         except NoResultFound:
-            raise NotFoundError(message=f"User {id or name} not found.")
+            raise NotFoundError(message=f"User {value} not found.")
+
+    def _attach(self, values: dict[str, Any]) -> User:
+        """
+        Attaches a cached user to the session - without a query.
+
+        Args:
+            values (dict[str, Any]): The user's (cached) column values.
+
+        Returns:
+            User: The user.
+        """
+        return self.session.merge(self.entity_cache.build(User, values), load=False)
 
     def delete(self):
         """
@@ -130,13 +397,52 @@ class UserService(BaseService, AuthService):
         Raises:
             NotFoundError: If the user with the given name is not found.
             InvalidPasswordError: If the password is invalid.
+
+        Note:
+            Outdated password hashes (i.e. a deprecated scheme or a lower cost than the configured one) are rehashed.
         """
         try:
             user = self.session.query(User).filter_by(username=username).one()
         except NoResultFound:
             raise NotFoundError(message=f"User {username} not found.")
 
-        if not user.check_password(password):
-            raise InvalidPasswordError(message="Invalid password.")
+        if not user.verify_and_update_password(password):
+            raise InvalidPasswordError()
+
+        if self.session.is_modified(user):
+            self.session.commit()
+            self.entity_cache.invalidate(user, CACHED_BY)
+
+        return user
+
+    async def aauthenticate(self, username: str, password: str) -> User:
+        """
+        Awaitable version of `authenticate` - runs on `async_session`, with the password verified by `hashing_service`.
+
+        Parameters:
+            username (str): The username of the user to authenticate.
+            password (str): The password for the user.
+
+        Returns:
+            User: The authenticated user.
+
+        Raises:
+            NotFoundError: If the user with the given name is not found.
+            InvalidPasswordError: If the password is invalid.
+            UnavailableError: If the hashing service is overloaded.
+
+        Note:
+            Outdated password hashes (i.e. a deprecated scheme or a lower cost than the configured one) are rehashed
+            - and the user invalidated in `entity_cache`. The user may come from `entity_cache`, but its password
+            hash is always read from the database.
+        """
+        user = await self.aget(username=username)
+
+        password_hash = await self.verify_password(
+            password, await self.aget_password_hash(user)
+        )
+        if password_hash is not None:
+            await self.run_sync(UserService._rehash_password, user, password_hash)
+            await self.entity_cache.ainvalidate(user, CACHED_BY)
 
         return user
@@ -1,4 +1,6 @@
 import os
+from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 
@@ -12,6 +14,37 @@ class Settings(BaseSettings):
         debug (bool): Flag indicating whether debug mode is enabled.
         description (str): A description of the API service.
         database_url (str): The URL of the database.
+        async_database_driver (str): The (async) driver used to connect to `database_url` from asyncio code.
+        uuid_column_type (str): How UUIDs are written - as `binary` (i.e. `BINARY(16)`) or `char` (i.e. `CHAR(32)`), while the columns are migrated (see a3f9c1e7b204).
+        password_hashing_workers (int | None): The number of password hashing processes - defaults to the number of CPUs.
+        password_hashing_queue_size (int): The maximum number of password hashing requests waiting for a process.
+        password_schemes (list[str]): The accepted password hashing schemes - the first one is used for new hashes.
+        password_pbkdf2_sha256_rounds (int | None): The number of rounds for `pbkdf2_sha256` - defaults to passlib's.
+        password_argon2_time_cost (int | None): The time cost for `argon2` - defaults to passlib's.
+        password_argon2_memory_cost (int | None): The memory cost (in KiB) for `argon2` - defaults to passlib's.
+        password_argon2_parallelism (int | None): The parallelism for `argon2` - defaults to passlib's.
+        password_calibration_target_ms (float | None): If set, the cost of the default scheme is calibrated on startup so that verifying a password takes about this long.
+        jwt_cache_size (int): The maximum number of verified JWT tokens cached - 0 disables caching.
+        email_validation_mode (str): How usernames (i.e. email addresses) are validated - `syntax` only, or also `deliverability` (via DNS).
+        email_dns_cache_ttl_seconds (float): For how long deliverable email domains are cached.
+        email_dns_negative_cache_ttl_seconds (float): For how long undeliverable email domains are cached.
+        email_dns_timeout_seconds (float): The timeout for each DNS query checking email deliverability.
+        job_batch_max_size (int): The maximum number of jobs created by a single batch request.
+        batch_get_max_size (int): The maximum number of IDs (e.g. of jobs) retrieved by a single batch request.
+        job_page_size (int): The default number of jobs per page of a listing.
+        job_page_max_size (int): The maximum number of jobs per page of a listing.
+        job_search_backend (str): What searches jobs - the `database` (i.e. its FULLTEXT index) or an in-process index kept in `memory`.
+        job_search_snapshot_path (str | None): If set (and searching in memory), where the in-process index is restored from on startup and snapshotted to on shutdown.
+        job_search_refresh_seconds (float): How often the in-process index catches up with jobs written by other workers.
+        job_catalog_enabled (bool): Whether jobs are browsed (i.e. filtered and sorted) with an in-process, columnar catalog rather than SQL.
+        job_catalog_refresh_seconds (float): How often the in-process catalog catches up with jobs written by other workers.
+        watermark_lag_seconds (float): How far behind incremental reads (i.e. snapshots and in-process read model refreshes) stay - the longest a transaction may take to commit after setting `updated`.
+        application_export_batch_size (int): The number of applications fetched (and serialized) at a time by an export.
+        entity_cache_size (int): The maximum number of keys (i.e. entities by ID or natural key) cached in-process - 0 disables caching.
+        entity_cache_ttl_seconds (float): For how long entities (e.g. organizations, users and jobs) are cached - i.e. how stale other workers' copies get.
+        entity_cache_url (str | None): If set, the URL of a cache shared by workers (e.g. `redis://localhost:6379/0`) - requires `redis`.
+        job_response_cache_bytes (int): The maximum total size (in bytes) of the job detail responses cached in-process - 0 disables caching.
+        http_cache_max_age_seconds (int): For how long clients may reuse public resources (e.g. a job) without revalidating them - 0 to always revalidate (i.e. with a conditional request).
 
     """
 
@@ -19,9 +52,53 @@ class Settings(BaseSettings):
     debug: bool = False
     description: str = "An API providing a service that manages job postings."
     database_url: str
+    async_database_driver: str = "mysql+aiomysql"
+    uuid_column_type: Literal["binary", "char"] = "binary"
     jwt_algorithm: str = "HS256"
     jwt_secret_key: str
     jwt_token_expiration_minutes: int = 60
+    jwt_cache_size: int = 10000
+    email_validation_mode: Literal["syntax", "deliverability"] = "syntax"
+    email_dns_cache_ttl_seconds: float = 3600
+    email_dns_negative_cache_ttl_seconds: float = 300
+    email_dns_timeout_seconds: float = 5
+    job_batch_max_size: int = 1000
+    batch_get_max_size: int = 100
+    job_page_size: int = 20
+    job_page_max_size: int = 100
+    job_search_backend: Literal["database", "memory"] = "database"
+    job_search_snapshot_path: str | None = None
+    job_search_refresh_seconds: float = 60
+    job_catalog_enabled: bool = False
+    job_catalog_refresh_seconds: float = 60
+    watermark_lag_seconds: float = 5
+    application_export_batch_size: int = 1000
+    entity_cache_size: int = 10000
+    entity_cache_ttl_seconds: float = 60
+    entity_cache_url: str | None = None
+    job_response_cache_bytes: int = 16 * 1024 * 1024
+    http_cache_max_age_seconds: int = 0
+    password_hashing_workers: int | None = None
+    password_hashing_queue_size: int = 64
+    password_schemes: list[str] = ["pbkdf2_sha256"]
+    password_pbkdf2_sha256_rounds: int | None = None
+    password_argon2_time_cost: int | None = None
+    password_argon2_memory_cost: int | None = None
+    password_argon2_parallelism: int | None = None
+    password_calibration_target_ms: float | None = None
 
     class Config:
         env_file = os.getenv("ENV_FILE", None)
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Get the (process-wide) settings.
+
+    The environment (and env file) is read once - on the first call - rather than on every `Settings()`.
+
+    Returns:
+        Settings: The settings.
+    """
+    return Settings()
@@ -9,6 +9,7 @@ from ..services.job import JobService
 from ..services.organization import OrganizationService
 from ..services.user import UserService
 from ..settings.base import Settings
+from ..utils.cache import ENTITY_CACHE, JOB_RESPONSE_CACHE
 
 
 engine = create_engine(Settings().database_url)
@@ -41,11 +42,29 @@ def database_setup_and_teardown(database_engine):
     for table in reversed(Base.metadata.sorted_tables):
         session.execute(table.delete())
     session.commit()
+    # NOTE: rows are deleted behind the services' back - i.e. cached entities (and responses) have to be dropped too.
+    ENTITY_CACHE.clear()
+    JOB_RESPONSE_CACHE.clear()
 
 
 @pytest.fixture(scope="function")
-def organization_service():
-    service = OrganizationService()
+def database_session(database_engine):
+    """
+    Provide a session for a single test.
+
+    The session reads committed data - i.e. it sees whatever the (async) endpoints under test commit.
+    """
+    session = Session(
+        bind=database_engine.execution_options(isolation_level="READ COMMITTED")
+    )
+    yield session
+    session.rollback()
+    session.close()
+
+
+@pytest.fixture(scope="function")
+def organization_service(database_session):
+    service = OrganizationService(session=database_session)
     yield service
     service.session.rollback()
 
@@ -56,21 +75,21 @@ def valid_password():
 
 
 @pytest.fixture(scope="function")
-def job_service():
-    service = JobService()
+def job_service(database_session):
+    service = JobService(session=database_session)
     yield service
     service.session.rollback()
 
 
 @pytest.fixture(scope="function")
-def user_service():
-    service = UserService()
+def user_service(database_session):
+    service = UserService(session=database_session)
     yield service
     service.session.rollback()
 
 
 @pytest.fixture(scope="function")
-def application_service():
-    service = ApplicationService()
+def application_service(database_session):
+    service = ApplicationService(session=database_session)
     yield service
     service.session.rollback()
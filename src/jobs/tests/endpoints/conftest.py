@@ -1,8 +1,29 @@
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+
 from ...endpoints.app import app
+from ...models.async_database import async_engine
 
 
 @pytest.fixture(scope="session")
 def test_app():
-    return TestClient(app)
+    # NOTE: the client is used as a context manager so that all requests run on the same
+    # event loop - which the async engine's pooled connections are bound to.
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="function")
+def statements():
+    """
+    Record the SQL statements the (async) endpoints execute - e.g. to assert how many queries a request issues.
+    """
+    statements = []
+
+    def record(connection, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
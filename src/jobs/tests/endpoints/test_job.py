@@ -0,0 +1,425 @@
+from datetime import datetime
+
+import pytest
+
+from ...models.organization import Organization
+from ...settings.base import get_settings
+from ...utils.cache import ENTITY_CACHE, JOB_RESPONSE_CACHE
+from ...utils.conditional import get_etag, get_last_modified
+from ...utils.identifier import uuid7
+from ...utils.job import JobContract, JobMode
+
+
+settings = get_settings()
+
+
+class TestSearchJobsEndpoint:
+    """
+    Test class for the search jobs endpoint.
+    """
+
+    resource: str = "/api/v1/jobs"
+
+    @pytest.fixture
+    def jobs(self, job_service, valid_password):
+        """
+        Creates (and commits) jobs to search for.
+
+        Args:
+            job_service (JobService): The job service.
+            valid_password (str): A valid password for the organization.
+
+        Returns:
+            list[Job]: The jobs.
+        """
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.commit()
+        an_organization = job_service.session.query(Organization).one()
+        return job_service.create_many(
+            organization_id=an_organization.id,
+            jobs=[
+                {
+                    "title": "python developer",
+                    "description": "python python python",
+                    "salary": float(100000),
+                    "mode": JobMode.REMOTE,
+                    "contract": JobContract.FULL_TIME,
+                },
+                {
+                    "title": "backend developer",
+                    "description": "some python",
+                    "salary": float(50000),
+                    "mode": JobMode.ON_SITE,
+                    "contract": JobContract.PART_TIME,
+                },
+                {
+                    "title": "accountant",
+                    "description": "spreadsheets",
+                    "salary": float(50000),
+                    "mode": JobMode.ON_SITE,
+                    "contract": JobContract.FULL_TIME,
+                },
+            ],
+        )
+
+    def test_when_search_jobs_is_successful(self, test_app, jobs, statements):
+        """
+        Test case for searching jobs - ranked by relevance.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            jobs (list[Job]): The jobs to search for.
+            statements (list[str]): The SQL statements executed by the endpoint.
+
+        Returns:
+            None
+        """
+        response = test_app.get(self.resource, params={"q": "python"})
+
+        # NOTE: a single SELECT - i.e. served by the FULLTEXT index.
+        assert [statement.split()[0] for statement in statements] == ["SELECT"]
+        assert "MATCH" in statements[0]
+
+        assert response.status_code == 200
+        assert [a_job["title"] for a_job in response.json()["jobs"]] == [
+            "python developer",
+            "backend developer",
+        ]
+
+    def test_when_search_jobs_is_filtered(self, test_app, jobs):
+        """
+        Test case for searching jobs - narrowed down by filters.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            jobs (list[Job]): The jobs to search for.
+
+        Returns:
+            None
+        """
+        response = test_app.get(
+            self.resource,
+            params={
+                "q": "developer",
+                "mode": JobMode.ON_SITE.value,
+                "contract": JobContract.PART_TIME.value,
+                "max_salary": 75000,
+            },
+        )
+
+        assert response.status_code == 200
+        assert [a_job["title"] for a_job in response.json()["jobs"]] == [
+            "backend developer"
+        ]
+
+    def test_when_search_jobs_query_is_empty(self, test_app):
+        """
+        Test case for searching jobs with empty search terms.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+
+        Returns:
+            None
+        """
+        response = test_app.get(self.resource, params={"q": ""})
+
+        assert response.status_code == 422
+
+    def test_when_browse_jobs_is_successful(self, test_app, jobs, statements):
+        """
+        Test case for browsing jobs - i.e. without search terms.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            jobs (list[Job]): The jobs to browse.
+            statements (list[str]): The SQL statements executed by the endpoint.
+
+        Returns:
+            None
+        """
+        response = test_app.get(
+            self.resource,
+            params={
+                "mode": JobMode.ON_SITE.value,
+                "min_salary": 40000,
+                "order_by": "salary",
+            },
+        )
+
+        assert [statement.split()[0] for statement in statements] == ["SELECT"]
+
+        assert response.status_code == 200
+        assert sorted(a_job["title"] for a_job in response.json()["jobs"]) == [
+            "accountant",
+            "backend developer",
+        ]
+
+
+class TestGetJobEndpoint:
+    """
+    Test class for the get job endpoint.
+    """
+
+    resource: str = "/api/v1/jobs/{job_id}"
+
+    @pytest.fixture
+    def a_job(self, job_service, valid_password):
+        """
+        Creates (and commits) a job to retrieve.
+
+        Args:
+            job_service (JobService): The job service.
+            valid_password (str): A valid password for the organization.
+
+        Returns:
+            Job: The job.
+        """
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.commit()
+        an_organization = job_service.session.query(Organization).one()
+        return job_service.create(
+            organization_id=an_organization.id,
+            title="a-job",
+            salary=float(100000),
+            mode=JobMode.REMOTE,
+            contract=JobContract.FULL_TIME,
+        )
+
+    def test_when_get_job_is_successful(self, test_app, job_service, a_job, statements):
+        """
+        Test case for retrieving a job - with its caching headers, in a single query.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            job_service (JobService): The job service.
+            a_job (Job): The job.
+            statements (list[str]): The SQL statements executed by the endpoint.
+
+        Returns:
+            None
+        """
+        # NOTE: `Last-Modified` is only sent once the second the job was last updated in is over.
+        a_job.updated = datetime(2024, 6, 17, 12, 0, 0)
+        job_service.session.commit()
+
+        response = test_app.get(self.resource.format(job_id=a_job.id))
+
+        assert len(statements) == 1
+
+        assert response.status_code == 200
+        assert response.json()["id"] == str(a_job.id)
+        assert response.json()["title"] == "a-job"
+        assert a_job.version == 2
+        assert response.headers["ETag"] == get_etag(a_job.updated, a_job.version)
+        assert response.headers["Last-Modified"] == get_last_modified(a_job.updated)
+        assert response.headers["Cache-Control"] == "public, no-cache"
+
+    def test_when_get_job_response_is_cached(self, test_app, a_job, statements):
+        """
+        Test case for retrieving a job again - served from the response cache.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            a_job (Job): The job.
+            statements (list[str]): The SQL statements executed by the endpoint.
+
+        Returns:
+            None
+        """
+        response = test_app.get(self.resource.format(job_id=a_job.id))
+
+        statements.clear()
+        cached = test_app.get(self.resource.format(job_id=a_job.id))
+
+        assert statements == []
+
+        assert cached.status_code == 200
+        assert cached.content == response.content
+        assert cached.headers["ETag"] == response.headers["ETag"]
+        assert cached.headers["Content-Type"] == "application/json"
+        assert JOB_RESPONSE_CACHE.stats().hits == 1
+
+    def test_when_get_job_is_not_modified(self, test_app, a_job, statements):
+        """
+        Test case for retrieving an unchanged job - checking its version alone.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            a_job (Job): The job.
+            statements (list[str]): The SQL statements executed by the endpoint.
+
+        Returns:
+            None
+        """
+        etag = test_app.get(self.resource.format(job_id=a_job.id)).headers["ETag"]
+
+        statements.clear()
+        response = test_app.get(
+            self.resource.format(job_id=a_job.id), headers={"If-None-Match": etag}
+        )
+
+        # NOTE: served from the entity cache - i.e. neither the version nor the job is queried.
+        assert statements == []
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+        response = test_app.get(
+            self.resource.format(job_id=a_job.id),
+            headers={"If-Modified-Since": get_last_modified(a_job.updated)},
+        )
+
+        assert response.status_code == 304
+
+    def test_when_get_job_version_is_queried(self, test_app, a_job, statements):
+        """
+        Test case for retrieving an unchanged job which is not cached - loading (and caching) it once.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            a_job (Job): The job.
+            statements (list[str]): The SQL statements executed by the endpoint.
+
+        Returns:
+            None
+        """
+        response = test_app.get(
+            self.resource.format(job_id=a_job.id),
+            headers={"If-None-Match": get_etag(a_job.updated, a_job.version)},
+        )
+
+        assert len(statements) == 1
+
+        assert response.status_code == 304
+
+        statements.clear()
+        response = test_app.get(self.resource.format(job_id=a_job.id))
+
+        assert statements == []
+        assert response.status_code == 200
+
+    def test_when_get_job_is_modified_within_the_same_second(
+        self, test_app, job_service, a_job
+    ):
+        """
+        Test case for revalidating a job written again within the same second - i.e. with the same `updated`.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            job_service (JobService): The job service.
+            a_job (Job): The job.
+
+        Returns:
+            None
+        """
+        etag = test_app.get(self.resource.format(job_id=a_job.id)).headers["ETag"]
+
+        updated = a_job.updated
+        a_job.title, a_job.updated = "another-job", updated
+        job_service.session.commit()
+        ENTITY_CACHE.clear()
+
+        response = test_app.get(
+            self.resource.format(job_id=a_job.id), headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "another-job"
+        assert response.headers["ETag"] != etag
+
+    def test_when_get_job_is_not_found(self, test_app):
+        """
+        Test case for retrieving a job that does not exist.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+
+        Returns:
+            None
+        """
+        response = test_app.get(self.resource.format(job_id=uuid7()))
+
+        assert response.status_code == 404
+
+
+class TestGetJobsByIdsEndpoint:
+    """
+    Test class for the batch get jobs endpoint.
+    """
+
+    resource: str = "/api/v1/jobs:batchGet"
+
+    def test_when_get_jobs_by_ids_is_successful(
+        self, test_app, job_service, valid_password, statements
+    ):
+        """
+        Test case for retrieving jobs in a batch - in the order of the input, missing ones reported.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            job_service (JobService): The job service.
+            valid_password (str): A valid password for the organization.
+            statements (list[str]): The SQL statements executed by the endpoint.
+
+        Returns:
+            None
+        """
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.commit()
+        an_organization = job_service.session.query(Organization).one()
+        jobs = job_service.create_many(
+            organization_id=an_organization.id,
+            jobs=[
+                {
+                    "title": title,
+                    "salary": float(100000),
+                    "mode": JobMode.ON_SITE,
+                    "contract": JobContract.FULL_TIME,
+                }
+                for title in ("a-job", "another-job")
+            ],
+        )
+        missing_id = uuid7()
+
+        response = test_app.post(
+            self.resource,
+            json={"ids": [str(jobs[1].id), str(missing_id), str(jobs[0].id)]},
+        )
+
+        assert [statement.split()[0] for statement in statements] == ["SELECT"]
+
+        assert response.status_code == 200
+        assert response.json()["results"] == [
+            {"job": response.json()["results"][0]["job"], "error": None},
+            {"job": None, "error": f"Job {missing_id} not found."},
+            {"job": response.json()["results"][2]["job"], "error": None},
+        ]
+        assert response.json()["results"][0]["job"]["title"] == "another-job"
+        assert response.json()["results"][2]["job"]["title"] == "a-job"
+
+    def test_when_get_jobs_by_ids_has_too_many_ids(self, test_app):
+        """
+        Test case for retrieving more jobs than a batch allows.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+
+        Returns:
+            None
+        """
+        response = test_app.post(
+            self.resource,
+            json={
+                "ids": [str(uuid7()) for _ in range(settings.batch_get_max_size + 1)]
+            },
+        )
+
+        assert response.status_code == 422
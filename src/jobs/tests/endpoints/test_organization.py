@@ -1,9 +1,27 @@
+import csv
+import gzip
+import io
 import json
+import resource
+import uuid
+import anyio
 import pytest
+from sqlalchemy import insert
 
+from ...endpoints.app import app
+from ...models.application import Application
+from ...models.base import utcnow
 from ...models.job import Job
 from ...models.organization import Organization
-from ...utils.auth import create_jwt_token
+from ...models.user import User
+from ...utils.auth import (
+    create_jwt_token,
+    get_jwt_principal,
+    Principal,
+    PrincipalType,
+)
+from ...utils.application import ApplicationState
+from ...utils.identifier import uuid7
 from ...utils.job import JobContract, JobMode, JobState
 
 
@@ -15,7 +33,7 @@ class TestCreateOrganizationEndpoint:
     resource: str = "/api/v1/organizations"
 
     def test_when_create_organization_is_successful(
-        self, test_app, organization_service, valid_password
+        self, test_app, organization_service, valid_password, statements
     ):
         """
         Test case for creating an organization successfully.
@@ -24,6 +42,7 @@ class TestCreateOrganizationEndpoint:
             test_app: The test client for the application.
             organization_service: The organization service.
             valid_password: A valid password for the organization.
+            statements: The SQL statements executed by the endpoint.
 
         Returns:
             None
@@ -35,6 +54,8 @@ class TestCreateOrganizationEndpoint:
             data=json.dumps({"name": "an-organization", "password": valid_password}),
         )
 
+        # NOTE: a single INSERT - i.e. no SELECT to read back generated values.
+        assert [statement.split()[0] for statement in statements] == ["INSERT"]
         assert organization_service.session.query(Organization).count() == 1
 
         an_organization = organization_service.session.query(Organization).one()
@@ -74,7 +95,7 @@ class TestAuthenticateOrganizationEndpoint:
         organization_service.session.add(
             Organization(name="an-organization", password=valid_password)
         )
-        organization_service.session.flush()
+        organization_service.session.commit()
 
         response = test_app.post(
             self.resource,
@@ -82,7 +103,15 @@ class TestAuthenticateOrganizationEndpoint:
         )
 
         assert response.status_code == 200
-        assert response.json()["access_token"] == create_jwt_token("an-organization")
+        an_organization = organization_service.session.query(Organization).one()
+
+        assert get_jwt_principal(
+            response.json()["access_token"], PrincipalType.ORGANIZATION
+        ) == Principal(
+            id=an_organization.id,
+            subject="an-organization",
+            type=PrincipalType.ORGANIZATION,
+        )
         assert response.json()["token_type"] == "bearer"
 
 
@@ -115,7 +144,9 @@ class TestCreateJobEndpoint:
             data={"username": username, "password": password},
         ).json()["access_token"]
 
-    def test_when_create_job_is_successful(self, test_app, job_service, valid_password):
+    def test_when_create_job_is_successful(
+        self, test_app, job_service, valid_password, statements
+    ):
         """
         Test case for creating a job successfully.
 
@@ -123,6 +154,7 @@ class TestCreateJobEndpoint:
             test_app (TestClient): The test client for the application.
             job_service (JobService): The job service.
             valid_password (str): A valid password for the organization.
+            statements (list[str]): The SQL statements executed by the endpoint.
 
         Returns:
             None
@@ -130,11 +162,13 @@ class TestCreateJobEndpoint:
         job_service.session.add(
             Organization(name="an-organization", password=valid_password)
         )
-        job_service.session.flush()
+        job_service.session.commit()
         an_organization = job_service.session.query(Organization).one()
+        token = self._authenticate(test_app, "an-organization", valid_password)
 
         assert job_service.session.query(Job).count() == 0
 
+        statements.clear()
         response = test_app.post(
             self.resource.format(organization_id=an_organization.id),
             data=json.dumps(
@@ -145,11 +179,11 @@ class TestCreateJobEndpoint:
                     "contract": JobContract.FULL_TIME.value,
                 }
             ),
-            headers={
-                "Authorization": f"Bearer {self._authenticate(test_app, "an-organization", valid_password)}"
-            },
+            headers={"Authorization": f"Bearer {token}"},
         )
 
+        # NOTE: a single INSERT - i.e. no organization lookup, nor SELECT to read back generated values.
+        assert [statement.split()[0] for statement in statements] == ["INSERT"]
         assert job_service.session.query(Job).count() == 1
 
         a_job = job_service.session.query(Job).one()
@@ -165,3 +199,578 @@ class TestCreateJobEndpoint:
         assert response.json()["state"] == JobState.DRAFT.value
         assert response.json()["created"] == a_job.created.strftime("%Y-%m-%dT%H:%M:%S")
         assert response.json()["updated"] == a_job.updated.strftime("%Y-%m-%dT%H:%M:%S")
+
+    def test_when_create_job_is_not_authorized_for_user_token(
+        self, test_app, job_service, valid_password
+    ):
+        """
+        Test case for creating a job with a token issued to a user (rather than an organization).
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            job_service (JobService): The job service.
+            valid_password (str): A valid password for the organization.
+
+        Returns:
+            None
+        """
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.commit()
+        an_organization = job_service.session.query(Organization).one()
+
+        response = test_app.post(
+            self.resource.format(organization_id=an_organization.id),
+            data=json.dumps(
+                {
+                    "title": "a-job",
+                    "salary": float(100000),
+                    "mode": JobMode.ON_SITE.value,
+                    "contract": JobContract.FULL_TIME.value,
+                }
+            ),
+            headers={
+                "Authorization": f"Bearer {create_jwt_token("an-organization", an_organization.id, PrincipalType.USER)}"
+            },
+        )
+
+        assert response.status_code == 401
+        assert job_service.session.query(Job).count() == 0
+
+
+class TestCreateJobsEndpoint:
+    """
+    Test class for the create jobs (in a batch) endpoint.
+    """
+
+    resource: str = "/api/v1/organizations/{organization_id}/jobs:batchCreate"
+
+    def test_when_create_jobs_is_successful(
+        self, test_app, job_service, valid_password, statements
+    ):
+        """
+        Test case for creating jobs in a batch - with valid and invalid jobs.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            job_service (JobService): The job service.
+            valid_password (str): A valid password for the organization.
+            statements (list[str]): The SQL statements executed by the endpoint.
+
+        Returns:
+            None
+        """
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.commit()
+        an_organization = job_service.session.query(Organization).one()
+        token = create_jwt_token(
+            "an-organization", an_organization.id, PrincipalType.ORGANIZATION
+        )
+
+        response = test_app.post(
+            self.resource.format(organization_id=an_organization.id),
+            data=json.dumps(
+                {
+                    "jobs": [
+                        {
+                            "title": "a-job",
+                            "salary": float(100000),
+                            "mode": JobMode.ON_SITE.value,
+                            "contract": JobContract.FULL_TIME.value,
+                        },
+                        {
+                            "title": "an-invalid-job",
+                            "salary": float(0),
+                            "mode": JobMode.ON_SITE.value,
+                            "contract": JobContract.FULL_TIME.value,
+                        },
+                        {"title": "another-invalid-job"},
+                        {
+                            "title": "another-job",
+                            "salary": float(50000),
+                            "mode": JobMode.REMOTE.value,
+                            "contract": JobContract.PART_TIME.value,
+                        },
+                    ]
+                }
+            ),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        # NOTE: a single (multi-row) INSERT for all valid jobs.
+        assert [statement.split()[0] for statement in statements] == ["INSERT"]
+        assert job_service.session.query(Job).count() == 2
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [result["job"]["title"] for result in results[::3]] == [
+            "a-job",
+            "another-job",
+        ]
+        assert all(result["job"] is None for result in results[1:3])
+        assert all(result["error"] for result in results[1:3])
+        assert {str(a_job.id) for a_job in job_service.session.query(Job)} == {
+            result["job"]["id"] for result in results[::3]
+        }
+
+    def test_when_create_jobs_is_forbidden(self, test_app, job_service, valid_password):
+        """
+        Test case for creating jobs in a batch for another organization.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            job_service (JobService): The job service.
+            valid_password (str): A valid password for the organization.
+
+        Returns:
+            None
+        """
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.commit()
+        an_organization = job_service.session.query(Organization).one()
+        token = create_jwt_token(
+            "an-organization", an_organization.id, PrincipalType.ORGANIZATION
+        )
+
+        response = test_app.post(
+            self.resource.format(organization_id=uuid.uuid4()),
+            data=json.dumps({"jobs": [{"title": "a-job"}]}),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 403
+        assert job_service.session.query(Job).count() == 0
+
+
+class TestGetOrganizationEndpoint:
+    """
+    Test class for the get organization endpoint.
+    """
+
+    resource: str = "/api/v1/organizations/{organization_id}"
+
+    def test_when_get_organization_is_successful(
+        self, test_app, organization_service, valid_password
+    ):
+        """
+        Test case for retrieving an organization - and revalidating it.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            organization_service (OrganizationService): The organization service.
+            valid_password (str): A valid password for the organization.
+
+        Returns:
+            None
+        """
+        organization_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        organization_service.session.commit()
+        an_organization = organization_service.session.query(Organization).one()
+
+        response = test_app.get(
+            self.resource.format(organization_id=an_organization.id)
+        )
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "an-organization"
+        assert "password" not in response.json()
+        assert response.headers["Cache-Control"] == "public, no-cache"
+
+        response = test_app.get(
+            self.resource.format(organization_id=an_organization.id),
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+
+        assert response.status_code == 304
+
+    def test_when_get_organization_is_not_found(self, test_app):
+        """
+        Test case for retrieving an organization that does not exist.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+
+        Returns:
+            None
+        """
+        response = test_app.get(self.resource.format(organization_id=uuid7()))
+
+        assert response.status_code == 404
+
+
+class TestGetOrganizationsByIdsEndpoint:
+    """
+    Test class for the batch get organizations endpoint.
+    """
+
+    resource: str = "/api/v1/organizations:batchGet"
+
+    def test_when_get_organizations_by_ids_is_successful(
+        self, test_app, organization_service, valid_password
+    ):
+        """
+        Test case for retrieving organizations in a batch - in the order of the input, missing ones reported.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            organization_service (OrganizationService): The organization service.
+            valid_password (str): A valid password for the organization.
+
+        Returns:
+            None
+        """
+        organization_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        organization_service.session.commit()
+        an_organization = organization_service.session.query(Organization).one()
+        missing_id = uuid7()
+
+        response = test_app.post(
+            self.resource,
+            json={"ids": [str(missing_id), str(an_organization.id)]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"][0] == {
+            "organization": None,
+            "error": f"Organization {missing_id} not found.",
+        }
+        assert response.json()["results"][1]["organization"]["name"] == (
+            "an-organization"
+        )
+
+
+class TestGetJobsByOrganizationEndpoint:
+    """
+    Test class for the get jobs by organization endpoint.
+    """
+
+    resource: str = "/api/v1/organizations/{organization_id}/jobs"
+
+    def test_when_get_jobs_by_organization_is_paginated(
+        self, test_app, job_service, valid_password, statements
+    ):
+        """
+        Test case for walking through an organization's jobs - a page at a time.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            job_service (JobService): The job service.
+            valid_password (str): A valid password for the organization.
+            statements (list[str]): The SQL statements executed by the endpoint.
+
+        Returns:
+            None
+        """
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.commit()
+        an_organization = job_service.session.query(Organization).one()
+        job_service.create_many(
+            organization_id=an_organization.id,
+            jobs=[
+                {
+                    "title": f"a-job-{index}",
+                    "salary": float(100000),
+                    "mode": JobMode.ON_SITE,
+                    "contract": JobContract.FULL_TIME,
+                }
+                for index in range(5)
+            ],
+        )
+
+        titles = []
+        params = {"limit": 2}
+        while True:
+            statements.clear()
+            response = test_app.get(
+                self.resource.format(organization_id=an_organization.id),
+                params=params,
+            )
+
+            # NOTE: a single (keyset paginated) SELECT per page - i.e. no OFFSET.
+            assert [statement.split()[0] for statement in statements] == ["SELECT"]
+            assert "OFFSET" not in statements[0]
+
+            assert response.status_code == 200
+            titles += [a_job["title"] for a_job in response.json()["jobs"]]
+            if response.json()["next_cursor"] is None:
+                break
+            params["cursor"] = response.json()["next_cursor"]
+
+        assert sorted(titles) == [f"a-job-{index}" for index in range(5)]
+
+    def test_when_get_jobs_by_organization_cursor_is_invalid(self, test_app):
+        """
+        Test case for getting an organization's jobs with an invalid cursor.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+
+        Returns:
+            None
+        """
+        response = test_app.get(
+            self.resource.format(organization_id=uuid.uuid4()),
+            params={"cursor": "a-cursor"},
+        )
+
+        assert response.status_code == 400
+
+
+def get_rss() -> int:
+    """
+    Returns the resident set size (in bytes) of the current process - Linux only.
+    """
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * resource.getpagesize()
+
+
+class TestExportApplicationsEndpoint:
+    """
+    Test class for the export applications endpoint.
+    """
+
+    resource: str = "/api/v1/organizations/{organization_id}/applications:export"
+
+    # NOTE: the export must run in constant memory - i.e. well under the size of the export itself.
+    rows: int = 5_000_000
+    rss_ceiling: int = 64 * 2**20
+
+    @pytest.fixture
+    def applications(self, job_service, valid_password):
+        """
+        Creates an application for one of an organization's jobs - and for another organization's job.
+
+        Args:
+            job_service (JobService): The job service.
+            valid_password (str): A valid password for the organizations and the user.
+
+        Returns:
+            tuple[Organization, Job, User]: The organization, its job and the user.
+        """
+        job_service.session.add_all(
+            [
+                Organization(name="an-organization", password=valid_password),
+                Organization(name="another-organization", password=valid_password),
+                User(
+                    username="username@server.io",
+                    name="a-user",
+                    password=valid_password,
+                ),
+            ]
+        )
+        job_service.session.commit()
+        an_organization, another_organization = (
+            job_service.session.query(Organization).order_by(Organization.name).all()
+        )
+        a_user = job_service.session.query(User).one()
+        a_job, another_job = (
+            job_service.create(
+                organization_id=organization.id,
+                title="a-job",
+                salary=float(100000),
+                mode=JobMode.ON_SITE,
+                contract=JobContract.FULL_TIME,
+            )
+            for organization in (an_organization, another_organization)
+        )
+        job_service.session.add_all(
+            [
+                Application(job_id=a_job.id, user_id=a_user.id),
+                Application(job_id=another_job.id, user_id=a_user.id),
+            ]
+        )
+        job_service.session.commit()
+
+        return an_organization, a_job, a_user
+
+    def test_when_export_applications_is_ndjson(self, test_app, applications):
+        """
+        Test case for exporting an organization's applications as NDJSON.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            applications (tuple[Organization, Job, User]): The organization, its job and the user.
+
+        Returns:
+            None
+        """
+        an_organization, a_job, a_user = applications
+        token = create_jwt_token(
+            "an-organization", an_organization.id, PrincipalType.ORGANIZATION
+        )
+
+        response = test_app.get(
+            self.resource.format(organization_id=an_organization.id),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 1
+        assert rows[0]["job_id"] == str(a_job.id)
+        assert rows[0]["job_title"] == "a-job"
+        assert rows[0]["user_id"] == str(a_user.id)
+        assert rows[0]["state"] == ApplicationState.DRAFT.value
+
+    def test_when_export_applications_is_gzipped_csv(self, test_app, applications):
+        """
+        Test case for exporting an organization's applications as gzipped CSV.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            applications (tuple[Organization, Job, User]): The organization, its job and the user.
+
+        Returns:
+            None
+        """
+        an_organization, a_job, _ = applications
+        token = create_jwt_token(
+            "an-organization", an_organization.id, PrincipalType.ORGANIZATION
+        )
+
+        response = test_app.get(
+            self.resource.format(organization_id=an_organization.id),
+            params={"format": "csv", "compress": True},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert "applications.csv.gz" in response.headers["content-disposition"]
+        header, *rows = csv.reader(
+            io.StringIO(gzip.decompress(response.content).decode())
+        )
+        assert header == [
+            "id",
+            "state",
+            "job_id",
+            "job_title",
+            "user_id",
+            "created",
+            "updated",
+        ]
+        assert [row[2] for row in rows] == [str(a_job.id)]
+
+    def test_when_export_applications_is_forbidden(self, test_app, applications):
+        """
+        Test case for exporting another organization's applications.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            applications (tuple[Organization, Job, User]): The organization, its job and the user.
+
+        Returns:
+            None
+        """
+        an_organization, _, _ = applications
+        token = create_jwt_token(
+            "an-organization", an_organization.id, PrincipalType.ORGANIZATION
+        )
+
+        response = test_app.get(
+            self.resource.format(organization_id=uuid.uuid4()),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 403
+
+    @pytest.mark.slow
+    def test_when_export_applications_memory_is_constant(
+        self, test_app, job_service, applications
+    ):
+        """
+        Test case for exporting millions of applications under a fixed RSS ceiling.
+
+        The application is called directly (on the test client's event loop) rather than through the test client,
+        which buffers whole responses - i.e. chunks are counted and dropped as they are sent.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            job_service (JobService): The job service.
+            applications (tuple[Organization, Job, User]): The organization, its job and the user.
+
+        Returns:
+            None
+        """
+        an_organization, a_job, a_user = applications
+        for start in range(1, self.rows, 10_000):
+            now = utcnow()
+            job_service.session.execute(
+                insert(Application),
+                [
+                    {
+                        "id": uuid7(),
+                        "state": ApplicationState.DRAFT,
+                        "job_id": a_job.id,
+                        "user_id": a_user.id,
+                        "created": now,
+                        "updated": now,
+                    }
+                    for _ in range(min(10_000, self.rows - start))
+                ],
+            )
+            job_service.session.commit()
+        token = create_jwt_token(
+            "an-organization", an_organization.id, PrincipalType.ORGANIZATION
+        )
+
+        baseline = get_rss()
+        exported = {"lines": 0, "bytes": 0, "rss": baseline, "status": None}
+        requested, completed = False, anyio.Event()
+
+        async def receive():
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # NOTE: the client disconnects only once the whole response is sent.
+            await completed.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                exported["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                exported["lines"] += message.get("body", b"").count(b"\n")
+                exported["bytes"] += len(message.get("body", b""))
+                exported["rss"] = max(exported["rss"], get_rss())
+                if not message.get("more_body", False):
+                    completed.set()
+
+        path = self.resource.format(organization_id=an_organization.id)
+        test_app.portal.call(
+            app,
+            {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": path,
+                "raw_path": path.encode(),
+                "root_path": "",
+                "query_string": b"format=ndjson",
+                "headers": [(b"authorization", f"Bearer {token}".encode())],
+                "client": ("testclient", 50000),
+                "server": ("testserver", 80),
+            },
+            receive,
+            send,
+        )
+
+        assert exported["status"] == 200
+        assert exported["lines"] == self.rows
+        assert exported["bytes"] > self.rss_ceiling
+        assert exported["rss"] - baseline < self.rss_ceiling
@@ -6,7 +6,8 @@ from ...models.job import Job
 from ...models.organization import Organization
 from ...models.user import User
 from ...utils.application import ApplicationState
-from ...utils.auth import create_jwt_token
+from ...utils.auth import create_jwt_token, get_jwt_principal, Principal, PrincipalType
+from ...utils.identifier import uuid7
 from ...utils.job import JobContract, JobMode
 
 
@@ -18,7 +19,7 @@ class TestCreateUserEndpoint:
     resource: str = "/api/v1/users"
 
     def test_when_create_user_is_successful(
-        self, test_app, user_service, valid_password
+        self, test_app, user_service, valid_password, statements
     ):
         """
         Test case for creating a user successfully.
@@ -27,6 +28,7 @@ class TestCreateUserEndpoint:
             test_app: The test client for the application.
             user_service: The user service.
             valid_password: A valid password for the user.
+            statements: The SQL statements executed by the endpoint.
 
         Returns:
             None
@@ -44,6 +46,8 @@ class TestCreateUserEndpoint:
             ),
         )
 
+        # NOTE: a single INSERT - i.e. no SELECT to read back generated values.
+        assert [statement.split()[0] for statement in statements] == ["INSERT"]
         assert user_service.session.query(User).count() == 1
 
         a_user = user_service.session.query(User).one()
@@ -59,6 +63,62 @@ class TestCreateUserEndpoint:
             "%Y-%m-%dT%H:%M:%S"
         )
 
+    def test_when_create_user_has_an_invalid_password(self, test_app, user_service):
+        """
+        Test case for creating a user with an invalid password - i.e. a validation error, not a server error.
+
+        Args:
+            test_app: The test client for the application.
+            user_service: The user service.
+
+        Returns:
+            None
+        """
+        response = test_app.post(
+            self.resource,
+            data=json.dumps(
+                {
+                    "name": "a-user",
+                    "username": "username@server.io",
+                    "password": "weak",
+                }
+            ),
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "password"]
+        assert user_service.session.query(User).count() == 0
+
+    def test_when_create_user_has_a_too_long_name(
+        self, test_app, user_service, valid_password
+    ):
+        """
+        Test case for creating a user with a name longer than its column - i.e. a validation error, rather than
+        a database one.
+
+        Args:
+            test_app: The test client for the application.
+            user_service: The user service.
+            valid_password: A valid password.
+
+        Returns:
+            None
+        """
+        response = test_app.post(
+            self.resource,
+            data=json.dumps(
+                {
+                    "name": "a" * 256,
+                    "username": "username@server.io",
+                    "password": valid_password,
+                }
+            ),
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "name"]
+        assert user_service.session.query(User).count() == 0
+
 
 class TestAuthenticateUserEndpoint:
     """
@@ -84,7 +144,7 @@ class TestAuthenticateUserEndpoint:
         user_service.session.add(
             User(name="a-user", username="username@server.io", password=valid_password)
         )
-        user_service.session.flush()
+        user_service.session.commit()
 
         response = test_app.post(
             self.resource,
@@ -92,10 +152,185 @@ class TestAuthenticateUserEndpoint:
         )
 
         assert response.status_code == 200
-        assert response.json()["access_token"] == create_jwt_token("username@server.io")
+        a_user = user_service.session.query(User).one()
+
+        assert get_jwt_principal(
+            response.json()["access_token"], PrincipalType.USER
+        ) == Principal(
+            id=a_user.id,
+            subject="username@server.io",
+            type=PrincipalType.USER,
+        )
         assert response.json()["token_type"] == "bearer"
 
 
+class TestGetUserEndpoint:
+    """
+    Test class for the get user endpoint.
+    """
+
+    resource: str = "/api/v1/users/{user_id}"
+
+    def test_when_get_user_is_successful(self, test_app, user_service, valid_password):
+        """
+        Test case for a user retrieving themselves - privately cached.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            user_service (UserService): The user service.
+            valid_password (str): A valid password for the user.
+
+        Returns:
+            None
+        """
+        user_service.session.add(
+            User(name="a-user", username="username@server.io", password=valid_password)
+        )
+        user_service.session.commit()
+        a_user = user_service.session.query(User).one()
+        token = create_jwt_token("username@server.io", a_user.id, PrincipalType.USER)
+
+        response = test_app.get(
+            self.resource.format(user_id=a_user.id),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["username"] == "username@server.io"
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+        response = test_app.get(
+            self.resource.format(user_id=a_user.id),
+            headers={
+                "Authorization": f"Bearer {token}",
+                "If-None-Match": response.headers["ETag"],
+            },
+        )
+
+        assert response.status_code == 304
+
+    def test_when_get_user_is_forbidden(self, test_app, user_service, valid_password):
+        """
+        Test case for a user retrieving another user.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            user_service (UserService): The user service.
+            valid_password (str): A valid password for the user.
+
+        Returns:
+            None
+        """
+        user_service.session.add(
+            User(name="a-user", username="username@server.io", password=valid_password)
+        )
+        user_service.session.commit()
+        a_user = user_service.session.query(User).one()
+        token = create_jwt_token("username@server.io", uuid7(), PrincipalType.USER)
+
+        response = test_app.get(
+            self.resource.format(user_id=a_user.id),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 403
+
+
+class TestGetUsersByIdsEndpoint:
+    """
+    Test class for the batch get users endpoint.
+    """
+
+    resource: str = "/api/v1/users:batchGet"
+
+    def test_when_get_users_by_ids_is_scoped_to_applicants(
+        self, test_app, application_service, valid_password
+    ):
+        """
+        Test case for an organization retrieving users in a batch - only its applicants are visible.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            application_service (ApplicationService): The application service.
+            valid_password (str): A valid password for the organization and users.
+
+        Returns:
+            None
+        """
+        application_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        an_organization = application_service.session.query(Organization).one()
+        application_service.session.add(
+            Job(
+                title="a-job",
+                salary=float(100000),
+                mode=JobMode.ON_SITE,
+                contract=JobContract.FULL_TIME,
+                organization=an_organization,
+            )
+        )
+        for username in ("applicant@server.io", "another@server.io"):
+            application_service.session.add(
+                User(name="a-user", username=username, password=valid_password)
+            )
+        application_service.session.commit()
+        a_job = application_service.session.query(Job).one()
+        an_applicant = (
+            application_service.session.query(User)
+            .filter_by(username="applicant@server.io")
+            .one()
+        )
+        another_user = (
+            application_service.session.query(User)
+            .filter_by(username="another@server.io")
+            .one()
+        )
+        application_service.create(job_id=a_job.id, user_id=an_applicant.id)
+        token = create_jwt_token(
+            "an-organization", an_organization.id, PrincipalType.ORGANIZATION
+        )
+
+        response = test_app.post(
+            self.resource,
+            json={"ids": [str(another_user.id), str(an_applicant.id)]},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"][0] == {
+            "user": None,
+            "error": f"User {another_user.id} not found.",
+        }
+        assert response.json()["results"][1]["user"]["username"] == (
+            "applicant@server.io"
+        )
+
+    def test_when_get_users_by_ids_is_not_authorized_for_user_token(
+        self, test_app, user_service, valid_password
+    ):
+        """
+        Test case for a user retrieving users in a batch.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            user_service (UserService): The user service.
+            valid_password (str): A valid password for the user.
+
+        Returns:
+            None
+        """
+        token = create_jwt_token("username@server.io", uuid7(), PrincipalType.USER)
+
+        response = test_app.post(
+            self.resource,
+            json={"ids": [str(uuid7())]},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 401
+
+
 class TestCreateApplicationEndpoint:
     """
     Test class for the create job endpoint.
@@ -126,7 +361,7 @@ class TestCreateApplicationEndpoint:
         ).json()["access_token"]
 
     def test_when_create_job_is_successful(
-        self, test_app, application_service, valid_password
+        self, test_app, application_service, valid_password, statements
     ):
         """
         Test case for creating an application successfully.
@@ -135,6 +370,7 @@ class TestCreateApplicationEndpoint:
             test_app (TestClient): The test client for the application.
             job_service (JobService): The job service.
             valid_password (str): A valid password for the organization.
+            statements (list[str]): The SQL statements executed by the endpoint.
 
         Returns:
             None
@@ -155,18 +391,21 @@ class TestCreateApplicationEndpoint:
         application_service.session.add(
             User(name="a-user", username="username@server.io", password=valid_password)
         )
-        application_service.session.flush()
+        application_service.session.commit()
         a_job = application_service.session.query(Job).one()
         a_user = application_service.session.query(User).one()
+        token = self._authenticate(test_app, "username@server.io", valid_password)
 
+        statements.clear()
         response = test_app.post(
             self.resource.format(user_id=a_user.id),
             data=json.dumps({"job_id": str(a_job.id)}),
-            headers={
-                "Authorization": f"Bearer {self._authenticate(test_app, "username@server.io", valid_password)}"
-            },
+            headers={"Authorization": f"Bearer {token}"},
         )
 
+        # NOTE: a single INSERT - i.e. no job/user lookups, nor SELECT to read back generated values.
+        assert [statement.split()[0] for statement in statements] == ["INSERT"]
+
         assert application_service.session.query(Application).count() == 1
 
         an_application = application_service.session.query(Application).one()
@@ -182,3 +421,86 @@ class TestCreateApplicationEndpoint:
         assert response.json()["updated"] == an_application.updated.strftime(
             "%Y-%m-%dT%H:%M:%S"
         )
+
+
+class TestGetApplicationsByUserEndpoint:
+    """
+    Test class for the get applications by user endpoint.
+    """
+
+    resource: str = "/api/v1/users/{user_id}/applications"
+
+    def test_when_get_applications_by_user_is_successful(
+        self, test_app, application_service, valid_password, statements
+    ):
+        """
+        Test case for a user retrieving their applications - with their jobs, without a query per application.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+            application_service (ApplicationService): The application service.
+            valid_password (str): A valid password for the organization and user.
+            statements (list[str]): The SQL statements executed by the endpoint.
+
+        Returns:
+            None
+        """
+        an_organization = Organization(name="an-organization", password=valid_password)
+        a_user = User(
+            name="a-user", username="username@server.io", password=valid_password
+        )
+        jobs = [
+            Job(
+                title=title,
+                salary=float(100000),
+                mode=JobMode.ON_SITE,
+                contract=JobContract.FULL_TIME,
+                organization=an_organization,
+            )
+            for title in ("a-job", "another-job", "yet-another-job")
+        ]
+        application_service.session.add_all([an_organization, a_user, *jobs])
+        application_service.session.commit()
+        for job in jobs:
+            application_service.create(job_id=job.id, user_id=a_user.id)
+        token = create_jwt_token("username@server.io", a_user.id, PrincipalType.USER)
+
+        statements.clear()
+        response = test_app.get(
+            self.resource.format(user_id=a_user.id),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        # NOTE: the applications, then their jobs (in a single IN query).
+        assert [statement.split()[0] for statement in statements] == [
+            "SELECT",
+            "SELECT",
+        ]
+
+        assert response.status_code == 200
+        assert [
+            application["job"]["title"]
+            for application in response.json()["applications"]
+        ] == ["a-job", "another-job", "yet-another-job"]
+        assert {
+            application["user_id"] for application in response.json()["applications"]
+        } == {str(a_user.id)}
+
+    def test_when_get_applications_by_user_is_forbidden(self, test_app):
+        """
+        Test case for a user retrieving another user's applications.
+
+        Args:
+            test_app (TestClient): The test client for the application.
+
+        Returns:
+            None
+        """
+        token = create_jwt_token("username@server.io", uuid7(), PrincipalType.USER)
+
+        response = test_app.get(
+            self.resource.format(user_id=uuid7()),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 403
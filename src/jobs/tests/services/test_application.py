@@ -1,9 +1,12 @@
+import uuid
+
 import pytest
 
 from ...models.application import Application
 from ...models.job import Job
 from ...models.organization import Organization
 from ...models.user import User
+from ...services.exceptions import NotFoundError
 from ...utils.application import ApplicationState
 from ...utils.job import JobContract, JobMode
 
@@ -42,3 +45,41 @@ class TestApplicationService:
         assert an_application.state == ApplicationState.DRAFT
         assert an_application.job_id == a_job.id
         assert an_application.user_id == a_user.id
+
+    def test_when_create_job_is_not_found(self, application_service, valid_password):
+        application_service.session.add(
+            User(name="a-user", username="username@server.io", password=valid_password)
+        )
+        application_service.session.flush()
+        a_user = application_service.session.query(User).one()
+        job_id = uuid.uuid4()
+
+        with pytest.raises(NotFoundError) as exc_info:
+            application_service.create(job_id=job_id, user_id=a_user.id)
+
+        assert exc_info.value.message == f"Job {job_id} not found."
+        assert application_service.session.query(Application).count() == 0
+
+    def test_when_create_user_is_not_found(self, application_service, valid_password):
+        application_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        an_organization = application_service.session.query(Organization).one()
+        application_service.session.add(
+            Job(
+                title="a-job",
+                salary=float(100000),
+                mode=JobMode.ON_SITE,
+                contract=JobContract.FULL_TIME,
+                organization=an_organization,
+            )
+        )
+        application_service.session.flush()
+        a_job = application_service.session.query(Job).one()
+        user_id = uuid.uuid4()
+
+        with pytest.raises(NotFoundError) as exc_info:
+            application_service.create(job_id=a_job.id, user_id=user_id)
+
+        assert exc_info.value.message == f"User {user_id} not found."
+        assert application_service.session.query(Application).count() == 0
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from passlib.hash import pbkdf2_sha256
+
+from ...services.exceptions import UnavailableError
+from ...services.hashing import PasswordHashingService
+
+
+@pytest.fixture(scope="function")
+def hashing_service():
+    service = PasswordHashingService(max_workers=1, max_queue_size=1)
+    yield service
+    service.shutdown()
+
+
+class TestPasswordHashingService:
+
+    def test_when_hash_and_verify_are_successful(self, hashing_service, valid_password):
+        async def hash_and_verify():
+            hashed = await hashing_service.hash(valid_password)
+            return (
+                hashed,
+                await hashing_service.verify(valid_password, hashed),
+                await hashing_service.verify(f"{valid_password}!", hashed),
+            )
+
+        hashed, verified, not_verified = asyncio.run(hash_and_verify())
+
+        assert pbkdf2_sha256.verify(valid_password, hashed) is True
+        assert verified == (True, None)
+        assert not_verified == (False, None)
+
+        stats = hashing_service.stats()
+        assert stats.completed == 3
+        assert stats.rejected == 0
+        assert stats.in_flight == 0
+        assert stats.queue_depth == 0
+        assert stats.max_hash_latency > 0
+
+    def test_when_verify_rehashes_outdated_hash(self, hashing_service, valid_password):
+        outdated = pbkdf2_sha256.using(rounds=500).hash(valid_password)
+
+        verified, rehashed = asyncio.run(
+            hashing_service.verify(valid_password, outdated)
+        )
+
+        assert verified is True
+        assert rehashed is not None
+        assert pbkdf2_sha256.from_string(rehashed).rounds > 500
+        assert pbkdf2_sha256.verify(valid_password, rehashed) is True
+
+    def test_when_queue_is_full(self, hashing_service, valid_password):
+        async def hash_many():
+            return await asyncio.gather(
+                *(hashing_service.hash(valid_password) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(hash_many())
+
+        assert [isinstance(result, UnavailableError) for result in results] == [
+            False,
+            False,
+            True,
+        ]
+        assert hashing_service.stats().rejected == 1
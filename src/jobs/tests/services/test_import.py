@@ -0,0 +1,61 @@
+import asyncio
+import json
+
+from ...cli import import_file
+from ...models.job import Job
+from ...models.organization import Organization
+
+
+class TestImportFile:
+
+    def test_when_a_row_is_too_long(self, job_service, valid_password, tmp_path):
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.commit()
+        an_organization = job_service.session.query(Organization).one()
+
+        path, rejects_path = tmp_path / "jobs.ndjson", tmp_path / "jobs.rejects"
+        rows = [
+            {
+                "title": "a-job",
+                "salary": 100000,
+                "mode": "REMOTE",
+                "contract": "FULL_TIME",
+            },
+            {
+                "title": "a" * 256,
+                "salary": 100000,
+                "mode": "REMOTE",
+                "contract": "FULL_TIME",
+            },
+            {
+                "title": "another-job",
+                "salary": 100000,
+                "mode": "REMOTE",
+                "contract": "FULL_TIME",
+            },
+        ]
+        path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+        checkpoint = asyncio.run(
+            import_file(
+                entity="jobs",
+                path=str(path),
+                format="ndjson",
+                chunk_size=10,
+                checkpoint_path=str(tmp_path / "jobs.checkpoint"),
+                rejects_path=str(rejects_path),
+                organization_id=an_organization.id,
+                hashing_workers=1,
+            )
+        )
+
+        assert (checkpoint.rows, checkpoint.imported, checkpoint.rejected) == (3, 2, 1)
+        assert [
+            json.loads(line)["row"] for line in rejects_path.read_text().splitlines()
+        ] == [2]
+        assert sorted(title for (title,) in job_service.session.query(Job.title)) == [
+            "a-job",
+            "another-job",
+        ]
@@ -1,8 +1,16 @@
+import uuid
+from datetime import timedelta
+
 import pytest
+from sqlalchemy import event
 
 from ...models.job import Job
 from ...models.organization import Organization
+from ...services.exceptions import ClientError, NotFoundError
+from ...services.job import JobService
+from ...utils.catalog import JobCatalog
 from ...utils.job import JobContract, JobMode, JobState
+from ...utils.search import JobSearchIndex
 
 
 class TestJobService:
@@ -32,3 +40,423 @@ class TestJobService:
         assert a_job.mode == JobMode.ON_SITE
         assert a_job.contract == JobContract.FULL_TIME
         assert a_job.organization_id == an_organization.id
+
+    def test_when_create_organization_is_not_found(self, job_service):
+        organization_id = uuid.uuid4()
+
+        with pytest.raises(NotFoundError) as exc_info:
+            job_service.create(
+                organization_id=organization_id,
+                title="a-job",
+                salary=float(100000),
+                mode=JobMode.ON_SITE,
+                contract=JobContract.FULL_TIME,
+            )
+
+        assert exc_info.value.message == f"Organization {organization_id} not found."
+        assert job_service.session.query(Job).count() == 0
+
+
+class TestCreateManyJobService:
+
+    def test_when_create_many_is_successful(self, job_service, valid_password):
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.flush()
+        an_organization = job_service.session.query(Organization).one()
+
+        results = job_service.create_many(
+            organization_id=an_organization.id,
+            jobs=[
+                {
+                    "title": f"a-job-{index}",
+                    "salary": float(100000),
+                    "mode": JobMode.ON_SITE,
+                    "contract": JobContract.FULL_TIME,
+                }
+                for index in range(3)
+            ],
+        )
+
+        assert [result.title for result in results] == [
+            "a-job-0",
+            "a-job-1",
+            "a-job-2",
+        ]
+        assert job_service.session.query(Job).count() == 3
+        assert {a_job.organization_id for a_job in job_service.session.query(Job)} == {
+            an_organization.id
+        }
+
+    def test_when_create_many_has_invalid_salary(self, job_service, valid_password):
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.flush()
+        an_organization = job_service.session.query(Organization).one()
+
+        results = job_service.create_many(
+            organization_id=an_organization.id,
+            jobs=[
+                {
+                    "title": "a-job",
+                    "salary": salary,
+                    "mode": JobMode.ON_SITE,
+                    "contract": JobContract.FULL_TIME,
+                }
+                for salary in (float(100000), float(0))
+            ],
+        )
+
+        assert isinstance(results[0], Job)
+        assert isinstance(results[1], ClientError)
+        assert job_service.session.query(Job).count() == 1
+
+    def test_when_create_many_organization_is_not_found(self, job_service):
+        with pytest.raises(NotFoundError):
+            job_service.create_many(
+                organization_id=uuid.uuid4(),
+                jobs=[
+                    {
+                        "title": "a-job",
+                        "salary": float(100000),
+                        "mode": JobMode.ON_SITE,
+                        "contract": JobContract.FULL_TIME,
+                    }
+                ],
+            )
+
+        assert job_service.session.query(Job).count() == 0
+
+
+class TestGetByOrganizationJobService:
+
+    def test_when_get_by_organization_is_paginated(self, job_service, valid_password):
+        job_service.session.add_all(
+            [
+                Organization(name="an-organization", password=valid_password),
+                Organization(name="another-organization", password=valid_password),
+            ]
+        )
+        job_service.session.flush()
+        an_organization, another_organization = (
+            job_service.session.query(Organization).order_by(Organization.name).all()
+        )
+        for organization in (an_organization, another_organization):
+            job_service.create_many(
+                organization_id=organization.id,
+                jobs=[
+                    {
+                        "title": f"a-job-{index}",
+                        "salary": float(100000),
+                        "mode": JobMode.ON_SITE,
+                        "contract": JobContract.FULL_TIME,
+                    }
+                    for index in range(5)
+                ],
+            )
+
+        pages = []
+        cursor = None
+        while True:
+            jobs, cursor = job_service.get_by_organization(
+                organization_id=an_organization.id, limit=2, cursor=cursor
+            )
+            pages.append(jobs)
+            if cursor is None:
+                break
+
+        assert [len(jobs) for jobs in pages] == [2, 2, 1]
+        jobs = [a_job for jobs in pages for a_job in jobs]
+        assert {a_job.organization_id for a_job in jobs} == {an_organization.id}
+        assert jobs == sorted(jobs, key=lambda a_job: (a_job.created, a_job.id))
+        assert len({a_job.id for a_job in jobs}) == 5
+
+    def test_when_get_by_organization_has_no_jobs(self, job_service):
+        jobs, cursor = job_service.get_by_organization(
+            organization_id=uuid.uuid4(), limit=2
+        )
+
+        assert jobs == []
+        assert cursor is None
+
+
+class TestGetManyJobService:
+
+    def test_when_get_many_is_successful(
+        self, job_service, database_engine, valid_password
+    ):
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.commit()
+        an_organization = job_service.session.query(Organization).one()
+        jobs = job_service.create_many(
+            organization_id=an_organization.id,
+            jobs=[
+                {
+                    "title": title,
+                    "salary": float(100000),
+                    "mode": JobMode.ON_SITE,
+                    "contract": JobContract.FULL_TIME,
+                }
+                for title in ("a-job", "another-job", "yet-another-job")
+            ],
+        )
+        job_service.get(jobs[0].id)
+        job_service.session.expunge_all()
+        missing_id = uuid.uuid4()
+
+        statements = []
+
+        def record(connection, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(database_engine, "before_cursor_execute", record)
+        try:
+            results = job_service.get_many(
+                [jobs[2].id, missing_id, jobs[0].id, jobs[1].id, jobs[2].id]
+            )
+        finally:
+            event.remove(database_engine, "before_cursor_execute", record)
+
+        # NOTE: a single IN query - for the jobs not cached (i.e. not the first one).
+        assert len(statements) == 1
+        assert " IN " in statements[0]
+
+        assert [getattr(result, "title", None) for result in results] == [
+            "yet-another-job",
+            None,
+            "a-job",
+            "another-job",
+            "yet-another-job",
+        ]
+        assert isinstance(results[1], NotFoundError)
+        assert results[1].message == f"Job {missing_id} not found."
+
+        # NOTE: the queried jobs are cached too.
+        assert job_service.entity_cache.get(Job, "id", jobs[1].id) is not None
+
+
+class TestSearchJobService:
+
+    @pytest.fixture
+    def jobs(self, job_service, valid_password):
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.flush()
+        an_organization = job_service.session.query(Organization).one()
+        # NOTE: committed by create_many - i.e. InnoDB only indexes committed rows for FULLTEXT searches.
+        return job_service.create_many(
+            organization_id=an_organization.id,
+            jobs=[
+                {
+                    "title": "python developer",
+                    "description": "python python python",
+                    "salary": float(100000),
+                    "mode": JobMode.REMOTE,
+                    "contract": JobContract.FULL_TIME,
+                },
+                {
+                    "title": "backend developer",
+                    "description": "some python",
+                    "salary": float(50000),
+                    "mode": JobMode.ON_SITE,
+                    "contract": JobContract.FULL_TIME,
+                },
+                {
+                    "title": "accountant",
+                    "description": "spreadsheets",
+                    "salary": float(50000),
+                    "mode": JobMode.ON_SITE,
+                    "contract": JobContract.FULL_TIME,
+                },
+            ],
+        )
+
+    def test_when_search_is_ranked_by_relevance(self, job_service, jobs):
+        found = job_service.search(q="python", limit=10)
+
+        assert [a_job.title for a_job in found] == [
+            "python developer",
+            "backend developer",
+        ]
+
+    def test_when_search_is_filtered(self, job_service, jobs):
+        assert [
+            a_job.title
+            for a_job in job_service.search(q="python", limit=10, mode=JobMode.ON_SITE)
+        ] == ["backend developer"]
+        assert [
+            a_job.title
+            for a_job in job_service.search(q="python", limit=10, min_salary=75000)
+        ] == ["python developer"]
+        assert job_service.search(q="python", limit=10, state=JobState.OPEN) == []
+
+    def test_when_search_is_limited(self, job_service, jobs):
+        assert len(job_service.search(q="developer", limit=1)) == 1
+
+    def test_when_search_has_no_matches(self, job_service, jobs):
+        assert job_service.search(q="gardener", limit=10) == []
+
+
+class TestSearchIndexJobService:
+
+    @pytest.fixture
+    def job_service(self, database_session):
+        service = JobService(session=database_session, search_index=JobSearchIndex())
+        yield service
+        service.session.rollback()
+
+    def test_when_search_index_is_updated_on_create(self, job_service, valid_password):
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.flush()
+        an_organization = job_service.session.query(Organization).one()
+
+        job_service.create(
+            organization_id=an_organization.id,
+            title="python developer",
+            salary=float(100000),
+            mode=JobMode.REMOTE,
+            contract=JobContract.FULL_TIME,
+        )
+        job_service.create_many(
+            organization_id=an_organization.id,
+            jobs=[
+                {
+                    "title": "backend developer",
+                    "description": "some python",
+                    "salary": float(50000),
+                    "mode": JobMode.ON_SITE,
+                    "contract": JobContract.FULL_TIME,
+                },
+                {
+                    "title": "accountant",
+                    "salary": float(50000),
+                    "mode": JobMode.ON_SITE,
+                    "contract": JobContract.FULL_TIME,
+                },
+            ],
+        )
+
+        assert len(job_service.search_index) == 3
+        assert [a_job.title for a_job in job_service.search(q="python", limit=10)] == [
+            "python developer",
+            "backend developer",
+        ]
+        assert [
+            a_job.title
+            for a_job in job_service.search(q="python", limit=10, mode=JobMode.ON_SITE)
+        ] == ["backend developer"]
+        assert job_service.search(q="gardener", limit=10) == []
+
+    def test_when_search_index_is_refreshed(self, job_service, valid_password):
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.flush()
+        an_organization = job_service.session.query(Organization).one()
+        # NOTE: committed without the index - e.g. by another worker.
+        JobService(session=job_service.session, search_index=None).create_many(
+            organization_id=an_organization.id,
+            jobs=[
+                {
+                    "title": f"python developer {index}",
+                    "salary": float(100000),
+                    "mode": JobMode.REMOTE,
+                    "contract": JobContract.FULL_TIME,
+                }
+                for index in range(3)
+            ],
+        )
+
+        assert job_service.refresh_search_index(batch_size=2) == 3
+        assert len(job_service.search(q="python", limit=10)) == 3
+        # NOTE: jobs updated at the watermark are indexed again - i.e. not duplicated.
+        assert job_service.refresh_search_index() == 3
+        assert len(job_service.search_index) == 3
+
+        # NOTE: committed after the refresh, but updated (i.e. before committing) earlier than its watermark.
+        job_service.session.add(
+            Job(
+                organization_id=an_organization.id,
+                title="python developer late",
+                salary=float(100000),
+                mode=JobMode.REMOTE,
+                contract=JobContract.FULL_TIME,
+                updated=job_service.search_index.watermark - timedelta(seconds=2),
+            )
+        )
+        job_service.session.commit()
+
+        assert job_service.refresh_search_index() == 4
+        assert len(job_service.search(q="python", limit=10)) == 4
+
+
+class TestBrowseJobService:
+
+    @pytest.fixture(params=[False, True], ids=["sql", "catalog"])
+    def job_service(self, request, database_session):
+        service = JobService(
+            session=database_session,
+            catalog=JobCatalog() if request.param else None,
+        )
+        yield service
+        service.session.rollback()
+
+    @pytest.fixture
+    def jobs(self, job_service, valid_password):
+        job_service.session.add(
+            Organization(name="an-organization", password=valid_password)
+        )
+        job_service.session.flush()
+        an_organization = job_service.session.query(Organization).one()
+        return job_service.create_many(
+            organization_id=an_organization.id,
+            jobs=[
+                {
+                    "title": f"a-job-{index}",
+                    "salary": float(50000 + index * 10000),
+                    "mode": JobMode.REMOTE if index % 2 else JobMode.ON_SITE,
+                    "contract": JobContract.FULL_TIME,
+                }
+                for index in range(5)
+            ],
+        )
+
+    def test_when_browse_is_sorted_by_salary(self, job_service, jobs):
+        assert [
+            a_job.title for a_job in job_service.browse(limit=2, order_by="salary")
+        ] == ["a-job-4", "a-job-3"]
+
+    def test_when_browse_is_filtered(self, job_service, jobs):
+        assert [
+            a_job.title
+            for a_job in job_service.browse(
+                limit=10,
+                organization_id=jobs[0].organization_id,
+                mode=JobMode.REMOTE,
+                min_salary=65000,
+                order_by="salary",
+            )
+        ] == ["a-job-3"]
+        assert job_service.browse(limit=10, organization_id=uuid.uuid4()) == []
+        assert job_service.browse(limit=10, state=JobState.OPEN) == []
+
+    def test_when_catalog_is_refreshed(self, job_service, jobs):
+        catalog = JobCatalog()
+
+        assert (
+            JobService(session=job_service.session, catalog=catalog).refresh_catalog(
+                batch_size=2
+            )
+            == 5
+        )
+        assert len(catalog) == 5
+        assert (
+            JobService(session=job_service.session, catalog=None).refresh_catalog() == 0
+        )
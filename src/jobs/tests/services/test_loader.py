@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+
+from ...models.application import Application
+from ...models.async_database import async_engine, async_session_scope
+from ...models.job import Job
+from ...models.organization import Organization
+from ...models.user import User
+from ...services.loader import RelationshipLoader
+from ...utils.job import JobContract, JobMode
+
+
+@pytest.fixture
+def applications(application_service, valid_password):
+    """
+    Creates (and commits) two jobs of an organization and three applications of a user for them.
+    """
+    an_organization = Organization(name="an-organization", password=valid_password)
+    a_user = User(name="a-user", username="username@server.io", password=valid_password)
+    jobs = [
+        Job(
+            title=title,
+            salary=float(100000),
+            mode=JobMode.ON_SITE,
+            contract=JobContract.FULL_TIME,
+            organization=an_organization,
+        )
+        for title in ("a-job", "another-job")
+    ]
+    application_service.session.add_all([an_organization, a_user, *jobs])
+    application_service.session.commit()
+    for job in (jobs[0], jobs[1], jobs[0]):
+        application_service.create(job_id=job.id, user_id=a_user.id)
+
+    return application_service.session.query(Application).all()
+
+
+class TestRelationshipLoader:
+
+    def test_when_relationships_are_loaded_in_batches(self, applications):
+        statements = []
+
+        def record(connection, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        async def load():
+            async with async_session_scope() as session:
+                loader = RelationshipLoader(async_session=session)
+                a_user_applications = await loader.applications_by_user.load(
+                    applications[0].user_id
+                )
+                await loader.load(a_user_applications, Application.job)
+                jobs = list({application.job for application in a_user_applications})
+                await loader.load(jobs, Job.organization)
+                await loader.load(jobs, Job.applications)
+                result = (
+                    sorted(
+                        application.job.title for application in a_user_applications
+                    ),
+                    {job.organization.name for job in jobs},
+                    sorted(len(job.applications) for job in jobs),
+                )
+            await async_engine.dispose()
+            return result
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            titles, organizations, applications_per_job = asyncio.run(load())
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+        # NOTE: a query per relationship - not per application (nor job).
+        assert len(statements) == 4
+        assert titles == ["a-job", "a-job", "another-job"]
+        assert organizations == {"an-organization"}
+        assert applications_per_job == [1, 2]
+
+    def test_when_relationship_is_lazy_loaded(self, application_service, applications):
+        application_service.session.expunge_all()
+        an_application = application_service.session.get(
+            Application, applications[0].id
+        )
+
+        # NOTE: an N+1 regression fails instead of issuing a query per row.
+        with pytest.raises(InvalidRequestError, match="raise_on_sql"):
+            an_application.job
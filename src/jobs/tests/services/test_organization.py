@@ -1,6 +1,17 @@
+import asyncio
+import gc
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from passlib.hash import pbkdf2_sha256
+from sqlalchemy import event
 
+from ...models.async_database import async_engine, async_session_scope
+from ...models.database import Session
 from ...models.organization import Organization
+from ...services.exceptions import ConflictError
+from ...services.organization import OrganizationService
 
 
 class TestCreateOrganizationService:
@@ -16,6 +27,23 @@ class TestCreateOrganizationService:
         assert an_organization.name == "an-organization"
         assert an_organization.check_password(valid_password) is True
 
+    def test_when_acreate_is_successful(self, organization_service, valid_password):
+        async def acreate():
+            async with async_session_scope() as session:
+                organization = await OrganizationService(async_session=session).acreate(
+                    name="an-organization", password=valid_password
+                )
+            # NOTE: pooled connections are bound to the event loop they were created on.
+            await async_engine.dispose()
+            return organization
+
+        organization = asyncio.run(acreate())
+
+        an_organization = organization_service.session.query(Organization).one()
+        assert an_organization.id == organization.id
+        assert an_organization.name == "an-organization"
+        assert an_organization.created == organization.created
+
 
 class TestGetOrganizationService:
 
@@ -37,6 +65,33 @@ class TestGetOrganizationService:
         assert an_organization.name == "an-organization"
         assert an_organization.check_password(valid_password) is True
 
+    def test_when_get_is_cached(
+        self, organization_service, database_engine, valid_password
+    ):
+        organization = organization_service.create(
+            name="an-organization", password=valid_password
+        )
+        organization_service.get(name="an-organization")
+        organization_service.session.expunge_all()
+
+        statements = []
+
+        def record(connection, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(database_engine, "before_cursor_execute", record)
+        try:
+            by_name = organization_service.get(name="an-organization")
+            by_id = organization_service.get(id=organization.id)
+        finally:
+            event.remove(database_engine, "before_cursor_execute", record)
+
+        # NOTE: both served from the cache (by natural key and ID) - i.e. no query.
+        assert statements == []
+        assert by_name is by_id
+        assert by_name.id == organization.id
+        assert by_name.check_password(valid_password) is True
+
 
 class TestAuthenticateOrganizationService:
 
@@ -51,3 +106,108 @@ class TestAuthenticateOrganizationService:
 
         assert an_organization.name == "an-organization"
         assert an_organization.check_password(valid_password) is True
+
+    def test_when_authenticate_rehashes_outdated_password(
+        self, organization_service, valid_password
+    ):
+        organization_service.session.add(
+            Organization(
+                name="an-organization",
+                password_hash=pbkdf2_sha256.using(rounds=500).hash(valid_password),
+            )
+        )
+        organization_service.session.commit()
+
+        an_organization = organization_service.authenticate(
+            name="an-organization", password=valid_password
+        )
+
+        assert pbkdf2_sha256.from_string(an_organization.password_hash).rounds > 500
+        assert an_organization.check_password(valid_password) is True
+
+    def test_when_authenticate_rehash_invalidates_cache(
+        self, organization_service, valid_password
+    ):
+        organization_service.session.add(
+            Organization(
+                name="an-organization",
+                password_hash=pbkdf2_sha256.using(rounds=500).hash(valid_password),
+            )
+        )
+        organization_service.session.commit()
+        organization_service.get(name="an-organization")
+
+        organization_service.authenticate(
+            name="an-organization", password=valid_password
+        )
+        organization_service.session.expunge_all()
+
+        an_organization = organization_service.get(name="an-organization")
+
+        assert pbkdf2_sha256.from_string(an_organization.password_hash).rounds > 500
+        assert organization_service.entity_cache.stats().invalidations == 2
+
+
+class TestConcurrentOrganizationService:
+
+    calls: int = 200
+    workers: int = 10
+
+    @staticmethod
+    def _create_and_authenticate(name: str, password: str) -> bool:
+        """
+        Create and authenticate an organization within its own session - as a request would.
+
+        Every tenth call tries to create an organization that already exists, so that rollbacks
+        happen while other calls are in flight.
+        """
+        with Session() as session:
+            service = OrganizationService(session=session)
+            try:
+                created = service.create(name=name, password=password)
+            except ConflictError:
+                return False
+
+            authenticated = service.authenticate(name=name, password=password)
+
+            return created.id == authenticated.id
+
+    def _run(self, prefix: str, password: str) -> list[bool]:
+        names = [
+            f"{prefix}-{index - 1 if index % 10 == 9 else index}"
+            for index in range(self.calls)
+        ]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(
+                executor.map(
+                    self._create_and_authenticate, names, [password] * len(names)
+                )
+            )
+
+    def test_when_creating_and_authenticating_concurrently(
+        self, organization_service, valid_password
+    ):
+        results = self._run("an-organization", valid_password)
+
+        assert results.count(False) == self.calls // 10
+        assert results.count(True) == self.calls - self.calls // 10
+        assert organization_service.session.query(Organization).count() == (
+            self.calls - self.calls // 10
+        )
+
+    def test_when_memory_is_flat_across_concurrent_requests(self, valid_password):
+        self._run("warm-up", valid_password)
+
+        tracemalloc.start()
+        try:
+            gc.collect()
+            before, _ = tracemalloc.get_traced_memory()
+            self._run("an-organization", valid_password)
+            gc.collect()
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # NOTE: with a process-wide session the identity map would keep every created
+        # organization alive - i.e. memory would grow with the number of requests.
+        assert after - before < 256 * 1024
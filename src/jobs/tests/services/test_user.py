@@ -1,6 +1,8 @@
 import pytest
 
 from ...models.user import User
+from ...services.exceptions import ClientError, ConflictError
+from ...utils.password import CRYPT_CONTEXT
 
 
 class TestCreateUserService:
@@ -19,6 +21,67 @@ class TestCreateUserService:
         assert a_user.check_password(valid_password) is True
 
 
+class TestCreateManyUserService:
+
+    def test_when_create_many_is_successful(self, user_service, valid_password):
+        password_hash = CRYPT_CONTEXT.hash(valid_password)
+
+        results = user_service.create_many(
+            users=[
+                {
+                    "username": f"username-{index}@server.io",
+                    "name": f"a-user-{index}",
+                    "password_hash": password_hash,
+                }
+                for index in range(3)
+            ]
+        )
+
+        assert [result.name for result in results] == [
+            "a-user-0",
+            "a-user-1",
+            "a-user-2",
+        ]
+        assert user_service.session.query(User).count() == 3
+        assert all(
+            a_user.check_password(valid_password)
+            for a_user in user_service.session.query(User)
+        )
+
+    def test_when_create_many_has_invalid_username(self, user_service, valid_password):
+        password_hash = CRYPT_CONTEXT.hash(valid_password)
+
+        results = user_service.create_many(
+            users=[
+                {"username": username, "name": "a-user", "password_hash": password_hash}
+                for username in ("username@server.io", "not-an-email")
+            ]
+        )
+
+        assert isinstance(results[0], User)
+        assert isinstance(results[1], ClientError)
+        assert user_service.session.query(User).count() == 1
+
+    def test_when_create_many_username_is_taken(self, user_service, valid_password):
+        user_service.create(
+            name="a-user", username="username@server.io", password=valid_password
+        )
+
+        with pytest.raises(ConflictError):
+            user_service.create_many(
+                users=[
+                    {
+                        "username": username,
+                        "name": "a-user",
+                        "password_hash": CRYPT_CONTEXT.hash(valid_password),
+                    }
+                    for username in ("another@server.io", "username@server.io")
+                ]
+            )
+
+        assert user_service.session.query(User).count() == 1
+
+
 class TestGetUserService:
 
     def test_when_get_by_id_is_successful(self, user_service, valid_password):
@@ -0,0 +1,44 @@
+import time
+import uuid
+
+import pytest
+
+from ...utils.auth import (
+    TokenCache,
+    TOKEN_CACHE,
+    PrincipalType,
+    create_jwt_token,
+    decode_jwt_token,
+)
+
+
+class TestTokenCache:
+
+    def test_when_decoding_the_same_token_is_cached(self):
+        token = create_jwt_token(
+            "an-organization", uuid.uuid4(), PrincipalType.ORGANIZATION
+        )
+        TOKEN_CACHE.clear()
+
+        claims = decode_jwt_token(token)
+
+        assert decode_jwt_token(token) == claims
+        assert TOKEN_CACHE.stats().misses == 1
+        assert TOKEN_CACHE.stats().hits == 1
+
+    def test_when_cached_token_expires(self):
+        cache = TokenCache(max_size=10)
+        cache.set("a-token", {"sub": "an-organization", "exp": time.time() - 1})
+
+        assert cache.get("a-token") is None
+        assert cache.stats().size == 0
+
+    def test_when_cache_is_full(self):
+        cache = TokenCache(max_size=2)
+        for token in ("a-token", "another-token", "yet-another-token"):
+            cache.set(token, {"sub": token, "exp": time.time() + 60})
+
+        assert cache.get("a-token") is None
+        assert cache.get("another-token") is not None
+        assert cache.get("yet-another-token") is not None
+        assert cache.stats().size == 2
@@ -0,0 +1,214 @@
+import asyncio
+import json
+import pickle
+import time
+from datetime import datetime
+from uuid import UUID
+
+from ...models.organization import Organization
+from ...utils.cache import EntityCache, LocalSharedCacheBackend, ResponseCache
+
+
+CACHED_BY = ("id", "name")
+
+UPDATED = datetime(2024, 6, 17, 12, 0, 0)
+
+
+def make_organization(name: str) -> Organization:
+    return Organization(
+        id=UUID(int=len(name)), name=name, password_hash="a-password-hash"
+    )
+
+
+class TestEntityCache:
+
+    def test_when_entity_is_cached_by_id_and_natural_key(self):
+        cache = EntityCache(max_size=10)
+        organization = make_organization("an-organization")
+
+        cache.set(organization, CACHED_BY)
+
+        assert cache.get(Organization, "id", organization.id)["name"] == (
+            "an-organization"
+        )
+        assert cache.get(Organization, "name", "an-organization")["id"] == (
+            organization.id
+        )
+        assert cache.get(Organization, "name", "another-organization") is None
+        assert (cache.stats().hits, cache.stats().misses) == (2, 1)
+
+    def test_when_cached_entity_is_built(self):
+        cache = EntityCache(max_size=10)
+        organization = make_organization("an-organization")
+        cache.set(organization, CACHED_BY)
+
+        built = cache.build(
+            Organization, cache.get(Organization, "id", organization.id)
+        )
+
+        assert built is not organization
+        assert built.id == organization.id
+
+    def test_when_entity_has_credentials(self):
+        cache = EntityCache(max_size=10)
+        organization = make_organization("an-organization")
+
+        cache.set(organization, CACHED_BY)
+
+        assert "_password" not in cache.get(Organization, "id", organization.id)
+
+    def test_when_cached_entity_expires(self):
+        cache = EntityCache(max_size=10, ttl=0)
+        cache.set(make_organization("an-organization"), CACHED_BY)
+
+        assert cache.get(Organization, "name", "an-organization") is None
+        assert cache.stats().evictions == 1
+
+    def test_when_cache_is_full(self):
+        cache = EntityCache(max_size=2)
+        for name in ("an-organization", "another-organization"):
+            cache.set(make_organization(name), CACHED_BY)
+
+        assert cache.get(Organization, "name", "an-organization") is None
+        assert cache.get(Organization, "name", "another-organization") is not None
+        assert cache.stats().size == 2
+        assert cache.stats().evictions == 2
+
+    def test_when_cached_entity_is_invalidated(self):
+        cache = EntityCache(max_size=10)
+        organization = make_organization("an-organization")
+        cache.set(organization, CACHED_BY)
+
+        cache.invalidate(organization, CACHED_BY)
+
+        assert cache.get(Organization, "id", organization.id) is None
+        assert cache.get(Organization, "name", "an-organization") is None
+        assert cache.stats().invalidations == 2
+
+    def test_when_cache_is_disabled(self):
+        cache = EntityCache(max_size=0)
+        cache.set(make_organization("an-organization"), CACHED_BY)
+
+        assert cache.get(Organization, "name", "an-organization") is None
+        assert cache.stats().size == 0
+
+
+class TestSharedEntityCache:
+
+    def test_when_local_miss_is_served_from_shared_cache(self):
+        backend = LocalSharedCacheBackend()
+        organization = make_organization("an-organization")
+        asyncio.run(
+            EntityCache(max_size=10, backend=backend).aset(organization, CACHED_BY)
+        )
+
+        # NOTE: another worker - i.e. same shared cache, empty local one.
+        cache = EntityCache(max_size=10, backend=backend)
+        values = asyncio.run(cache.aget(Organization, "name", "an-organization"))
+
+        assert values["id"] == organization.id
+        assert cache.get(Organization, "name", "an-organization") == values
+        assert cache.stats().shared_hits == 1
+
+    def test_when_shared_entity_is_encoded(self):
+        backend = LocalSharedCacheBackend()
+        organization = make_organization("an-organization")
+        organization.created = organization.updated = UPDATED
+        asyncio.run(
+            EntityCache(max_size=10, backend=backend).aset(organization, CACHED_BY)
+        )
+
+        value, _ = backend.values[f"organizations:id:{organization.id}"]
+        values = json.loads(value)
+
+        assert values["id"] == str(organization.id)
+        assert values["updated"] == UPDATED.isoformat()
+        assert "_password" not in values
+        assert EntityCache.decode(Organization, value)["updated"] == UPDATED
+
+    def test_when_shared_entity_is_invalid(self):
+        backend = LocalSharedCacheBackend()
+        organization = make_organization("an-organization")
+        backend.values["organizations:name:an-organization"] = (
+            pickle.dumps({"id": organization.id}),
+            time.monotonic() + 60,
+        )
+        cache = EntityCache(max_size=10, backend=backend)
+
+        values = asyncio.run(cache.aget(Organization, "name", "an-organization"))
+
+        assert values is None
+        assert cache.stats().shared_misses == 1
+
+    def test_when_invalidated_across_workers(self):
+        backend = LocalSharedCacheBackend()
+        organization = make_organization("an-organization")
+        cache = EntityCache(max_size=10, backend=backend)
+        asyncio.run(cache.aset(organization, CACHED_BY))
+
+        asyncio.run(
+            EntityCache(max_size=10, backend=backend).ainvalidate(
+                organization, CACHED_BY
+            )
+        )
+        cache.clear()
+
+        assert asyncio.run(cache.aget(Organization, "id", organization.id)) is None
+        assert cache.stats().shared_misses == 1
+
+    def test_when_shared_entity_expires(self):
+        backend = LocalSharedCacheBackend()
+        organization = make_organization("an-organization")
+        asyncio.run(
+            EntityCache(max_size=10, backend=backend).aset(organization, CACHED_BY)
+        )
+        for key, (value, _) in backend.values.items():
+            backend.values[key] = (value, time.monotonic() - 1)
+
+        values = asyncio.run(
+            EntityCache(max_size=10, backend=backend).aget(
+                Organization, "name", "an-organization"
+            )
+        )
+
+        assert values is None
+
+
+class TestResponseCache:
+
+    def test_when_response_is_cached_by_version(self):
+        cache = ResponseCache(max_bytes=100)
+        cache.set(UUID(int=1), 1, b'{"title":"a-job"}')
+
+        assert UUID(int=1) in cache
+        assert cache.get(UUID(int=1), 1) == b'{"title":"a-job"}'
+        assert cache.get(UUID(int=1), 2) is None
+        assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+    def test_when_newer_version_is_cached(self):
+        cache = ResponseCache(max_bytes=100)
+        cache.set(UUID(int=1), 2, b"newer")
+        cache.set(UUID(int=1), 1, b"older")
+
+        assert cache.get(UUID(int=1), 1) is None
+        assert cache.stats().size == 1
+        assert cache.stats().bytes == len(b"newer")
+
+    def test_when_cache_is_full(self):
+        cache = ResponseCache(max_bytes=10)
+        for id in range(3):
+            cache.set(UUID(int=id), 1, b"12345")
+
+        assert cache.get(UUID(int=0), 1) is None
+        assert cache.get(UUID(int=2), 1) == b"12345"
+        assert (cache.stats().size, cache.stats().bytes) == (2, 10)
+        assert cache.stats().evictions == 1
+
+    def test_when_response_is_invalidated(self):
+        cache = ResponseCache(max_bytes=100)
+        cache.set(UUID(int=1), 1, b"a-job")
+
+        cache.invalidate(UUID(int=1))
+
+        assert cache.get(UUID(int=1), 1) is None
+        assert (cache.stats().bytes, cache.stats().invalidations) == (0, 1)
@@ -0,0 +1,102 @@
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from ...utils.catalog import JobCatalog, to_cents
+from ...utils.job import JobContract, JobMode, JobState
+
+
+def make_job(**kwargs) -> SimpleNamespace:
+    created = datetime(2024, 6, 17, 7, 7, 51)
+    return SimpleNamespace(
+        **{
+            "id": uuid.uuid4(),
+            "salary": float(100000),
+            "mode": JobMode.ON_SITE,
+            "contract": JobContract.FULL_TIME,
+            "state": JobState.OPEN,
+            "organization_id": uuid.uuid4(),
+            "created": created,
+            "updated": created,
+            **kwargs,
+        }
+    )
+
+
+class TestJobCatalog:
+
+    @pytest.fixture
+    def jobs(self):
+        organization_id = uuid.uuid4()
+        created = datetime(2024, 6, 17, 7, 7, 51)
+        return [
+            make_job(
+                salary=float(50000 + index * 10000),
+                mode=JobMode.REMOTE if index % 2 else JobMode.ON_SITE,
+                organization_id=organization_id if index < 3 else uuid.uuid4(),
+                created=created + timedelta(seconds=index),
+            )
+            for index in range(5)
+        ]
+
+    @pytest.fixture
+    def catalog(self, jobs):
+        catalog = JobCatalog()
+        catalog.add_many(jobs)
+        return catalog
+
+    @pytest.mark.parametrize(
+        "salary, rounding, cents",
+        [
+            (100.1, round, 10010),
+            (Decimal("100.10"), round, 10010),
+            (100.005, int, 10000),
+        ],
+    )
+    def test_when_salary_is_converted_to_cents(self, salary, rounding, cents):
+        assert to_cents(salary, rounding) == cents
+
+    def test_when_query_is_sorted_by_created(self, catalog, jobs):
+        assert catalog.query(limit=10) == [a_job.id for a_job in reversed(jobs)]
+        assert catalog.query(limit=2) == [jobs[4].id, jobs[3].id]
+
+    def test_when_query_is_sorted_by_salary(self, catalog, jobs):
+        jobs[0].salary = float(1000000)
+        catalog.add(jobs[0])
+
+        assert len(catalog) == 5
+        assert catalog.query(limit=2, order_by="salary") == [jobs[0].id, jobs[4].id]
+
+    def test_when_query_is_filtered(self, catalog, jobs):
+        assert catalog.query(limit=10, mode=JobMode.REMOTE) == [jobs[3].id, jobs[1].id]
+        assert catalog.query(
+            limit=10, organization_id=jobs[0].organization_id, min_salary=60000
+        ) == [jobs[2].id, jobs[1].id]
+        assert catalog.query(limit=10, min_salary=59999.99, max_salary=70000) == [
+            jobs[2].id,
+            jobs[1].id,
+        ]
+        assert catalog.query(limit=10, state=JobState.CLOSED) == []
+        assert catalog.query(limit=10, organization_id=uuid.uuid4()) == []
+
+    def test_when_job_is_removed(self, catalog, jobs):
+        catalog.remove(jobs[4].id)
+        catalog.remove(uuid.uuid4())
+
+        assert len(catalog) == 4
+        assert jobs[4].id not in catalog
+        assert catalog.query(limit=1) == [jobs[3].id]
+
+    def test_when_catalog_grows(self):
+        catalog = JobCatalog()
+        jobs = [make_job(salary=float(index + 1)) for index in range(3000)]
+
+        for start in range(0, len(jobs), 1000):
+            catalog.add_many(jobs[start : start + 1000])
+
+        assert len(catalog) == 3000
+        assert catalog.query(limit=1, order_by="salary") == [jobs[-1].id]
+        assert catalog.watermark == datetime(2024, 6, 17, 7, 7, 51)
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+from ...utils.conditional import (
+    get_cache_headers,
+    get_etag,
+    get_last_modified,
+    get_public_cache_control,
+    is_not_modified,
+)
+
+
+UPDATED = datetime(2024, 6, 17, 12, 0, 0)
+
+
+class TestConditional:
+
+    def test_when_cache_headers_are_built(self):
+        headers = get_cache_headers(UPDATED, 2, get_public_cache_control(60))
+
+        assert headers == {
+            "ETag": 'W/"1718625600-2"',
+            "Last-Modified": "Mon, 17 Jun 2024 12:00:00 GMT",
+            "Cache-Control": "public, max-age=60",
+        }
+        assert get_public_cache_control(0) == "public, no-cache"
+
+    def test_when_updated_within_the_last_second(self):
+        headers = get_cache_headers(
+            UPDATED, 1, "public, no-cache", now=UPDATED + timedelta(milliseconds=999)
+        )
+
+        assert "Last-Modified" not in headers
+        assert headers["ETag"] == 'W/"1718625600-1"'
+
+    def test_when_written_within_the_same_second(self):
+        assert get_etag(UPDATED, 1) != get_etag(UPDATED, 2)
+        assert not is_not_modified(
+            get_etag(UPDATED, 2), UPDATED, if_none_match=get_etag(UPDATED, 1)
+        )
+
+    def test_when_entity_tag_matches(self):
+        etag = get_etag(UPDATED, 1)
+
+        assert is_not_modified(etag, UPDATED, if_none_match=etag)
+        assert is_not_modified(etag, UPDATED, if_none_match='"1718625600-1"')
+        assert is_not_modified(etag, UPDATED, if_none_match=f'W/"1", {etag}')
+        assert is_not_modified(etag, UPDATED, if_none_match="*")
+        assert not is_not_modified(etag, UPDATED, if_none_match='W/"1"')
+
+    def test_when_modified_since(self):
+        etag = get_etag(UPDATED, 1)
+
+        assert is_not_modified(
+            etag, UPDATED, if_modified_since=get_last_modified(UPDATED)
+        )
+        assert not is_not_modified(
+            etag, UPDATED, if_modified_since="Mon, 17 Jun 2024 11:59:59 GMT"
+        )
+        assert not is_not_modified(etag, UPDATED, if_modified_since="yesterday")
+        assert not is_not_modified(etag, UPDATED)
+
+    def test_when_entity_tag_takes_precedence(self):
+        etag = get_etag(UPDATED, 1)
+
+        assert not is_not_modified(
+            etag,
+            UPDATED,
+            if_none_match='W/"1"',
+            if_modified_since=get_last_modified(UPDATED),
+        )
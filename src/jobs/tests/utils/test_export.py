@@ -0,0 +1,106 @@
+import asyncio
+import csv
+import gzip
+import io
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+
+from ...utils.application import ApplicationState
+from ...utils.export import encode_csv, encode_ndjson, media_type, stream_export
+
+
+COLUMNS = ["id", "state", "title", "created"]
+
+
+def make_rows(size: int) -> list[dict]:
+    return [
+        {
+            "id": uuid.UUID(int=index),
+            "state": ApplicationState.DRAFT,
+            "title": f'a-job, "{index}"',
+            "created": datetime(2024, 6, 17, 7, 7, 51),
+        }
+        for index in range(size)
+    ]
+
+
+async def partition(rows: list[dict], size: int):
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def export(rows: list[dict], format: str, compress: bool = False) -> list[bytes]:
+    async def collect():
+        return [
+            chunk
+            async for chunk in stream_export(
+                partition(rows, 2), columns=COLUMNS, format=format, compress=compress
+            )
+        ]
+
+    return asyncio.run(collect())
+
+
+class TestExport:
+
+    def test_when_rows_are_encoded_as_ndjson(self):
+        lines = encode_ndjson(COLUMNS, make_rows(2)).decode().splitlines()
+
+        assert [json.loads(line) for line in lines] == [
+            {
+                "id": str(uuid.UUID(int=index)),
+                "state": "DRAFT",
+                "title": f'a-job, "{index}"',
+                "created": "2024-06-17T07:07:51",
+            }
+            for index in range(2)
+        ]
+
+    def test_when_rows_are_encoded_as_csv(self):
+        rows = list(
+            csv.reader(
+                io.StringIO(encode_csv(COLUMNS, make_rows(2), header=True).decode())
+            )
+        )
+
+        assert rows[0] == COLUMNS
+        assert rows[1] == [
+            str(uuid.UUID(int=0)),
+            "DRAFT",
+            'a-job, "0"',
+            "2024-06-17T07:07:51",
+        ]
+
+    @pytest.mark.parametrize("format", ["ndjson", "csv"])
+    def test_when_export_is_streamed(self, format):
+        rows = make_rows(5)
+
+        chunks = export(rows, format)
+
+        # NOTE: a chunk per batch of rows - and the header.
+        assert len(chunks) == (4 if format == "csv" else 3)
+        assert b"".join(chunks) == (
+            encode_csv(COLUMNS, rows, header=True)
+            if format == "csv"
+            else encode_ndjson(COLUMNS, rows)
+        )
+
+    @pytest.mark.parametrize("format", ["ndjson", "csv"])
+    def test_when_export_is_compressed(self, format):
+        rows = make_rows(5)
+
+        assert gzip.decompress(b"".join(export(rows, format, compress=True))) == (
+            b"".join(export(rows, format))
+        )
+
+    def test_when_export_is_empty(self):
+        assert export([], "ndjson") == []
+        assert export([], "csv") == [b"id,state,title,created\r\n"]
+
+    def test_when_media_type_is_resolved(self):
+        assert media_type("ndjson") == "application/x-ndjson"
+        assert media_type("csv") == "text/csv"
+        assert media_type("csv", compress=True) == "application/gzip"
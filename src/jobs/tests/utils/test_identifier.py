@@ -0,0 +1,21 @@
+import time
+
+from ...utils.identifier import uuid7
+
+
+class TestUUID7:
+
+    def test_when_uuid7_is_generated(self):
+        before = time.time_ns() // 1_000_000
+        an_id = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert an_id.version == 7
+        assert before <= an_id.int >> 80 <= after
+
+    def test_when_uuid7_is_time_ordered(self):
+        ids = [uuid7() for _ in range(10000)]
+
+        assert ids == sorted(ids)
+        assert ids == sorted(ids, key=lambda an_id: an_id.bytes)
+        assert len(set(ids)) == len(ids)
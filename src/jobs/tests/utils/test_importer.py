@@ -0,0 +1,70 @@
+import io
+import json
+
+import pytest
+
+from ...utils.importer import ImportCheckpoint, InvalidCheckpointError, read_rows
+
+
+class TestImporter:
+
+    def test_when_csv_rows_are_read(self):
+        file = io.StringIO("title,salary,description\r\na-job,100000,\r\n")
+
+        rows = list(read_rows(file, "csv"))
+
+        assert len(rows) == 1
+        assert rows[0].number == 1
+        assert rows[0].data == {"title": "a-job", "salary": "100000"}
+        assert rows[0].error is None
+
+    def test_when_ndjson_rows_are_read(self):
+        file = io.StringIO('{"title": "a-job"}\n\n{"title": \n[1]\n')
+
+        rows = list(read_rows(file, "ndjson"))
+
+        assert [row.number for row in rows] == [1, 3, 4]
+        assert rows[0].data == {"title": "a-job"}
+        assert rows[0].error is None
+        assert rows[1].data == '{"title": '
+        assert rows[1].error is not None
+        assert rows[2].error == "Not a JSON object."
+
+    @pytest.mark.parametrize(
+        "format, content",
+        [
+            ("csv", "title\na\nb\nc\n"),
+            ("ndjson", '{"title": "a"}\n{"title": "b"}\n{"title": "c"}\n'),
+        ],
+    )
+    def test_when_rows_are_skipped(self, format, content):
+        rows = list(read_rows(io.StringIO(content), format, skip=2))
+
+        assert [(row.number, row.data) for row in rows] == [(3, {"title": "c"})]
+
+    def test_when_checkpoint_is_saved_and_loaded(self, tmp_path):
+        path = tmp_path / "jobs.csv.checkpoint"
+        checkpoint = ImportCheckpoint.load(path, source="jobs.csv")
+        assert checkpoint.rows == 0
+
+        checkpoint.rows, checkpoint.imported, checkpoint.rejected = 10, 9, 1
+        checkpoint.save()
+
+        assert ImportCheckpoint.load(path, source="jobs.csv") == checkpoint
+        assert [file.name for file in tmp_path.iterdir()] == ["jobs.csv.checkpoint"]
+
+    def test_when_checkpoint_is_of_another_file(self, tmp_path):
+        path = tmp_path / "jobs.csv.checkpoint"
+        path.write_text(
+            json.dumps({"source": "other.csv", "rows": 1, "imported": 1, "rejected": 0})
+        )
+
+        with pytest.raises(InvalidCheckpointError):
+            ImportCheckpoint.load(path, source="jobs.csv")
+
+    def test_when_checkpoint_is_corrupted(self, tmp_path):
+        path = tmp_path / "jobs.csv.checkpoint"
+        path.write_text("{")
+
+        with pytest.raises(InvalidCheckpointError):
+            ImportCheckpoint.load(path, source="jobs.csv")
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from ...utils.loader import DataLoader
+
+
+class TestDataLoader:
+
+    def test_when_keys_are_batched(self):
+        batches = []
+
+        async def batch_load(keys):
+            batches.append(keys)
+            return [key * 2 for key in keys]
+
+        async def load():
+            loader = DataLoader(batch_load=batch_load)
+            values = await asyncio.gather(
+                loader.load(1), loader.load_many([2, 3, 1]), loader.load(4)
+            )
+            return values, loader.batches
+
+        values, batches_dispatched = asyncio.run(load())
+
+        assert values == [2, [4, 6, 2], 8]
+        assert [sorted(batch) for batch in batches] == [[1, 2, 3, 4]]
+        assert batches_dispatched == 1
+
+    def test_when_keys_are_memoized(self):
+        batches = []
+
+        async def batch_load(keys):
+            batches.append(keys)
+            return [str(key) for key in keys]
+
+        async def load():
+            loader = DataLoader(batch_load=batch_load)
+            await loader.load_many([1, 2])
+            return await loader.load_many([2, 3])
+
+        assert asyncio.run(load()) == ["2", "3"]
+        assert batches == [[1, 2], [3]]
+
+    def test_when_batch_fails(self):
+        calls = []
+
+        async def batch_load(keys):
+            calls.append(keys)
+            if len(calls) == 1:
+                raise RuntimeError("a-failure")
+            return keys
+
+        async def load():
+            loader = DataLoader(batch_load=batch_load)
+            with pytest.raises(RuntimeError, match="a-failure"):
+                await loader.load_many([1, 2])
+            # NOTE: failures are not memoized.
+            return await loader.load(1)
+
+        assert asyncio.run(load()) == 1
+        assert calls == [[1, 2], [1]]
+
+    def test_when_dispatch_is_cancelled(self):
+        async def batch_load(keys):
+            await asyncio.sleep(60)
+
+        async def load():
+            loader = DataLoader(batch_load=batch_load)
+            pending = asyncio.ensure_future(loader.load(1))
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            [task] = loader._dispatch_tasks
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await pending
+            return loader
+
+        loader = asyncio.run(load())
+
+        # NOTE: neither kept alive (i.e. referenced) nor memoized once done.
+        assert loader._dispatch_tasks == set()
+        assert loader._futures == {}
+
+    def test_when_dispatch_fails(self):
+        async def batch_load(keys):
+            raise KeyboardInterrupt
+
+        async def load():
+            loader = DataLoader(batch_load=batch_load)
+            return await loader.load(1)
+
+        with pytest.raises(KeyboardInterrupt):
+            asyncio.run(load())
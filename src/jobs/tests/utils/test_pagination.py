@@ -0,0 +1,19 @@
+import uuid
+from datetime import datetime
+
+import pytest
+
+from ...utils.pagination import Cursor, InvalidCursorError
+
+
+class TestCursor:
+
+    def test_when_cursor_is_encoded_and_decoded(self):
+        cursor = Cursor(created=datetime(2024, 6, 17, 7, 7, 51), id=uuid.uuid4())
+
+        assert Cursor.decode(cursor.encode()) == cursor
+
+    @pytest.mark.parametrize("cursor", ["", "a-cursor", "YS1jdXJzb3I"])
+    def test_when_cursor_is_invalid(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            Cursor.decode(cursor)
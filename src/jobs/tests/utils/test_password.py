@@ -0,0 +1,60 @@
+import pytest
+from passlib.context import CryptContext
+
+from ...utils import password
+from ...utils.password import CALIBRATION_TOLERANCE, calibrate_crypt_context
+
+
+@pytest.fixture
+def crypt_context(monkeypatch):
+    crypt_context = CryptContext(
+        schemes=["pbkdf2_sha256"],
+        pbkdf2_sha256__rounds=1000,
+        pbkdf2_sha256__min_rounds=1000,
+    )
+    monkeypatch.setattr(password, "CRYPT_CONTEXT", crypt_context)
+    return crypt_context
+
+
+class TestCalibrateCryptContext:
+    def test_when_calibrated(self, crypt_context):
+        policy = calibrate_crypt_context(target_latency=0.02, iterations=2)
+
+        cost = policy["pbkdf2_sha256__rounds"]
+        assert policy["pbkdf2_sha256__min_rounds"] == max(
+            1000, min(cost, int(cost * CALIBRATION_TOLERANCE))
+        )
+        assert crypt_context.to_dict()["pbkdf2_sha256__rounds"] == cost
+
+    def test_when_a_hash_is_slightly_below_the_calibrated_cost(self, crypt_context):
+        policy = calibrate_crypt_context(target_latency=0.02, iterations=2)
+
+        cost = policy["pbkdf2_sha256__rounds"]
+        password_hash = (
+            crypt_context.handler("pbkdf2_sha256")
+            .using(rounds=max(1000, int(cost * 0.9)))
+            .hash("a-password")
+        )
+        assert not crypt_context.needs_update(password_hash)
+
+    def test_when_a_hash_is_far_below_the_calibrated_cost(self, crypt_context):
+        policy = calibrate_crypt_context(target_latency=0.02, iterations=2)
+
+        min_cost = policy["pbkdf2_sha256__min_rounds"]
+        if min_cost <= 1000:
+            pytest.skip("The calibrated cost is too low to be undercut.")
+
+        password_hash = (
+            crypt_context.handler("pbkdf2_sha256")
+            .using(rounds=min_cost - 1)
+            .hash("a-password")
+        )
+        assert crypt_context.needs_update(password_hash)
+
+    def test_when_the_scheme_cannot_be_calibrated(self, monkeypatch):
+        monkeypatch.setattr(
+            password, "CRYPT_CONTEXT", CryptContext(schemes=["md5_crypt"])
+        )
+
+        with pytest.raises(ValueError):
+            calibrate_crypt_context(target_latency=0.02)
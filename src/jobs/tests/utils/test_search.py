@@ -0,0 +1,95 @@
+import uuid
+from datetime import datetime
+
+import pytest
+
+from ...utils.search import InvalidSearchSnapshotError, JobSearchIndex, tokenize
+
+
+class TestJobSearchIndex:
+
+    @pytest.fixture
+    def index(self):
+        index = JobSearchIndex()
+        index.add(uuid.uuid4(), "python developer", "python python python")
+        index.add(uuid.uuid4(), "backend developer", "some python")
+        index.add(uuid.uuid4(), "accountant", "spreadsheets")
+        return index
+
+    def test_when_text_is_tokenized(self):
+        assert tokenize("Senior Python-Developer (m/f)") == [
+            "senior",
+            "python",
+            "developer",
+            "m",
+            "f",
+        ]
+
+    def test_when_search_is_ranked_by_relevance(self, index):
+        python_developer, backend_developer, _ = index._ids
+
+        results = index.search("Python")
+
+        assert [id for id, _ in results] == [python_developer, backend_developer]
+        assert results[0][1] > results[1][1] > 0
+
+    def test_when_search_is_limited(self, index):
+        assert len(index.search("developer", limit=1)) == 1
+
+    def test_when_search_has_no_matches(self, index):
+        assert index.search("gardener") == []
+        assert JobSearchIndex().search("python") == []
+
+    def test_when_job_is_added_again(self, index):
+        python_developer = index._ids[0]
+
+        index.add(python_developer, "gardener")
+
+        assert len(index) == 3
+        assert [id for id, _ in index.search("gardener")] == [python_developer]
+        assert python_developer not in [id for id, _ in index.search("python")]
+
+    def test_when_job_is_removed(self, index):
+        python_developer, backend_developer, accountant = index._ids
+
+        index.remove(python_developer)
+        index.remove(uuid.uuid4())
+
+        assert len(index) == 2
+        assert python_developer not in index
+        assert [id for id, _ in index.search("python developer")] == [backend_developer]
+
+        # NOTE: a quarter of the index is tombstones - i.e. it is compacted.
+        index.remove(accountant)
+
+        assert index._ids == [backend_developer]
+        assert [id for id, _ in index.search("python")] == [backend_developer]
+
+    def test_when_watermark_is_advanced(self):
+        index = JobSearchIndex()
+
+        index.add(uuid.uuid4(), "a-job", updated=datetime(2024, 6, 17, 7, 7, 51))
+        index.add(uuid.uuid4(), "a-job", updated=datetime(2024, 6, 17, 7, 7, 50))
+
+        assert index.watermark == datetime(2024, 6, 17, 7, 7, 51)
+
+    def test_when_index_is_snapshotted_and_restored(self, index, tmp_path):
+        index.remove(index._ids[2])
+        index.watermark = datetime(2024, 6, 17, 7, 7, 51)
+
+        index.snapshot(tmp_path / "index")
+        restored = JobSearchIndex()
+        restored.restore(tmp_path / "index")
+
+        assert len(restored) == len(index) == 2
+        assert restored.watermark == index.watermark
+        assert restored.search("python developer") == index.search("python developer")
+        assert list(tmp_path.iterdir()) == [tmp_path / "index"]
+
+    def test_when_snapshot_is_invalid(self, tmp_path):
+        (tmp_path / "index").write_bytes(b"a-snapshot")
+
+        with pytest.raises(InvalidSearchSnapshotError):
+            JobSearchIndex().restore(tmp_path / "index")
+        with pytest.raises(InvalidSearchSnapshotError):
+            JobSearchIndex().restore(tmp_path / "another-index")
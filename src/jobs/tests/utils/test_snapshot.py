@@ -0,0 +1,106 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+
+from ...models.job import Job
+from ...utils.job import JobContract, JobMode, JobState
+from ...utils.snapshot import (
+    InvalidSnapshotManifestError,
+    SnapshotManifest,
+    get_arrow_schema,
+    write_snapshot,
+)
+
+
+COLUMNS = [
+    Job.__table__.c.id,
+    Job.__table__.c.title,
+    Job.__table__.c.salary,
+    Job.__table__.c.mode,
+    Job.__table__.c.updated,
+]
+
+
+def make_rows(size: int, updated: datetime) -> list[dict]:
+    return [
+        {
+            "id": uuid.UUID(int=index),
+            "title": f"a-job-{index}",
+            "salary": Decimal("100000.50"),
+            "mode": JobMode.REMOTE,
+            "updated": updated,
+        }
+        for index in range(size)
+    ]
+
+
+class TestSnapshot:
+
+    def test_when_schema_is_derived_from_columns(self):
+        schema = get_arrow_schema(COLUMNS)
+
+        assert schema.field("id").type == pa.string()
+        assert schema.field("title").type == pa.string()
+        assert schema.field("salary").type == pa.decimal128(10, 2)
+        assert schema.field("mode").type == pa.string()
+        assert schema.field("updated").type == pa.timestamp("s")
+        assert schema.field("id").nullable is False
+
+    def test_when_snapshot_is_partitioned_by_updated_date(self, tmp_path):
+        rows = make_rows(3, datetime(2024, 6, 17, 7, 7, 51)) + make_rows(
+            2, datetime(2024, 6, 18, 8, 0, 0)
+        )
+
+        count, watermark = write_snapshot(
+            [rows[:2], rows[2:]], get_arrow_schema(COLUMNS), tmp_path, run="a-run"
+        )
+
+        assert count == 5
+        assert watermark == datetime(2024, 6, 18, 8, 0, 0)
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "updated_date=2024-06-17",
+            "updated_date=2024-06-18",
+        ]
+        table = ds.dataset(tmp_path, partitioning="hive").to_table()
+        assert table.num_rows == 5
+        assert set(table["id"].to_pylist()) == {
+            str(uuid.UUID(int=index)) for index in range(3)
+        }
+        assert set(table["mode"].to_pylist()) == {JobMode.REMOTE.value}
+        assert set(table["salary"].to_pylist()) == {Decimal("100000.50")}
+
+    def test_when_snapshots_are_incremental(self, tmp_path):
+        schema = get_arrow_schema(COLUMNS)
+        updated = datetime(2024, 6, 17, 7, 7, 51)
+
+        write_snapshot([make_rows(2, updated)], schema, tmp_path, run="a-run")
+        write_snapshot([make_rows(1, updated)], schema, tmp_path, run="another-run")
+
+        assert ds.dataset(tmp_path, partitioning="hive").count_rows() == 3
+
+    def test_when_snapshot_is_empty(self, tmp_path):
+        assert write_snapshot([], get_arrow_schema(COLUMNS), tmp_path, run="a-run") == (
+            0,
+            None,
+        )
+
+    def test_when_manifest_is_saved_and_loaded(self, tmp_path):
+        path = tmp_path / "_manifest.json"
+        manifest = SnapshotManifest.load(path)
+        assert manifest.watermarks == {}
+
+        manifest.watermarks["jobs"] = datetime(2024, 6, 17, 7, 7, 51)
+        manifest.save()
+
+        assert SnapshotManifest.load(path) == manifest
+
+    def test_when_manifest_is_corrupted(self, tmp_path):
+        path = tmp_path / "_manifest.json"
+        path.write_text('{"watermarks": {"jobs": "yesterday"}}')
+
+        with pytest.raises(InvalidSnapshotManifestError):
+            SnapshotManifest.load(path)
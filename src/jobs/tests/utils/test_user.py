@@ -0,0 +1,105 @@
+import asyncio
+from types import SimpleNamespace
+
+import dns.exception
+import dns.resolver
+import pytest
+
+from ...utils.user import EmailDeliverabilityChecker, InvalidUsernameError
+
+
+class StubResolver:
+    """
+    A DNS resolver that answers from a fixed set of records - i.e. without network access.
+    """
+
+    def __init__(self, records):
+        self.records = records
+        self.queries = []
+
+    async def resolve(self, qname, rdtype, lifetime=None):
+        self.queries.append((qname, rdtype))
+        answer = self.records.get((qname, rdtype), dns.resolver.NoAnswer)
+        if isinstance(answer, type) and issubclass(answer, Exception):
+            raise answer()
+        return answer
+
+
+def mx(*exchanges):
+    return [SimpleNamespace(exchange=exchange) for exchange in exchanges]
+
+
+class TestEmailDeliverabilityChecker:
+
+    def test_when_domain_has_mx_records(self):
+        checker = EmailDeliverabilityChecker(
+            resolver=StubResolver({("server.io", "MX"): mx("mail.server.io.")})
+        )
+
+        asyncio.run(checker.check("username@server.io"))
+
+    def test_when_domain_has_only_a_records(self):
+        checker = EmailDeliverabilityChecker(
+            resolver=StubResolver({("server.io", "A"): ["10.0.0.1"]})
+        )
+
+        asyncio.run(checker.check("username@server.io"))
+
+    def test_when_domain_has_null_mx(self):
+        checker = EmailDeliverabilityChecker(
+            resolver=StubResolver({("server.io", "MX"): mx(".")})
+        )
+
+        with pytest.raises(InvalidUsernameError):
+            asyncio.run(checker.check("username@server.io"))
+
+    def test_when_domain_does_not_exist(self):
+        checker = EmailDeliverabilityChecker(
+            resolver=StubResolver({("server.io", "MX"): dns.resolver.NXDOMAIN})
+        )
+
+        with pytest.raises(InvalidUsernameError):
+            asyncio.run(checker.check("username@server.io"))
+
+    def test_when_no_nameserver_answers(self):
+        resolver = StubResolver(
+            {
+                ("server.io", rdtype): dns.resolver.NoNameservers
+                for rdtype in ("MX", "A", "AAAA")
+            }
+        )
+        checker = EmailDeliverabilityChecker(resolver=resolver)
+
+        for _ in range(2):
+            asyncio.run(checker.check("username@server.io"))
+
+        # NOTE: unknown (i.e. transient) outcomes are not cached.
+        assert resolver.queries.count(("server.io", "MX")) == 2
+
+    def test_when_outcome_is_cached(self):
+        resolver = StubResolver({("server.io", "MX"): mx("mail.server.io.")})
+        checker = EmailDeliverabilityChecker(resolver=resolver)
+
+        asyncio.run(checker.check("username@server.io"))
+        asyncio.run(checker.check("another-username@SERVER.io"))
+
+        assert resolver.queries == [("server.io", "MX")]
+
+    def test_when_negative_outcome_expires(self):
+        resolver = StubResolver({("server.io", "MX"): dns.resolver.NXDOMAIN})
+        checker = EmailDeliverabilityChecker(resolver=resolver, negative_ttl=0)
+
+        for _ in range(2):
+            with pytest.raises(InvalidUsernameError):
+                asyncio.run(checker.check("username@server.io"))
+
+        assert len(resolver.queries) == 2
+
+    def test_when_resolution_times_out(self):
+        resolver = StubResolver({("server.io", "MX"): dns.exception.Timeout})
+        checker = EmailDeliverabilityChecker(resolver=resolver)
+
+        asyncio.run(checker.check("username@server.io"))
+        asyncio.run(checker.check("username@server.io"))
+
+        assert len(resolver.queries) == 2
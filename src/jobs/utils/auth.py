@@ -1,9 +1,17 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any
+from uuid import UUID
 
 import jwt
 from jwt.exceptions import PyJWTError
 
-from ..settings.base import Settings
+from ..settings.base import get_settings
 
 
 class NoJWTSubjectError(Exception):
@@ -22,23 +30,187 @@ class FailedJWTDecodeError(Exception):
     pass
 
 
-def create_jwt_token(subject: str) -> str:
+class InvalidJWTPrincipalError(Exception):
     """
-    Create a JWT token with the provided subject.
+    Exception raised when a JWT token does not identify a principal of the expected type.
+    """
+
+    pass
+
+
+class PrincipalType(Enum):
+    """
+    Represents the type of an authenticated principal - to be used at the `type` claim of JWT tokens.
+
+    Attributes:
+        ORGANIZATION (str): The principal is an organization.
+        USER (str): The principal is a user.
+    """
+
+    ORGANIZATION: str = "ORGANIZATION"
+    USER: str = "USER"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Represents an authenticated principal - as identified by a (verified) JWT token.
+
+    Attributes:
+        id (UUID): The ID of the principal.
+        subject (str): The subject of the token - i.e. the organization name or the user username.
+        type (PrincipalType): The type of the principal.
+    """
+
+    id: UUID
+    subject: str
+    type: PrincipalType
+
+
+@dataclass
+class TokenCacheStats:
+    """
+    Represents a snapshot of the verified token cache's metrics.
+
+    Attributes:
+        size (int): The number of tokens cached.
+        max_size (int): The maximum number of tokens cached.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups not served from the cache.
+    """
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+
+
+@dataclass
+class TokenCache:
+    """
+    A bounded LRU cache of verified JWT token claims.
+
+    Tokens are keyed by their (SHA-256) digest and cached until their `exp` claim - i.e. a cached token
+    does not have its signature verified again until it expires (or is evicted).
+
+    Attributes:
+        max_size (int): The maximum number of tokens cached - 0 disables caching.
+    """
+
+    max_size: int
+    _claims: OrderedDict[str, tuple[dict[str, Any], float]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _hits: int = field(default=0, init=False, repr=False)
+    _misses: int = field(default=0, init=False, repr=False)
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """
+        Get the (verified) claims of a token - if cached and not expired.
+
+        Args:
+            token (str): The token.
+
+        Returns:
+            dict[str, Any] | None: The claims of the token - or None.
+        """
+        key = self._key(token)
+        with self._lock:
+            cached = self._claims.get(key)
+            if cached is None or cached[1] <= time.time():
+                if cached is not None:
+                    del self._claims[key]
+                self._misses += 1
+                return None
+
+            self._claims.move_to_end(key)
+            self._hits += 1
+
+            return cached[0]
+
+    def set(self, token: str, claims: dict[str, Any]) -> None:
+        """
+        Cache the (verified) claims of a token - until it expires.
+
+        Args:
+            token (str): The token.
+            claims (dict[str, Any]): The claims of the token.
+
+        Returns:
+            None
+        """
+        if self.max_size <= 0 or "exp" not in claims:
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._claims[key] = (claims, float(claims["exp"]))
+            self._claims.move_to_end(key)
+            while len(self._claims) > self.max_size:
+                self._claims.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Clear the cache - and its metrics.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._claims.clear()
+            self._hits = self._misses = 0
+
+    def stats(self) -> TokenCacheStats:
+        """
+        Returns a snapshot of the cache's metrics.
+
+        Returns:
+            TokenCacheStats: The cache's metrics.
+        """
+        return TokenCacheStats(
+            size=len(self._claims),
+            max_size=self.max_size,
+            hits=self._hits,
+            misses=self._misses,
+        )
+
+
+TOKEN_CACHE = TokenCache(max_size=get_settings().jwt_cache_size)
+
+
+def create_jwt_token(subject: str, id: UUID, type: PrincipalType) -> str:
+    """
+    Create a JWT token for the provided principal.
+
+    Besides the subject, the token carries the principal's ID and type (`id` and `type` claims) and
+    when it was issued/expires - so that the principal can be resolved from the token alone.
 
     Args:
         subject (str): The subject of the token.
+        id (UUID): The ID of the principal.
+        type (PrincipalType): The type of the principal.
 
     Returns:
         str: The encoded JWT token.
     """
-    settings = Settings()
+    settings = get_settings()
+    now = datetime.now(timezone.utc)
 
     return jwt.encode(
         {
             "sub": subject,
-            "exp": datetime.now(timezone.utc)
-            + timedelta(minutes=settings.jwt_token_expiration_minutes),
+            "id": str(id),
+            "type": type.value,
+            "iat": now,
+            "nbf": now,
+            "exp": now + timedelta(minutes=settings.jwt_token_expiration_minutes),
         },
         settings.jwt_secret_key,
         algorithm=settings.jwt_algorithm,
@@ -49,39 +221,61 @@ def decode_jwt_token(token: str) -> dict:
     """
     Decode a JWT token.
 
+    Verified tokens are cached (see `TOKEN_CACHE`) until they expire - i.e. decoding the same token again
+    does not verify its signature again.
+
     Args:
         token (str): The token to be decoded.
 
     Returns:
         dict: The decoded token data.
     """
-    settings = Settings()
+    claims = TOKEN_CACHE.get(token)
+    if claims is not None:
+        return claims
 
-    return jwt.decode(
+    settings = get_settings()
+
+    claims = jwt.decode(
         token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
     )
+    TOKEN_CACHE.set(token, claims)
+
+    return claims
 
 
-def get_jwt_subject(token: str) -> str:
+def get_jwt_principal(token: str, type: PrincipalType) -> Principal:
     """
-    Get the subject of a JWT token.
+    Get the principal identified by a JWT token - without any database lookup.
 
     Args:
-        token (str): The JWT token from which to extract the subject.
+        token (str): The JWT token from which to extract the principal.
+        type (PrincipalType): The expected type of the principal.
 
     Returns:
-        str: The subject of the JWT token.
+        Principal: The principal identified by the token.
 
     Raises:
         NoJWTSubjectError: If no subject is found in the token.
         FailedJWTDecodeError: If there is an error decoding the JWT token.
+        InvalidJWTPrincipalError: If the token does not identify a principal of the expected type.
     """
     try:
-        subject = decode_jwt_token(token).get("sub")
+        claims = decode_jwt_token(token)
     except PyJWTError as exc:
         raise FailedJWTDecodeError(f"Failed to decode JWT token: {exc}")
 
-    if subject is None:
+    if claims.get("sub") is None:
         raise NoJWTSubjectError("No subject found in token.")
 
-    return subject
+    if claims.get("type") != type.value:
+        raise InvalidJWTPrincipalError(
+            f"Invalid principal type (expected: {type.value}): {claims.get('type')}."
+        )
+
+    try:
+        id = UUID(claims["id"])
+    except (KeyError, TypeError, ValueError):
+        raise InvalidJWTPrincipalError("No (valid) principal ID found in token.")
+
+    return Principal(id=id, subject=claims["sub"], type=type)
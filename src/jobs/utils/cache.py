@@ -0,0 +1,668 @@
+"""
+This module defines entity cache related utilities - i.e. a read-through cache of (rarely changing) rows, such as
+organizations, users and jobs, so that looking them up does not hit the database every time.
+
+Entities are cached as their column values (never as ORM instances, which are bound to a session) under their ID
+and - if any - their natural key (e.g. `organizations:name:an-organization`). A cached entity is rebuilt and
+attached to the caller's session without a query (see `EntityCache.build`), so that it can be updated like a
+queried one. Columns marked `info={"cached": False}` (i.e. credentials, such as password hashes) are never cached -
+they are loaded from the database when needed.
+
+The cache has two tiers:
+    - local: an in-process LRU with a TTL - every worker has its own. Writes invalidate it in the worker they run
+      on; the TTL bounds how stale the other workers' copies get.
+    - shared (optional): e.g. Redis, behind `SharedCacheBackend` - looked up by the awaitable service methods on a
+      local miss, and invalidated by their writes (i.e. across workers). Values are stored as JSON, decoded by the
+      types of the model's columns (e.g. UUIDs, datetimes, decimals, enums) - never as pickles, which would run
+      whatever the shared cache returns. `LocalSharedCacheBackend` stands in for it in tests (and development).
+
+The synchronous service methods only use the local tier: the shared one is reached over the network, so it is only
+used by the awaitable ones (i.e. without blocking the event loop).
+
+`ResponseCache` goes one step further for hot public reads (e.g. a job's detail): it caches their serialized
+responses by entity version (i.e. its write counter), invalidated by writes in the worker they run on.
+
+Example usage:
+    cache = EntityCache(max_size=10_000, ttl=60)
+    values = cache.get(Organization, "name", "an-organization")
+    if values is not None:
+        organization = session.merge(cache.build(Organization, values), load=False)
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Protocol, TypeVar
+from uuid import UUID
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from ..settings.base import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+T = TypeVar("T")
+
+
+class SharedCacheBackend(Protocol):
+    """
+    Represents a cache shared by workers - e.g. `redis.asyncio.Redis` (or `LocalSharedCacheBackend`, in tests).
+    """
+
+    async def get(self, key: str) -> bytes | None:
+        """
+        Get the value of a key - None if missing (or expired).
+        """
+        ...
+
+    async def set(self, key: str, value: bytes, ex: int) -> Any:
+        """
+        Set the value of a key - expiring after `ex` seconds.
+        """
+        ...
+
+    async def delete(self, *keys: str) -> Any:
+        """
+        Delete keys.
+        """
+        ...
+
+
+@dataclass
+class LocalSharedCacheBackend:
+    """
+    An in-process stand-in for a shared cache (e.g. Redis) - for tests and development.
+
+    Attributes:
+        values (dict[str, tuple[bytes, float]]): The values - and when they expire.
+    """
+
+    values: dict[str, tuple[bytes, float]] = field(default_factory=dict)
+
+    async def get(self, key: str) -> bytes | None:
+        cached = self.values.get(key)
+        if cached is None or cached[1] <= time.monotonic():
+            self.values.pop(key, None)
+            return None
+
+        return cached[0]
+
+    async def set(self, key: str, value: bytes, ex: int) -> None:
+        self.values[key] = (value, time.monotonic() + ex)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+
+@dataclass
+class EntityCacheStats:
+    """
+    Represents a snapshot of the entity cache's metrics.
+
+    Attributes:
+        size (int): The number of keys cached (locally).
+        max_size (int): The maximum number of keys cached (locally).
+        hits (int): The number of lookups served from the local tier.
+        misses (int): The number of lookups not served from the local tier.
+        evictions (int): The number of keys evicted from the local tier - i.e. expired or least recently used.
+        invalidations (int): The number of keys invalidated by writes.
+        shared_hits (int): The number of local misses served from the shared tier.
+        shared_misses (int): The number of local misses not served from the shared tier either.
+    """
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    shared_hits: int
+    shared_misses: int
+
+
+@dataclass
+class EntityCache:
+    """
+    A read-through cache of entities - an in-process LRU with a TTL, optionally backed by a shared cache.
+
+    Attributes:
+        max_size (int): The maximum number of keys cached locally - 0 disables caching.
+        ttl (float): For how long (in seconds) entities are cached.
+        backend (SharedCacheBackend | None): The shared cache - None to only cache locally.
+    """
+
+    max_size: int
+    ttl: float = 60
+    backend: SharedCacheBackend | None = None
+    _values: OrderedDict[str, tuple[dict[str, Any], float]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _hits: int = field(default=0, init=False, repr=False)
+    _misses: int = field(default=0, init=False, repr=False)
+    _evictions: int = field(default=0, init=False, repr=False)
+    _invalidations: int = field(default=0, init=False, repr=False)
+    _shared_hits: int = field(default=0, init=False, repr=False)
+    _shared_misses: int = field(default=0, init=False, repr=False)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    @staticmethod
+    def key(model: type, name: str, value: Any) -> str:
+        """
+        Get the key an entity is cached under.
+
+        Args:
+            model (type): The model - e.g. `Organization`.
+            name (str): The name of the (unique) column - e.g. `id` or `name`.
+            value (Any): The value of the column.
+
+        Returns:
+            str: The key - e.g. `organizations:name:an-organization`.
+        """
+        return f"{model.__tablename__}:{name}:{value}"
+
+    @classmethod
+    def keys(cls, entity: Any, names: tuple[str, ...]) -> list[str]:
+        """
+        Get the keys an entity is cached under.
+
+        Args:
+            entity (Any): The entity.
+            names (tuple[str, ...]): The names of its (unique) columns it is cached by - e.g. `("id", "name")`.
+
+        Returns:
+            list[str]: The keys.
+        """
+        return [cls.key(type(entity), name, getattr(entity, name)) for name in names]
+
+    @staticmethod
+    def dump(entity: Any) -> dict[str, Any]:
+        """
+        Get the column values of an entity - i.e. what is cached - save for the ones marked `info={"cached": False}`
+        (e.g. password hashes).
+
+        Args:
+            entity (Any): The entity.
+
+        Returns:
+            dict[str, Any]: The column values - by attribute name.
+        """
+        return {
+            attribute.key: getattr(entity, attribute.key)
+            for attribute in inspect(type(entity)).column_attrs
+            if attribute.columns[0].info.get("cached", True)
+        }
+
+    @staticmethod
+    def encode(values: dict[str, Any]) -> bytes:
+        """
+        Encode the column values of an entity as JSON - i.e. how they are stored in the shared tier.
+
+        Args:
+            values (dict[str, Any]): The column values - as returned by `dump`.
+
+        Returns:
+            bytes: The JSON encoded values - UUIDs, datetimes and decimals as strings, enums as their values.
+        """
+
+        def default(value: Any) -> Any:
+            if isinstance(value, Enum):
+                return value.value
+            if isinstance(value, datetime):
+                return value.isoformat()
+            if isinstance(value, (UUID, Decimal)):
+                return str(value)
+
+            raise TypeError(f"Cannot encode {type(value).__name__}: {value!r}.")
+
+        return json.dumps(values, default=default).encode()
+
+    @staticmethod
+    def decode(model: type, value: bytes) -> dict[str, Any]:
+        """
+        Decode the column values of an entity from JSON - by the types of the model's columns.
+
+        Args:
+            model (type): The model - e.g. `Organization`.
+            value (bytes): The JSON encoded values - as returned by `encode`.
+
+        Returns:
+            dict[str, Any]: The column values - by attribute name.
+
+        Raises:
+            ValueError: If the values are not (valid) JSON encoded column values of the model.
+        """
+        python_types = {
+            attribute.key: attribute.columns[0].type.python_type
+            for attribute in inspect(model).column_attrs
+            if attribute.columns[0].info.get("cached", True)
+        }
+
+        try:
+            encoded = json.loads(value)
+            if not isinstance(encoded, dict) or encoded.keys() != python_types.keys():
+                raise ValueError(f"Not the cached columns of {model.__name__}.")
+
+            values = {}
+            for key, python_type in python_types.items():
+                if encoded[key] is None or python_type in (str, int, float, bool):
+                    values[key] = encoded[key]
+                elif python_type is datetime:
+                    values[key] = datetime.fromisoformat(encoded[key])
+                else:
+                    # NOTE: i.e. `UUID`, `Decimal` or an `Enum` - all built from their string (or value).
+                    values[key] = python_type(encoded[key])
+        except (TypeError, ArithmeticError) as exc:
+            raise ValueError(f"Cannot decode {model.__name__}: {exc}") from exc
+
+        return values
+
+    @staticmethod
+    def build(model: type[T], values: dict[str, Any]) -> T:
+        """
+        Build a (detached) entity from its cached column values - to be attached to a session with
+        `session.merge(entity, load=False)`, which issues no query.
+
+        Once attached, the entity is persistent - i.e. it can be updated (and committed) like a queried one.
+
+        Args:
+            model (type[T]): The model - e.g. `Organization`.
+            values (dict[str, Any]): The column values - as returned by `dump`.
+
+        Returns:
+            T: The entity.
+        """
+        entity = inspect(model).class_manager.new_instance()
+        for key, value in values.items():
+            set_committed_value(entity, key, value)
+        make_transient_to_detached(entity)
+
+        return entity
+
+    def get(self, model: type, name: str, value: Any) -> dict[str, Any] | None:
+        """
+        Get the column values of an entity from the local tier - if cached and not expired.
+
+        Args:
+            model (type): The model - e.g. `Organization`.
+            name (str): The name of the (unique) column looked up by - e.g. `id` or `name`.
+            value (Any): The value of the column.
+
+        Returns:
+            dict[str, Any] | None: The column values - or None.
+        """
+        if not self.enabled:
+            return None
+
+        key = self.key(model, name, value)
+        with self._lock:
+            cached = self._values.get(key)
+            if cached is None or cached[1] <= time.monotonic():
+                if cached is not None:
+                    del self._values[key]
+                    self._evictions += 1
+                self._misses += 1
+                return None
+
+            self._values.move_to_end(key)
+            self._hits += 1
+
+            return cached[0]
+
+    def set(self, entity: Any, names: tuple[str, ...]) -> None:
+        """
+        Cache an entity in the local tier - under each of its keys.
+
+        Args:
+            entity (Any): The entity.
+            names (tuple[str, ...]): The names of the (unique) columns it is cached by - e.g. `("id", "name")`.
+
+        Returns:
+            None
+        """
+        if self.enabled:
+            self._set(self.keys(entity, names), self.dump(entity))
+
+    def _set(self, keys: list[str], values: dict[str, Any]) -> None:
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for key in keys:
+                self._values[key] = (values, expires)
+                self._values.move_to_end(key)
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, entity: Any, names: tuple[str, ...]) -> None:
+        """
+        Invalidate an entity in the local tier - e.g. after it is written.
+
+        Args:
+            entity (Any): The entity.
+            names (tuple[str, ...]): The names of the (unique) columns it is cached by - e.g. `("id", "name")`.
+
+        Returns:
+            None
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            for key in self.keys(entity, names):
+                if self._values.pop(key, None) is not None:
+                    self._invalidations += 1
+
+    async def aget(self, model: type, name: str, value: Any) -> dict[str, Any] | None:
+        """
+        Get the column values of an entity - from the local tier or, if missing, the shared one (which the local
+        tier is then filled from).
+
+        Args:
+            model (type): The model - e.g. `Organization`.
+            name (str): The name of the (unique) column looked up by - e.g. `id` or `name`.
+            value (Any): The value of the column.
+
+        Returns:
+            dict[str, Any] | None: The column values - or None.
+        """
+        values = self.get(model, name, value)
+        if values is not None or self.backend is None or not self.enabled:
+            return values
+
+        key = self.key(model, name, value)
+        cached = await self.backend.get(key)
+        if cached is None:
+            self._shared_misses += 1
+            return None
+
+        try:
+            values = self.decode(model, cached)
+        except ValueError as exc:
+            logger.warning(f"Ignoring invalid shared cache value ({key}): {exc}")
+            self._shared_misses += 1
+            return None
+
+        self._shared_hits += 1
+        self._set([key], values)
+
+        return values
+
+    async def aset(self, entity: Any, names: tuple[str, ...]) -> None:
+        """
+        Cache an entity - in the local tier and the shared one (if any).
+
+        Args:
+            entity (Any): The entity.
+            names (tuple[str, ...]): The names of the (unique) columns it is cached by - e.g. `("id", "name")`.
+
+        Returns:
+            None
+        """
+        if not self.enabled:
+            return
+
+        keys, values = self.keys(entity, names), self.dump(entity)
+        self._set(keys, values)
+        if self.backend is not None:
+            value = self.encode(values)
+            for key in keys:
+                await self.backend.set(key, value, ex=max(1, round(self.ttl)))
+
+    async def ainvalidate(self, entity: Any, names: tuple[str, ...]) -> None:
+        """
+        Invalidate an entity - in the local tier and the shared one (if any), i.e. across workers.
+
+        Args:
+            entity (Any): The entity.
+            names (tuple[str, ...]): The names of the (unique) columns it is cached by - e.g. `("id", "name")`.
+
+        Returns:
+            None
+        """
+        self.invalidate(entity, names)
+        if self.enabled and self.backend is not None:
+            await self.backend.delete(*self.keys(entity, names))
+
+    def clear(self) -> None:
+        """
+        Clear the local tier - and the metrics.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._values.clear()
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+            self._shared_hits = self._shared_misses = 0
+
+    def stats(self) -> EntityCacheStats:
+        """
+        Returns a snapshot of the cache's metrics.
+
+        Returns:
+            EntityCacheStats: The cache's metrics.
+        """
+        return EntityCacheStats(
+            size=len(self._values),
+            max_size=self.max_size,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            shared_hits=self._shared_hits,
+            shared_misses=self._shared_misses,
+        )
+
+
+@dataclass
+class ResponseCacheStats:
+    """
+    Represents a snapshot of a response cache's metrics.
+
+    Attributes:
+        size (int): The number of responses cached.
+        bytes (int): The total size (in bytes) of the responses cached.
+        max_bytes (int): The maximum total size (in bytes) of the responses cached.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups not served from the cache - i.e. missing or of another version.
+        evictions (int): The number of responses evicted - i.e. least recently used.
+        invalidations (int): The number of responses invalidated by writes.
+    """
+
+    size: int
+    bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+@dataclass
+class ResponseCache:
+    """
+    An in-process LRU of serialized (i.e. JSON encoded) responses, by entity ID and version (i.e. `version`) - so
+    that hot reads skip the ORM, validation and encoding altogether.
+
+    A single version is cached per entity: caching a newer one replaces it, and an older one is never served.
+
+    Attributes:
+        max_bytes (int): The maximum total size (in bytes) of the responses cached - 0 disables caching.
+    """
+
+    max_bytes: int
+    _values: OrderedDict[Any, tuple[int, bytes]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _bytes: int = field(default=0, init=False, repr=False)
+    _hits: int = field(default=0, init=False, repr=False)
+    _misses: int = field(default=0, init=False, repr=False)
+    _evictions: int = field(default=0, init=False, repr=False)
+    _invalidations: int = field(default=0, init=False, repr=False)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def __contains__(self, id: Any) -> bool:
+        """
+        Check whether a response of an entity (i.e. any version) is cached.
+
+        Args:
+            id (Any): The ID of the entity.
+
+        Returns:
+            bool: Whether a response is cached.
+        """
+        return id in self._values
+
+    def get(self, id: Any, version: int) -> bytes | None:
+        """
+        Get the response of an entity version - if cached.
+
+        Args:
+            id (Any): The ID of the entity.
+            version (int): The version of the entity - i.e. its write counter.
+
+        Returns:
+            bytes | None: The response - or None.
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            cached = self._values.get(id)
+            if cached is None or cached[0] != version:
+                self._misses += 1
+                return None
+
+            self._values.move_to_end(id)
+            self._hits += 1
+
+            return cached[1]
+
+    def set(self, id: Any, version: int, response: bytes) -> None:
+        """
+        Cache the response of an entity version - evicting the least recently used ones beyond `max_bytes`.
+
+        Args:
+            id (Any): The ID of the entity.
+            version (int): The version of the entity - i.e. its write counter.
+            response (bytes): The response.
+
+        Returns:
+            None
+        """
+        if not self.enabled or len(response) > self.max_bytes:
+            return
+
+        with self._lock:
+            cached = self._values.get(id)
+            if cached is not None:
+                if cached[0] > version:
+                    return
+                self._bytes -= len(cached[1])
+            self._values[id] = (version, response)
+            self._values.move_to_end(id)
+            self._bytes += len(response)
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._values.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._evictions += 1
+
+    def invalidate(self, id: Any) -> None:
+        """
+        Invalidate the response of an entity - e.g. after it is written.
+
+        Args:
+            id (Any): The ID of the entity.
+
+        Returns:
+            None
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            cached = self._values.pop(id, None)
+            if cached is not None:
+                self._bytes -= len(cached[1])
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Clear the cache - and the metrics.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._values.clear()
+            self._bytes = self._hits = self._misses = 0
+            self._evictions = self._invalidations = 0
+
+    def stats(self) -> ResponseCacheStats:
+        """
+        Returns a snapshot of the cache's metrics.
+
+        Returns:
+            ResponseCacheStats: The cache's metrics.
+        """
+        return ResponseCacheStats(
+            size=len(self._values),
+            bytes=self._bytes,
+            max_bytes=self.max_bytes,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+        )
+
+
+def get_shared_cache_backend(url: str) -> SharedCacheBackend:
+    """
+    Get the shared cache at a URL - i.e. a Redis client (`redis` being an optional dependency).
+
+    Args:
+        url (str): The URL - e.g. `redis://localhost:6379/0`.
+
+    Returns:
+        SharedCacheBackend: The shared cache.
+    """
+    import redis.asyncio
+
+    return redis.asyncio.Redis.from_url(url)
+
+
+settings = get_settings()
+
+ENTITY_CACHE = EntityCache(
+    max_size=settings.entity_cache_size,
+    ttl=settings.entity_cache_ttl_seconds,
+    backend=(
+        get_shared_cache_backend(settings.entity_cache_url)
+        if settings.entity_cache_url is not None
+        else None
+    ),
+)
+
+JOB_RESPONSE_CACHE = ResponseCache(max_bytes=settings.job_response_cache_bytes)
@@ -0,0 +1,282 @@
+"""
+This module defines catalog related utilities - i.e. an in-process, columnar copy of the fields jobs are browsed by.
+
+Browsing jobs filters on small, fixed-width fields - `salary`, `mode`, `contract`, `state` and `organization_id` - and
+sorts by `created` or `salary`. If `Settings.job_catalog_enabled` is set, every worker keeps a `JobCatalog` holding
+these as NumPy arrays - enums as `int8` codes, salaries as `int64` cents, organizations as `int32` codes (i.e.
+dictionary encoded) and creation times as `int64` seconds since the epoch - so that filtering and sorting are vectorized masks and
+sorts rather than SQL queries. Only the page of matching job IDs is then read from the database - by primary key.
+
+`JobService` updates the catalog as it commits jobs (and catches up with other workers' writes periodically - see
+`JobService.refresh_catalog`). Jobs are updated in place (their fields are fixed-width) and removals are flagged.
+
+Example usage:
+    catalog = JobCatalog()
+    catalog.add_many(jobs)
+    catalog.query(mode=JobMode.REMOTE, min_salary=100000, limit=20)
+"""
+
+import math
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Literal
+from uuid import UUID
+
+import numpy as np
+
+from .job import JobContract, JobMode, JobState
+from ..settings.base import get_settings
+
+
+COLUMNS = {
+    "salary": np.int64,
+    "mode": np.int8,
+    "contract": np.int8,
+    "state": np.int8,
+    "organization": np.int32,
+    # NOTE: seconds since the epoch - NumPy partitions (and sorts) datetime64 far slower than int64.
+    "created": np.int64,
+    "live": np.bool_,
+}
+
+ENUMS = {
+    "mode": JobMode,
+    "contract": JobContract,
+    "state": JobState,
+}
+
+INITIAL_CAPACITY = 1024
+
+
+def to_cents(salary: float | Decimal, rounding=round) -> int:
+    """
+    Convert a salary to (integer) cents.
+
+    Args:
+        salary (float | Decimal): The salary.
+        rounding (Callable, optional): How fractions of a cent are rounded - e.g. `math.ceil` for a lower bound.
+            Defaults to `round`.
+
+    Returns:
+        int: The salary in cents.
+    """
+    # NOTE: through the decimal representation - i.e. 100.1 is 10010 cents, not 10009.999999999998.
+    return int(rounding(Decimal(str(salary)) * 100))
+
+
+@dataclass
+class JobCatalog:
+    """
+    An in-memory, columnar catalog of jobs' browsing fields.
+
+    Each job is a row of every column - rows are appended as jobs are added and updated in place afterwards.
+    Columns grow by doubling their capacity.
+
+    Attributes:
+        watermark (datetime, optional): The latest `updated` of the cataloged jobs - None if empty.
+    """
+
+    watermark: datetime | None = None
+    _columns: dict[str, np.ndarray] = field(
+        default_factory=lambda: {
+            name: np.zeros(INITIAL_CAPACITY, dtype=dtype)
+            for name, dtype in COLUMNS.items()
+        },
+        init=False,
+        repr=False,
+    )
+    _size: int = field(default=0, init=False, repr=False)
+    _ids: list[UUID] = field(default_factory=list, init=False, repr=False)
+    _rows: dict[UUID, int] = field(default_factory=dict, init=False, repr=False)
+    _organizations: dict[UUID, int] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _codes: dict[str, dict[Enum, int]] = field(
+        default_factory=lambda: {
+            name: {member: code for code, member in enumerate(enum)}
+            for name, enum in ENUMS.items()
+        },
+        init=False,
+        repr=False,
+    )
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False
+    )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(np.count_nonzero(self._columns["live"][: self._size]))
+
+    def __contains__(self, id: UUID) -> bool:
+        with self._lock:
+            row = self._rows.get(id)
+            return row is not None and bool(self._columns["live"][row])
+
+    def add(self, job: Any) -> None:
+        """
+        Catalog a job - updating it if already cataloged.
+
+        Args:
+            job (Any): The job - i.e. anything with the `id`, `salary`, `mode`, `contract`, `state`,
+                `organization_id`, `created` and `updated` of a job (e.g. a `Job`, or a row).
+
+        Returns:
+            None
+        """
+        self.add_many([job])
+
+    def add_many(self, jobs: Iterable[Any]) -> None:
+        """
+        Catalog jobs - updating the ones already cataloged.
+
+        Rows are resolved one job at a time, but columns are written once per call - i.e. a batch at a time.
+
+        Args:
+            jobs (Iterable[Any]): The jobs - i.e. anything with the `id`, `salary`, `mode`, `contract`, `state`,
+                `organization_id`, `created` and `updated` of a job (e.g. `Job`s, or rows).
+
+        Returns:
+            None
+        """
+        rows: list[int] = []
+        values: dict[str, list] = {name: [] for name in COLUMNS}
+        with self._lock:
+            for job in jobs:
+                row = self._rows.get(job.id)
+                if row is None:
+                    row = self._rows[job.id] = len(self._ids)
+                    self._ids.append(job.id)
+                rows.append(row)
+
+                values["salary"].append(to_cents(job.salary))
+                for name in ENUMS:
+                    values[name].append(self._codes[name][getattr(job, name)])
+                values["organization"].append(
+                    self._organizations.setdefault(
+                        job.organization_id, len(self._organizations)
+                    )
+                )
+                values["created"].append(job.created)
+                values["live"].append(True)
+
+                if job.updated is not None and (
+                    self.watermark is None or job.updated > self.watermark
+                ):
+                    self.watermark = job.updated
+
+            if not rows:
+                return
+
+            self._reserve(len(self._ids))
+            values["created"] = np.array(values["created"], dtype="datetime64[s]").view(
+                np.int64
+            )
+            for name, dtype in COLUMNS.items():
+                self._columns[name][rows] = np.asarray(values[name], dtype=dtype)
+
+    def remove(self, id: UUID) -> None:
+        """
+        Remove a job from the catalog - if cataloged.
+
+        Args:
+            id (UUID): The ID of the job.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            row = self._rows.get(id)
+            if row is not None:
+                self._columns["live"][row] = False
+
+    def query(
+        self,
+        limit: int,
+        organization_id: UUID | None = None,
+        mode: JobMode | None = None,
+        contract: JobContract | None = None,
+        state: JobState | None = None,
+        min_salary: float | None = None,
+        max_salary: float | None = None,
+        order_by: Literal["created", "salary"] = "created",
+    ) -> list[UUID]:
+        """
+        Filter and sort the catalog - highest `order_by` first, then latest cataloged first.
+
+        Args:
+            limit (int): The maximum number of jobs.
+            organization_id (UUID, optional): The ID of the organization of the jobs. Defaults to None (i.e. any).
+            mode (JobMode, optional): The mode of the jobs. Defaults to None (i.e. any).
+            contract (JobContract, optional): The contract type of the jobs. Defaults to None (i.e. any).
+            state (JobState, optional): The state of the jobs. Defaults to None (i.e. any).
+            min_salary (float, optional): The minimum salary of the jobs. Defaults to None.
+            max_salary (float, optional): The maximum salary of the jobs. Defaults to None.
+            order_by (str, optional): What the jobs are sorted by - `created` or `salary`. Defaults to `created`.
+
+        Returns:
+            list[UUID]: The IDs of the matching jobs - in order.
+        """
+        with self._lock:
+            columns = {
+                name: column[: self._size] for name, column in self._columns.items()
+            }
+
+            mask = columns["live"].copy()
+            if organization_id is not None:
+                code = self._organizations.get(organization_id)
+                if code is None:
+                    return []
+                mask &= columns["organization"] == code
+            for name, value in (
+                ("mode", mode),
+                ("contract", contract),
+                ("state", state),
+            ):
+                if value is not None:
+                    mask &= columns[name] == self._codes[name][value]
+            if min_salary is not None:
+                mask &= columns["salary"] >= to_cents(min_salary, math.ceil)
+            if max_salary is not None:
+                mask &= columns["salary"] <= to_cents(max_salary, math.floor)
+
+            rows = np.flatnonzero(mask)
+            keys = columns[order_by][rows]
+            if len(rows) > limit:
+                # NOTE: only the rows tied with (or above) the limit-th highest key are fully sorted.
+                threshold = np.partition(keys, len(keys) - limit)[len(keys) - limit]
+                selected = keys >= threshold
+                rows, keys = rows[selected], keys[selected]
+
+            order = np.lexsort((-rows, -keys))[:limit]
+
+            return [self._ids[row] for row in rows[order]]
+
+    def _reserve(self, size: int) -> None:
+        """
+        Grow the columns (by doubling their capacity) to hold `size` rows. The lock must be held.
+
+        Args:
+            size (int): The number of rows.
+
+        Returns:
+            None
+        """
+        capacity = len(self._columns["live"])
+        if size > capacity:
+            while capacity < size:
+                capacity *= 2
+            for name, column in self._columns.items():
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[: self._size] = column[: self._size]
+                self._columns[name] = grown
+
+        self._size = max(self._size, size)
+
+
+settings = get_settings()
+
+JOB_CATALOG = JobCatalog() if settings.job_catalog_enabled else None
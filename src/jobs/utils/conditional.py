@@ -0,0 +1,132 @@
+"""
+This module defines conditional request related utilities - i.e. answering `GET`s of unchanged resources with
+`304 Not Modified`, so that clients polling them neither transfer nor make the server serialize them again.
+
+A resource's `ETag` is derived from when it was last updated (`updated`, with a one second resolution) and its
+`version` - a counter incremented on every write, so that writes within the same second get different tags. Its
+`Last-Modified` (`updated`) is only sent once that second is over - i.e. it is implicitly weak until then (as
+per RFC 9110), given that a later write within the same second would have the same `Last-Modified`.
+`If-None-Match` takes precedence over `If-Modified-Since` - as per RFC 9110.
+
+Example usage:
+    headers = get_cache_headers(job.updated, job.version, cache_control="public, no-cache")
+    if is_not_modified(headers["ETag"], job.updated, if_none_match, if_modified_since):
+        return Response(status_code=304, headers=headers)
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+
+# NOTE: private resources (e.g. a user) may only be stored by the client - and always revalidated.
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def get_etag(updated: datetime, version: int) -> str:
+    """
+    Get the (weak) entity tag of a resource version.
+
+    Args:
+        updated (datetime): When the resource was last updated - naive UTC, as stored.
+        version (int): The version of the resource - i.e. its write counter.
+
+    Returns:
+        str: The entity tag - e.g. `W/"1718625600-2"`.
+    """
+    return f'W/"{int(updated.replace(tzinfo=timezone.utc).timestamp())}-{version}"'
+
+
+def get_last_modified(updated: datetime) -> str:
+    """
+    Get the `Last-Modified` (i.e. an HTTP date) of a resource version.
+
+    Args:
+        updated (datetime): When the resource was last updated - naive UTC, as stored.
+
+    Returns:
+        str: The HTTP date - e.g. `Mon, 17 Jun 2024 12:00:00 GMT`.
+    """
+    return format_datetime(updated.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def get_cache_headers(
+    updated: datetime,
+    version: int,
+    cache_control: str,
+    now: datetime | None = None,
+) -> dict[str, str]:
+    """
+    Get the caching headers of a resource version.
+
+    Args:
+        updated (datetime): When the resource was last updated - naive UTC, as stored.
+        version (int): The version of the resource - i.e. its write counter.
+        cache_control (str): The `Cache-Control` of the resource - e.g. `private, no-cache`.
+        now (datetime, optional): The current time - naive UTC. Defaults to None (i.e. now).
+
+    Returns:
+        dict[str, str]: The `ETag`, `Last-Modified` (unless `updated` is within the last second) and
+            `Cache-Control` headers.
+    """
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    headers = {"ETag": get_etag(updated, version), "Cache-Control": cache_control}
+    # NOTE: `updated` has a one second resolution - i.e. it only identifies a version once its second is over.
+    if now - updated >= timedelta(seconds=1):
+        headers["Last-Modified"] = get_last_modified(updated)
+
+    return headers
+
+
+def get_public_cache_control(max_age: int) -> str:
+    """
+    Get the `Cache-Control` of a public resource (e.g. a job).
+
+    Args:
+        max_age (int): For how long (in seconds) clients may reuse the resource without revalidating it.
+
+    Returns:
+        str: The `Cache-Control` - e.g. `public, max-age=60`, or `public, no-cache` (i.e. always revalidate).
+    """
+    return f"public, max-age={max_age}" if max_age > 0 else "public, no-cache"
+
+
+def is_not_modified(
+    etag: str,
+    updated: datetime,
+    if_none_match: str | None = None,
+    if_modified_since: str | None = None,
+) -> bool:
+    """
+    Check whether a conditional `GET` of a resource version can be answered with `304 Not Modified`.
+
+    Entity tags are compared weakly (i.e. regardless of `W/`). An invalid `If-Modified-Since` is ignored.
+
+    Args:
+        etag (str): The entity tag of the resource version.
+        updated (datetime): When the resource was last updated - naive UTC, as stored.
+        if_none_match (str, optional): The `If-None-Match` of the request - if any. Defaults to None.
+        if_modified_since (str, optional): The `If-Modified-Since` of the request - if any. Defaults to None.
+
+    Returns:
+        bool: Whether the resource is not modified.
+    """
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+
+        opaque = etag.removeprefix("W/")
+        return any(
+            tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+        )
+
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return updated.replace(tzinfo=timezone.utc) <= since
+
+    return False
@@ -0,0 +1,148 @@
+"""
+This module defines export related utilities - i.e. serializing rows incrementally, as NDJSON or CSV (optionally gzipped).
+
+Exports are streamed: rows arrive in batches (e.g. the partitions of a server-side cursor) and each batch is
+serialized - and compressed - into a chunk of the response on its own, so that memory use does not depend on the
+size of the export.
+
+Example usage:
+    return StreamingResponse(
+        stream_export(partitions, columns=["id", "state"], format="csv", compress=True),
+        media_type=media_type("csv", compress=True),
+    )
+"""
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Mapping, Sequence
+from datetime import datetime
+from enum import Enum
+from typing import Any, Literal
+from uuid import UUID
+
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def serialize(value: Any) -> Any:
+    """
+    Convert a column value to its exported representation - e.g. UUIDs and datetimes to strings.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        Any: The exported value - a string, a number or None.
+    """
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+
+    return value
+
+
+def encode_ndjson(columns: Sequence[str], rows: Sequence[Mapping[str, Any]]) -> bytes:
+    """
+    Serialize rows as NDJSON - i.e. a JSON object per line.
+
+    Args:
+        columns (Sequence[str]): The columns - i.e. the keys of each object.
+        rows (Sequence[Mapping[str, Any]]): The rows.
+
+    Returns:
+        bytes: The lines.
+    """
+    return "".join(
+        json.dumps({column: serialize(row[column]) for column in columns}) + "\n"
+        for row in rows
+    ).encode()
+
+
+def encode_csv(
+    columns: Sequence[str], rows: Sequence[Mapping[str, Any]], header: bool = False
+) -> bytes:
+    """
+    Serialize rows as CSV.
+
+    Args:
+        columns (Sequence[str]): The columns - in order.
+        rows (Sequence[Mapping[str, Any]]): The rows.
+        header (bool, optional): Whether the column names are written first. Defaults to False.
+
+    Returns:
+        bytes: The lines.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows([serialize(row[column]) for column in columns] for row in rows)
+
+    return buffer.getvalue().encode()
+
+
+def media_type(format: ExportFormat, compress: bool = False) -> str:
+    """
+    Get the media type of an export.
+
+    Args:
+        format (ExportFormat): The format - `ndjson` or `csv`.
+        compress (bool, optional): Whether the export is gzipped. Defaults to False.
+
+    Returns:
+        str: The media type.
+    """
+    return "application/gzip" if compress else MEDIA_TYPES[format]
+
+
+async def stream_export(
+    partitions: AsyncIterable[Sequence[Mapping[str, Any]]],
+    columns: Sequence[str],
+    format: ExportFormat,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Serialize (and compress) rows incrementally - a chunk per batch of rows.
+
+    Args:
+        partitions (AsyncIterable[Sequence[Mapping[str, Any]]]): The rows - in batches.
+        columns (Sequence[str]): The columns - in order.
+        format (ExportFormat): The format - `ndjson` or `csv`.
+        compress (bool, optional): Whether the chunks are gzipped. Defaults to False.
+
+    Yields:
+        bytes: The chunks.
+    """
+    # NOTE: wbits=31 - i.e. a gzip (rather than zlib) header and trailer.
+    compressor = zlib.compressobj(wbits=31) if compress else None
+
+    def encode(chunk: bytes) -> bytes:
+        return compressor.compress(chunk) if compressor is not None else chunk
+
+    chunks = (
+        encode_csv(columns, rows) if format == "csv" else encode_ndjson(columns, rows)
+        async for rows in partitions
+    )
+    if format == "csv":
+        header = encode(encode_csv(columns, [], header=True))
+        # NOTE: the compressor buffers small inputs - i.e. there may be nothing to send yet.
+        if header:
+            yield header
+
+    async for chunk in chunks:
+        chunk = encode(chunk)
+        if chunk:
+            yield chunk
+
+    if compressor is not None:
+        yield compressor.flush()
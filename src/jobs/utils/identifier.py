@@ -0,0 +1,58 @@
+"""
+This module defines identifier related utilities - i.e. generating time-ordered UUIDs (version 7, RFC 9562).
+
+Random UUIDs (version 4) make every insert land at a random spot of the primary key (i.e. the clustered
+index) and of the indexes referencing it. UUIDv7 start with a millisecond timestamp instead, so new rows
+are appended - and rows created around the same time are stored next to each other.
+
+Within the same millisecond, UUIDs are kept monotonic by a 12-bit counter (RFC 9562, section 6.2, method 1)
+seeded randomly every millisecond.
+
+Example usage:
+    id = uuid7()
+"""
+
+import os
+import threading
+import time
+from uuid import UUID
+
+
+_lock = threading.Lock()
+_last_timestamp = 0
+_counter = 0
+
+
+def uuid7() -> UUID:
+    """
+    Generates a time-ordered UUID (version 7).
+
+    Returns:
+        UUID: The UUID - greater than any previously generated (by this process).
+    """
+    global _last_timestamp, _counter
+
+    with _lock:
+        timestamp = time.time_ns() // 1_000_000
+        if timestamp > _last_timestamp:
+            # NOTE: seeding with 11 (rather than 12) random bits leaves room to increment within the millisecond.
+            _last_timestamp, _counter = timestamp, int.from_bytes(os.urandom(2)) >> 5
+        else:
+            # NOTE: same millisecond (or the clock went backwards) - i.e. incrementing the counter, and
+            # borrowing the next millisecond if it overflows.
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_timestamp, _counter = _last_timestamp + 1, 0
+            timestamp = _last_timestamp
+
+        counter = _counter
+
+    random = int.from_bytes(os.urandom(8)) & 0x3FFF_FFFF_FFFF_FFFF
+
+    return UUID(
+        int=(timestamp & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | random
+    )
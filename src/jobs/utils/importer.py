@@ -0,0 +1,169 @@
+"""
+This module defines import related utilities - i.e. reading rows from CSV/NDJSON files incrementally, and keeping
+track of how far an import got.
+
+Imports are streamed: rows are read one at a time (never the whole file) and written in chunks - each one in its
+own transaction. After a chunk is committed, an `ImportCheckpoint` records how many rows were consumed, so that an
+interrupted import resumes after the last committed chunk rather than from the start. (If the import stops between
+a commit and its checkpoint, that chunk is imported again on resume.)
+
+Example usage:
+    checkpoint = ImportCheckpoint.load("jobs.csv.checkpoint", source="jobs.csv")
+    with open("jobs.csv", newline="") as file:
+        for row in read_rows(file, format="csv", skip=checkpoint.rows):
+            ...
+"""
+
+import csv
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Literal, TextIO
+
+
+ImportFormat = Literal["csv", "ndjson"]
+
+
+class InvalidCheckpointError(Exception):
+    """
+    Exception raised when an import checkpoint cannot be resumed from.
+
+    Attributes:
+        path (str): The path of the checkpoint.
+    """
+
+    def __init__(self, path: str | os.PathLike, reason: str):
+        self.path = str(path)
+        super().__init__(f"Invalid import checkpoint: {path} ({reason}).")
+
+
+@dataclass
+class ImportRow:
+    """
+    Represents a row read from an import file.
+
+    Attributes:
+        number (int): The (1-based) number of the row - header excluded.
+        data (dict[str, Any] | str): The fields of the row - or its raw text, if it cannot be parsed.
+        error (str, optional): Why the row cannot be parsed - if so. Defaults to None.
+    """
+
+    number: int
+    data: dict[str, Any] | str
+    error: str | None = None
+
+
+def read_rows(file: TextIO, format: ImportFormat, skip: int = 0) -> Iterator[ImportRow]:
+    """
+    Read the rows of a CSV (with a header) or NDJSON file - one at a time.
+
+    Empty CSV fields are omitted - i.e. they are missing (rather than empty strings), so that optional fields take
+    their defaults. Blank NDJSON lines are skipped (but counted).
+
+    Args:
+        file (TextIO): The file - opened with `newline=""` for CSV.
+        format (ImportFormat): The format - `csv` or `ndjson`.
+        skip (int, optional): The number of rows to skip - e.g. the ones a checkpoint records as imported.
+            Defaults to 0.
+
+    Yields:
+        ImportRow: The rows - in order.
+    """
+    if format == "csv":
+        for number, fields in enumerate(csv.DictReader(file), start=1):
+            if number > skip:
+                yield ImportRow(
+                    number=number,
+                    data={key: value for key, value in fields.items() if value != ""},
+                )
+        return
+
+    for number, line in enumerate(file, start=1):
+        if number <= skip or not line.strip():
+            continue
+
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield ImportRow(number=number, data=line.rstrip("\n"), error=str(exc))
+            continue
+
+        if isinstance(data, dict):
+            yield ImportRow(number=number, data=data)
+        else:
+            yield ImportRow(number=number, data=data, error="Not a JSON object.")
+
+
+@dataclass
+class ImportCheckpoint:
+    """
+    Represents how far an import got - saved after every committed chunk.
+
+    Attributes:
+        path (str): The path of the checkpoint.
+        source (str): The path of the imported file.
+        rows (int): The number of rows consumed - i.e. imported or rejected.
+        imported (int): The number of rows imported.
+        rejected (int): The number of rows rejected.
+    """
+
+    path: str
+    source: str
+    rows: int = 0
+    imported: int = 0
+    rejected: int = 0
+
+    @classmethod
+    def load(
+        cls, path: str | os.PathLike, source: str | os.PathLike
+    ) -> "ImportCheckpoint":
+        """
+        Load a checkpoint - or start a new one, if there is none.
+
+        Args:
+            path (str | os.PathLike): The path of the checkpoint.
+            source (str | os.PathLike): The path of the imported file.
+
+        Returns:
+            ImportCheckpoint: The checkpoint.
+
+        Raises:
+            InvalidCheckpointError: If the checkpoint cannot be read - or is for another file.
+        """
+        if not os.path.exists(path):
+            return cls(path=str(path), source=str(source))
+
+        try:
+            with open(path) as file:
+                state = json.load(file)
+        except (OSError, json.JSONDecodeError) as exc:
+            raise InvalidCheckpointError(path, str(exc))
+
+        if state.get("source") != str(source):
+            raise InvalidCheckpointError(path, f"checkpoint of {state.get('source')}")
+
+        return cls(
+            path=str(path),
+            source=state["source"],
+            rows=state["rows"],
+            imported=state["imported"],
+            rejected=state["rejected"],
+        )
+
+    def save(self) -> None:
+        """
+        Write the checkpoint to disk - atomically (i.e. through a temporary file in the same directory).
+
+        Returns:
+            None
+        """
+        path = Path(self.path)
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        state = asdict(self)
+        del state["path"]
+        with open(temporary, "w") as file:
+            json.dump(state, file)
+
+        os.replace(temporary, path)
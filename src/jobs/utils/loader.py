@@ -0,0 +1,129 @@
+"""
+This module defines batching loader related utilities - i.e. a DataLoader: values requested one key at a time are
+resolved together, with a single call of a batch function, and memoized.
+
+Keys requested within the same event loop iteration (e.g. by `load_many`, or by coroutines gathered together) are
+collected into a batch, which is dispatched once they are all queued. A key is only ever resolved once per loader:
+loaders are meant to be short-lived (e.g. request-scoped), so that memoized values do not go stale.
+
+Example usage:
+    loader = DataLoader(batch_load=load_organizations_by_ids)
+    organizations = await loader.load_many([job.organization_id for job in jobs])
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class DataLoader(Generic[K, V]):
+    """
+    A batching (and memoizing) loader of values by key.
+
+    Attributes:
+        batch_load (Callable[[list[K]], Awaitable[list[V]]]): Resolves a batch of (distinct) keys - returning the
+            value of each, in order.
+        batches (int): The number of batches dispatched - i.e. calls of `batch_load`.
+    """
+
+    batch_load: Callable[[list[K]], Awaitable[list[V]]]
+    batches: int = field(default=0, init=False)
+    _futures: dict[K, asyncio.Future] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _queue: list[K] = field(default_factory=list, init=False, repr=False)
+    # NOTE: the event loop only holds weak references to tasks - i.e. dispatches are kept alive here.
+    _dispatch_tasks: set[asyncio.Task] = field(
+        default_factory=set, init=False, repr=False
+    )
+
+    def load(self, key: K) -> Awaitable[V]:
+        """
+        Load the value of a key - batched with the other keys requested in the same event loop iteration.
+
+        Args:
+            key (K): The key.
+
+        Returns:
+            Awaitable[V]: The value.
+        """
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = self._futures[key] = loop.create_future()
+        self._queue.append(key)
+        if len(self._queue) == 1:
+            loop.call_soon(self._schedule_dispatch)
+
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> list[V]:
+        """
+        Load the values of keys - in a single batch (save for those already loaded).
+
+        Args:
+            keys (Iterable[K]): The keys.
+
+        Returns:
+            list[V]: The value of each key - in order.
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _schedule_dispatch(self) -> None:
+        keys: list[K] = []
+        task = asyncio.get_running_loop().create_task(self._dispatch(keys))
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(lambda task: self._dispatched(task, keys))
+
+    def _dispatched(self, task: asyncio.Task, keys: list[K]) -> None:
+        self._dispatch_tasks.discard(task)
+        # NOTE: a dispatch cancelled (or failing outside of `batch_load`'s exceptions) must not leave its keys
+        # pending forever - nor memoized.
+        cancelled = task.cancelled()
+        exc = None if cancelled else task.exception()
+        if not cancelled and exc is None:
+            return
+
+        if not keys:
+            # NOTE: i.e. cancelled before it took its batch.
+            keys, self._queue = self._queue, []
+
+        for key in keys:
+            future = self._futures.get(key)
+            if future is not None and not future.done():
+                del self._futures[key]
+                if cancelled:
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
+
+    async def _dispatch(self, keys: list[K]) -> None:
+        # NOTE: the batch is only taken once the task runs - i.e. with the keys queued meanwhile (e.g. by `load_many`).
+        keys.extend(self._queue)
+        self._queue = []
+        self.batches += 1
+        try:
+            values = await self.batch_load(keys)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"Batch loaded {len(values)} values for {len(keys)} keys."
+                )
+        except Exception as exc:
+            for key in keys:
+                # NOTE: failures are not memoized - i.e. the keys can be loaded again.
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for key, value in zip(keys, values):
+            if not self._futures[key].done():
+                self._futures[key].set_result(value)
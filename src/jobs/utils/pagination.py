@@ -0,0 +1,81 @@
+"""
+This module defines keyset (i.e. cursor) pagination utilities.
+
+Rather than skipping rows (i.e. `OFFSET`) - which gets slower the deeper the page - a page starts right after
+the last row of the previous one, as identified by its sort key: `(created, id)`. Given an index on the sort
+key, fetching any page costs the same.
+
+The cursor is opaque to clients: the sort key of the last row, URL-safe base64 encoded.
+
+Example usage:
+    cursor = Cursor(created=job.created, id=job.id).encode()
+    Cursor.decode(cursor)
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+class InvalidCursorError(Exception):
+    """
+    Exception raised when a pagination cursor cannot be decoded.
+    """
+
+    def __init__(self, cursor: str) -> None:
+        super().__init__(f"Invalid cursor: {cursor}.")
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Represents the position of a row in a keyset paginated listing - i.e. its sort key.
+
+    Attributes:
+        created (datetime): The datetime when the row was created.
+        id (UUID): The ID of the row - breaking ties between rows created at the same time.
+    """
+
+    created: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        """
+        Encodes the cursor - as an opaque, URL-safe string.
+
+        Returns:
+            str: The encoded cursor.
+        """
+        return (
+            base64.urlsafe_b64encode(
+                f"{self.created.isoformat()}|{self.id.hex}".encode()
+            )
+            .decode()
+            .rstrip("=")
+        )
+
+    @classmethod
+    def decode(cls, cursor: str) -> "Cursor":
+        """
+        Decodes a cursor - as encoded by `encode`.
+
+        Args:
+            cursor (str): The encoded cursor.
+
+        Returns:
+            Cursor: The decoded cursor.
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded.
+        """
+        try:
+            created, id = (
+                base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+                .decode()
+                .split("|")
+            )
+            return cls(created=datetime.fromisoformat(created), id=UUID(hex=id))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise InvalidCursorError(cursor)
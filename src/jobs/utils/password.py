@@ -1,5 +1,5 @@
 """
-This module defines a password schema using the `password_validator` library.
+This module defines a password schema using the `password_validator` library - and the password hashing policy.
 
 The `password_schema` variable represents the password validation rules.
 It requires a password to be at least 16 characters long, contain at least one
@@ -12,10 +12,34 @@ Example usage:
         print("Password is valid.")
     else:
         print("Password is invalid.")
+
+The `CRYPT_CONTEXT` variable represents the password hashing policy (a `passlib` `CryptContext`).
+It is configured from `Settings`: `password_schemes` lists the accepted schemes - the first one is used
+for new hashes, while the others are deprecated (i.e. their hashes are rehashed on the next successful
+login) - and the `password_*` cost settings tune each scheme. Hashes whose cost is below the configured
+one are rehashed on login as well.
+
+Example usage:
+    password_hash = CRYPT_CONTEXT.hash(password)
+    is_valid, new_password_hash = CRYPT_CONTEXT.verify_and_update(password, password_hash)
 """
 
+import logging
+import time
+from typing import Any
+
+from passlib.context import CryptContext
 from password_validator import PasswordValidator
 
+from ..settings.base import Settings, get_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+# NOTE: hashes within this fraction of the calibrated cost are not rehashed - measurements vary between startups.
+CALIBRATION_TOLERANCE = 0.5
+
 
 PASSWORD_SCHEMA = (
     PasswordValidator()
@@ -37,3 +61,92 @@ class InvalidPasswordError(Exception):
 
     def __init__(self) -> None:
         super().__init__("Invalid password.")
+
+
+def get_crypt_context_policy(settings: Settings) -> dict[str, Any]:
+    """
+    Get the password hashing policy - i.e. the `CryptContext` options - configured at `settings`.
+
+    Args:
+        settings (Settings): The settings.
+
+    Returns:
+        dict[str, Any]: The `CryptContext` options.
+    """
+    policy: dict[str, Any] = {
+        "schemes": settings.password_schemes,
+        "deprecated": "auto",
+    }
+
+    if settings.password_pbkdf2_sha256_rounds is not None:
+        policy["pbkdf2_sha256__rounds"] = settings.password_pbkdf2_sha256_rounds
+        policy["pbkdf2_sha256__min_rounds"] = settings.password_pbkdf2_sha256_rounds
+
+    if settings.password_argon2_time_cost is not None:
+        policy["argon2__time_cost"] = settings.password_argon2_time_cost
+
+    if settings.password_argon2_memory_cost is not None:
+        policy["argon2__memory_cost"] = settings.password_argon2_memory_cost
+
+    if settings.password_argon2_parallelism is not None:
+        policy["argon2__parallelism"] = settings.password_argon2_parallelism
+
+    return policy
+
+
+CRYPT_CONTEXT = CryptContext(**get_crypt_context_policy(get_settings()))
+
+
+def calibrate_crypt_context(
+    target_latency: float, iterations: int = 3
+) -> dict[str, int]:
+    """
+    Calibrate the cost of the default scheme of `CRYPT_CONTEXT` so that verifying a password takes about `target_latency`.
+
+    The cost (i.e. rounds for `pbkdf2_sha256`, time cost for `argon2`) is scaled linearly with the measured latency.
+    Hashes are only rehashed (on login) below `CALIBRATION_TOLERANCE` of the calibrated cost - or below the
+    configured minimum, if higher - so that startups measuring slightly different costs do not rehash every
+    password. `CRYPT_CONTEXT` is updated in place - hence, it should be called at startup, before any hashing happens.
+
+    Args:
+        target_latency (float): The target latency (in seconds) for verifying a password.
+        iterations (int): The number of measure/scale iterations. Defaults to 3.
+
+    Returns:
+        dict[str, int]: The calibrated `CryptContext` options.
+
+    Raises:
+        ValueError: If the default scheme cannot be calibrated.
+    """
+    scheme = CRYPT_CONTEXT.default_scheme()
+    # NOTE: `argon2` exposes its time cost as rounds.
+    match scheme:
+        case "pbkdf2_sha256":
+            minimum = 1000
+        case "argon2":
+            minimum = 1
+        case _:
+            raise ValueError(f"Cannot calibrate password hashing scheme: {scheme}.")
+
+    cost = CRYPT_CONTEXT.handler(scheme).default_rounds
+    floor = CRYPT_CONTEXT.to_dict().get(f"{scheme}__min_rounds", minimum)
+
+    for _ in range(iterations):
+        handler = CRYPT_CONTEXT.handler(scheme).using(rounds=cost)
+        password_hash = handler.hash("a-calibration-password")
+
+        start = time.perf_counter()
+        handler.verify("a-calibration-password", password_hash)
+        latency = time.perf_counter() - start
+
+        cost = max(minimum, round(cost * target_latency / latency))
+
+    min_cost = min(cost, max(floor, minimum, int(cost * CALIBRATION_TOLERANCE)))
+    policy = {f"{scheme}__rounds": cost, f"{scheme}__min_rounds": min_cost}
+
+    CRYPT_CONTEXT.update(**policy)
+    logger.info(
+        f"Calibrated password hashing ({scheme}) for {target_latency * 1000:.0f}ms: {policy}."
+    )
+
+    return policy
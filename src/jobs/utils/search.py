@@ -0,0 +1,333 @@
+"""
+This module defines search related utilities - i.e. an in-process inverted index over jobs' titles and descriptions.
+
+It is meant for deployments that would rather not rely on the database's full-text support: if
+`Settings.job_search_backend` is `memory`, every worker keeps a `JobSearchIndex` that `JobService` updates as it
+commits jobs (and catches up with other workers' writes periodically - see `JobService.refresh_search_index`).
+
+Postings are compact: for each term, the (sorted) numbers of the documents containing it and how often it occurs in
+each - both in `array`s of 32-bit integers rather than lists of Python ints. Matches are scored with BM25.
+
+Removed documents are tombstoned - i.e. skipped by searches - until they make up a quarter of the index, at which
+point the postings are compacted. Until then, document frequencies (and hence BM25's IDF) still count them.
+
+The index can be snapshotted to disk so that workers start from a snapshot (and catch up from its watermark)
+rather than reading every job. Snapshots are pickled - i.e. they are trusted, local files.
+
+Example usage:
+    index = JobSearchIndex()
+    index.add(job.id, job.title, job.description, updated=job.updated)
+    index.search("python developer", limit=20)
+"""
+
+import heapq
+import math
+import os
+import pickle
+import re
+import threading
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from ..settings.base import get_settings
+
+
+SNAPSHOT_VERSION = 1
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class InvalidSearchSnapshotError(Exception):
+    """
+    Exception raised when a search index snapshot cannot be restored.
+
+    Attributes:
+        path (str): The path of the snapshot.
+    """
+
+    def __init__(self, path: str | os.PathLike, reason: str):
+        self.path = str(path)
+        super().__init__(f"Invalid search index snapshot: {path} ({reason}).")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split a text into terms - i.e. its lowercased words.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        list[str]: The terms - in order, with repetitions.
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+@dataclass
+class JobSearchIndex:
+    """
+    An in-memory inverted index over jobs' titles and descriptions, scored with BM25.
+
+    Documents are numbered in the order they are added - so that appending a number keeps postings sorted - and
+    mapped back to job IDs. Adding a job that is already indexed replaces it.
+
+    Attributes:
+        k1 (float): BM25's term frequency saturation.
+        b (float): BM25's length normalization.
+        title_weight (int): How many times a title's terms count - i.e. relative to the description's.
+        watermark (datetime, optional): The latest `updated` of the indexed jobs - None if empty.
+    """
+
+    k1: float = 1.2
+    b: float = 0.75
+    title_weight: int = 2
+    watermark: datetime | None = None
+    _postings: dict[str, tuple[array, array]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _ids: list[UUID | None] = field(default_factory=list, init=False, repr=False)
+    _numbers: dict[UUID, int] = field(default_factory=dict, init=False, repr=False)
+    _lengths: array = field(default_factory=lambda: array("I"), init=False, repr=False)
+    _total_length: int = field(default=0, init=False, repr=False)
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __contains__(self, id: UUID) -> bool:
+        return id in self._numbers
+
+    def add(
+        self,
+        id: UUID,
+        title: str,
+        description: str | None = None,
+        updated: datetime | None = None,
+    ) -> None:
+        """
+        Index a job - replacing it if already indexed.
+
+        Args:
+            id (UUID): The ID of the job.
+            title (str): The title of the job.
+            description (str, optional): The description of the job. Defaults to None.
+            updated (datetime, optional): When the job was last updated - advances the watermark. Defaults to None.
+
+        Returns:
+            None
+        """
+        frequencies = Counter(tokenize(title) * self.title_weight)
+        frequencies.update(tokenize(description or ""))
+
+        with self._lock:
+            self._remove(id)
+
+            number = len(self._ids)
+            for term, frequency in frequencies.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array("I"), array("I"))
+                postings[0].append(number)
+                postings[1].append(frequency)
+
+            length = sum(frequencies.values())
+            self._ids.append(id)
+            self._numbers[id] = number
+            self._lengths.append(length)
+            self._total_length += length
+
+            if updated is not None and (
+                self.watermark is None or updated > self.watermark
+            ):
+                self.watermark = updated
+
+    def remove(self, id: UUID) -> None:
+        """
+        Remove a job from the index - if indexed.
+
+        Args:
+            id (UUID): The ID of the job.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._remove(id)
+
+    def search(self, q: str, limit: int | None = None) -> list[tuple[UUID, float]]:
+        """
+        Search the index - ranking the matches (i.e. jobs with any of the terms) by their BM25 score.
+
+        Args:
+            q (str): The search terms.
+            limit (int, optional): The maximum number of matches - None for all of them. Defaults to None.
+
+        Returns:
+            list[tuple[UUID, float]]: The IDs of the matching jobs and their scores - highest first.
+        """
+        with self._lock:
+            size = len(self._numbers)
+            if self._total_length == 0:
+                return []
+
+            # NOTE: BM25's length normalization is `k1 * (1 - b + b * length / average_length)` - i.e.
+            # `base + scale * length`, hoisted out of the loop over the postings.
+            base = self.k1 * (1 - self.b)
+            scale = self.k1 * self.b * size / self._total_length
+            lengths = self._lengths
+            scores: dict[int, float] = {}
+            for term in set(tokenize(q)):
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+
+                numbers, frequencies = postings
+                count = len(numbers)
+                idf = math.log(1 + max(size - count + 0.5, 0.5) / (count + 0.5))
+                weight = idf * (self.k1 + 1)
+                for number, frequency in zip(numbers, frequencies):
+                    length = lengths[number]
+                    if length == 0:
+                        # NOTE: tombstoned - i.e. removed, but not compacted yet.
+                        continue
+                    scores[number] = scores.get(number, 0.0) + weight * frequency / (
+                        frequency + base + scale * length
+                    )
+
+            # NOTE: ties are broken by insertion order - i.e. older jobs first.
+            key = lambda item: (item[1], -item[0])
+            ranked = (
+                sorted(scores.items(), key=key, reverse=True)
+                if limit is None
+                else heapq.nlargest(limit, scores.items(), key=key)
+            )
+
+            return [(self._ids[number], score) for number, score in ranked]
+
+    def compact(self) -> None:
+        """
+        Drop the tombstones - renumbering the remaining jobs and rewriting the postings.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            renumbered = array("i", [-1]) * len(self._ids)
+            ids, lengths = [], array("I")
+            for number, id in enumerate(self._ids):
+                if id is not None:
+                    renumbered[number] = len(ids)
+                    ids.append(id)
+                    lengths.append(self._lengths[number])
+
+            postings = {}
+            for term, (numbers, frequencies) in self._postings.items():
+                kept = (array("I"), array("I"))
+                for number, frequency in zip(numbers, frequencies):
+                    if renumbered[number] >= 0:
+                        kept[0].append(renumbered[number])
+                        kept[1].append(frequency)
+                if kept[0]:
+                    postings[term] = kept
+
+            self._postings = postings
+            self._ids = ids
+            self._numbers = {id: number for number, id in enumerate(ids)}
+            self._lengths = lengths
+
+    def snapshot(self, path: str | os.PathLike) -> None:
+        """
+        Write the index to disk - atomically (i.e. through a temporary file in the same directory).
+
+        Args:
+            path (str | os.PathLike): The path of the snapshot.
+
+        Returns:
+            None
+        """
+        path = Path(path)
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with self._lock:
+            self.compact()
+            state = {
+                "version": SNAPSHOT_VERSION,
+                "k1": self.k1,
+                "b": self.b,
+                "title_weight": self.title_weight,
+                "watermark": self.watermark,
+                "ids": b"".join(id.bytes for id in self._ids),
+                "lengths": self._lengths,
+                "postings": self._postings,
+            }
+            with open(temporary, "wb") as file:
+                pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temporary, path)
+
+    def restore(self, path: str | os.PathLike) -> None:
+        """
+        Replace the index with a snapshot.
+
+        Args:
+            path (str | os.PathLike): The path of the snapshot.
+
+        Returns:
+            None
+
+        Raises:
+            InvalidSearchSnapshotError: If the snapshot cannot be read - or was written by another version.
+        """
+        try:
+            with open(path, "rb") as file:
+                state = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError) as exc:
+            raise InvalidSearchSnapshotError(path, str(exc))
+
+        if not isinstance(state, dict) or state.get("version") != SNAPSHOT_VERSION:
+            raise InvalidSearchSnapshotError(path, "unsupported version")
+
+        ids = [
+            UUID(bytes=state["ids"][start : start + 16])
+            for start in range(0, len(state["ids"]), 16)
+        ]
+        with self._lock:
+            self.k1, self.b = state["k1"], state["b"]
+            self.title_weight = state["title_weight"]
+            self.watermark = state["watermark"]
+            self._postings = state["postings"]
+            self._ids = ids
+            self._numbers = {id: number for number, id in enumerate(ids)}
+            self._lengths = state["lengths"]
+            self._total_length = sum(self._lengths)
+
+    def _remove(self, id: UUID) -> None:
+        """
+        Tombstone a job - compacting the index once a quarter of it is tombstones. The lock must be held.
+
+        Args:
+            id (UUID): The ID of the job.
+
+        Returns:
+            None
+        """
+        number = self._numbers.pop(id, None)
+        if number is None:
+            return
+
+        self._ids[number] = None
+        self._total_length -= self._lengths[number]
+        self._lengths[number] = 0
+
+        if len(self._ids) - len(self._numbers) > len(self._ids) // 4:
+            self.compact()
+
+
+settings = get_settings()
+
+JOB_SEARCH_INDEX = JobSearchIndex() if settings.job_search_backend == "memory" else None
@@ -0,0 +1,256 @@
+"""
+This module defines snapshot related utilities - i.e. writing tables to (partitioned) Parquet files, for analytics to
+run off the database.
+
+Snapshots are streamed: rows arrive in batches (e.g. the partitions of a server-side cursor), each batch is converted
+to an Arrow record batch and written out as it arrives - i.e. memory use does not depend on the size of a table.
+Files are partitioned by the date rows were last updated (hive-style, e.g. `jobs/updated_date=2024-06-17/`).
+
+Snapshots can be incremental: a `SnapshotManifest` records - per table - the latest `updated` snapshotted, and the
+next snapshot only reads the rows updated since then (into new files, alongside the previous ones). A row updated in
+between is therefore in several files: analytics should keep the latest `updated` of each `id`. Watermarks are kept
+behind when the snapshot started (see `snapshot_tables` in `cli`) - given that `updated` is set before committing,
+i.e. rows committed after a snapshot may be older than the latest it read - and rows updated at the watermark itself
+are read again (timestamps have a one second resolution).
+
+Example usage:
+    schema = get_arrow_schema([Job.id, Job.title, Job.updated])
+    write_snapshot(partitions, schema, "snapshots/jobs", run=uuid7().hex)
+"""
+
+import json
+import os
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+from sqlalchemy import DateTime, Integer, Numeric, String
+from sqlalchemy import Enum as EnumType
+from sqlalchemy.sql import ColumnElement
+
+from ..models.types import BinaryUUID
+
+
+PARTITION_COLUMN = "updated_date"
+
+PARTITIONING = ds.partitioning(
+    pa.schema([(PARTITION_COLUMN, pa.date32())]), flavor="hive"
+)
+
+
+class InvalidSnapshotManifestError(Exception):
+    """
+    Exception raised when a snapshot manifest cannot be read.
+
+    Attributes:
+        path (str): The path of the manifest.
+    """
+
+    def __init__(self, path: str | os.PathLike, reason: str):
+        self.path = str(path)
+        super().__init__(f"Invalid snapshot manifest: {path} ({reason}).")
+
+
+def get_arrow_type(column: ColumnElement) -> pa.DataType:
+    """
+    Get the Arrow type a column is snapshotted as.
+
+    UUIDs and enums are written as strings - i.e. readable as is by analytics tools (Parquet dictionary encodes
+    them anyway) - decimals keep their precision and timestamps their (one second) resolution.
+
+    Args:
+        column (ColumnElement): The column - e.g. `Job.salary`.
+
+    Returns:
+        pa.DataType: The Arrow type.
+
+    Raises:
+        ValueError: If the column's type is not supported.
+    """
+    match column.type:
+        case BinaryUUID() | EnumType() | String():
+            return pa.string()
+        case Integer():
+            return pa.int64()
+        case Numeric(precision=precision, scale=scale):
+            return pa.decimal128(precision, scale)
+        case DateTime():
+            return pa.timestamp("s")
+        case _:
+            raise ValueError(f"Cannot snapshot column {column.name}: {column.type}.")
+
+
+def get_arrow_schema(columns: Sequence[ColumnElement]) -> pa.Schema:
+    """
+    Get the Arrow schema columns are snapshotted as.
+
+    Args:
+        columns (Sequence[ColumnElement]): The columns - which must include `updated`.
+
+    Returns:
+        pa.Schema: The schema - one field per column, nullable as the column is.
+    """
+    return pa.schema(
+        [
+            pa.field(column.name, get_arrow_type(column), nullable=column.nullable)
+            for column in columns
+        ]
+    )
+
+
+def to_arrow(value: Any) -> Any:
+    """
+    Convert a column value to its snapshotted representation - e.g. UUIDs to strings.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        Any: The snapshotted value.
+    """
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+
+    return value
+
+
+def to_record_batch(
+    rows: Sequence[Mapping[str, Any]], schema: pa.Schema
+) -> pa.RecordBatch:
+    """
+    Convert rows to a record batch - with the partition column (i.e. the date of `updated`) appended.
+
+    Args:
+        rows (Sequence[Mapping[str, Any]]): The rows.
+        schema (pa.Schema): The schema.
+
+    Returns:
+        pa.RecordBatch: The record batch.
+    """
+    arrays = [
+        pa.array([to_arrow(row[name]) for row in rows], type=schema.field(name).type)
+        for name in schema.names
+    ]
+    arrays.append(arrays[schema.get_field_index("updated")].cast(pa.date32()))
+
+    return pa.RecordBatch.from_arrays(
+        arrays, schema=schema.append(pa.field(PARTITION_COLUMN, pa.date32()))
+    )
+
+
+def write_snapshot(
+    partitions: Iterable[Sequence[Mapping[str, Any]]],
+    schema: pa.Schema,
+    directory: str | os.PathLike,
+    run: str,
+) -> tuple[int, datetime | None]:
+    """
+    Write rows to Parquet files - partitioned by the date of `updated`, a batch of rows at a time.
+
+    Files are added to (rather than replace) the ones of previous runs - which is what incremental snapshots need.
+
+    Args:
+        partitions (Iterable[Sequence[Mapping[str, Any]]]): The rows - in batches.
+        schema (pa.Schema): The schema - see `get_arrow_schema`.
+        directory (str | os.PathLike): The directory of the table's snapshot.
+        run (str): The name of the run - i.e. what its files are named after (e.g. a time-ordered UUID). Files of a
+            previous run with the same name are overwritten.
+
+    Returns:
+        tuple[int, datetime | None]: The number of rows written and their latest `updated` - None if no rows.
+    """
+    written = {"rows": 0, "watermark": None}
+
+    def batches() -> Iterator[pa.RecordBatch]:
+        for rows in partitions:
+            written["rows"] += len(rows)
+            latest = max(row["updated"] for row in rows)
+            if written["watermark"] is None or latest > written["watermark"]:
+                written["watermark"] = latest
+            yield to_record_batch(rows, schema)
+
+    batch_schema = schema.append(pa.field(PARTITION_COLUMN, pa.date32()))
+    ds.write_dataset(
+        pa.RecordBatchReader.from_batches(batch_schema, batches()),
+        directory,
+        format="parquet",
+        partitioning=PARTITIONING,
+        basename_template=f"part-{run}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+
+    return written["rows"], written["watermark"]
+
+
+@dataclass
+class SnapshotManifest:
+    """
+    Represents what the snapshots in a directory hold - i.e. the latest `updated` snapshotted, per table.
+
+    Attributes:
+        path (str): The path of the manifest.
+        watermarks (dict[str, datetime]): Where the next snapshot reads from - per table, i.e. the latest `updated`
+            snapshotted, capped at a lag behind when the snapshot started.
+    """
+
+    path: str
+    watermarks: dict[str, datetime] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "SnapshotManifest":
+        """
+        Load a manifest - or start a new one, if there is none.
+
+        Args:
+            path (str | os.PathLike): The path of the manifest.
+
+        Returns:
+            SnapshotManifest: The manifest.
+
+        Raises:
+            InvalidSnapshotManifestError: If the manifest cannot be read.
+        """
+        if not os.path.exists(path):
+            return cls(path=str(path))
+
+        try:
+            with open(path) as file:
+                state = json.load(file)
+            watermarks = {
+                table: datetime.fromisoformat(watermark)
+                for table, watermark in state["watermarks"].items()
+            }
+        except (OSError, ValueError, KeyError, AttributeError) as exc:
+            raise InvalidSnapshotManifestError(path, str(exc))
+
+        return cls(path=str(path), watermarks=watermarks)
+
+    def save(self) -> None:
+        """
+        Write the manifest to disk - atomically (i.e. through a temporary file in the same directory).
+
+        Returns:
+            None
+        """
+        path = Path(self.path)
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(temporary, "w") as file:
+            json.dump(
+                {
+                    "watermarks": {
+                        table: watermark.isoformat()
+                        for table, watermark in self.watermarks.items()
+                    }
+                },
+                file,
+            )
+
+        os.replace(temporary, path)
@@ -1,3 +1,31 @@
+"""
+This module defines user related utilities - e.g. checking whether a username (i.e. an email address) is deliverable.
+
+Usernames are always validated syntactically (see `User.validate_username`) - which requires no network access.
+Deliverability - i.e. whether the email domain accepts email - is only checked if `Settings.email_validation_mode`
+is `deliverability`, and it is checked asynchronously (see `EmailDeliverabilityChecker`), with the outcome cached
+per domain: positive outcomes for `email_dns_cache_ttl_seconds`, negative ones for `email_dns_negative_cache_ttl_seconds`.
+
+Example usage:
+    checker = EmailDeliverabilityChecker()
+    await checker.check("username@server.io")
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+import dns.asyncresolver
+import dns.exception
+import dns.resolver
+
+from ..settings.base import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+
 class InvalidUsernameError(Exception):
     """
     Exception raised when an invalid username is encountered.
@@ -7,3 +35,137 @@ class InvalidUsernameError(Exception):
     """
 
     pass
+
+
+class AsyncResolver(Protocol):
+    """
+    Represents an async DNS resolver - e.g. `dns.asyncresolver.Resolver` (or a stub, in tests).
+    """
+
+    async def resolve(self, qname: str, rdtype: str, lifetime: float | None) -> Any:
+        """
+        Resolve a DNS query.
+        """
+        ...
+
+
+@dataclass
+class EmailDeliverabilityChecker:
+    """
+    A class that checks - asynchronously - whether email domains accept email, caching the outcome per domain.
+
+    A domain is deliverable if it has MX records (other than a "null MX") or - lacking those - A/AAAA records.
+
+    Attributes:
+        resolver (AsyncResolver): The DNS resolver.
+        ttl (float): For how long (in seconds) deliverable domains are cached.
+        negative_ttl (float): For how long (in seconds) undeliverable domains are cached.
+        timeout (float): The timeout (in seconds) for each DNS query.
+    """
+
+    resolver: AsyncResolver = field(default_factory=dns.asyncresolver.Resolver)
+    ttl: float = 3600
+    negative_ttl: float = 300
+    timeout: float = 5
+    _cache: dict[str, tuple[bool, float]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    async def check(self, email: str) -> None:
+        """
+        Check whether an email address is deliverable.
+
+        Args:
+            email (str): The (syntactically valid) email address.
+
+        Returns:
+            None
+
+        Raises:
+            InvalidUsernameError: If the email domain does not accept email.
+        """
+        domain = email.rsplit("@", 1)[-1].lower()
+
+        deliverable = self._get(domain)
+        if deliverable is None:
+            deliverable = await self._resolve(domain)
+
+        if not deliverable:
+            raise InvalidUsernameError(
+                f"Invalid username (i.e. email address - domain does not accept email): {email}."
+            )
+
+    def _get(self, domain: str) -> bool | None:
+        """
+        Get the cached outcome for a domain - if any (and not expired).
+        """
+        cached = self._cache.get(domain)
+        if cached is None or cached[1] <= time.monotonic():
+            return None
+
+        return cached[0]
+
+    async def _resolve(self, domain: str) -> bool:
+        """
+        Resolve whether a domain accepts email - caching the outcome (unless it is unknown, e.g. the resolution
+        timed out).
+        """
+        try:
+            deliverable = await self._has_records(domain)
+        except dns.exception.Timeout:
+            # NOTE: not failing (nor caching) on timeouts - i.e. deliverability is unknown.
+            logger.warning(f"Timed out checking email deliverability for: {domain}.")
+            return True
+
+        if deliverable is None:
+            # NOTE: likewise on resolver failures (e.g. SERVFAIL, no nameserver reachable) - i.e. transient.
+            logger.warning(f"Failed to check email deliverability for: {domain}.")
+            return True
+
+        self._cache[domain] = (
+            deliverable,
+            time.monotonic() + (self.ttl if deliverable else self.negative_ttl),
+        )
+
+        return deliverable
+
+    async def _has_records(self, domain: str) -> bool | None:
+        """
+        Check whether a domain has MX (or - lacking those - A/AAAA) records - None if unknown, i.e. a lookup failed
+        (`NoNameservers`) and none found any.
+        """
+        unknown = False
+        try:
+            answer = await self.resolver.resolve(domain, "MX", lifetime=self.timeout)
+            # NOTE: a "null MX" (i.e. preference 0 and exchange ".") means the domain does not accept email.
+            return any(str(record.exchange) != "." for record in answer)
+        except dns.resolver.NXDOMAIN:
+            return False
+        except dns.resolver.NoAnswer:
+            pass
+        except dns.resolver.NoNameservers:
+            unknown = True
+
+        for rdtype in ("A", "AAAA"):
+            try:
+                await self.resolver.resolve(domain, rdtype, lifetime=self.timeout)
+                return True
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                continue
+            except dns.resolver.NoNameservers:
+                unknown = True
+
+        return None if unknown else False
+
+
+settings = get_settings()
+
+EMAIL_DELIVERABILITY_CHECKER = (
+    EmailDeliverabilityChecker(
+        ttl=settings.email_dns_cache_ttl_seconds,
+        negative_ttl=settings.email_dns_negative_cache_ttl_seconds,
+        timeout=settings.email_dns_timeout_seconds,
+    )
+    if settings.email_validation_mode == "deliverability"
+    else None
+)